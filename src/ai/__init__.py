@@ -5,21 +5,34 @@ Ce module contient le système IA refactorisé basé sur le SokolutionSolver
 avec des capacités ML et d'analyse avancées.
 """
 
-from .unified_ai_controller import UnifiedAIController
-from .enhanced_sokolution_solver import EnhancedSokolutionSolver
-from .algorithm_selector import AlgorithmSelector, Algorithm
-from .ml_metrics_collector import MLMetricsCollector
-from .ml_report_generator import MLReportGenerator
-from .visual_ai_solver import VisualAISolver
-
-__all__ = [
-    'UnifiedAIController',
-    'EnhancedSokolutionSolver', 
-    'AlgorithmSelector',
-    'Algorithm',
-    'MLMetricsCollector',
-    'MLReportGenerator',
-    'VisualAISolver'
-]
-
-__version__ = "2.0.0"
\ No newline at end of file
+# Nom exporté -> module qui le définit. Les modules sont importés au premier
+# accès : importer src.ai.festival_solver ou le solveur ne charge ni pygame
+# (VisualAISolver) ni NumPy et les modules ML (UnifiedAIController).
+_EXPORTS = {
+    'UnifiedAIController': '.unified_ai_controller',
+    'EnhancedSokolutionSolver': '.enhanced_sokolution_solver',
+    'AlgorithmSelector': '.algorithm_selector',
+    'Algorithm': '.algorithm_selector',
+    'MLMetricsCollector': '.ml_metrics_collector',
+    'MLReportGenerator': '.ml_report_generator',
+    'VisualAISolver': '.visual_ai_solver',
+}
+
+__all__ = list(_EXPORTS)
+
+__version__ = "2.0.0"
+
+
+def __getattr__(name):
+    """Importe le module d'un nom exporté à sa première utilisation."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -3,12 +3,21 @@ Sélecteur d'algorithme automatique pour le système IA Sokoban.
 
 Ce module implémente la logique de sélection automatique d'algorithme
 basée sur la complexité du niveau, inspirée des techniques Sokolution.
+
+Quand un modèle de budgets a été entraîné sur la télémétrie des résolutions
+passées (voir ``budget_model``), il choisit l'algorithme et ses limites ; les
+seuils de complexité ne servent plus que de repli.
 """
 
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import math
 
+from .budget_model import BudgetModel, SolveRecord, extract_features
+from .difficulty_estimator import get_difficulty_estimator
+
 
 class Algorithm(Enum):
     """Énumération des algorithmes disponibles."""
@@ -19,6 +28,34 @@ class Algorithm(Enum):
     BIDIRECTIONAL_GREEDY = "BIDIRECTIONAL_GREEDY"
 
 
+# Limites par algorithme : (max_states, time_limit). Règles appliquées tant
+# qu'aucun modèle de budgets ne couvre le niveau.
+SOLVER_LIMITS = {
+    Algorithm.BFS: (75000, 10.0),
+    Algorithm.ASTAR: (1000000, 120.0),
+    Algorithm.IDA_STAR: (2000000, 300.0),
+    Algorithm.GREEDY: (2000000, 600.0),
+    Algorithm.BIDIRECTIONAL_GREEDY: (2000000, 600.0),
+}
+DEFAULT_SOLVER_LIMITS = (1000000, 120.0)
+
+# Nombre de comparaisons coût prédit / coût réel gardées en mémoire
+COST_REPORT_HISTORY = 100
+
+
+@dataclass
+class SolvePlan:
+    """Algorithme et budget retenus pour un niveau."""
+    algorithm: Algorithm
+    max_states: int
+    time_limit: float
+    source: str  # 'model' ou 'rules'
+    features: Optional[Dict[str, float]] = None
+    success_probability: Optional[float] = None
+    predicted_states: Optional[float] = None
+    predicted_time: Optional[float] = None
+
+
 class ComplexityAnalyzer:
     """Analyseur de complexité pour les niveaux Sokoban."""
     
@@ -142,8 +179,17 @@ class AlgorithmSelector:
     selon les principes du solver Sokolution.
     """
     
-    def __init__(self):
+    def __init__(self, budget_model: Optional[BudgetModel] = None, telemetry=None):
+        """
+        Args:
+            budget_model: Modèle de budgets (par défaut, celui sauvegardé dans data/ s'il existe)
+            telemetry: SolveTelemetryLog où consigner les résolutions, ou None
+        """
         self.complexity_analyzer = ComplexityAnalyzer()
+        self.budget_model = budget_model if budget_model is not None else BudgetModel.load()
+        self.telemetry = telemetry
+        # Coûts prédits contre coûts réels des dernières résolutions consignées
+        self.cost_reports = deque(maxlen=COST_REPORT_HISTORY)
         self.algorithm_thresholds = {
             'simple': 50,      # BFS pour niveaux simples
             'medium': 150,     # A* pour niveaux moyens
@@ -170,15 +216,90 @@ class AlgorithmSelector:
         Returns:
             Algorithm: Algorithme optimal sélectionné
         """
-        complexity_score = self.complexity_analyzer.calculate_complexity_score(level)
-
-        # Sélection basée sur la complexité du niveau
-        selected_algorithm = self._select_fallback_algorithm(complexity_score)
+        selected_algorithm = self.plan_budget(level).algorithm
 
         # Mise à jour des statistiques
         self.selection_stats[selected_algorithm] += 1
 
         return selected_algorithm
+
+    def plan_budget(self, level) -> SolvePlan:
+        """
+        Choisit l'algorithme et son budget pour un niveau.
+
+        Le modèle appris est consulté s'il est entraîné ; sinon, ou s'il ne
+        prédit de succès probable pour aucun algorithme, on applique les seuils
+        de complexité et SOLVER_LIMITS.
+
+        Args:
+            level: Instance de Level à analyser
+
+        Returns:
+            SolvePlan: Algorithme, limites et coûts prédits
+        """
+        if self.budget_model is not None and self.budget_model.is_trained:
+            features = extract_features(level)
+            prediction = self.budget_model.best(features)
+            if prediction is not None:
+                max_states, time_limit = self.budget_model.budget_for(prediction)
+                return SolvePlan(
+                    algorithm=Algorithm(prediction.algorithm),
+                    max_states=max_states,
+                    time_limit=time_limit,
+                    source='model',
+                    features=features,
+                    success_probability=prediction.success_probability,
+                    predicted_states=prediction.predicted_states,
+                    predicted_time=prediction.predicted_time,
+                )
+
+        complexity_score = self.complexity_analyzer.calculate_complexity_score(level)
+        algorithm = self._select_fallback_algorithm(complexity_score)
+        max_states, time_limit = SOLVER_LIMITS.get(algorithm, DEFAULT_SOLVER_LIMITS)
+        return SolvePlan(algorithm=algorithm, max_states=max_states,
+                         time_limit=time_limit, source='rules')
+
+    def record_outcome(self, level, plan: SolvePlan, states: int, solve_time: float,
+                       success: bool, algorithm: Optional[Algorithm] = None) -> Dict[str, Any]:
+        """
+        Consigne le résultat d'une résolution et le compare à la prédiction.
+
+        Args:
+            level: Niveau résolu (dans son état de départ)
+            plan: Plan retenu avant la résolution
+            states: Nombre d'états explorés
+            solve_time: Durée de la résolution en secondes
+            success: True si une solution a été trouvée
+            algorithm: Algorithme effectivement utilisé (par défaut celui du plan)
+
+        Returns:
+            Dict: Coûts prédits et réels
+        """
+        algorithm = algorithm or plan.algorithm
+        report = {
+            'algorithm': algorithm.value,
+            'source': plan.source,
+            'success': success,
+            'predicted_states': plan.predicted_states,
+            'actual_states': states,
+            'predicted_time': plan.predicted_time,
+            'actual_time': solve_time,
+            'success_probability': plan.success_probability,
+        }
+        self.cost_reports.append(report)
+
+        if self.telemetry is not None:
+            features = plan.features if plan.features is not None else extract_features(level)
+            self.telemetry.append(SolveRecord(
+                features=features,
+                algorithm=algorithm.value,
+                states=states,
+                time=solve_time,
+                success=success,
+                max_states=plan.max_states,
+                time_limit=plan.time_limit,
+            ))
+        return report
     
     def _select_fallback_algorithm(self, complexity_score: float) -> Algorithm:
         """Sélectionne l'algorithme optimal basé sur la complexité."""
@@ -200,6 +321,10 @@ class AlgorithmSelector:
         """
         Obtient une recommandation détaillée d'algorithme.
         
+        Le rapport de difficulté n'est joint que s'il est déjà en cache (par
+        exemple calculé par le modèle de budget) : la recherche sonde coûte
+        jusqu'à quelques secondes et n'influe pas sur l'algorithme recommandé.
+        
         Args:
             level: Instance de Level à analyser
             
@@ -207,11 +332,16 @@ class AlgorithmSelector:
             Dict contenant les détails de la recommandation
         """
         complexity_score = self.complexity_analyzer.calculate_complexity_score(level)
-        selected_algorithm = self.select_optimal_algorithm(level)
+        plan = self.plan_budget(level)
+        selected_algorithm = plan.algorithm
+        self.selection_stats[selected_algorithm] += 1
+        difficulty = get_difficulty_estimator().get_cached(level)
         
         return {
             'recommended_algorithm': selected_algorithm,
             'complexity_score': complexity_score,
+            'difficulty': difficulty.to_dict() if difficulty is not None else None,
+            'budget': plan,
             'complexity_category': self._get_complexity_category(complexity_score),
             'reasoning': self._get_selection_reasoning(complexity_score, selected_algorithm),
             'expected_performance': self._get_expected_performance(selected_algorithm),
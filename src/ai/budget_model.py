@@ -0,0 +1,378 @@
+"""
+Budgets de résolution appris sur la télémétrie des résolutions passées.
+
+``AlgorithmSelector`` choisissait l'algorithme et ses limites (états, temps)
+par seuils fixes sur un score de complexité : BFS recevait 75 000 états et
+10 s quel que soit le niveau. Ce module apprend plutôt des résolutions
+réelles.
+
+Chaque résolution est consignée dans le journal des résolutions
+(``data/telemetry/solves.jsonl``, à rotation, voir ``TelemetrySink``) sous
+forme de ``SolveRecord`` : caractéristiques du niveau, algorithme, états
+explorés, temps, succès.
+``BudgetModel`` est entraîné hors ligne sur ce journal avec NumPy :
+
+- par algorithme, une régression logistique prédit la probabilité de succès ;
+- par algorithme, une régression ridge sur les succès prédit le log du nombre
+  d'états et du temps nécessaires.
+
+Pour un niveau, le modèle retient l'algorithme qui minimise le temps espéré
+jusqu'au succès (temps prédit / probabilité de succès) et en déduit un budget
+avec une marge. Sans données suffisantes, il ne propose rien et le sélecteur
+retombe sur ses règles.
+
+Entraînement :
+
+    python -m src.ai.budget_model --telemetry data/telemetry/solves.jsonl \\
+        --output data/budget_model.json
+
+NumPy n'est importé qu'à la construction d'un modèle : sans modèle entraîné,
+le sélecteur et les outils sans affichage ne le chargent pas.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional
+
+from .telemetry_sink import DEFAULT_TELEMETRY_DIR, TelemetrySink, get_telemetry_sink
+
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_TELEMETRY_PATH = os.path.join(DEFAULT_TELEMETRY_DIR, 'solves.jsonl')
+DEFAULT_MODEL_PATH = os.path.join(_PROJECT_ROOT, 'data', 'budget_model.json')
+
+# Caractéristiques d'un niveau, dans l'ordre du vecteur d'entrée du modèle
+FEATURE_NAMES = (
+    'boxes',
+    'log_area',
+    'difficulty_score',
+    'log_estimated_nodes',
+    'branching_factor',
+    'lower_bound',
+)
+
+# Un algorithme n'est modélisé qu'avec assez d'exemples, dont assez de succès
+MIN_RECORDS = 5
+MIN_SUCCESSES = 2
+
+# Probabilité de succès en dessous de laquelle le modèle ne propose rien
+MIN_SUCCESS_PROBABILITY = 0.2
+
+# Marge appliquée aux coûts prédits pour fixer le budget
+BUDGET_MARGIN = 3.0
+MIN_STATES, MAX_STATES = 1000, 2000000
+MIN_TIME, MAX_TIME = 1.0, 600.0
+
+
+def extract_features(level, report=None) -> Dict[str, float]:
+    """
+    Caractéristiques d'un niveau utilisées par le modèle.
+
+    Args:
+        level: Instance de Level
+        report: DifficultyReport déjà calculé (sinon obtenu de l'estimateur global)
+
+    Returns:
+        Dict[str, float]: Valeur de chaque caractéristique de FEATURE_NAMES
+    """
+    if report is None:
+        from .difficulty_estimator import get_difficulty_estimator
+        report = get_difficulty_estimator().estimate(level)
+
+    return {
+        'boxes': float(len(level.boxes)),
+        'log_area': math.log10(max(level.width * level.height, 1)),
+        'difficulty_score': report.score / 100.0,
+        'log_estimated_nodes': math.log10(max(report.estimated_nodes, 1.0)),
+        'branching_factor': report.effort.effective_branching_factor,
+        'lower_bound': float(report.effort.lower_bound),
+    }
+
+
+@dataclass
+class SolveRecord:
+    """Télémétrie d'une résolution."""
+    features: Dict[str, float]
+    algorithm: str
+    states: int
+    time: float
+    success: bool
+    max_states: Optional[int] = None
+    time_limit: Optional[float] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation sérialisable de l'enregistrement."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SolveRecord':
+        """Reconstruit un enregistrement depuis sa représentation JSON."""
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+class SolveTelemetryLog:
+    """
+    SolveRecord consignés dans un journal de télémétrie à rotation.
+
+    Par défaut, le journal est celui des résolutions du contrôleur IA
+    (``get_telemetry_sink('solves')``) : les SolveRecord s'y distinguent des
+    autres enregistrements par leur champ ``features``.
+    """
+
+    def __init__(self, path: Optional[str] = None, sink: Optional[TelemetrySink] = None):
+        """
+        Args:
+            path: Fichier JSONL dédié, ou None pour le journal des résolutions
+            sink: Journal à utiliser (prioritaire sur path)
+        """
+        if sink is None:
+            sink = get_telemetry_sink('solves') if path is None else TelemetrySink(path)
+        self.sink = sink
+        self.path = sink.path
+
+    def append(self, record: SolveRecord):
+        """
+        Ajoute un enregistrement à la fin du journal.
+
+        Une erreur d'écriture est signalée par le journal sans être propagée :
+        elle ne doit pas faire échouer la résolution qui vient d'aboutir.
+        """
+        self.sink.record(record.to_dict())
+
+    def load(self) -> List[SolveRecord]:
+        """Lit tous les SolveRecord valides du journal, archives comprises."""
+        records = []
+        for entry in self.sink.iter_records():
+            if not isinstance(entry, dict) or 'features' not in entry:
+                continue
+            try:
+                records.append(SolveRecord.from_dict(entry))
+            except (ValueError, TypeError, KeyError):
+                continue
+        return records
+
+
+@dataclass
+class BudgetPrediction:
+    """Prédiction du modèle pour un algorithme sur un niveau."""
+    algorithm: str
+    success_probability: float
+    predicted_states: float
+    predicted_time: float
+
+    @property
+    def expected_cost(self) -> float:
+        """Temps espéré jusqu'au succès."""
+        return self.predicted_time / max(self.success_probability, 1e-6)
+
+
+def _fit_logistic(x: np.ndarray, y: np.ndarray, l2: float = 1e-2,
+                  iterations: int = 500, learning_rate: float = 0.5) -> np.ndarray:
+    """Régression logistique L2 par descente de gradient (biais en colonne 0)."""
+    import numpy as np
+    weights = np.zeros(x.shape[1])
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(-np.clip(x @ weights, -30, 30)))
+        gradient = x.T @ (p - y) / len(y)
+        gradient[1:] += l2 * weights[1:]
+        weights -= learning_rate * gradient
+    return weights
+
+
+def _fit_ridge(x: np.ndarray, y: np.ndarray, l2: float = 1e-1) -> np.ndarray:
+    """Régression ridge en forme fermée (biais non régularisé en colonne 0)."""
+    import numpy as np
+    penalty = l2 * np.eye(x.shape[1])
+    penalty[0, 0] = 0.0
+    return np.linalg.solve(x.T @ x + penalty, x.T @ y)
+
+
+class BudgetModel:
+    """
+    Modèle de coût et de succès par algorithme.
+
+    Les caractéristiques sont centrées-réduites avec les statistiques du jeu
+    d'entraînement ; les poids de chaque algorithme sont des vecteurs NumPy
+    sérialisés en JSON.
+    """
+
+    def __init__(self):
+        import numpy as np
+        self.mean = np.zeros(len(FEATURE_NAMES))
+        self.scale = np.ones(len(FEATURE_NAMES))
+        # algorithme -> {'success': w, 'log_states': w, 'log_time': w, 'samples': n}
+        self.algorithms: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def is_trained(self) -> bool:
+        return bool(self.algorithms)
+
+    def _design(self, rows: List[Dict[str, float]]) -> np.ndarray:
+        """Matrice d'entrée normalisée, avec une colonne de biais."""
+        import numpy as np
+        raw = np.array([[row.get(name, 0.0) for name in FEATURE_NAMES] for row in rows], dtype=float)
+        normalized = (raw - self.mean) / self.scale
+        return np.hstack([np.ones((len(rows), 1)), normalized])
+
+    def fit(self, records: List[SolveRecord]) -> 'BudgetModel':
+        """
+        Entraîne le modèle sur des enregistrements de résolution.
+
+        Args:
+            records: Télémétrie des résolutions passées
+
+        Returns:
+            BudgetModel: self, pour chaîner
+        """
+        self.algorithms = {}
+        if not records:
+            return self
+
+        import numpy as np
+        raw = np.array([[r.features.get(name, 0.0) for name in FEATURE_NAMES] for r in records], dtype=float)
+        self.mean = raw.mean(axis=0)
+        self.scale = raw.std(axis=0)
+        self.scale[self.scale == 0] = 1.0
+
+        by_algorithm: Dict[str, List[SolveRecord]] = {}
+        for record in records:
+            by_algorithm.setdefault(record.algorithm, []).append(record)
+
+        for algorithm, samples in by_algorithm.items():
+            successes = [r for r in samples if r.success]
+            if len(samples) < MIN_RECORDS or len(successes) < MIN_SUCCESSES:
+                continue
+
+            x = self._design([r.features for r in samples])
+            y = np.array([1.0 if r.success else 0.0 for r in samples])
+            xs = self._design([r.features for r in successes])
+            self.algorithms[algorithm] = {
+                'success': _fit_logistic(x, y),
+                'log_states': _fit_ridge(xs, np.log10([max(r.states, 1) for r in successes])),
+                'log_time': _fit_ridge(xs, np.log10([max(r.time, 1e-3) for r in successes])),
+                'samples': len(samples),
+            }
+        return self
+
+    def predict(self, features: Dict[str, float]) -> List[BudgetPrediction]:
+        """
+        Prédictions pour chaque algorithme modélisé, de la moins coûteuse à la plus coûteuse.
+
+        Args:
+            features: Caractéristiques du niveau (voir extract_features)
+
+        Returns:
+            List[BudgetPrediction]: Vide si le modèle n'est pas entraîné
+        """
+        import numpy as np
+        x = self._design([features])[0]
+        predictions = []
+        for algorithm, weights in self.algorithms.items():
+            logit = float(np.clip(x @ weights['success'], -30, 30))
+            predictions.append(BudgetPrediction(
+                algorithm=algorithm,
+                success_probability=1.0 / (1.0 + math.exp(-logit)),
+                predicted_states=10 ** float(x @ weights['log_states']),
+                predicted_time=10 ** float(x @ weights['log_time']),
+            ))
+        predictions.sort(key=lambda p: p.expected_cost)
+        return predictions
+
+    def best(self, features: Dict[str, float]) -> Optional[BudgetPrediction]:
+        """Meilleure prédiction suffisamment probable, ou None pour garder les règles."""
+        for prediction in self.predict(features):
+            if prediction.success_probability >= MIN_SUCCESS_PROBABILITY:
+                return prediction
+        return None
+
+    @staticmethod
+    def budget_for(prediction: BudgetPrediction) -> tuple:
+        """Budget (max_states, time_limit) tiré d'une prédiction, avec marge."""
+        max_states = int(min(max(prediction.predicted_states * BUDGET_MARGIN, MIN_STATES), MAX_STATES))
+        time_limit = float(min(max(prediction.predicted_time * BUDGET_MARGIN, MIN_TIME), MAX_TIME))
+        return max_states, time_limit
+
+    def save(self, path: str = DEFAULT_MODEL_PATH):
+        """Sauvegarde le modèle en JSON."""
+        import numpy as np
+        data = {
+            'features': list(FEATURE_NAMES),
+            'mean': self.mean.tolist(),
+            'scale': self.scale.tolist(),
+            'algorithms': {
+                algorithm: {
+                    key: value.tolist() if isinstance(value, np.ndarray) else value
+                    for key, value in weights.items()
+                }
+                for algorithm, weights in self.algorithms.items()
+            },
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MODEL_PATH) -> Optional['BudgetModel']:
+        """
+        Charge un modèle sauvegardé.
+
+        Returns:
+            BudgetModel, ou None si le fichier est absent, illisible ou
+            construit sur d'autres caractéristiques
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if tuple(data.get('features', ())) != FEATURE_NAMES:
+            return None
+
+        import numpy as np
+        model = cls()
+        model.mean = np.array(data['mean'], dtype=float)
+        model.scale = np.array(data['scale'], dtype=float)
+        model.algorithms = {
+            algorithm: {
+                key: np.array(value, dtype=float) if isinstance(value, list) else value
+                for key, value in weights.items()
+            }
+            for algorithm, weights in data['algorithms'].items()
+        }
+        return model
+
+
+def main(argv=None) -> int:
+    """Entraîne le modèle de budgets sur un journal de télémétrie."""
+    parser = argparse.ArgumentParser(description="Entraîne le modèle de budgets de résolution.")
+    parser.add_argument('--telemetry', default=DEFAULT_TELEMETRY_PATH,
+                        help="journal JSONL des résolutions")
+    parser.add_argument('--output', default=DEFAULT_MODEL_PATH,
+                        help="fichier JSON du modèle entraîné")
+    args = parser.parse_args(argv)
+
+    records = SolveTelemetryLog(args.telemetry).load()
+    model = BudgetModel().fit(records)
+    if not model.is_trained:
+        print(f"{len(records)} résolutions dans {args.telemetry} : pas assez de données "
+              f"(au moins {MIN_RECORDS} par algorithme dont {MIN_SUCCESSES} succès)")
+        return 1
+
+    model.save(args.output)
+    print(f"{len(records)} résolutions → modèle écrit dans {args.output}")
+    for algorithm, weights in sorted(model.algorithms.items()):
+        print(f"  {algorithm:<22} {weights['samples']} exemples")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
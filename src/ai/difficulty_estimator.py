@@ -0,0 +1,294 @@
+"""
+Estimation de difficulté par mesure de l'effort de recherche.
+
+Les scores historiques (``LevelMetrics._estimate_difficulty``,
+``ComplexityAnalyzer.calculate_complexity_score``) pondèrent à la main la
+taille du niveau et le nombre de caisses. Ils prédisent mal le coût réel :
+un grand niveau ouvert à six caisses peut se résoudre en cent nœuds, une
+petite salle à quatre caisses en demander un million.
+
+Ce module mesure plutôt qu'il ne devine. Une recherche en poussées bornée
+(voir ``push_engine``) est lancée sur le niveau et instrumentée ; de l'effort
+observé — nœuds développés, facteur de branchement effectif, poussées de la
+solution, élagages par deadlock et par corral — on tire un score sur 0-100
+et un temps de résolution prédit. Les rapports sont mis en cache par état de
+départ, pour que la sélection de niveaux, les filtres de génération et le
+budget des solveurs partagent la même mesure.
+"""
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+from .push_engine import PushEngine
+
+
+# Nombre de nœuds estimé correspondant au score 100 : au-delà, le solveur
+# interne n'aboutit pratiquement plus dans son budget par défaut.
+_SCORE_SATURATION_NODES = 1e6
+
+# Plafond de l'extrapolation quand la sonde n'aboutit pas.
+_MAX_ESTIMATED_NODES = 1e12
+
+# Bornes des catégories de score, alignées sur celles d'AlgorithmSelector.
+_CATEGORY_BOUNDS = ((25, "Simple"), (50, "Medium"), (75, "Complex"))
+
+
+@dataclass
+class SearchEffort:
+    """Télémétrie d'une recherche sonde."""
+    nodes_expanded: int
+    nodes_generated: int
+    effective_branching_factor: float
+    solution_pushes: Optional[int]
+    deadlock_prunes: int
+    corral_prunes: int
+    lower_bound: int
+    solved: bool
+    exhausted: bool
+    elapsed: float
+
+
+@dataclass
+class DifficultyReport:
+    """Difficulté calibrée d'un niveau, dérivée de l'effort de recherche."""
+    effort: SearchEffort
+    estimated_nodes: float
+    score: float
+    predicted_solve_time: float
+    category: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation sérialisable du rapport."""
+        return asdict(self)
+
+
+def _log_geometric_sum(b: float, depth: int) -> float:
+    """
+    Logarithme de b + b² + ... + b^depth, calculé sans former b^depth.
+
+    Aux profondeurs réelles, b^depth dépasse la plage des flottants dès
+    quelques milliers de nœuds générés ; le logarithme reste borné.
+    """
+    if b == 1.0:
+        return math.log(depth)
+    x = depth * math.log(b)
+    # log(b^depth - 1) ~ x dès que b^depth domine largement 1
+    log_powers = x if x > 30 else math.log(math.expm1(x))
+    return math.log(b) + log_powers - math.log(b - 1)
+
+
+def effective_branching_factor(nodes: int, depth: int) -> float:
+    """
+    Facteur de branchement effectif b* tel que b* + b*² + ... + b*^depth = nodes.
+
+    Args:
+        nodes: Nombre de nœuds générés
+        depth: Profondeur de la solution (ou de la recherche)
+
+    Returns:
+        float: b*, ou 0 si la recherche n'a rien généré
+    """
+    if nodes <= 0 or depth <= 0:
+        return 0.0
+    if nodes <= depth:
+        return 1.0
+
+    log_nodes = math.log(nodes)
+    low, high = 1.0, float(nodes)
+    for _ in range(60):
+        mid = (low + high) / 2
+        if _log_geometric_sum(mid, depth) < log_nodes:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+class DifficultyEstimator:
+    """
+    Estime la difficulté d'un niveau en lançant une recherche en poussées bornée.
+
+    Les rapports sont mis en cache par état de départ du niveau.
+    """
+
+    CACHE_SIZE = 512
+
+    def __init__(self, max_nodes: int = 20000, time_limit: float = 2.0):
+        """
+        Args:
+            max_nodes: Budget en nœuds de la recherche sonde
+            time_limit: Budget en secondes de la recherche sonde
+        """
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self._cache: "OrderedDict[tuple, DifficultyReport]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def estimate(self, level) -> DifficultyReport:
+        """
+        Obtient le rapport de difficulté d'un niveau, en le calculant si besoin.
+
+        Args:
+            level: Instance de Level à analyser
+
+        Returns:
+            DifficultyReport du niveau
+        """
+        key = level.state_key()
+        report = self._cache.get(key)
+        if report is not None:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+            return report
+
+        self.cache_misses += 1
+        report = self._probe(level)
+        self._cache[key] = report
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return report
+
+    def record_search(self, level, nodes_expanded: int, elapsed: float,
+                      solution_length: int) -> DifficultyReport:
+        """
+        Enregistre le rapport d'une résolution déjà menée sur le niveau.
+
+        Les générateurs résolvent chaque niveau pour le valider : l'effort de
+        cette résolution donne le score sans relancer de sonde. Un solveur en
+        déplacements développe plus de nœuds qu'une recherche en poussées, le
+        score obtenu est donc un majorant.
+
+        Args:
+            level: Niveau résolu, dans son état de départ
+            nodes_expanded: Nœuds développés par la résolution
+            elapsed: Durée de la résolution en secondes
+            solution_length: Longueur de la solution trouvée
+
+        Returns:
+            DifficultyReport du niveau, mis en cache
+        """
+        effort = SearchEffort(
+            nodes_expanded=nodes_expanded,
+            nodes_generated=nodes_expanded,
+            effective_branching_factor=effective_branching_factor(nodes_expanded, solution_length),
+            solution_pushes=None,
+            deadlock_prunes=0,
+            corral_prunes=0,
+            lower_bound=0,
+            solved=True,
+            exhausted=False,
+            elapsed=elapsed,
+        )
+        report = self._report(effort)
+        key = level.state_key()
+        self._cache[key] = report
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return report
+
+    def get_cached(self, level) -> Optional[DifficultyReport]:
+        """Rapport déjà calculé pour ce niveau, sans lancer de recherche."""
+        return self._cache.get(level.state_key())
+
+    def clear_cache(self):
+        """Vide le cache des rapports."""
+        self._cache.clear()
+
+    def _probe(self, level) -> DifficultyReport:
+        """Lance la recherche sonde et convertit sa télémétrie en rapport."""
+        engine = PushEngine(level)
+        result = engine.search(max_nodes=self.max_nodes, time_limit=self.time_limit)
+        stats = result.stats
+
+        solution_pushes = len(result.pushes) if result.solved else None
+        depth = solution_pushes if result.solved else max(stats.max_depth, result.lower_bound, 1)
+        branching = effective_branching_factor(stats.nodes_generated, depth)
+
+        effort = SearchEffort(
+            nodes_expanded=stats.nodes_expanded,
+            nodes_generated=stats.nodes_generated,
+            effective_branching_factor=branching,
+            solution_pushes=solution_pushes,
+            deadlock_prunes=stats.deadlock_prunes,
+            corral_prunes=stats.corral_prunes,
+            lower_bound=result.lower_bound,
+            solved=result.solved,
+            exhausted=result.exhausted,
+            elapsed=stats.elapsed,
+        )
+        return self._report(effort)
+
+    def _report(self, effort: SearchEffort) -> DifficultyReport:
+        """Convertit l'effort d'une recherche en rapport de difficulté."""
+        estimated_nodes = self._estimate_nodes(effort)
+        throughput = effort.nodes_expanded / effort.elapsed if effort.elapsed > 0 else 0.0
+        predicted_time = estimated_nodes / throughput if throughput > 0 else 0.0
+        if effort.exhausted:
+            # Espace épuisé sans solution : aucun budget n'y changera rien
+            score, category = 100.0, "Unsolvable"
+        else:
+            score = self._score(estimated_nodes)
+            category = self._category(score)
+
+        return DifficultyReport(
+            effort=effort,
+            estimated_nodes=estimated_nodes,
+            score=score,
+            predicted_solve_time=predicted_time,
+            category=category,
+        )
+
+    def _estimate_nodes(self, effort: SearchEffort) -> float:
+        """
+        Nombre de nœuds nécessaire pour résoudre le niveau.
+
+        Mesuré quand la sonde aboutit ; sinon extrapolé avec le facteur de
+        branchement effectif jusqu'à une profondeur au moins égale à la borne
+        inférieure en poussées.
+        """
+        if effort.solved or effort.exhausted:
+            return float(max(effort.nodes_expanded, 1))
+
+        b = max(effort.effective_branching_factor, 1.0)
+        depth = max(effort.lower_bound, 1)
+        if b == 1.0:
+            extrapolated = effort.nodes_expanded + depth
+        else:
+            log_extrapolated = _log_geometric_sum(b, depth)
+            extrapolated = math.exp(min(log_extrapolated, math.log(_MAX_ESTIMATED_NODES)))
+        # Ne jamais estimer moins que ce qui a déjà été dépensé sans succès
+        return min(max(extrapolated, effort.nodes_expanded * 2.0), _MAX_ESTIMATED_NODES)
+
+    @staticmethod
+    def _score(estimated_nodes: float) -> float:
+        """Score 0-100, logarithmique en nombre de nœuds."""
+        score = 100.0 * math.log10(max(estimated_nodes, 1.0)) / math.log10(_SCORE_SATURATION_NODES)
+        return max(0.0, min(100.0, score))
+
+    @staticmethod
+    def _category(score: float) -> str:
+        for bound, name in _CATEGORY_BOUNDS:
+            if score < bound:
+                return name
+        return "Expert"
+
+
+# Estimateur partagé : un seul cache pour tout le processus
+_difficulty_estimator = None
+
+
+def get_difficulty_estimator() -> DifficultyEstimator:
+    """
+    Obtient l'estimateur de difficulté global.
+
+    Returns:
+        DifficultyEstimator: L'instance partagée
+    """
+    global _difficulty_estimator
+    if _difficulty_estimator is None:
+        _difficulty_estimator = DifficultyEstimator()
+    return _difficulty_estimator
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from .algorithm_selector import Algorithm
-import numpy as np
+from .solver_profiler import SolverProfiler
 
 
 class SearchMode(Enum):
@@ -554,7 +554,7 @@ class FeatureExtractor:
             connectivity[target] = free_directions
         return connectivity
         
-    def extract_features(self, state: 'SokolutionState') -> np.ndarray:
+    def extract_features(self, state: 'SokolutionState') -> 'np.ndarray':
         """
         Extrait un vecteur de features complet de l'état.
         
@@ -578,6 +578,7 @@ class FeatureExtractor:
         # 5. Features de connectivité
         features.extend(self._extract_connectivity_features(state))
         
+        import numpy as np
         return np.array(features, dtype=np.float32)
         
     def _extract_basic_features(self, state: 'SokolutionState') -> List[float]:
@@ -817,7 +818,7 @@ class FESSHeuristic:
         # Poids appris/configurés pour les différentes features
         self.feature_weights = self._initialize_feature_weights()
         
-    def _initialize_feature_weights(self) -> np.ndarray:
+    def _initialize_feature_weights(self) -> 'np.ndarray':
         """
         Initialise les poids des features.
         
@@ -827,6 +828,8 @@ class FESSHeuristic:
         # Nombre total de features estimé
         num_features = 15  # À ajuster selon le nombre réel de features
         
+        import numpy as np
+        
         # Poids heuristiques (à affiner empiriquement)
         weights = np.array([
             # Basic features (4)
@@ -867,6 +870,7 @@ class FESSHeuristic:
         weights_trimmed = self.feature_weights[:min_len]
         
         # Produit scalaire pour obtenir la valeur heuristique
+        import numpy as np
         heuristic_value = np.dot(features_trimmed, weights_trimmed)
         
         # S'assurer que la valeur est positive et raisonnable
@@ -881,11 +885,27 @@ class EnhancedSokolutionSolver:
     avancées d'optimisation dans une seule classe unifiée.
     """
     
-    def __init__(self, level, max_states=1000000, time_limit=120.0):
+    def __init__(self, level, max_states=1000000, time_limit=120.0, profile=False,
+                 memory_limit_mb=None, spill_dir=None):
         self.level = level
         self.max_states = max_states
         self.time_limit = time_limit
         
+        # Mode mémoire externe pour A* et glouton (voir external_search) :
+        # frontière et ensemble fermé débordent sur disque au-delà du plafond
+        self.memory_limit_mb = memory_limit_mb
+        self.spill_dir = spill_dir
+        self.external_search = None
+        
+        # Instrumentation par phase (voir solver_profiler), absente par défaut
+        self.profiler = SolverProfiler() if profile else None
+        
+        # Opérations sur la frontière, en attributs pour pouvoir être mesurées
+        self._heappush = heapq.heappush
+        self._heappop = heapq.heappop
+        self._enqueue = deque.append
+        self._dequeue = deque.popleft
+        
         # Composants principaux
         self.hungarian_matcher = HungarianMatcher(level)
         self.deadlock_detector = DeadlockDetector(level)
@@ -923,13 +943,18 @@ class EnhancedSokolutionSolver:
         self.current_algorithm = algorithm
         self.current_mode = mode
         self.start_time = time.time()
+        if self.profiler is not None:
+            self._install_profiler()
         
         if progress_callback:
             level_complexity = len(self.level.boxes) * self.level.width * self.level.height
             progress_callback(f"🔍 Démarrage solver {algorithm.value} (mode {mode.value}) - Complexité: {level_complexity}")
         
         # Sélection de l'algorithme de recherche
-        if algorithm == Algorithm.BFS:
+        if self.memory_limit_mb is not None and algorithm in (
+                Algorithm.ASTAR, Algorithm.GREEDY, Algorithm.BIDIRECTIONAL_GREEDY):
+            solution_moves = self._external_memory_search(algorithm, progress_callback)
+        elif algorithm == Algorithm.BFS:
             solution_moves = self._bfs_search(progress_callback)
         elif algorithm == Algorithm.ASTAR:
             solution_moves = self._astar_search(progress_callback)
@@ -943,6 +968,8 @@ class EnhancedSokolutionSolver:
             raise ValueError(f"Algorithme non supporté: {algorithm}")
         
         solve_time = time.time() - self.start_time
+        if self.profiler is not None:
+            self.profiler.stop()
         
         if solution_moves:
             if progress_callback:
@@ -956,7 +983,8 @@ class EnhancedSokolutionSolver:
                 deadlocks_pruned=self.deadlock_detector.deadlocks_detected,
                 algorithm_used=algorithm,
                 search_mode=mode,
-                memory_peak=self.transposition_table.count,
+                memory_peak=(self.external_search.statistics['peak_memory_records']
+                             if self.external_search else self.transposition_table.count),
                 heuristic_calls=self.heuristic_calls,
                 macro_moves_used=self.macro_moves_used
             )
@@ -974,6 +1002,40 @@ class EnhancedSokolutionSolver:
         self.transposition_table = TranspositionTable()
         self.open_set = []
         self.solution = None
+        self.external_search = None
+    
+    def _install_profiler(self):
+        """Enveloppe les méthodes du chemin critique avec les chronomètres du profileur."""
+        profiler = self.profiler
+        profiler.start()
+        
+        cls = type(self)
+        self._generate_successors = profiler.wrap('successors', cls._generate_successors.__get__(self))
+        self._calculate_heuristic = profiler.wrap('heuristic', cls._calculate_heuristic.__get__(self))
+        
+        detector = self.deadlock_detector
+        detector.is_deadlock = profiler.wrap('deadlock', type(detector).is_deadlock.__get__(detector))
+        
+        table = self.transposition_table
+        table.add = profiler.wrap('transposition', type(table).add.__get__(table))
+        table.contains = profiler.wrap('transposition', type(table).contains.__get__(table))
+        
+        self._heappush = profiler.wrap('heap', heapq.heappush)
+        self._heappop = profiler.wrap('heap', heapq.heappop, frontier=True)
+        self._enqueue = profiler.wrap('heap', deque.append)
+        self._dequeue = profiler.wrap('heap', deque.popleft, frontier=True)
+    
+    def export_profile_trace(self, path: str):
+        """
+        Exporte la dernière résolution profilée au format speedscope.
+        
+        Args:
+            path: Fichier JSON de sortie
+        """
+        if self.profiler is None:
+            raise RuntimeError("Profilage désactivé : créer le solver avec profile=True")
+        name = self.current_algorithm.value if self.current_algorithm else 'solve'
+        self.profiler.export_speedscope(path, name)
     
     def _create_initial_state(self) -> SokolutionState:
         """Crée l'état initial selon le mode de recherche."""
@@ -1052,7 +1114,7 @@ class EnhancedSokolutionSolver:
         self.transposition_table.add(initial_state)
         
         while self.open_set and self._within_limits():
-            current_state = self.open_set.popleft()
+            current_state = self._dequeue(self.open_set)
             self.states_explored += 1
             
             if progress_callback and self.states_explored % 10000 == 0:
@@ -1065,7 +1127,7 @@ class EnhancedSokolutionSolver:
             # Générer les successeurs
             for successor in self._generate_successors(current_state):
                 if not self.transposition_table.contains(successor):
-                    self.open_set.append(successor)
+                    self._enqueue(self.open_set, successor)
                     self.transposition_table.add(successor)
                     self.states_generated += 1
         
@@ -1081,7 +1143,7 @@ class EnhancedSokolutionSolver:
         self.transposition_table.add(initial_state)
         
         while self.open_set and self._within_limits():
-            current_state = heapq.heappop(self.open_set)
+            current_state = self._heappop(self.open_set)
             self.states_explored += 1
             
             if progress_callback and self.states_explored % 10000 == 0:
@@ -1096,7 +1158,7 @@ class EnhancedSokolutionSolver:
                 successor.f_cost = successor.g_cost + successor.h_cost
                 
                 if not self.transposition_table.contains(successor):
-                    heapq.heappush(self.open_set, successor)
+                    self._heappush(self.open_set, successor)
                     self.transposition_table.add(successor)
                     self.states_generated += 1
         
@@ -1112,7 +1174,7 @@ class EnhancedSokolutionSolver:
         self.transposition_table.add(initial_state)
         
         while self.open_set and self._within_limits():
-            current_state = heapq.heappop(self.open_set)
+            current_state = self._heappop(self.open_set)
             self.states_explored += 1
             
             if progress_callback and self.states_explored % 10000 == 0:
@@ -1127,7 +1189,7 @@ class EnhancedSokolutionSolver:
                 successor.f_cost = successor.h_cost  # Greedy: ignorer g_cost
                 
                 if not self.transposition_table.contains(successor):
-                    heapq.heappush(self.open_set, successor)
+                    self._heappush(self.open_set, successor)
                     self.transposition_table.add(successor)
                     self.states_generated += 1
         
@@ -1199,6 +1261,20 @@ class EnhancedSokolutionSolver:
         # Une vraie implémentation bidirectionnelle nécessiterait threading
         return self._greedy_search(progress_callback)
     
+    def _external_memory_search(self, algorithm: Algorithm,
+                                progress_callback: Optional[Callable] = None) -> Optional[List[str]]:
+        """A* ou glouton à mémoire bornée, frontière et ensemble fermé sur disque."""
+        # Import tardif : external_search dépend de numpy, inutile en mémoire
+        from .external_search import ExternalMemorySearch
+        
+        self.external_search = ExternalMemorySearch(
+            self,
+            memory_limit_mb=self.memory_limit_mb,
+            greedy=algorithm != Algorithm.ASTAR,
+            spill_dir=self.spill_dir
+        )
+        return self.external_search.search(progress_callback)
+    
     def _generate_successors(self, state: SokolutionState) -> List[SokolutionState]:
         """Génère tous les états successeurs valides."""
         successors = []
@@ -1272,7 +1348,7 @@ class EnhancedSokolutionSolver:
         deadlock_stats = self.deadlock_detector.get_statistics()
         table_stats = self.transposition_table.get_statistics()
         
-        return {
+        statistics = {
             'search_statistics': {
                 'states_explored': self.states_explored,
                 'states_generated': self.states_generated,
@@ -1288,4 +1364,9 @@ class EnhancedSokolutionSolver:
                 'max_states': self.max_states,
                 'time_limit': self.time_limit
             }
-        }
\ No newline at end of file
+        }
+        if self.profiler is not None:
+            statistics['profiling'] = self.profiler.get_statistics(self.states_explored)
+        if self.external_search is not None:
+            statistics['external_memory'] = dict(self.external_search.statistics)
+        return statistics
\ No newline at end of file
@@ -0,0 +1,363 @@
+"""
+Recherche à mémoire bornée avec débordement de la frontière sur disque.
+
+A* et la recherche gloutonne d'``EnhancedSokolutionSolver`` gardent en RAM
+un tas de ``SokolutionState`` et une table de transposition : c'est ce qui
+limite la taille des niveaux abordables. Ce module implémente un mode à
+mémoire externe :
+
+- chaque nœud est un enregistrement de largeur fixe (clé = position du
+  joueur et cases des caisses triées en uint16, coût g, dernier coup) ;
+- la frontière est rangée par paquets de même coût f (ou h en glouton) ;
+  tant qu'elle tient dans le budget mémoire, elle reste en RAM, sinon les
+  paquets les plus lointains sont écrits en runs triés, relus par memmap ;
+- la détection des doublons est différée et faite par lots : un lot
+  est dédoublonné en interne puis confronté, par recherche dichotomique,
+  aux runs triés de l'ensemble fermé, fusionnés au fil de l'eau comme dans
+  un LSM-tree pour en garder un nombre logarithmique ;
+- le chemin est reconstruit en défaisant les coups depuis le but, chaque
+  enregistrement fermé donnant le coup qui y a mené.
+
+Le plafond de RAM est explicite (``memory_limit_mb``) : seuls les paquets en
+cours et les lots de travail y vivent, le reste est sur disque.
+"""
+
+import os
+import struct
+import tempfile
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+_MOVES = ('UP', 'DOWN', 'LEFT', 'RIGHT')
+_DELTAS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_MOVE_INDEX = {move: index for index, move in enumerate(_MOVES)}
+_PUSH_FLAG = 4
+_ROOT_MOVE = 255
+
+# Coût approximatif d'un enregistrement en RAM sous forme de tuple Python,
+# en plus de sa largeur fixe
+_PYTHON_RECORD_OVERHEAD = 120
+
+
+@dataclass
+class _Bucket:
+    """Paquet de frontière de même priorité : une partie en RAM, des runs sur disque."""
+    records: List[Tuple[bytes, int, int]] = field(default_factory=list)
+    runs: List[Tuple[str, int]] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.records or self.runs)
+
+
+class ExternalMemorySearch:
+    """
+    A* ou recherche gloutonne dont la frontière et l'ensemble fermé vivent sur disque.
+
+    Le solver fournit le niveau, la génération de successeurs (avec sa
+    détection de deadlocks), l'heuristique et les limites d'états et de temps.
+    """
+
+    def __init__(self, solver, memory_limit_mb: float = 256.0, greedy: bool = False,
+                 spill_dir: Optional[str] = None):
+        """
+        Args:
+            solver: EnhancedSokolutionSolver hôte
+            memory_limit_mb: Plafond de RAM pour les enregistrements de recherche
+            greedy: Si True, priorité = h (glouton) ; sinon f = g + h (A*)
+            spill_dir: Dossier des fichiers temporaires (par défaut celui du système)
+        """
+        self.solver = solver
+        self.level = solver.level
+        self.greedy = greedy
+        self.spill_dir = spill_dir
+        self.memory_limit_mb = memory_limit_mb
+
+        self.width = self.level.width
+        self.box_count = len(self.level.boxes)
+        # Octet final non nul : NumPy retire les octets nuls en fin de chaîne 'S'
+        self._key_format = f'>{self.box_count + 1}HB'
+        self.dtype = np.dtype([
+            ('key', f'S{2 * (self.box_count + 1) + 1}'),
+            ('g', '<u4'),
+            ('move', 'u1'),
+        ])
+        record_bytes = self.dtype.itemsize + _PYTHON_RECORD_OVERHEAD
+        self.max_memory_records = max(64, int(memory_limit_mb * 1024 * 1024) // record_bytes)
+        # Taille des lots de travail (fusion, confrontation à l'ensemble fermé)
+        self.chunk_records = max(16, self.max_memory_records // 4)
+
+        self._goal_boxes = frozenset(self.level.targets)
+        self._buckets: Dict[int, _Bucket] = {}
+        self._closed_runs: List[np.memmap] = []
+        self._directory: Optional[str] = None
+        self._file_counter = 0
+        self._in_memory = 0
+
+        self.statistics = {
+            'memory_limit_mb': memory_limit_mb,
+            'max_memory_records': self.max_memory_records,
+            'peak_memory_records': 0,
+            'spilled_records': 0,
+            'runs_written': 0,
+            'duplicates_removed': 0,
+            'closed_records': 0,
+            'disk_bytes_peak': 0,
+        }
+        self._disk_bytes = 0
+
+    # ------------------------------------------------------------------
+    # Encodage des états
+    # ------------------------------------------------------------------
+
+    def encode(self, player: Tuple[int, int], boxes) -> bytes:
+        """Clé de largeur fixe : case du joueur puis cases des caisses triées."""
+        width = self.width
+        cells = sorted(y * width + x for x, y in boxes)
+        return struct.pack(self._key_format, player[1] * width + player[0], *cells, 1)
+
+    def decode(self, key: bytes):
+        """Inverse d'encode : (position du joueur, frozenset des caisses)."""
+        cells = struct.unpack(self._key_format, key)[:-1]
+        width = self.width
+        player = (cells[0] % width, cells[0] // width)
+        boxes = frozenset((cell % width, cell // width) for cell in cells[1:])
+        return player, boxes
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+
+    def search(self, progress_callback: Optional[Callable] = None) -> Optional[List[str]]:
+        """
+        Lance la recherche.
+
+        Returns:
+            Liste des coups de la solution, ou None
+        """
+        from .enhanced_sokolution_solver import SokolutionState
+
+        solver = self.solver
+        with tempfile.TemporaryDirectory(prefix='pysokoban_search_', dir=self.spill_dir) as directory:
+            self._directory = directory
+            try:
+                root = solver._create_initial_state()
+                h = solver._calculate_heuristic(root)
+                self._push(h, self.encode(root.player_pos, root.boxes), 0, _ROOT_MOVE)
+
+                while self._buckets and solver._within_limits():
+                    priority = min(self._buckets)
+                    chunk = self._take_chunk(priority)
+                    chunk = self._remove_duplicates(chunk)
+                    if len(chunk) == 0:
+                        continue
+                    self._add_closed(chunk)
+
+                    for key, g, move in zip(chunk['key'].tolist(), chunk['g'].tolist(),
+                                            chunk['move'].tolist()):
+                        player, boxes = self.decode(key)
+                        solver.states_explored += 1
+
+                        if progress_callback and solver.states_explored % 10000 == 0:
+                            progress_callback(
+                                f"Mémoire externe: {solver.states_explored} états, "
+                                f"{self.statistics['spilled_records']} enregistrements sur disque")
+
+                        if boxes == self._goal_boxes:
+                            return self._reconstruct(key, move)
+
+                        state = SokolutionState(player, boxes, g_cost=g)
+                        for successor in solver._generate_successors(state):
+                            successor_h = solver._calculate_heuristic(successor)
+                            successor_g = g + 1
+                            successor_move = _MOVE_INDEX[successor.move]
+                            if successor.boxes is not boxes:
+                                successor_move |= _PUSH_FLAG
+                            self._push(successor_h if self.greedy else successor_g + successor_h,
+                                       self.encode(successor.player_pos, successor.boxes),
+                                       successor_g, successor_move)
+                            solver.states_generated += 1
+
+                        if not solver._within_limits():
+                            return None
+                return None
+            finally:
+                # Libérer les memmaps avant la suppression du dossier
+                self._closed_runs = []
+                self._buckets = {}
+                self._in_memory = 0
+                self._directory = None
+
+    def _push(self, priority: int, key: bytes, g: int, move: int):
+        """Ajoute un nœud à la frontière, en débordant sur disque si besoin."""
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = _Bucket()
+        bucket.records.append((key, g, move))
+        self._in_memory += 1
+        if self._in_memory > self.statistics['peak_memory_records']:
+            self.statistics['peak_memory_records'] = self._in_memory
+        if self._in_memory > self.max_memory_records:
+            self._spill()
+
+    def _spill(self):
+        """Écrit sur disque les paquets les plus lointains jusqu'à libérer la moitié du budget."""
+        target = self.max_memory_records // 2
+        for priority in sorted(self._buckets, reverse=True):
+            if self._in_memory <= target:
+                break
+            bucket = self._buckets[priority]
+            if not bucket.records:
+                continue
+            count = len(bucket.records)
+            run = self._unique(np.array(bucket.records, dtype=self.dtype))
+            bucket.records = []
+            self._in_memory -= count
+            bucket.runs.append((self._write_run(run), len(run)))
+            self.statistics['spilled_records'] += len(run)
+
+    def _take_chunk(self, priority: int) -> np.ndarray:
+        """Retire un lot du paquet de priorité donnée : d'abord un run disque, puis la RAM."""
+        bucket = self._buckets[priority]
+        if bucket.runs:
+            path, count = bucket.runs.pop()
+            run = np.memmap(path, dtype=self.dtype, mode='r', shape=(count,))
+            chunk = np.array(run)
+            del run
+            self._delete_file(path)
+        else:
+            chunk = np.array(bucket.records, dtype=self.dtype)
+            self._in_memory -= len(bucket.records)
+            bucket.records = []
+        if not bucket:
+            del self._buckets[priority]
+        return chunk
+
+    # ------------------------------------------------------------------
+    # Détection différée des doublons
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _unique(records: np.ndarray) -> np.ndarray:
+        """Trie par clé et garde, pour chaque clé, l'enregistrement de plus petit g."""
+        if len(records) == 0:
+            return records
+        records = records[np.lexsort((records['g'], records['key']))]
+        keep = np.ones(len(records), dtype=bool)
+        keep[1:] = records['key'][1:] != records['key'][:-1]
+        return records[keep]
+
+    def _remove_duplicates(self, chunk: np.ndarray) -> np.ndarray:
+        """Dédoublonne un lot puis retire les états déjà fermés."""
+        before = len(chunk)
+        chunk = self._unique(chunk)
+        for run in self._closed_runs:
+            if len(chunk) == 0:
+                break
+            found = self._contains(run, chunk['key'])
+            chunk = chunk[~found]
+        self.statistics['duplicates_removed'] += before - len(chunk)
+        return chunk
+
+    @staticmethod
+    def _contains(run: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        """Masque des clés présentes dans un run trié."""
+        index = np.searchsorted(run['key'], keys)
+        index[index == len(run)] = len(run) - 1
+        return run['key'][index] == keys
+
+    def _add_closed(self, chunk: np.ndarray):
+        """Ajoute un lot trié à l'ensemble fermé, en fusionnant les runs de taille voisine."""
+        path = self._write_run(chunk)
+        self._closed_runs.append(np.memmap(path, dtype=self.dtype, mode='r', shape=(len(chunk),)))
+        self.statistics['closed_records'] += len(chunk)
+
+        runs = self._closed_runs
+        while len(runs) >= 2 and len(runs[-1]) >= len(runs[-2]):
+            newer, older = runs.pop(), runs.pop()
+            runs.append(self._merge(older, newer))
+
+    def _merge(self, first: np.memmap, second: np.memmap) -> np.memmap:
+        """Fusionne deux runs triés par lots bornés, sans les charger entiers."""
+        total = len(first) + len(second)
+        path = self._new_path()
+        out = np.memmap(path, dtype=self.dtype, mode='w+', shape=(total,))
+        size = self.chunk_records
+        i = j = k = 0
+        while i < len(first) or j < len(second):
+            a = first[i:i + size]
+            b = second[j:j + size]
+            if len(a) == 0 or len(b) == 0:
+                part = np.array(a if len(a) else b)
+            else:
+                bound = min(a['key'][-1], b['key'][-1])
+                a = a[:np.searchsorted(a['key'], bound, side='right')]
+                b = b[:np.searchsorted(b['key'], bound, side='right')]
+                part = np.concatenate([a, b])
+                part = part[np.argsort(part['key'], kind='stable')]
+            out[k:k + len(part)] = part
+            i += len(a)
+            j += len(b)
+            k += len(part)
+        out.flush()
+        paths = (first.filename, second.filename)
+        del out, first, second, a, b
+        for run_path in paths:
+            self._delete_file(run_path)
+        self._disk_bytes += total * self.dtype.itemsize
+        self._update_disk_peak()
+        return np.memmap(path, dtype=self.dtype, mode='r', shape=(total,))
+
+    def _lookup_move(self, key: bytes) -> int:
+        """Coup ayant mené à un état fermé."""
+        keys = np.array([key], dtype=self.dtype['key'])
+        for run in self._closed_runs:
+            index = int(np.searchsorted(run['key'], keys)[0])
+            if index < len(run) and run['key'][index] == key:
+                return int(run['move'][index])
+        raise KeyError("état absent de l'ensemble fermé")
+
+    def _reconstruct(self, key: bytes, move: int) -> List[str]:
+        """Remonte du but à la racine en défaisant les coups."""
+        moves = []
+        while move != _ROOT_MOVE:
+            direction = move & 3
+            moves.append(_MOVES[direction])
+            dx, dy = _DELTAS[direction]
+            (px, py), boxes = self.decode(key)
+            if move & _PUSH_FLAG:
+                boxes = (boxes - {(px + dx, py + dy)}) | {(px, py)}
+            key = self.encode((px - dx, py - dy), boxes)
+            move = self._lookup_move(key)
+        moves.reverse()
+        return moves
+
+    # ------------------------------------------------------------------
+    # Fichiers
+    # ------------------------------------------------------------------
+
+    def _new_path(self) -> str:
+        self._file_counter += 1
+        return os.path.join(self._directory, f'run_{self._file_counter:06d}.dat')
+
+    def _write_run(self, records: np.ndarray) -> str:
+        """Écrit un run trié dans un fichier mappé en mémoire."""
+        path = self._new_path()
+        out = np.memmap(path, dtype=self.dtype, mode='w+', shape=(len(records),))
+        out[:] = records
+        out.flush()
+        del out
+        self.statistics['runs_written'] += 1
+        self._disk_bytes += len(records) * self.dtype.itemsize
+        self._update_disk_peak()
+        return path
+
+    def _delete_file(self, path: str):
+        self._disk_bytes -= os.path.getsize(path)
+        os.remove(path)
+
+    def _update_disk_peak(self):
+        if self._disk_bytes > self.statistics['disk_bytes_peak']:
+            self.statistics['disk_bytes_peak'] = self._disk_bytes
@@ -0,0 +1,109 @@
+"""
+Analyse ML des résolutions en arrière-plan.
+
+La collecte des métriques ML et la génération du rapport ne font pas partie
+de la résolution : le contrôleur confie chaque solution à un
+``MLAnalysisWorker``, qui les traite dans un thread dédié, une à une, sur
+une copie privée du niveau. Le résultat est remis à un callback.
+
+Les métriques et le rapport sont des ``LazySections`` : seules les sections
+utiles au journal d'entraînement sont calculées par le worker, les autres
+le sont à leur lecture. Aucun fichier de rapport n'est écrit sans formats
+d'export explicites.
+"""
+
+import copy
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.background_worker import BackgroundWorker
+
+from .ml_metrics_collector import MLMetricsCollector
+from .ml_report_generator import MLReportGenerator
+
+
+class MLAnalysisWorker:
+    """File d'analyses ML traitée par un thread en arrière-plan."""
+
+    def __init__(self, collector: Optional[MLMetricsCollector] = None,
+                 report_generator: Optional[MLReportGenerator] = None):
+        """
+        Args:
+            collector: Collecteur de métriques (créé à la première analyse si None)
+            report_generator: Générateur de rapports (créé au premier rapport si None)
+        """
+        self.collector = collector
+        self.report_generator = report_generator
+
+        self._worker = BackgroundWorker(self._run, name="ml-analysis",
+                                        error_message="Erreur lors de l'analyse ML")
+        self.completed = 0
+
+    def submit(self, level, solution_data, solver_stats: Dict[str, Any],
+               on_done: Optional[Callable[[Any, Any], None]] = None,
+               metric_sections: Optional[List[str]] = None,
+               generate_report: bool = False,
+               report_sections: Optional[List[str]] = None,
+               export_formats: tuple = ()):
+        """
+        Programme l'analyse d'une solution.
+
+        Le niveau est copié tout de suite : il peut être joué pendant l'analyse.
+
+        Args:
+            level: Niveau dans sa position de départ
+            solution_data: Données de solution du solver
+            solver_stats: Statistiques détaillées du solver
+            on_done: Appelé depuis le worker avec (métriques, rapport ou None)
+            metric_sections: Sections de métriques à calculer tout de suite
+            generate_report: Si générer un rapport
+            report_sections: Sections du rapport à calculer tout de suite
+            export_formats: Formats de fichiers du rapport à écrire
+        """
+        job = (copy.deepcopy(level), solution_data, solver_stats, on_done,
+               metric_sections, generate_report, report_sections, export_formats)
+        self._worker.submit(job)
+
+    def analyze(self, level, solution_data, solver_stats: Dict[str, Any],
+                metric_sections: Optional[List[str]] = None,
+                generate_report: bool = False,
+                report_sections: Optional[List[str]] = None,
+                export_formats: tuple = ()):
+        """
+        Analyse une solution dans le thread appelant.
+
+        Returns:
+            tuple: (métriques, rapport ou None)
+        """
+        if self.collector is None:
+            self.collector = MLMetricsCollector()
+        metrics = self.collector.collect_solving_metrics(level, solution_data, solver_stats,
+                                                         sections=metric_sections)
+        report = None
+        if generate_report:
+            if self.report_generator is None:
+                self.report_generator = MLReportGenerator()
+            report = self.report_generator.generate_comprehensive_report(
+                level, solution_data, metrics,
+                sections=report_sections, export_formats=export_formats
+            )
+        return metrics, report
+
+    def wait_idle(self):
+        """Attend que toutes les analyses programmées soient terminées."""
+        self._worker.wait_idle()
+
+    def pending(self) -> int:
+        """Nombre approximatif d'analyses en attente."""
+        return self._worker.pending()
+
+    def stop(self):
+        """Abandonne les analyses en attente et arrête le thread du worker."""
+        self._worker.stop()
+
+    def _run(self, job, generation):
+        """Thread du worker : traite une analyse."""
+        level, solution_data, solver_stats, on_done, *options = job
+        metrics, report = self.analyze(level, solution_data, solver_stats, *options)
+        self.completed += 1
+        if on_done is not None:
+            on_done(metrics, report)
@@ -3,15 +3,45 @@ Collecteur de métriques ML pour l'analyse des performances de résolution Sokob
 
 Ce module implémente la collection complète de métriques pour l'apprentissage
 automatique et l'analyse de performance selon le plan de refactoring.
+
+Les métriques sont rendues sous forme de ``LazySections`` : chaque section
+n'est calculée qu'à sa première lecture. Les analyses qui ne dépendent que
+de la position de départ (structure du niveau, distribution spatiale) sont
+mises en cache par empreinte de niveau et ne sont faites qu'une fois par
+niveau.
 """
 
 import math
+import threading
 import time
-from typing import Dict, List, Tuple, Any, Set, Optional
-from collections import Counter, defaultdict
+from collections.abc import Mapping
+from typing import Dict, List, Tuple, Any, Set, Optional, Callable
+from collections import Counter, OrderedDict, defaultdict, deque
 import numpy as np
 from dataclasses import dataclass
 
+from src.core.constants import WALL
+from .telemetry_sink import TelemetrySink, DEFAULT_BUFFER_SIZE, get_telemetry_sink, level_hash
+
+
+# Sections de métriques, dans l'ordre des exports
+METRIC_SECTIONS = (
+    'basic_metrics',
+    'algorithm_metrics',
+    'level_structure',
+    'movement_analysis',
+    'spatial_analysis',
+    'correlation_analysis',
+    'solution_quality',
+    'ml_features',
+)
+
+# Nombre d'analyses structurelles de niveau gardées en cache
+STRUCTURE_CACHE_SIZE = 64
+
+NEIGHBOUR_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+MOVE_OFFSETS = {'UP': (0, -1), 'DOWN': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+
 
 @dataclass
 class MovementPattern:
@@ -33,6 +63,63 @@ class SpatialDistribution:
     symmetry_score: float
 
 
+class LazySections(Mapping):
+    """
+    Dictionnaire en lecture seule dont les sections sont calculées à la demande.
+    
+    Chaque section est une fonction sans argument, appelée à la première
+    lecture puis gardée. Une section peut en lire d'autres (le verrou est
+    réentrant) ; itérer ou exporter calcule toutes les sections.
+    """
+    
+    def __init__(self, builders: Dict[str, Callable[[], Any]], values: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            builders: Nom de section -> fonction qui la calcule
+            values: Sections déjà connues
+        """
+        self._values = dict(values or {})
+        self._builders = dict(builders)
+        self._order = list(self._values) + [name for name in self._builders if name not in self._values]
+        self._lock = threading.RLock()
+    
+    def __getitem__(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        builder = self._builders[name]
+        with self._lock:
+            if name not in self._values:
+                self._values[name] = builder()
+            return self._values[name]
+    
+    def __iter__(self):
+        return iter(self._order)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def is_computed(self, name: str) -> bool:
+        """Indique si une section a déjà été calculée."""
+        return name in self._values
+    
+    def computed_sections(self) -> List[str]:
+        """Sections déjà calculées, dans l'ordre."""
+        return [name for name in self._order if name in self._values]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Calcule toutes les sections et les rend sous forme de dictionnaires simples."""
+        return {name: _plain(self[name]) for name in self._order}
+
+
+def _plain(value):
+    """Convertit récursivement les LazySections en dictionnaires."""
+    if isinstance(value, LazySections):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
 class MLMetricsCollector:
     """
     Collecteur de métriques ML pour l'analyse avancée des performances Sokoban.
@@ -45,66 +132,89 @@ class MLMetricsCollector:
     - Corrélations et apprentissage
     """
     
-    def __init__(self):
-        self.collected_metrics_history = []
+    def __init__(self, sink: Optional[TelemetrySink] = None, history_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            sink: Journal des lignes d'entraînement (par défaut data/telemetry/ml_metrics.jsonl)
+            history_size: Nombre de collectes complètes gardées en mémoire
+        """
+        self.collected_metrics_history = deque(maxlen=history_size)
+        self.telemetry_sink = sink if sink is not None else get_telemetry_sink('ml_metrics')
+        self.total_collections = 0
+        self._success_totals = {'count': 0, 'solve_time': 0.0, 'moves_count': 0,
+                                'states_explored': 0}
+        self._algorithms_used = set()
         self.movement_pattern_library = {}
-        self.level_complexity_cache = {}
+        
+        # Analyses par niveau : (empreinte, section) -> résultat, LRU borné
+        self.level_complexity_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._interior_memo = (None, None)
     
-    def collect_solving_metrics(self, level, solution_data, solver_stats) -> Dict[str, Any]:
+    def collect_solving_metrics(self, level, solution_data, solver_stats,
+                                sections: Optional[List[str]] = None) -> LazySections:
         """
-        Collecte complète de toutes les métriques pour une résolution.
+        Collecte les métriques d'une résolution.
+        
+        Les sections sont calculées à leur première lecture ; seules les
+        features ML (et les sections dont elles dépendent) le sont tout de
+        suite, pour le journal d'entraînement.
         
         Args:
-            level: Instance du niveau résolu
+            level: Niveau dans sa position de départ (non modifié ensuite)
             solution_data: Données de solution du solver
             solver_stats: Statistiques détaillées du solver
+            sections: Sections supplémentaires à calculer immédiatement
             
         Returns:
-            Dict: Métriques complètes organisées par catégorie
+            LazySections: Métriques organisées par catégorie (METRIC_SECTIONS)
         """
-        # Métriques de base
-        basic_metrics = self._collect_basic_metrics(solution_data, solver_stats)
-        
-        # Métriques algorithmiques avancées
-        algorithm_metrics = self._collect_algorithm_metrics(solution_data, solver_stats)
-        
-        # Analyse de la structure du niveau
-        level_structure = self._analyze_level_structure(level)
-        
-        # Analyse des patterns de mouvement
-        movement_analysis = self._analyze_movement_patterns(solution_data.moves, level)
-        
-        # Distribution spatiale
-        spatial_analysis = self._analyze_spatial_distribution(level)
-        
-        # Corrélations structure-performance
-        correlation_analysis = self._analyze_structure_performance_correlation(
-            level, solution_data, level_structure
-        )
-        
-        # Métriques de qualité de solution
-        solution_quality = self._analyze_solution_quality(solution_data, level)
-        
-        # Compilation des métriques complètes
-        complete_metrics = {
-            'timestamp': time.time(),
-            'basic_metrics': basic_metrics,
-            'algorithm_metrics': algorithm_metrics,
-            'level_structure': level_structure,
-            'movement_analysis': movement_analysis,
-            'spatial_analysis': spatial_analysis,
-            'correlation_analysis': correlation_analysis,
-            'solution_quality': solution_quality,
-            'ml_features': self._extract_ml_features(
-                basic_metrics, algorithm_metrics, level_structure, 
-                movement_analysis, spatial_analysis
+        level_id = level_hash(level)
+        metrics = None
+        
+        def features():
+            return self._extract_ml_features(
+                metrics['basic_metrics'], metrics['algorithm_metrics'], metrics['level_structure'],
+                metrics['movement_analysis'], metrics['spatial_analysis']
             )
+        
+        builders = {
+            'basic_metrics': lambda: self._collect_basic_metrics(solution_data, solver_stats),
+            'algorithm_metrics': lambda: self._collect_algorithm_metrics(solution_data, solver_stats),
+            'level_structure': lambda: self._cached_analysis(
+                level_id, 'level_structure', self._analyze_level_structure, level),
+            'movement_analysis': lambda: self._analyze_movement_patterns(solution_data.moves, level),
+            'spatial_analysis': lambda: self._cached_analysis(
+                level_id, 'spatial_analysis', self._analyze_spatial_distribution, level),
+            'correlation_analysis': lambda: self._analyze_structure_performance_correlation(
+                level, solution_data, metrics['level_structure']),
+            'solution_quality': lambda: self._analyze_solution_quality(solution_data, level),
+            'ml_features': features
         }
+        metrics = LazySections(builders, {'timestamp': time.time(), 'level_hash': level_id})
+        for name in sections or ():
+            metrics[name]
         
         # Ajouter à l'historique
-        self.collected_metrics_history.append(complete_metrics)
+        self._record_metrics(metrics)
         
-        return complete_metrics
+        return metrics
+    
+    def _cached_analysis(self, level_id: str, name: str, analyze: Callable[[Any], Dict[str, Any]], level):
+        """Analyse d'un niveau mise en cache par empreinte (LRU de STRUCTURE_CACHE_SIZE entrées)."""
+        key = (level_id, name)
+        cache = self.level_complexity_cache
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        
+        result = analyze(level)
+        with self._cache_lock:
+            cache[key] = result
+            while len(cache) > STRUCTURE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
     
     def _collect_basic_metrics(self, solution_data, solver_stats) -> Dict[str, Any]:
         """Collecte les métriques de performance de base."""
@@ -150,13 +260,8 @@ class MLMetricsCollector:
         }
     
     def _analyze_level_structure(self, level) -> Dict[str, Any]:
-        """Analyse approfondie de la structure du niveau."""
-        # Utiliser le cache si disponible
-        level_key = self._generate_level_key(level)
-        if level_key in self.level_complexity_cache:
-            return self.level_complexity_cache[level_key]
-        
-        structure_analysis = {
+        """Analyse approfondie de la structure du niveau (mise en cache par l'appelant)."""
+        return {
             'basic_properties': {
                 'width': level.width,
                 'height': level.height,
@@ -173,10 +278,6 @@ class MLMetricsCollector:
             'space_distribution': self._analyze_space_distribution(level),
             'topological_features': self._extract_topological_features(level)
         }
-        
-        # Mettre en cache
-        self.level_complexity_cache[level_key] = structure_analysis
-        return structure_analysis
     
     def _analyze_movement_patterns(self, moves: List[str], level) -> Dict[str, Any]:
         """Analyse détaillée des patterns de mouvement."""
@@ -228,7 +329,7 @@ class MLMetricsCollector:
     def _calculate_wall_density(self, level) -> float:
         """Calcule la densité de murs dans le niveau."""
         total_cells = level.width * level.height
-        wall_count = sum(1 for y in range(level.height) for x in range(level.width) if level.is_wall(x, y))
+        wall_count = sum(row.count(WALL) for row in level.map_data)
         return wall_count / total_cells
     
     def _calculate_geometric_complexity(self, level) -> Dict[str, float]:
@@ -486,61 +587,532 @@ class MLMetricsCollector:
     
     # Méthodes utilitaires supplémentaires
     
-    def _generate_level_key(self, level) -> str:
-        """Génère une clé unique pour un niveau (pour le cache)."""
-        # Utiliser une représentation simplifiée du niveau
-        walls_str = ''.join('1' if level.is_wall(x, y) else '0' 
-                           for y in range(level.height) 
-                           for x in range(level.width))
-        boxes_str = ''.join(f"{x},{y};" for x, y in sorted(level.boxes))
-        targets_str = ''.join(f"{x},{y};" for x, y in sorted(level.targets))
+    def _record_metrics(self, metrics: LazySections):
+        """Garde une collecte en mémoire, cumule ses totaux et journalise sa ligne d'entraînement."""
+        self.collected_metrics_history.append(metrics)
+        self.total_collections += 1
         
-        return f"{level.width}x{level.height}_{hash(walls_str + boxes_str + targets_str)}"
+        basic = metrics['basic_metrics']
+        if basic['moves_count'] > 0:
+            totals = self._success_totals
+            totals['count'] += 1
+            totals['solve_time'] += basic['solve_time']
+            totals['moves_count'] += basic['moves_count']
+            totals['states_explored'] += basic['states_explored']
+            self._algorithms_used.add(basic['algorithm_used'])
+        
+        self.telemetry_sink.record({
+            'timestamp': metrics['timestamp'],
+            'level_hash': metrics['level_hash'],
+            'features': metrics['ml_features'],
+            'labels': {
+                'solve_time': basic['solve_time'],
+                'moves_count': basic['moves_count'],
+                'success': basic['moves_count'] > 0,
+                'algorithm_used': basic['algorithm_used']
+            }
+        })
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Obtient un résumé des métriques collectées."""
-        if not self.collected_metrics_history:
+        if not self.total_collections:
             return {'message': 'Aucune métrique collectée'}
         
-        # Calculer des moyennes et statistiques
-        successful_metrics = [m for m in self.collected_metrics_history 
-                             if m['basic_metrics']['moves_count'] > 0]
-        
-        if not successful_metrics:
+        # Moyennes sur les totaux cumulés depuis le début de la session
+        totals = self._success_totals
+        count = totals['count']
+        if not count:
             return {'message': 'Aucune résolution réussie'}
         
-        avg_solve_time = sum(m['basic_metrics']['solve_time'] for m in successful_metrics) / len(successful_metrics)
-        avg_moves = sum(m['basic_metrics']['moves_count'] for m in successful_metrics) / len(successful_metrics)
-        avg_states = sum(m['basic_metrics']['states_explored'] for m in successful_metrics) / len(successful_metrics)
-        
         return {
-            'total_collections': len(self.collected_metrics_history),
-            'successful_solves': len(successful_metrics),
+            'total_collections': self.total_collections,
+            'successful_solves': count,
             'averages': {
-                'solve_time': avg_solve_time,
-                'moves_count': avg_moves,
-                'states_explored': avg_states
+                'solve_time': totals['solve_time'] / count,
+                'moves_count': totals['moves_count'] / count,
+                'states_explored': totals['states_explored'] / count
             },
-            'algorithms_used': list(set(m['basic_metrics']['algorithm_used'] for m in successful_metrics)),
+            'algorithms_used': list(self._algorithms_used),
             'patterns_learned': len(self.movement_pattern_library)
         }
     
-    def export_training_data(self, filepath: str):
-        """Exporte les données pour l'entraînement ML."""
-        training_data = []
-        
-        for metrics in self.collected_metrics_history:
-            if 'ml_features' in metrics:
-                training_data.append({
-                    'features': metrics['ml_features'],
-                    'labels': {
-                        'solve_time': metrics['basic_metrics']['solve_time'],
-                        'moves_count': metrics['basic_metrics']['moves_count'],
-                        'success': metrics['basic_metrics']['moves_count'] > 0,
-                        'algorithm_used': metrics['basic_metrics']['algorithm_used']
-                    }
-                })
-        
-        import json
-        with open(filepath, 'w') as f:
-            json.dump(training_data, f, indent=2)
\ No newline at end of file
+    def export_training_data(self, filepath: str) -> int:
+        """
+        Exporte les données pour l'entraînement ML.
+        
+        Les lignes sont relues une à une dans le journal, archives comprises.
+        
+        Returns:
+            int: Nombre de lignes exportées
+        """
+        def training_row(entry):
+            if 'features' not in entry:
+                return None
+            return {'features': entry['features'], 'labels': entry['labels']}
+        
+        return self.telemetry_sink.export(filepath, transform=training_row)    
+    # Géométrie du niveau
+    
+    def _interior_cells(self, level) -> Set[Tuple[int, int]]:
+        """Cases de sol accessibles depuis le joueur sans tenir compte des caisses."""
+        key = (level.layout_key(), tuple(level.player_pos))
+        memo_key, cells = self._interior_memo
+        if memo_key == key:
+            return cells
+        
+        start = tuple(level.player_pos)
+        cells = {start}
+        stack = [start]
+        while stack:
+            x, y = stack.pop()
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                cell = (x + dx, y + dy)
+                if cell not in cells and not level.is_wall(*cell):
+                    cells.add(cell)
+                    stack.append(cell)
+        
+        self._interior_memo = (key, cells)
+        return cells
+    
+    def _floor_degrees(self, level) -> Dict[Tuple[int, int], int]:
+        """Nombre de voisins de sol de chaque case intérieure."""
+        cells = self._interior_cells(level)
+        return {(x, y): sum((x + dx, y + dy) in cells for dx, dy in NEIGHBOUR_OFFSETS)
+                for x, y in cells}
+    
+    def _calculate_free_area(self, level) -> int:
+        """Nombre de cases de sol intérieures."""
+        return len(self._interior_cells(level))
+    
+    def _calculate_level_perimeter(self, level) -> int:
+        """Nombre d'arêtes entre une case intérieure et un mur."""
+        return sum(4 - degree for degree in self._floor_degrees(level).values())
+    
+    def _calculate_edge_roughness(self, level) -> float:
+        """Excès du périmètre sur celui d'un carré de même aire (0 pour un carré)."""
+        area = self._calculate_free_area(level)
+        perimeter = self._calculate_level_perimeter(level)
+        return max(0.0, perimeter / (4 * math.sqrt(area)) - 1.0) if area else 0.0
+    
+    def _calculate_fragmentation_index(self, level) -> float:
+        """Part des cases intérieures qui coupent le niveau en deux (points d'articulation)."""
+        area = self._calculate_free_area(level)
+        articulation_points, _ = self._articulation_points_and_bridges(self._build_connectivity_graph(level))
+        return len(articulation_points) / area if area else 0.0
+    
+    def _build_connectivity_graph(self, level) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """Graphe d'adjacence des cases intérieures."""
+        cells = self._interior_cells(level)
+        return {(x, y): [(x + dx, y + dy) for dx, dy in NEIGHBOUR_OFFSETS if (x + dx, y + dy) in cells]
+                for x, y in cells}
+    
+    def _find_connected_components(self, graph) -> List[Set[Tuple[int, int]]]:
+        """Composantes connexes du graphe."""
+        components = []
+        seen = set()
+        for start in graph:
+            if start in seen:
+                continue
+            component = {start}
+            stack = [start]
+            while stack:
+                for neighbour in graph[stack.pop()]:
+                    if neighbour not in component:
+                        component.add(neighbour)
+                        stack.append(neighbour)
+            seen |= component
+            components.append(component)
+        return components
+    
+    def _articulation_points_and_bridges(self, graph):
+        """Points d'articulation et ponts du graphe (Tarjan, itératif)."""
+        disc = {}
+        low = {}
+        articulation_points = set()
+        bridges = []
+        counter = 0
+        for root in graph:
+            if root in disc:
+                continue
+            disc[root] = low[root] = counter
+            counter += 1
+            root_children = 0
+            stack = [(root, None, iter(graph[root]))]
+            while stack:
+                node, parent, neighbours = stack[-1]
+                advanced = False
+                for neighbour in neighbours:
+                    if neighbour not in disc:
+                        disc[neighbour] = low[neighbour] = counter
+                        counter += 1
+                        if node == root:
+                            root_children += 1
+                        stack.append((neighbour, node, iter(graph[neighbour])))
+                        advanced = True
+                        break
+                    if neighbour != parent:
+                        low[node] = min(low[node], disc[neighbour])
+                if advanced:
+                    continue
+                stack.pop()
+                if parent is not None:
+                    low[parent] = min(low[parent], low[node])
+                    if low[node] > disc[parent]:
+                        bridges.append((parent, node))
+                    if parent != root and low[node] >= disc[parent]:
+                        articulation_points.add(parent)
+            if root_children > 1:
+                articulation_points.add(root)
+        return articulation_points, bridges
+    
+    def _find_articulation_points(self, graph) -> Set[Tuple[int, int]]:
+        """Cases dont le blocage coupe le niveau en deux."""
+        return self._articulation_points_and_bridges(graph)[0]
+    
+    def _find_bridges(self, graph) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Passages entre deux cases dont le blocage coupe le niveau en deux."""
+        return self._articulation_points_and_bridges(graph)[1]
+    
+    def _calculate_clustering_coefficient(self, graph) -> float:
+        """
+        Coefficient de regroupement sur grille.
+        
+        Une grille n'a pas de triangle : on mesure la part des carrés 2x2
+        ouverts autour de chaque case (1 dans une salle, 0 dans un couloir).
+        """
+        if not graph:
+            return 0.0
+        total = 0
+        for x, y in graph:
+            for ox, oy in ((-1, -1), (0, -1), (-1, 0), (0, 0)):
+                square = ((x + ox, y + oy), (x + ox + 1, y + oy), (x + ox, y + oy + 1), (x + ox + 1, y + oy + 1))
+                if all(cell in graph for cell in square):
+                    total += 1
+        return total / (4 * len(graph))
+    
+    def _identify_bottlenecks(self, level) -> Dict[str, Any]:
+        """Cases de passage obligé entre deux zones du niveau."""
+        graph = self._build_connectivity_graph(level)
+        articulation_points, _ = self._articulation_points_and_bridges(graph)
+        return {
+            'bottleneck_count': len(articulation_points),
+            'bottleneck_ratio': len(articulation_points) / max(len(graph), 1),
+            'bottleneck_positions': sorted(articulation_points)
+        }
+    
+    def _analyze_corridors(self, level) -> Dict[str, Any]:
+        """Couloirs (deux voisins opposés) et culs-de-sac (un seul voisin)."""
+        cells = self._interior_cells(level)
+        corridors = 0
+        dead_ends = 0
+        for (x, y), degree in self._floor_degrees(level).items():
+            if degree == 1:
+                dead_ends += 1
+            elif degree == 2 and (((x - 1, y) in cells and (x + 1, y) in cells)
+                                  or ((x, y - 1) in cells and (x, y + 1) in cells)):
+                corridors += 1
+        area = max(len(cells), 1)
+        return {
+            'corridor_cells': corridors,
+            'corridor_ratio': corridors / area,
+            'dead_ends': dead_ends,
+            'dead_end_ratio': dead_ends / area
+        }
+    
+    def _analyze_space_distribution(self, level) -> Dict[str, Any]:
+        """Répartition du sol entre salles et passages."""
+        cells = self._interior_cells(level)
+        degrees = self._floor_degrees(level)
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        bounding_area = (max(xs) - min(xs) + 1) * (max(ys) - min(ys) + 1)
+        open_cells = sum(1 for degree in degrees.values() if degree >= 3)
+        return {
+            'free_area': len(cells),
+            'open_cells': open_cells,
+            'open_ratio': open_cells / len(cells),
+            'bounding_box_fill': len(cells) / bounding_area,
+            'free_space_per_box': (len(cells) - len(level.boxes)) / max(len(level.boxes), 1)
+        }
+    
+    def _extract_topological_features(self, level) -> Dict[str, Any]:
+        """Jonctions, culs-de-sac et nombre de cycles indépendants du sol."""
+        graph = self._build_connectivity_graph(level)
+        edges = sum(len(neighbours) for neighbours in graph.values()) // 2
+        components = len(self._find_connected_components(graph))
+        degrees = [len(neighbours) for neighbours in graph.values()]
+        return {
+            'cycle_count': edges - len(graph) + components,
+            'junctions': sum(1 for degree in degrees if degree >= 3),
+            'dead_ends': sum(1 for degree in degrees if degree == 1),
+            'average_degree': sum(degrees) / max(len(degrees), 1)
+        }
+    
+    # Analyse spatiale
+    
+    def _measure_target_dispersion(self, targets: List[Tuple[int, int]], level) -> Dict[str, float]:
+        """Dispersion des cibles autour de leur centre."""
+        if not targets:
+            return {'dispersion_index': 0.0, 'average_distance_to_centroid': 0.0, 'spread_x': 0.0, 'spread_y': 0.0}
+        cx = sum(x for x, _ in targets) / len(targets)
+        cy = sum(y for _, y in targets) / len(targets)
+        average_distance = sum(math.hypot(x - cx, y - cy) for x, y in targets) / len(targets)
+        half_diagonal = math.hypot(level.width, level.height) / 2
+        return {
+            'dispersion_index': average_distance / half_diagonal if half_diagonal else 0.0,
+            'average_distance_to_centroid': average_distance,
+            'spread_x': max(x for x, _ in targets) - min(x for x, _ in targets),
+            'spread_y': max(y for _, y in targets) - min(y for _, y in targets)
+        }
+    
+    def _calculate_box_target_spatial_correlation(self, level) -> Dict[str, float]:
+        """Proximité des caisses et des cibles (1 quand chaque caisse est sur une cible)."""
+        boxes = list(level.boxes)
+        targets = list(level.targets)
+        if not boxes or not targets:
+            return {'correlation_coefficient': 0.0, 'average_box_target_distance': 0.0, 'boxes_on_targets': 0}
+        distances = [min(abs(bx - tx) + abs(by - ty) for tx, ty in targets) for bx, by in boxes]
+        average_distance = sum(distances) / len(distances)
+        return {
+            'correlation_coefficient': 1.0 / (1.0 + average_distance),
+            'average_box_target_distance': average_distance,
+            'boxes_on_targets': sum(1 for distance in distances if distance == 0)
+        }
+    
+    def _analyze_free_space_distribution(self, level) -> Dict[str, float]:
+        """Espace libre disponible pour manœuvrer les caisses."""
+        free_cells = self._calculate_free_area(level) - len(level.boxes)
+        return {
+            'free_cells': free_cells,
+            'free_ratio': free_cells / (level.width * level.height),
+            'cells_per_box': free_cells / max(len(level.boxes), 1)
+        }
+    
+    def _extract_geometric_features(self, level) -> Dict[str, Any]:
+        """Centres des caisses et des cibles, et emprise du sol."""
+        def centroid(positions):
+            positions = list(positions)
+            if not positions:
+                return [0.0, 0.0]
+            return [sum(x for x, _ in positions) / len(positions), sum(y for _, y in positions) / len(positions)]
+        
+        cells = self._interior_cells(level)
+        box_centroid = centroid(level.boxes)
+        target_centroid = centroid(level.targets)
+        return {
+            'box_centroid': box_centroid,
+            'target_centroid': target_centroid,
+            'centroid_offset': math.hypot(box_centroid[0] - target_centroid[0],
+                                          box_centroid[1] - target_centroid[1]),
+            'bounding_box': [min(x for x, _ in cells), min(y for _, y in cells),
+                             max(x for x, _ in cells), max(y for _, y in cells)]
+        }
+    
+    def _analyze_level_symmetries(self, level) -> Dict[str, float]:
+        """Part du sol symétrique par rapport aux axes de son emprise."""
+        cells = self._interior_cells(level)
+        min_x = min(x for x, _ in cells)
+        max_x = max(x for x, _ in cells)
+        min_y = min(y for _, y in cells)
+        max_y = max(y for _, y in cells)
+        horizontal = sum(1 for x, y in cells if (min_x + max_x - x, y) in cells) / len(cells)
+        vertical = sum(1 for x, y in cells if (x, min_y + max_y - y) in cells) / len(cells)
+        return {
+            'horizontal_symmetry': horizontal,
+            'vertical_symmetry': vertical,
+            'symmetry_score': max(horizontal, vertical)
+        }
+    
+    def _create_accessibility_map(self, level) -> Dict[str, Any]:
+        """Zone du joueur au départ et caisses qu'il peut pousser tout de suite."""
+        boxes = set(level.boxes)
+        start = tuple(level.player_pos)
+        reachable = {start}
+        stack = [start]
+        while stack:
+            x, y = stack.pop()
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                cell = (x + dx, y + dy)
+                if cell not in reachable and cell not in boxes and not level.is_wall(*cell):
+                    reachable.add(cell)
+                    stack.append(cell)
+        
+        pushable = 0
+        for bx, by in boxes:
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                target = (bx + dx, by + dy)
+                if ((bx - dx, by - dy) in reachable and target not in boxes
+                        and not level.is_wall(*target)):
+                    pushable += 1
+                    break
+        return {
+            'reachable_cells': len(reachable),
+            'reachable_ratio': len(reachable) / max(self._calculate_free_area(level) - len(boxes), 1),
+            'pushable_boxes': pushable
+        }
+    
+    # Analyse des mouvements
+    
+    def _replay(self, moves: List[str], level):
+        """Rejoue les mouvements depuis la position du niveau : (position, poussée) par coup."""
+        x, y = level.player_pos
+        boxes = set(level.boxes)
+        for move in moves:
+            dx, dy = MOVE_OFFSETS.get(move, (0, 0))
+            x, y = x + dx, y + dy
+            pushed = (x, y) in boxes
+            if pushed:
+                boxes.remove((x, y))
+                boxes.add((x + dx, y + dy))
+            yield (x, y), pushed
+    
+    def _analyze_push_pull_ratio(self, moves: List[str], level) -> Dict[str, Any]:
+        """Répartition des coups entre poussées et déplacements (pas de tirage en marche avant)."""
+        pushes = sum(1 for _, pushed in self._replay(moves, level) if pushed)
+        return {
+            'pushes': pushes,
+            'pulls': 0,
+            'walks': len(moves) - pushes,
+            'push_ratio': pushes / max(len(moves), 1)
+        }
+    
+    def _calculate_movement_efficiency(self, moves: List[str], level) -> Dict[str, float]:
+        """Coût de déplacement par poussée et part des cases revisitées."""
+        visited = set()
+        pushes = 0
+        for position, pushed in self._replay(moves, level):
+            visited.add(position)
+            pushes += pushed
+        return {
+            'push_efficiency': pushes / max(len(moves), 1),
+            'walk_overhead': (len(moves) - pushes) / max(pushes, 1),
+            'revisit_ratio': 1.0 - len(visited) / max(len(moves), 1)
+        }
+    
+    def _calculate_pattern_complexity(self, moves: List[str]) -> float:
+        """Part des triplets de directions distincts parmi ceux possibles (64 au plus)."""
+        if len(moves) < 3:
+            return 0.0
+        triplets = {tuple(moves[i:i + 3]) for i in range(len(moves) - 2)}
+        return len(triplets) / min(64, len(moves) - 2)
+    
+    def _analyze_spatial_movement_distribution(self, moves: List[str], level) -> Dict[str, Any]:
+        """Carte de passage du joueur sur le niveau."""
+        visits = Counter(position for position, _ in self._replay(moves, level))
+        return {
+            'cells_visited': len(visits),
+            'coverage': len(visits) / max(self._calculate_free_area(level), 1),
+            'max_visits': max(visits.values()) if visits else 0,
+            'heatmap': [[x, y, count] for (x, y), count in sorted(visits.items())]
+        }
+    
+    # Métriques algorithmiques
+    
+    def _calculate_algorithm_accuracy(self, solution_data) -> float:
+        """Proche de 1 quand l'algorithme a peu exploré au-delà de la solution (échelle log)."""
+        if not solution_data.moves:
+            return 0.0
+        return min(1.0, math.log1p(len(solution_data.moves)) / math.log1p(max(solution_data.states_explored, 1)))
+    
+    def _calculate_heuristic_effectiveness(self, solution_data, search_stats) -> float:
+        """Part des états explorés qui mènent à la solution."""
+        states_explored = search_stats.get('states_explored', solution_data.states_explored)
+        return min(1.0, len(solution_data.moves) / max(states_explored, 1))
+    
+    def _calculate_search_tree_efficiency(self, search_stats) -> float:
+        """Part des états générés qui ont été développés."""
+        return search_stats.get('states_explored', 0) / max(search_stats.get('states_generated', 1), 1)
+    
+    def _estimate_convergence_rate(self, search_stats) -> float:
+        """Vitesse de convergence : 1 sans exploration, décroît avec le log du nombre d'états."""
+        return 1.0 / (1.0 + math.log10(1 + search_stats.get('states_explored', 0)))
+    
+    # Corrélations structure-performance
+    
+    def _correlate_complexity_with_time(self, level_structure, solution_data) -> Dict[str, float]:
+        """Temps et états rapportés à la surface libre."""
+        free_area = max(level_structure['space_distribution']['free_area'], 1)
+        return {
+            'time_per_cell': solution_data.solve_time / free_area,
+            'states_per_cell': solution_data.states_explored / free_area
+        }
+    
+    def _correlate_structure_with_algorithm(self, level_structure, solution_data) -> Dict[str, Any]:
+        """Effort de l'algorithme rapporté au nombre de caisses et de goulots."""
+        boxes = max(level_structure['basic_properties']['boxes_count'], 1)
+        return {
+            'algorithm': solution_data.algorithm_used.value,
+            'states_per_box': solution_data.states_explored / boxes,
+            'bottleneck_ratio': level_structure['bottleneck_analysis']['bottleneck_ratio']
+        }
+    
+    def _correlate_geometry_with_difficulty(self, level_structure, solution_data) -> Dict[str, float]:
+        """Longueur de solution et effort rapportés à la forme du niveau."""
+        geometry = level_structure['geometric_complexity']
+        free_area = max(level_structure['space_distribution']['free_area'], 1)
+        return {
+            'moves_per_cell': len(solution_data.moves) / free_area,
+            'compactness': geometry['compactness'],
+            'difficulty_index': math.log1p(solution_data.states_explored) / (1.0 + geometry['compactness'])
+        }
+    
+    def _correlate_spatial_features_with_efficiency(self, level_structure, solution_data) -> Dict[str, float]:
+        """Couloirs et efficacité d'exploration."""
+        return {
+            'corridor_ratio': level_structure['corridor_analysis']['corridor_ratio'],
+            'exploration_efficiency': solution_data.states_explored / max(solution_data.states_generated, 1)
+        }
+    
+    def _analyze_pattern_predictability(self, level, solution_data) -> Dict[str, float]:
+        """Prévisibilité des coups : entropie et répétitions de direction."""
+        moves = solution_data.moves
+        entropy = self._calculate_movement_entropy(moves)
+        repeats = sum(1 for i in range(1, len(moves)) if moves[i] == moves[i - 1])
+        return {
+            'entropy': entropy,
+            'predictability': 1.0 - entropy,
+            'repeat_ratio': repeats / max(len(moves) - 1, 1)
+        }
+    
+    # Qualité de la solution
+    
+    def _estimate_solution_optimality(self, solution_data, level) -> float:
+        """Borne inférieure des poussées (distances caisse-cible) rapportée aux poussées de la solution."""
+        pushes = sum(1 for _, pushed in self._replay(solution_data.moves, level) if pushed)
+        if not pushes:
+            return 0.0
+        targets = list(level.targets)
+        lower_bound = sum(min(abs(bx - tx) + abs(by - ty) for tx, ty in targets) for bx, by in level.boxes)
+        return min(1.0, lower_bound / pushes)
+    
+    def _calculate_solution_elegance(self, solution_data) -> float:
+        """1 moins la part des changements de direction."""
+        moves = solution_data.moves
+        if len(moves) < 2:
+            return 1.0
+        turns = sum(1 for i in range(1, len(moves)) if moves[i] != moves[i - 1])
+        return 1.0 - turns / (len(moves) - 1)
+    
+    def _analyze_move_redundancy(self, moves: List[str]) -> Dict[str, float]:
+        """Allers-retours immédiats, qui s'annulent sans poussée utile."""
+        opposite = {'UP': 'DOWN', 'DOWN': 'UP', 'LEFT': 'RIGHT', 'RIGHT': 'LEFT'}
+        reversals = sum(1 for i in range(1, len(moves)) if moves[i] == opposite.get(moves[i - 1]))
+        return {
+            'immediate_reversals': reversals,
+            'redundancy_ratio': reversals / max(len(moves) - 1, 1)
+        }
+    
+    def _calculate_overall_efficiency_score(self, solution_data, level) -> float:
+        """Moyenne de l'optimalité estimée et de l'élégance."""
+        return (self._estimate_solution_optimality(solution_data, level)
+                + self._calculate_solution_elegance(solution_data)) / 2
+    
+    def _calculate_comparative_metrics(self, solution_data, level) -> Dict[str, float]:
+        """Solution comparée aux moyennes des résolutions réussies de la session."""
+        totals = self._success_totals
+        if not totals['count']:
+            return {'moves_vs_average': 1.0, 'time_vs_average': 1.0}
+        return {
+            'moves_vs_average': len(solution_data.moves) / max(totals['moves_count'] / totals['count'], 1),
+            'time_vs_average': solution_data.solve_time / max(totals['solve_time'] / totals['count'], 0.001)
+        }
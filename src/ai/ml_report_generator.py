@@ -3,15 +3,28 @@ Générateur de rapports ML pour l'analyse des performances Sokoban.
 
 Ce module génère des rapports complets en plusieurs formats (JSON, HTML, CSV)
 avec visualisations et analyses statistiques avancées.
+
+Un rapport est une ``LazySections`` : chaque section n'est calculée qu'à sa
+première lecture. Les fichiers ne sont écrits que si des formats d'export
+sont demandés, à la génération ou plus tard avec ``export_report``.
 """
 
 import json
 import time
 import math
+from collections import Counter, deque
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from .algorithm_selector import Algorithm
+from .ml_metrics_collector import LazySections
+from .telemetry_sink import TelemetrySink, DEFAULT_BUFFER_SIZE, get_telemetry_sink
+
+
+# Formats d'export disponibles
+EXPORT_FORMATS = ('json', 'html', 'csv')
+
 
 class MLReportGenerator:
     """
@@ -25,53 +38,98 @@ class MLReportGenerator:
     - Export multi-format
     """
     
-    def __init__(self, output_dir: str = "reports"):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        self.report_history = []
+    def __init__(self, output_dir: str = "reports", sink: Optional[TelemetrySink] = None,
+                 history_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            output_dir: Dossier des rapports exportés
+            sink: Journal des lignes d'entraînement (par défaut data/telemetry/ml_reports.jsonl)
+            history_size: Nombre de rapports complets gardés en mémoire
+        """
+        self.output_dir = Path(output_dir)  # Créé au premier export
+        self.report_history = deque(maxlen=history_size)
+        self._performance_history = deque(maxlen=history_size)
+        self.telemetry_sink = sink if sink is not None else get_telemetry_sink('ml_reports')
+        self.total_reports = 0
     
-    def generate_comprehensive_report(self, level, solution_data, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_comprehensive_report(self, level, solution_data, metrics: Dict[str, Any],
+                                      sections: Optional[List[str]] = None,
+                                      export_formats: tuple = ()) -> LazySections:
         """
         Génère un rapport ML complet pour une résolution.
         
+        Seuls les en-têtes et les sections du journal d'entraînement sont
+        calculés tout de suite ; les autres le sont à leur première lecture.
+        
         Args:
-            level: Instance du niveau résolu
+            level: Niveau dans sa position de départ (non modifié ensuite)
             solution_data: Données de solution
             metrics: Métriques collectées par MLMetricsCollector
+            sections: Sections supplémentaires à calculer immédiatement
+            export_formats: Formats à écrire dans output_dir (parmi EXPORT_FORMATS)
             
         Returns:
-            Dict: Rapport complet structuré
+            LazySections: Rapport structuré
         """
         timestamp = datetime.now()
+        history = tuple(self._performance_history)
         
         # Structure du rapport principal
-        report = {
-            'metadata': self._generate_metadata(timestamp, level, solution_data),
-            'executive_summary': self._generate_executive_summary(solution_data, metrics),
-            'performance_analysis': self._analyze_performance(solution_data, metrics),
-            'algorithm_analysis': self._analyze_algorithm_performance(solution_data, metrics),
-            'level_analysis': self._analyze_level_characteristics(level, metrics),
-            'movement_analysis': self._analyze_movement_patterns(solution_data, metrics),
-            'spatial_analysis': self._analyze_spatial_distribution(metrics),
-            'efficiency_analysis': self._analyze_efficiency_metrics(solution_data, metrics),
-            'ml_features': self._structure_ml_features(metrics),
-            'comparative_analysis': self._generate_comparative_analysis(metrics),
-            'recommendations': self._generate_recommendations(solution_data, metrics),
-            'visualizations': self._prepare_visualization_data(metrics),
-            'raw_data': self._prepare_raw_data_export(solution_data, metrics)
+        builders = {
+            'executive_summary': lambda: self._generate_executive_summary(solution_data, metrics),
+            'performance_analysis': lambda: self._analyze_performance(solution_data, metrics),
+            'algorithm_analysis': lambda: self._analyze_algorithm_performance(solution_data, metrics),
+            'level_analysis': lambda: self._analyze_level_characteristics(level, metrics),
+            'movement_analysis': lambda: self._analyze_movement_patterns(solution_data, metrics),
+            'spatial_analysis': lambda: self._analyze_spatial_distribution(metrics),
+            'efficiency_analysis': lambda: self._analyze_efficiency_metrics(solution_data, metrics),
+            'ml_features': lambda: self._structure_ml_features(metrics),
+            'comparative_analysis': lambda: self._generate_comparative_analysis(metrics, history),
+            'recommendations': lambda: self._generate_recommendations(solution_data, metrics),
+            'visualizations': lambda: self._prepare_visualization_data(metrics, history),
+            'raw_data': lambda: self._prepare_raw_data_export(solution_data, metrics)
         }
+        report = LazySections(builders, {'metadata': self._generate_metadata(timestamp, level, solution_data)})
+        for name in sections or ():
+            report[name]
         
-        # Sauvegarder dans l'historique
+        # Sauvegarder dans l'historique et journaliser la ligne d'entraînement
         self.report_history.append(report)
+        self._performance_history.append(self._extract_performance_metrics(metrics))
+        self.total_reports += 1
+        self.telemetry_sink.record(self._training_row(report))
         
-        # Exporter en différents formats
-        report_id = self._generate_report_id(timestamp)
-        self._export_json_report(report, report_id)
-        self._export_html_report(report, report_id)
-        self._export_csv_features(report['ml_features'], report_id)
+        if export_formats:
+            self.export_report(report, export_formats)
         
         return report
     
+    def export_report(self, report: LazySections, formats: tuple = EXPORT_FORMATS) -> List[Path]:
+        """
+        Écrit un rapport dans output_dir.
+        
+        Args:
+            report: Rapport rendu par generate_comprehensive_report
+            formats: Formats à écrire (parmi EXPORT_FORMATS)
+            
+        Returns:
+            List[Path]: Fichiers écrits
+        """
+        unknown = set(formats) - set(EXPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Formats d'export inconnus : {', '.join(sorted(unknown))}")
+        
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        report_id = report['metadata']['report_id']
+        paths = []
+        if 'json' in formats:
+            paths.append(self._export_json_report(report, report_id))
+        if 'html' in formats:
+            paths.append(self._export_html_report(report, report_id))
+        if 'csv' in formats:
+            paths.append(self._export_csv_features(report['ml_features'], report_id))
+        return paths
+    
     def _generate_metadata(self, timestamp: datetime, level, solution_data) -> Dict[str, Any]:
         """Génère les métadonnées du rapport."""
         return {
@@ -339,14 +397,14 @@ class MLReportGenerator:
         
         return structured_features
     
-    def _generate_comparative_analysis(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
-        """Génère une analyse comparative avec l'historique."""
-        if len(self.report_history) < 2:
+    def _generate_comparative_analysis(self, metrics: Dict[str, Any], history: tuple) -> Dict[str, Any]:
+        """Génère une analyse comparative avec les rapports précédents."""
+        if len(history) < 2:
             return {'message': 'Insufficient historical data for comparison'}
         
         # Comparer avec la moyenne historique
         current_performance = self._extract_performance_metrics(metrics)
-        historical_average = self._calculate_historical_average()
+        historical_average = self._calculate_historical_average(history)
         
         comparison = {}
         for key, current_value in current_performance.items():
@@ -363,7 +421,7 @@ class MLReportGenerator:
         return {
             'performance_comparison': comparison,
             'overall_trend': self._determine_overall_trend(comparison),
-            'ranking_percentile': self._calculate_performance_percentile(current_performance)
+            'ranking_percentile': self._calculate_performance_percentile(current_performance, history)
         }
     
     def _generate_recommendations(self, solution_data, metrics: Dict[str, Any]) -> Dict[str, Any]:
@@ -422,13 +480,13 @@ class MLReportGenerator:
         
         return recommendations
     
-    def _prepare_visualization_data(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_visualization_data(self, metrics: Dict[str, Any], history: tuple) -> Dict[str, Any]:
         """Prépare les données pour les visualisations."""
         return {
             'performance_radar': self._prepare_performance_radar_data(metrics),
-            'algorithm_comparison': self._prepare_algorithm_comparison_data(metrics),
+            'algorithm_comparison': self._prepare_algorithm_comparison_data(metrics, history),
             'movement_heatmap': self._prepare_movement_heatmap_data(metrics),
-            'efficiency_timeline': self._prepare_efficiency_timeline_data(metrics),
+            'efficiency_timeline': self._prepare_efficiency_timeline_data(metrics, history),
             'feature_importance': self._prepare_feature_importance_data(metrics)
         }
     
@@ -452,20 +510,22 @@ class MLReportGenerator:
     
     # Méthodes d'export
     
-    def _export_json_report(self, report: Dict[str, Any], report_id: str):
+    def _export_json_report(self, report: LazySections, report_id: str) -> Path:
         """Exporte le rapport au format JSON."""
         json_path = self.output_dir / f"report_{report_id}.json"
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+            json.dump(report.to_dict(), f, indent=2, ensure_ascii=False, default=str)
+        return json_path
     
-    def _export_html_report(self, report: Dict[str, Any], report_id: str):
+    def _export_html_report(self, report: Dict[str, Any], report_id: str) -> Path:
         """Exporte le rapport au format HTML."""
         html_path = self.output_dir / f"report_{report_id}.html"
         html_content = self._generate_html_report(report)
         with open(html_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
+        return html_path
     
-    def _export_csv_features(self, ml_features: Dict[str, Any], report_id: str):
+    def _export_csv_features(self, ml_features: Dict[str, Any], report_id: str) -> Path:
         """Exporte les features ML au format CSV."""
         csv_path = self.output_dir / f"features_{report_id}.csv"
         
@@ -481,6 +541,7 @@ class MLReportGenerator:
             f.write("feature_name,value\n")
             for feature_name, value in flat_features.items():
                 f.write(f"{feature_name},{value}\n")
+        return csv_path
     
     def _generate_html_report(self, report: Dict[str, Any]) -> str:
         """Génère le contenu HTML du rapport."""
@@ -492,21 +553,21 @@ class MLReportGenerator:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Sokoban AI Performance Report</title>
     <style>
-        body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
-        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .section { margin-bottom: 30px; padding: 20px; border: 1px solid #ddd; border-radius: 8px; }
-        .metric { display: inline-block; margin: 10px; padding: 15px; background: #ecf0f1; border-radius: 5px; min-width: 150px; text-align: center; }
-        .metric-value { font-size: 24px; font-weight: bold; color: #2c3e50; }
-        .metric-label { font-size: 12px; color: #7f8c8d; }
-        .rating { padding: 5px 10px; border-radius: 15px; color: white; font-weight: bold; }
-        .rating-excellent { background-color: #27ae60; }
-        .rating-good { background-color: #f39c12; }
-        .rating-poor { background-color: #e74c3c; }
-        .recommendation { background: #fff3cd; border: 1px solid #ffeeba; padding: 15px; margin: 10px 0; border-radius: 5px; }
-        .feature-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }
-        .progress-bar { width: 100%; height: 20px; background-color: #ecf0f1; border-radius: 10px; overflow: hidden; }
-        .progress-fill { height: 100%; background-color: #3498db; transition: width 0.3s ease; }
+        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
+        .header {{ background: #2c3e50; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
+        .section {{ margin-bottom: 30px; padding: 20px; border: 1px solid #ddd; border-radius: 8px; }}
+        .metric {{ display: inline-block; margin: 10px; padding: 15px; background: #ecf0f1; border-radius: 5px; min-width: 150px; text-align: center; }}
+        .metric-value {{ font-size: 24px; font-weight: bold; color: #2c3e50; }}
+        .metric-label {{ font-size: 12px; color: #7f8c8d; }}
+        .rating {{ padding: 5px 10px; border-radius: 15px; color: white; font-weight: bold; }}
+        .rating-excellent {{ background-color: #27ae60; }}
+        .rating-good {{ background-color: #f39c12; }}
+        .rating-poor {{ background-color: #e74c3c; }}
+        .recommendation {{ background: #fff3cd; border: 1px solid #ffeeba; padding: 15px; margin: 10px 0; border-radius: 5px; }}
+        .feature-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; }}
+        .progress-bar {{ width: 100%; height: 20px; background-color: #ecf0f1; border-radius: 10px; overflow: hidden; }}
+        .progress-fill {{ height: 100%; background-color: #3498db; transition: width 0.3s ease; }}
     </style>
 </head>
 <body>
@@ -627,7 +688,7 @@ class MLReportGenerator:
     
     def _generate_report_id(self, timestamp: datetime) -> str:
         """Génère un ID unique pour le rapport."""
-        return timestamp.strftime("%Y%m%d_%H%M%S")
+        return timestamp.strftime("%Y%m%d_%H%M%S_%f")
     
     def _calculate_efficiency_score(self, basic_metrics: Dict[str, Any]) -> float:
         """Calcule un score d'efficacité global."""
@@ -685,52 +746,342 @@ class MLReportGenerator:
         
         return ''.join(html_parts) if html_parts else '<p>No specific recommendations available.</p>'
     
+    # Notes et catégories
+    
+    def _categorize_complexity(self, score: float) -> str:
+        """Catégorise un score de complexité entre 0 et 1."""
+        if score >= 0.7:
+            return "High"
+        elif score >= 0.4:
+            return "Medium"
+        else:
+            return "Low"
+    
+    def _rate_time_efficiency(self, solve_time: float) -> str:
+        """Note du temps de résolution (10 s comme référence)."""
+        return self._categorize_performance(1.0 / (1.0 + solve_time / 10.0))
+    
+    def _rate_search_efficiency(self, basic_metrics: Dict[str, Any]) -> str:
+        """Note de la part des états générés qui ont été développés."""
+        return self._categorize_performance(basic_metrics.get('exploration_efficiency', 0))
+    
+    def _rate_memory_efficiency(self, memory_peak: float) -> str:
+        """Note du pic mémoire (100 000 états comme référence)."""
+        return self._categorize_performance(1.0 / (1.0 + memory_peak / 100000))
+    
+    def _calculate_solution_compactness(self, solution_data) -> float:
+        """1 moins l'inverse de la longueur moyenne des suites de coups dans la même direction."""
+        moves = solution_data.moves
+        if not moves:
+            return 0.0
+        runs = 1 + sum(1 for i in range(1, len(moves)) if moves[i] != moves[i - 1])
+        return 1.0 - runs / len(moves)
+    
+    def _rate_solution_quality(self, solution_data) -> str:
+        """Note de la compacité de la solution."""
+        return self._categorize_performance(self._calculate_solution_compactness(solution_data))
+    
+    def _evaluate_algorithm_appropriateness(self, solution_data, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Adéquation de l'algorithme : peu d'exploration au-delà de la solution."""
+        score = metrics.get('algorithm_metrics', {}).get('algorithm_selection_accuracy', 0)
+        return {
+            'score': score,
+            'appropriate': score >= 0.4,
+            'rating': self._categorize_performance(score)
+        }
+    
+    def _suggest_alternative_algorithms(self, metrics: Dict[str, Any]) -> List[str]:
+        """Algorithmes à essayer quand la recherche a été longue ou très large."""
+        basic_metrics = metrics.get('basic_metrics', {})
+        used = basic_metrics.get('algorithm_used')
+        if basic_metrics.get('solve_time', 0) <= 10 and basic_metrics.get('states_explored', 0) <= 100000:
+            return []
+        candidates = [Algorithm.GREEDY.value, Algorithm.BIDIRECTIONAL_GREEDY.value, Algorithm.IDA_STAR.value]
+        return [name for name in candidates if name != used]
+    
+    def _rate_heuristic_performance(self, algorithm_metrics: Dict[str, Any]) -> str:
+        """Note de l'efficacité de l'heuristique."""
+        return self._categorize_performance(algorithm_metrics.get('heuristic_effectiveness', 0))
+    
+    def _rate_pruning_performance(self, algorithm_metrics: Dict[str, Any]) -> str:
+        """Note de l'élagage (un quart d'états élagués compte comme excellent)."""
+        return self._categorize_performance(min(1.0, 4 * algorithm_metrics.get('pruning_effectiveness', 0)))
+    
+    def _rate_convergence_performance(self, algorithm_metrics: Dict[str, Any]) -> str:
+        """Note de la vitesse de convergence."""
+        return self._categorize_performance(algorithm_metrics.get('convergence_rate', 0))
+    
+    def _rate_structural_complexity(self, basic_props: Dict[str, Any]) -> str:
+        """Complexité structurelle : nombre de caisses (10 et plus : élevée)."""
+        return self._categorize_complexity(min(1.0, basic_props.get('boxes_count', 0) / 10))
+    
+    def _rate_geometric_complexity(self, geometric: Dict[str, Any]) -> str:
+        """Complexité géométrique : rugosité des bords et fragmentation."""
+        score = min(1.0, geometric.get('edge_roughness', 0) + 5 * geometric.get('fragmentation_index', 0))
+        return self._categorize_complexity(score)
+    
+    def _rate_connectivity_complexity(self, connectivity: Dict[str, Any]) -> str:
+        """Complexité de connectivité : part des cases de passage obligé."""
+        size = max(connectivity.get('largest_component_size', 0), 1)
+        return self._categorize_complexity(min(1.0, 5 * connectivity.get('articulation_points_count', 0) / size))
+    
+    def _estimate_level_difficulty(self, level_structure: Dict[str, Any]) -> float:
+        """Difficulté estimée entre 0 et 1 : caisses, couloirs et goulots."""
+        boxes = level_structure.get('basic_properties', {}).get('boxes_count', 0)
+        corridor_ratio = level_structure.get('corridor_analysis', {}).get('corridor_ratio', 0)
+        bottleneck_ratio = level_structure.get('bottleneck_analysis', {}).get('bottleneck_ratio', 0)
+        return (min(1.0, boxes / 10) + min(1.0, 2 * corridor_ratio) + min(1.0, 5 * bottleneck_ratio)) / 3
+    
+    def _identify_complexity_factors(self, level_structure: Dict[str, Any]) -> List[str]:
+        """Caractéristiques du niveau qui le rendent difficile."""
+        factors = []
+        if level_structure.get('basic_properties', {}).get('boxes_count', 0) >= 6:
+            factors.append('many_boxes')
+        if level_structure.get('corridor_analysis', {}).get('corridor_ratio', 0) >= 0.25:
+            factors.append('long_corridors')
+        if level_structure.get('bottleneck_analysis', {}).get('bottleneck_ratio', 0) >= 0.1:
+            factors.append('bottlenecks')
+        if level_structure.get('corridor_analysis', {}).get('dead_ends', 0) >= 3:
+            factors.append('dead_ends')
+        if level_structure.get('space_distribution', {}).get('free_space_per_box', float('inf')) < 4:
+            factors.append('little_free_space')
+        return factors
+    
+    def _categorize_difficulty(self, level_structure: Dict[str, Any]) -> str:
+        """Catégorie de difficulté estimée."""
+        difficulty = self._estimate_level_difficulty(level_structure)
+        if difficulty >= 0.75:
+            return "Expert"
+        elif difficulty >= 0.5:
+            return "Hard"
+        elif difficulty >= 0.25:
+            return "Medium"
+        else:
+            return "Easy"
+    
+    def _rate_pattern_efficiency(self, movement_analysis: Dict[str, Any]) -> str:
+        """Note des allers-retours dans la solution."""
+        return self._categorize_performance(
+            movement_analysis.get('backtrack_analysis', {}).get('backtrack_efficiency', 0))
+    
+    def _rate_movement_efficiency(self, movement_analysis: Dict[str, Any]) -> str:
+        """Note des déplacements : peu de cases revisitées."""
+        efficiency = movement_analysis.get('efficiency_metrics', {})
+        return self._categorize_performance(1.0 - efficiency.get('revisit_ratio', 1.0))
+    
+    def _identify_movement_optimizations(self, movement_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pistes d'amélioration de la suite de coups."""
+        optimizations = []
+        if movement_analysis.get('backtrack_analysis', {}).get('backtrack_ratio', 0) > 0.1:
+            optimizations.append({
+                'priority': 'medium',
+                'optimization': 'Remove immediate back-and-forth moves',
+                'benefit': 'Shorter solution without changing the pushes'
+            })
+        if movement_analysis.get('efficiency_metrics', {}).get('walk_overhead', 0) > 5:
+            optimizations.append({
+                'priority': 'low',
+                'optimization': 'Reorder pushes to reduce walking between boxes',
+                'benefit': 'Fewer player moves per push'
+            })
+        return optimizations
+    
+    def _rate_spatial_efficiency(self, spatial_analysis: Dict[str, Any]) -> str:
+        """Note de la proximité des caisses et des cibles."""
+        return self._categorize_performance(
+            spatial_analysis.get('box_target_correlation', {}).get('correlation_coefficient', 0))
+    
+    def _suggest_spatial_optimizations(self, spatial_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Observations sur la disposition des caisses."""
+        suggestions = []
+        accessibility = spatial_analysis.get('accessibility_map', {})
+        if accessibility and accessibility.get('pushable_boxes', 0) <= 1:
+            suggestions.append({
+                'priority': 'low',
+                'insight': 'Few boxes can be pushed from the start position',
+                'impact': 'The search has little choice in its first pushes'
+            })
+        if spatial_analysis.get('box_clustering', {}).get('clustering_coefficient', 0) > 0.5:
+            suggestions.append({
+                'priority': 'low',
+                'insight': 'Boxes start in tight clusters',
+                'impact': 'Box order matters; deadlock pruning is important'
+            })
+        return suggestions
+    
+    def _rate_space_efficiency(self, basic_metrics: Dict[str, Any]) -> str:
+        """Note de l'exploration et de l'élagage."""
+        return self._categorize_performance(
+            (basic_metrics.get('exploration_efficiency', 0) + basic_metrics.get('pruning_efficiency', 0)) / 2)
+    
+    def _rate_solution_efficiency(self, solution_quality: Dict[str, Any]) -> str:
+        """Note du score d'efficacité de la solution."""
+        return self._categorize_performance(solution_quality.get('efficiency_score', 0))
+    
+    def _rate_overall_efficiency(self, overall_efficiency: float) -> str:
+        """Note de l'efficacité globale."""
+        return self._categorize_performance(overall_efficiency)
+    
+    def _calculate_feature_completeness(self, ml_features: Dict[str, Any]) -> float:
+        """Part des features qui sont des nombres finis."""
+        if not ml_features:
+            return 0.0
+        finite = sum(1 for value in ml_features.values()
+                     if isinstance(value, (int, float)) and math.isfinite(value))
+        return finite / len(ml_features)
+    
+    def _assess_feature_quality(self, ml_features: Dict[str, Any]) -> float:
+        """Part des features finies et non nulles (une feature nulle n'apporte rien)."""
+        if not ml_features:
+            return 0.0
+        informative = sum(1 for value in ml_features.values()
+                          if isinstance(value, (int, float)) and math.isfinite(value) and value != 0)
+        return informative / len(ml_features)
+    
+    # Historique des performances
+    
+    def _extract_performance_metrics(self, metrics: Dict[str, Any]) -> Dict[str, float]:
+        """Indicateurs de performance comparables d'un rapport à l'autre (plus haut = mieux)."""
+        basic_metrics = metrics.get('basic_metrics', {})
+        return {
+            'states_per_second': basic_metrics.get('states_per_second', 0),
+            'exploration_efficiency': basic_metrics.get('exploration_efficiency', 0),
+            'pruning_efficiency': basic_metrics.get('pruning_efficiency', 0),
+            'efficiency_score': self._calculate_efficiency_score(basic_metrics)
+        }
+    
+    def _calculate_historical_average(self, history: tuple) -> Dict[str, float]:
+        """Moyenne de chaque indicateur sur l'historique."""
+        if not history:
+            return {}
+        return {key: sum(entry[key] for entry in history) / len(history) for key in history[0]}
+    
+    def _determine_overall_trend(self, comparison: Dict[str, Any]) -> str:
+        """Tendance majoritaire des indicateurs comparés."""
+        trends = Counter(item['trend'] for item in comparison.values())
+        if trends['improved'] > trends['declined']:
+            return 'improved'
+        if trends['declined'] > trends['improved']:
+            return 'declined'
+        return 'stable'
+    
+    def _analyze_performance_trend(self, history: tuple) -> str:
+        """Compare le score d'efficacité de la première et de la seconde moitié de l'historique."""
+        if len(history) < 4:
+            return 'insufficient_data'
+        half = len(history) // 2
+        older = sum(entry['efficiency_score'] for entry in history[:half]) / half
+        newer = sum(entry['efficiency_score'] for entry in history[half:]) / (len(history) - half)
+        if newer > older * 1.05:
+            return 'improving'
+        if newer < older * 0.95:
+            return 'declining'
+        return 'stable'
+    
+    def _calculate_performance_percentile(self, current_performance: Dict[str, float], history: tuple) -> float:
+        """Pourcentage des rapports précédents dont le score d'efficacité est inférieur ou égal."""
+        if not history:
+            return 100.0
+        score = current_performance['efficiency_score']
+        return 100.0 * sum(1 for entry in history if entry['efficiency_score'] <= score) / len(history)
+    
+    # Données de visualisation
+    
+    def _prepare_performance_radar_data(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Axes normalisés entre 0 et 1 pour un graphique radar."""
+        basic_metrics = metrics.get('basic_metrics', {})
+        algorithm_metrics = metrics.get('algorithm_metrics', {})
+        axes = {
+            'speed': 1.0 / (1.0 + basic_metrics.get('solve_time', 0) / 10.0),
+            'exploration': basic_metrics.get('exploration_efficiency', 0),
+            'pruning': min(1.0, 4 * basic_metrics.get('pruning_efficiency', 0)),
+            'heuristic': algorithm_metrics.get('heuristic_effectiveness', 0),
+            'convergence': algorithm_metrics.get('convergence_rate', 0)
+        }
+        return {'axes': list(axes), 'values': list(axes.values())}
+    
+    def _prepare_algorithm_comparison_data(self, metrics: Dict[str, Any], history: tuple) -> Dict[str, Any]:
+        """Résolution courante face à la moyenne des rapports précédents."""
+        return {
+            'algorithm': metrics.get('basic_metrics', {}).get('algorithm_used', 'Unknown'),
+            'current': self._extract_performance_metrics(metrics),
+            'history_average': self._calculate_historical_average(history)
+        }
+    
+    def _prepare_movement_heatmap_data(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Cases traversées par le joueur et nombre de passages."""
+        level_structure = metrics.get('level_structure', {})
+        basic_props = level_structure.get('basic_properties', {})
+        distribution = metrics.get('movement_analysis', {}).get('spatial_movement_distribution', {})
+        return {
+            'width': basic_props.get('width', 0),
+            'height': basic_props.get('height', 0),
+            'cells': distribution.get('heatmap', [])
+        }
+    
+    def _prepare_efficiency_timeline_data(self, metrics: Dict[str, Any], history: tuple) -> List[float]:
+        """Scores d'efficacité des rapports précédents puis du rapport courant."""
+        current = self._extract_performance_metrics(metrics)['efficiency_score']
+        return [entry['efficiency_score'] for entry in history] + [current]
+    
+    def _prepare_feature_importance_data(self, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Features triées par valeur absolue relative à la plus grande (sans modèle entraîné)."""
+        numeric = {name: abs(value) for name, value in metrics.get('ml_features', {}).items()
+                   if isinstance(value, (int, float)) and math.isfinite(value)}
+        largest = max(numeric.values(), default=0) or 1
+        return [{'feature': name, 'importance': value / largest}
+                for name, value in sorted(numeric.items(), key=lambda item: -item[1])]
+    
     def get_report_history_summary(self) -> Dict[str, Any]:
         """Obtient un résumé de l'historique des rapports."""
         if not self.report_history:
             return {'message': 'No reports generated yet'}
         
         return {
-            'total_reports': len(self.report_history),
+            'total_reports': self.total_reports,
             'latest_report_id': self.report_history[-1].get('metadata', {}).get('report_id', 'Unknown'),
-            'average_performance': self._calculate_historical_average(),
-            'performance_trend': self._analyze_performance_trend()
+            'average_performance': self._calculate_historical_average(tuple(self._performance_history)),
+            'performance_trend': self._analyze_performance_trend(tuple(self._performance_history))
         }
     
-    def export_training_dataset(self, filepath: str):
-        """Exporte un dataset d'entraînement à partir de tous les rapports."""
-        training_data = []
+    def _training_row(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        """Ligne d'entraînement d'un rapport : features aplaties, cibles et métadonnées."""
+        ml_features = report.get('ml_features', {})
+        performance = report.get('performance_analysis', {})
         
-        for report in self.report_history:
-            ml_features = report.get('ml_features', {})
-            performance = report.get('performance_analysis', {})
-            
-            if ml_features and performance:
-                # Aplatir les features
-                features = {}
-                for category, cat_features in ml_features.items():
-                    if isinstance(cat_features, dict) and category != 'feature_metadata':
-                        for feature_name, value in cat_features.items():
-                            features[f"{category}_{feature_name}"] = value
-                
-                # Extraire les targets
-                targets = {
-                    'solve_time': performance.get('timing_analysis', {}).get('solve_time', 0),
-                    'efficiency_score': report.get('executive_summary', {}).get('efficiency_score', 0),
-                    'algorithm_effectiveness': report.get('executive_summary', {}).get('algorithm_effectiveness', 0)
-                }
-                
-                training_data.append({
-                    'features': features,
-                    'targets': targets,
-                    'metadata': {
-                        'report_id': report.get('metadata', {}).get('report_id'),
-                        'algorithm_used': report.get('metadata', {}).get('solution_info', {}).get('algorithm_used')
-                    }
-                })
-        
-        # Exporter en JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(training_data, f, indent=2, ensure_ascii=False)
-        
-        return len(training_data)
\ No newline at end of file
+        # Aplatir les features
+        features = {}
+        for category, cat_features in ml_features.items():
+            if isinstance(cat_features, dict) and category != 'feature_metadata':
+                for feature_name, value in cat_features.items():
+                    features[f"{category}_{feature_name}"] = value
+        
+        # Extraire les targets
+        targets = {
+            'solve_time': performance.get('timing_analysis', {}).get('solve_time', 0),
+            'efficiency_score': report.get('executive_summary', {}).get('efficiency_score', 0),
+            'algorithm_effectiveness': report.get('executive_summary', {}).get('algorithm_effectiveness', 0)
+        }
+        
+        return {
+            'features': features,
+            'targets': targets,
+            'metadata': {
+                'report_id': report.get('metadata', {}).get('report_id'),
+                'algorithm_used': report.get('metadata', {}).get('solution_info', {}).get('algorithm_used')
+            }
+        }
+    
+    def export_training_dataset(self, filepath: str) -> int:
+        """
+        Exporte un dataset d'entraînement à partir de tous les rapports.
+        
+        Les lignes sont relues une à une dans le journal, archives comprises.
+        
+        Returns:
+            int: Nombre de lignes exportées
+        """
+        def training_row(entry):
+            return entry if entry.get('features') and entry.get('targets') else None
+        
+        return self.telemetry_sink.export(filepath, transform=training_row)
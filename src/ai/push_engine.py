@@ -0,0 +1,429 @@
+"""
+Moteur de poussées compact pour le système IA Sokoban.
+
+Le niveau est aplati en un tableau de cases indexées par ``y * width + x`` ;
+les voisins, les cases mortes et les distances de poussée vers les cibles
+sont précalculés une fois. Un état ne retient que la position normalisée du
+joueur (la plus petite case de sa zone accessible) et l'ensemble des caisses :
+deux positions qui ne diffèrent que par la marche du joueur sont le même nœud.
+
+La recherche ``search`` est un A* sur les poussées, instrumenté : nœuds
+développés, nœuds générés, élagages par deadlock et par corral sont comptés
+dans un ``PushSearchStats``. L'estimateur de difficulté s'en sert comme sonde,
+mais le moteur ne dépend que de ``Level`` et peut servir à tout code qui a
+besoin de raisonner en poussées plutôt qu'en pas.
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+# Ordre des directions : identique à celui du solveur principal.
+DIRECTIONS = (('UP', 0, -1), ('DOWN', 0, 1), ('LEFT', -1, 0), ('RIGHT', 1, 0))
+
+INFINITY = float('inf')
+
+Push = Tuple[int, int]  # (case de la caisse avant poussée, indice de direction)
+
+
+@dataclass
+class PushSearchStats:
+    """Compteurs d'effort d'une recherche en poussées."""
+    nodes_expanded: int = 0
+    nodes_generated: int = 0
+    duplicates: int = 0
+    deadlock_prunes: int = 0
+    corral_prunes: int = 0
+    max_depth: int = 0
+    elapsed: float = 0.0
+
+
+@dataclass
+class PushSearchResult:
+    """Résultat d'une recherche : poussées trouvées et effort dépensé."""
+    pushes: Optional[List[Push]]
+    stats: PushSearchStats = field(default_factory=PushSearchStats)
+    exhausted: bool = False  # Espace épuisé sans solution : niveau insoluble
+    lower_bound: int = 0
+
+    @property
+    def solved(self) -> bool:
+        return self.pushes is not None
+
+
+class PushEngine:
+    """
+    Représentation plate d'un niveau, orientée poussées.
+
+    Les murs et les cibles sont figés à la construction ; les caisses et le
+    joueur sont passés à chaque appel, ce qui permet de partager un même
+    moteur entre plusieurs états.
+    """
+
+    def __init__(self, level):
+        self.width = level.width
+        self.height = level.height
+        size = self.width * self.height
+
+        self.floor = bytearray(size)
+        for y in range(self.height):
+            for x in range(self.width):
+                if not level.is_wall(x, y):
+                    self.floor[y * self.width + x] = 1
+
+        # neighbours[i][d] : case voisine dans la direction d, ou -1
+        self.neighbours: List[Tuple[int, int, int, int]] = []
+        for i in range(size):
+            x, y = i % self.width, i // self.width
+            row = []
+            for _, dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.width and 0 <= ny < self.height and self.floor[ny * self.width + nx]:
+                    row.append(ny * self.width + nx)
+                else:
+                    row.append(-1)
+            self.neighbours.append(tuple(row))
+
+        self.targets: FrozenSet[int] = frozenset(self.index(x, y) for x, y in level.targets)
+        self.initial_boxes: FrozenSet[int] = frozenset(self.index(x, y) for x, y in level.boxes)
+        self.initial_player: int = self.index(*level.player_pos)
+
+        self.push_distance = self._compute_push_distances()
+        self.dead_squares: FrozenSet[int] = frozenset(
+            i for i in range(size)
+            if self.floor[i] and self.push_distance[i] == INFINITY)
+
+    # ------------------------------------------------------------ géométrie
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        return index % self.width, index // self.width
+
+    @staticmethod
+    def opposite(direction: int) -> int:
+        """Indice de la direction opposée (UP<->DOWN, LEFT<->RIGHT)."""
+        return direction ^ 1
+
+    def _compute_push_distances(self) -> List[float]:
+        """
+        Nombre minimal de poussées de chaque case vers la cible la plus proche.
+
+        Calculé en tirant une caisse depuis chaque cible, en ignorant les
+        autres caisses. Une case à distance infinie est une case morte.
+        """
+        distance = [INFINITY] * (self.width * self.height)
+        queue = deque()
+        for target in self.targets:
+            distance[target] = 0
+            queue.append(target)
+
+        while queue:
+            box = queue.popleft()
+            for d in range(4):
+                # Tirer la caisse dans la direction d : le joueur se tient en
+                # box + d, la caisse arrive en box + d et il recule d'une case.
+                new_box = self.neighbours[box][d]
+                if new_box < 0 or self.neighbours[new_box][d] < 0:
+                    continue
+                if distance[new_box] == INFINITY:
+                    distance[new_box] = distance[box] + 1
+                    queue.append(new_box)
+        return distance
+
+    # ------------------------------------------------------------ joueur
+    def reachable(self, player: int, boxes: FrozenSet[int]) -> Set[int]:
+        """Cases accessibles au joueur sans pousser de caisse."""
+        seen = {player}
+        stack = [player]
+        neighbours = self.neighbours
+        while stack:
+            cell = stack.pop()
+            for nxt in neighbours[cell]:
+                if nxt >= 0 and nxt not in seen and nxt not in boxes:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return seen
+
+    def player_path(self, start: int, goal: int, boxes: FrozenSet[int]) -> Optional[List[int]]:
+        """Plus court chemin du joueur (liste d'indices de direction), ou None."""
+        if start == goal:
+            return []
+        parent = {start: None}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for d, nxt in enumerate(self.neighbours[cell]):
+                if nxt < 0 or nxt in parent or nxt in boxes:
+                    continue
+                parent[nxt] = (cell, d)
+                if nxt == goal:
+                    path = []
+                    while parent[nxt] is not None:
+                        nxt, step = parent[nxt]
+                        path.append(step)
+                    path.reverse()
+                    return path
+                queue.append(nxt)
+        return None
+
+    # ------------------------------------------------------------ poussées
+    def legal_pushes(self, reachable: Set[int], boxes: FrozenSet[int]) -> List[Push]:
+        """Poussées jouables depuis la zone accessible du joueur."""
+        pushes = []
+        neighbours = self.neighbours
+        for box in boxes:
+            row = neighbours[box]
+            for d in range(4):
+                behind = row[d ^ 1]
+                dest = row[d]
+                if behind >= 0 and dest >= 0 and behind in reachable and dest not in boxes:
+                    pushes.append((box, d))
+        return pushes
+
+    def apply_push(self, boxes: FrozenSet[int], push: Push) -> Tuple[FrozenSet[int], int]:
+        """Appliquer une poussée : nouvelles caisses et case où se trouve le joueur."""
+        box, d = push
+        dest = self.neighbours[box][d]
+        return (boxes - {box}) | {dest}, box
+
+    def lower_bound(self, boxes: FrozenSet[int]) -> float:
+        """Borne inférieure admissible du nombre de poussées restantes."""
+        return sum(self.push_distance[b] for b in boxes)
+
+    def is_solved(self, boxes: FrozenSet[int]) -> bool:
+        """Mêmes règles que Level.is_completed : chaque cible porte une caisse."""
+        return boxes == self.targets
+
+    def is_push_deadlock(self, boxes: FrozenSet[int], moved_box: int) -> bool:
+        """
+        Deadlock local provoqué par une poussée vers ``moved_box``.
+
+        Case morte, ou carré 2x2 de murs et de caisses contenant une caisse
+        hors cible (la caisse poussée fait partie du carré).
+        """
+        if moved_box in self.dead_squares:
+            return True
+        x, y = self.coords(moved_box)
+        for ox, oy in ((0, 0), (-1, 0), (0, -1), (-1, -1)):
+            block = []
+            for cx, cy in ((x + ox, y + oy), (x + ox + 1, y + oy),
+                           (x + ox, y + oy + 1), (x + ox + 1, y + oy + 1)):
+                if not (0 <= cx < self.width and 0 <= cy < self.height):
+                    block.append(None)
+                    continue
+                cell = self.index(cx, cy)
+                if not self.floor[cell]:
+                    block.append(None)
+                elif cell in boxes:
+                    block.append(cell)
+                else:
+                    break
+            else:
+                if any(c is not None and c not in self.targets for c in block):
+                    return True
+        return False
+
+    def corral_restriction(self, reachable: Set[int], boxes: FrozenSet[int],
+                           pushes: List[Push]) -> Optional[List[Push]]:
+        """
+        Restreindre les poussées à un PI-corral, s'il en existe un.
+
+        Un corral est une zone que le joueur ne peut pas atteindre. Il est
+        PI quand toute poussée jouable des caisses de sa frontière va vers
+        l'intérieur du corral, et que le joueur peut effectuer chacune des
+        poussées qui y mènent. Si le corral n'est pas résolu, il faudra tôt ou tard pousser
+        une de ces caisses : les autres poussées peuvent être différées.
+
+        Returns:
+            La liste restreinte (celle du plus petit PI-corral), ou None.
+        """
+        neighbours = self.neighbours
+        assigned: Set[int] = set()
+        best = None
+        by_box: Dict[int, List[Push]] = {}
+        for push in pushes:
+            by_box.setdefault(push[0], []).append(push)
+
+        for start in range(len(self.floor)):
+            if (not self.floor[start] or start in reachable or start in boxes
+                    or start in assigned):
+                continue
+
+            # Zone du corral, les caisses faisant office de barrière
+            area = {start}
+            stack = [start]
+            frontier: Set[int] = set()
+            while stack:
+                cell = stack.pop()
+                for nxt in neighbours[cell]:
+                    if nxt < 0 or nxt in area:
+                        continue
+                    if nxt in boxes:
+                        frontier.add(nxt)
+                    elif nxt not in reachable:
+                        area.add(nxt)
+                        stack.append(nxt)
+            assigned |= area
+
+            if not frontier:
+                continue
+            solved = (all(b in self.targets for b in frontier)
+                      and all(t in boxes for t in self.targets if t in area))
+            if solved:
+                continue
+
+            candidate = []
+            is_pi = True
+            for box in frontier:
+                for d in range(4):
+                    dest = neighbours[box][d]
+                    behind = neighbours[box][d ^ 1]
+                    if dest < 0 or behind < 0 or dest in boxes or behind in boxes:
+                        continue
+                    # I : toute poussée jouable doit entrer dans le corral
+                    # P : toute poussée vers le corral doit être jouable
+                    if (behind in reachable) != (dest in area):
+                        is_pi = False
+                        break
+                if not is_pi:
+                    break
+                candidate.extend(by_box.get(box, ()))
+
+            if is_pi and candidate and (best is None or len(candidate) < len(best)):
+                best = candidate
+
+        return best
+
+    # ------------------------------------------------------------ recherche
+    def normalize(self, player: int, boxes: FrozenSet[int]) -> Tuple[int, Set[int]]:
+        """Position canonique du joueur et zone accessible."""
+        reachable = self.reachable(player, boxes)
+        return min(reachable), reachable
+
+    def search(self, boxes: Optional[FrozenSet[int]] = None, player: Optional[int] = None,
+               max_nodes: int = 100000, time_limit: float = 10.0,
+               use_corrals: bool = True) -> PushSearchResult:
+        """
+        A* sur les poussées, borné en nœuds et en temps.
+
+        Args:
+            boxes: Caisses de départ (celles du niveau par défaut)
+            player: Case de départ du joueur (celle du niveau par défaut)
+            max_nodes: Nombre maximal de nœuds développés
+            time_limit: Durée maximale en secondes
+            use_corrals: Activer l'élagage par PI-corral
+
+        Returns:
+            PushSearchResult avec la séquence de poussées si trouvée
+        """
+        boxes = self.initial_boxes if boxes is None else boxes
+        player = self.initial_player if player is None else player
+        stats = PushSearchStats()
+        start_time = time.perf_counter()
+
+        start_h = self.lower_bound(boxes)
+        result = PushSearchResult(pushes=None, stats=stats,
+                                  lower_bound=int(start_h) if start_h != INFINITY else -1)
+        if start_h == INFINITY:
+            result.exhausted = True
+            return result
+
+        norm, _ = self.normalize(player, boxes)
+        start_key = (norm, boxes)
+        # parent[clé] = (clé parente, poussée, case réelle du joueur après la poussée)
+        parent: Dict[Tuple[int, FrozenSet[int]], Optional[Tuple]] = {start_key: None}
+        g_cost = {start_key: 0}
+        player_at = {start_key: player}
+        counter = itertools.count()
+        open_heap = [(start_h, start_h, next(counter), start_key)]
+        closed = set()
+
+        while open_heap:
+            if stats.nodes_expanded >= max_nodes or time.perf_counter() - start_time > time_limit:
+                stats.elapsed = time.perf_counter() - start_time
+                return result
+
+            _, _, _, key = heapq.heappop(open_heap)
+            if key in closed:
+                continue
+            closed.add(key)
+            stats.nodes_expanded += 1
+
+            _, state_boxes = key
+            g = g_cost[key]
+            if self.is_solved(state_boxes):
+                result.pushes = self._rebuild_pushes(parent, key)
+                stats.elapsed = time.perf_counter() - start_time
+                return result
+
+            reachable = self.reachable(player_at[key], state_boxes)
+            pushes = self.legal_pushes(reachable, state_boxes)
+            if use_corrals and pushes:
+                restricted = self.corral_restriction(reachable, state_boxes, pushes)
+                if restricted is not None:
+                    stats.corral_prunes += len(pushes) - len(restricted)
+                    pushes = restricted
+
+            for push in pushes:
+                new_boxes, new_player = self.apply_push(state_boxes, push)
+                moved = self.neighbours[push[0]][push[1]]
+                if self.is_push_deadlock(new_boxes, moved):
+                    stats.deadlock_prunes += 1
+                    continue
+                new_norm, _ = self.normalize(new_player, new_boxes)
+                new_key = (new_norm, new_boxes)
+                new_g = g + 1
+                if new_key in closed or g_cost.get(new_key, INFINITY) <= new_g:
+                    stats.duplicates += 1
+                    continue
+                h = self.lower_bound(new_boxes)
+                if h == INFINITY:
+                    stats.deadlock_prunes += 1
+                    continue
+                g_cost[new_key] = new_g
+                parent[new_key] = (key, push)
+                player_at[new_key] = new_player
+                stats.nodes_generated += 1
+                stats.max_depth = max(stats.max_depth, new_g)
+                heapq.heappush(open_heap, (new_g + h, h, next(counter), new_key))
+
+        result.exhausted = True
+        stats.elapsed = time.perf_counter() - start_time
+        return result
+
+    @staticmethod
+    def _rebuild_pushes(parent, key) -> List[Push]:
+        pushes = []
+        while parent[key] is not None:
+            key, push = parent[key]
+            pushes.append(push)
+        pushes.reverse()
+        return pushes
+
+    def pushes_to_moves(self, pushes: List[Push], boxes: Optional[FrozenSet[int]] = None,
+                        player: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Développer une séquence de poussées en coups ('UP', 'DOWN', ...).
+
+        Returns:
+            La liste de coups, ou None si une poussée n'est pas jouable.
+        """
+        boxes = self.initial_boxes if boxes is None else boxes
+        player = self.initial_player if player is None else player
+        moves = []
+        for box, d in pushes:
+            behind = self.neighbours[box][d ^ 1]
+            if behind < 0 or box not in boxes:
+                return None
+            walk = self.player_path(player, behind, boxes)
+            if walk is None:
+                return None
+            moves.extend(DIRECTIONS[step][0] for step in walk)
+            moves.append(DIRECTIONS[d][0])
+            boxes, player = self.apply_push(boxes, (box, d))
+        return moves
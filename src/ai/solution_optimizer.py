@@ -4,11 +4,22 @@ Solution Optimizer for Sokoban Game.
 Takes an existing solution and reduces the number of moves/pushes by:
 1. Eliminating redundant back-and-forth moves.
 2. Re-routing player walks between pushes via shortest paths.
+3. Re-solving windows of the push sequence with fewer pushes
+   (optimize_pushes), on the flat PushEngine rather than Level.move.
+
+BackgroundOptimizer runs the push optimization in a worker thread, so a
+solver can hand its solution over and return immediately.
 """
 
 import copy
+import heapq
+import itertools
+import time
 from collections import deque
 
+from src.ai.push_engine import DIRECTIONS, INFINITY, PushEngine
+from src.core.background_worker import BackgroundWorker
+
 
 DIRECTION_MAP = {
     'UP': (0, -1),
@@ -24,6 +35,14 @@ OPPOSITE = {
     'RIGHT': 'LEFT',
 }
 
+# Move string -> PushEngine direction index
+DIRECTION_INDEX = {name: index for index, (name, _, _) in enumerate(DIRECTIONS)}
+
+# Defaults of optimize_pushes: time budget in seconds, window size, nodes per window
+DEFAULT_TIME_BUDGET = 2.0
+DEFAULT_MAX_WINDOW = 10
+DEFAULT_MAX_NODES = 20000
+
 
 class SolutionOptimizer:
     """Optimizes Sokoban solutions to reduce total moves."""
@@ -190,3 +209,275 @@ class SolutionOptimizer:
                 (1 - len(optimized_moves) / max(len(original_moves), 1)) * 100
             ),
         }
+
+    def optimize_pushes(self, level, solution_moves, time_budget=DEFAULT_TIME_BUDGET,
+                        max_window=DEFAULT_MAX_WINDOW, max_nodes=DEFAULT_MAX_NODES):
+        """
+        Reduce the pushes, then the moves, of a solution.
+
+        The solution is replayed into its sequence of push states. Pushes
+        between two identical states are dropped, then every window of up to
+        max_window consecutive pushes is re-solved with an A* bounded by the
+        window length: a shorter push sequence joining the same two states
+        replaces it. Windows cover any reordering of the pushes of the boxes
+        they contain. Finally the walks between pushes are the shortest ones.
+
+        Args:
+            level: The Level object, in the position the solution starts from.
+                   It is not modified.
+            solution_moves: List of move strings ('UP', 'DOWN', 'LEFT', 'RIGHT').
+            time_budget (float): Maximum duration in seconds.
+            max_window (int): Largest number of consecutive pushes re-solved at once.
+            max_nodes (int): Node budget of each window search.
+
+        Returns:
+            tuple: (optimized move list, stats dict). The original moves are
+                returned if they do not solve the level or nothing shorter is found.
+        """
+        return self._optimize_pushes(PushEngine(level), solution_moves, time_budget,
+                                     max_window, max_nodes)
+
+    def _optimize_pushes(self, engine, solution_moves, time_budget, max_window, max_nodes):
+        """optimize_pushes on a prebuilt engine."""
+        start_time = time.perf_counter()
+        deadline = start_time + time_budget
+        moves = list(solution_moves)
+        stats = {
+            'verified': False,
+            'original_moves': len(moves),
+            'original_pushes': 0,
+            'optimized_moves': len(moves),
+            'optimized_pushes': 0,
+            'moves_saved': 0,
+            'pushes_saved': 0,
+            'windows_tried': 0,
+            'windows_improved': 0,
+            'complete': False,
+            'elapsed': 0.0,
+        }
+
+        pushes = self._trace_pushes(engine, moves)
+        if pushes is None:
+            stats['elapsed'] = time.perf_counter() - start_time
+            return moves, stats
+        stats['verified'] = True
+        stats['original_pushes'] = stats['optimized_pushes'] = len(pushes)
+
+        pushes = self._remove_push_cycles(engine, pushes)
+
+        timed_out = False
+        for window in range(2, max_window + 1):
+            states = self._push_states(engine, pushes)
+            i = 0
+            while i + window <= len(pushes):
+                if time.perf_counter() > deadline:
+                    timed_out = True
+                    break
+                stats['windows_tried'] += 1
+                shorter = self._resolve_window(engine, states[i], states[i + window],
+                                               window, deadline, max_nodes)
+                if shorter is None:
+                    i += 1
+                    continue
+                stats['windows_improved'] += 1
+                pushes = pushes[:i] + shorter + pushes[i + window:]
+                states = self._push_states(engine, pushes)
+            if timed_out:
+                break
+
+        optimized = engine.pushes_to_moves(pushes)
+        if optimized is not None and (len(pushes), len(optimized)) < (stats['original_pushes'], len(moves)):
+            stats['optimized_pushes'] = len(pushes)
+            stats['optimized_moves'] = len(optimized)
+            moves = optimized
+        stats['pushes_saved'] = stats['original_pushes'] - stats['optimized_pushes']
+        stats['moves_saved'] = stats['original_moves'] - stats['optimized_moves']
+        stats['complete'] = not timed_out
+        stats['elapsed'] = time.perf_counter() - start_time
+        return moves, stats
+
+    @staticmethod
+    def _trace_pushes(engine, moves):
+        """Pushes of a solution, or None if a move is illegal or the level is not solved."""
+        neighbours = engine.neighbours
+        boxes, player = engine.initial_boxes, engine.initial_player
+        pushes = []
+        for move in moves:
+            d = DIRECTION_INDEX.get(move)
+            if d is None:
+                return None
+            cell = neighbours[player][d]
+            if cell < 0:
+                return None
+            if cell in boxes:
+                dest = neighbours[cell][d]
+                if dest < 0 or dest in boxes:
+                    return None
+                pushes.append((cell, d))
+                boxes, _ = engine.apply_push(boxes, (cell, d))
+            player = cell
+        return pushes if engine.is_solved(boxes) else None
+
+    @staticmethod
+    def _push_states(engine, pushes):
+        """(player, boxes) before each push, and after the last one."""
+        boxes, player = engine.initial_boxes, engine.initial_player
+        states = [(player, boxes)]
+        for push in pushes:
+            boxes, player = engine.apply_push(boxes, push)
+            states.append((player, boxes))
+        return states
+
+    def _remove_push_cycles(self, engine, pushes):
+        """Drop the pushes between two visits of the same state."""
+        result = []
+        seen = {}  # State key -> number of pushes kept when first reached
+        for k, (player, boxes) in enumerate(self._push_states(engine, pushes)):
+            key = (engine.normalize(player, boxes)[0], boxes)
+            if key in seen:
+                del result[seen[key]:]
+                # Forget the states of the removed loop
+                seen = {state: count for state, count in seen.items() if count <= seen[key]}
+            else:
+                seen[key] = len(result)
+            if k < len(pushes):
+                result.append(pushes[k])
+        return result
+
+    @staticmethod
+    def _resolve_window(engine, start, goal, limit, deadline, max_nodes):
+        """
+        A* for fewer than limit pushes from start to goal.
+
+        Args:
+            start, goal: (player, boxes) states; the goal player position
+                         only has to be reachable.
+
+        Returns:
+            list: Pushes joining the states, or None.
+        """
+        goal_player, goal_boxes = goal
+        goal_key = (engine.normalize(goal_player, goal_boxes)[0], goal_boxes)
+        goal_cells = [engine.coords(cell) for cell in goal_boxes]
+        coords = engine.coords
+
+        def bound(boxes):
+            # Each push moves one box by one cell
+            total = 0
+            for box in boxes - goal_boxes:
+                x, y = coords(box)
+                total += min(abs(x - gx) + abs(y - gy) for gx, gy in goal_cells)
+            return total
+
+        player, boxes = start
+        start_key = (engine.normalize(player, boxes)[0], boxes)
+        h = bound(boxes)
+        if h >= limit:
+            return None
+
+        parent = {start_key: None}
+        g_cost = {start_key: 0}
+        player_at = {start_key: player}
+        counter = itertools.count()
+        open_heap = [(h, 0, next(counter), start_key)]
+        expanded = 0
+        neighbours = engine.neighbours
+
+        while open_heap:
+            _, g, _, key = heapq.heappop(open_heap)
+            if g > g_cost[key]:
+                continue
+            if key == goal_key:
+                return PushEngine._rebuild_pushes(parent, key)
+            expanded += 1
+            if expanded > max_nodes or (expanded % 64 == 0 and time.perf_counter() > deadline):
+                return None
+
+            state_boxes = key[1]
+            reachable = engine.reachable(player_at[key], state_boxes)
+            for push in engine.legal_pushes(reachable, state_boxes):
+                new_boxes, new_player = engine.apply_push(state_boxes, push)
+                if engine.is_push_deadlock(new_boxes, neighbours[push[0]][push[1]]):
+                    continue
+                new_g = g + 1
+                h = bound(new_boxes)
+                if new_g + h >= limit:
+                    continue
+                new_key = (engine.normalize(new_player, new_boxes)[0], new_boxes)
+                if g_cost.get(new_key, INFINITY) <= new_g:
+                    continue
+                g_cost[new_key] = new_g
+                parent[new_key] = (key, push)
+                player_at[new_key] = new_player
+                heapq.heappush(open_heap, (new_g + h, new_g, next(counter), new_key))
+        return None
+
+
+class BackgroundOptimizer:
+    """
+    Runs SolutionOptimizer.optimize_pushes in a daemon worker thread.
+
+    The push engine is built from the level when a job is submitted, so the
+    level can be played (or animated) while the worker runs. Submitting a
+    new job or cancelling drops the results of older ones.
+    """
+
+    def __init__(self, optimizer=None):
+        """
+        Args:
+            optimizer (SolutionOptimizer, optional): Optimizer to use.
+        """
+        self.optimizer = optimizer or SolutionOptimizer()
+        self._worker = BackgroundWorker(self._optimize, name="solution-optimizer",
+                                        error_message="Error in solution optimization")
+
+    def submit(self, level, solution_moves, on_done, time_budget=DEFAULT_TIME_BUDGET):
+        """
+        Queue the optimization of a solution.
+
+        Args:
+            level: The Level object, in the position the solution starts from.
+            solution_moves: List of move strings.
+            on_done (callable): Called from the worker thread with
+                (optimized moves, stats) when the job completes.
+            time_budget (float): Maximum duration in seconds.
+        """
+        self._worker.submit((PushEngine(level), list(solution_moves), on_done, time_budget),
+                            replace=True)
+
+    def cancel(self):
+        """Drop pending jobs and the result of the running one."""
+        self._worker.cancel()
+
+    def stop(self):
+        """Drop pending jobs and end the worker thread; a later submit starts a new one."""
+        self._worker.stop()
+
+    def wait_idle(self):
+        """Wait until the worker has processed all queued jobs."""
+        self._worker.wait_idle()
+
+    def _optimize(self, job, generation):
+        """Worker thread: optimize a submitted solution."""
+        engine, moves, on_done, time_budget = job
+        optimized, stats = self.optimizer._optimize_pushes(
+            engine, moves, time_budget, DEFAULT_MAX_WINDOW, DEFAULT_MAX_NODES)
+        if self._worker.is_current(generation):
+            on_done(optimized, stats)
+
+
+# Shared background optimizer: one worker thread for the whole process
+_background_optimizer = None
+
+
+def get_background_optimizer() -> BackgroundOptimizer:
+    """
+    Get the global background optimizer instance.
+
+    Returns:
+        BackgroundOptimizer: The shared background optimizer
+    """
+    global _background_optimizer
+    if _background_optimizer is None:
+        _background_optimizer = BackgroundOptimizer()
+    return _background_optimizer
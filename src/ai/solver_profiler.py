@@ -0,0 +1,210 @@
+"""
+Instrumentation optionnelle du chemin critique d'EnhancedSokolutionSolver.
+
+Le solver compte ses états et ses appels d'heuristique, mais ne dit pas où
+passe le temps. ``SolverProfiler`` mesure, phase par phase, le temps propre
+(hors sous-phases) passé dans :
+
+- ``successors``    : génération des successeurs ;
+- ``deadlock``      : détection de deadlocks ;
+- ``heuristic``     : calcul de l'heuristique ;
+- ``transposition`` : consultations et insertions de la table de transposition ;
+- ``heap``          : opérations sur la frontière (tas, ou file pour BFS).
+
+Le profileur s'installe en enveloppant les méthodes concernées sur l'instance
+du solver : désactivé, il ne coûte rien. Activé, chaque appel coûte deux
+``perf_counter_ns``. Il produit des histogrammes de durée par phase, la taille
+de la frontière au cours du temps et le débit en états par seconde, et exporte
+une trace lisible par speedscope (https://www.speedscope.app).
+"""
+
+import cProfile
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+PHASES = ('successors', 'deadlock', 'heuristic', 'transposition', 'heap')
+
+
+class SolverProfiler:
+    """Accumulateurs de temps par phase pour une résolution."""
+
+    def __init__(self, frontier_sample_every: int = 1000):
+        """
+        Args:
+            frontier_sample_every: Relevé de la taille de frontière toutes les N extractions
+        """
+        self.frontier_sample_every = frontier_sample_every
+        self.reset()
+
+    def reset(self):
+        """Remet à zéro toutes les mesures."""
+        self.totals_ns: Dict[str, int] = {phase: 0 for phase in PHASES}
+        self.calls: Dict[str, int] = {phase: 0 for phase in PHASES}
+        # phase -> {k: nombre d'appels dont la durée propre tient sur k bits de ns}
+        self.histograms: Dict[str, Dict[int, int]] = {phase: {} for phase in PHASES}
+        # (secondes écoulées, extractions, taille de la frontière)
+        self.frontier_samples: List[Tuple[float, int, int]] = []
+        self._pops = 0
+        self._stack: List[int] = []
+        self._start_ns = time.perf_counter_ns()
+        self._end_ns: Optional[int] = None
+
+    def start(self):
+        """Début d'une résolution."""
+        self.reset()
+
+    def stop(self):
+        """Fin d'une résolution."""
+        self._end_ns = time.perf_counter_ns()
+
+    @property
+    def elapsed_ns(self) -> int:
+        end = self._end_ns if self._end_ns is not None else time.perf_counter_ns()
+        return end - self._start_ns
+
+    def wrap(self, phase: str, func: Callable, frontier: bool = False) -> Callable:
+        """
+        Enveloppe une fonction pour comptabiliser son temps propre dans une phase.
+
+        Le temps passé dans une autre fonction enveloppée appelée depuis celle-ci
+        est retiré, pour que la somme des phases ne compte rien deux fois.
+
+        Args:
+            phase: Nom de la phase (voir PHASES)
+            func: Fonction à mesurer
+            frontier: Si True, le premier argument est la frontière, dont la
+                taille est relevée périodiquement
+
+        Returns:
+            Callable: Fonction instrumentée
+        """
+        perf_counter_ns = time.perf_counter_ns
+        stack = self._stack
+        totals = self.totals_ns
+        calls = self.calls
+        histogram = self.histograms[phase]
+
+        def instrumented(*args, **kwargs):
+            stack.append(0)
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                own = elapsed - stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                totals[phase] += own
+                calls[phase] += 1
+                bucket = own.bit_length()
+                histogram[bucket] = histogram.get(bucket, 0) + 1
+                if frontier:
+                    self._sample_frontier(args[0])
+
+        instrumented.__wrapped__ = func
+        return instrumented
+
+    def _sample_frontier(self, frontier):
+        self._pops += 1
+        if self._pops % self.frontier_sample_every == 0:
+            elapsed = (time.perf_counter_ns() - self._start_ns) / 1e9
+            self.frontier_samples.append((elapsed, self._pops, len(frontier)))
+
+    def get_statistics(self, states_explored: int = 0) -> Dict[str, Any]:
+        """
+        Résumé des mesures.
+
+        Args:
+            states_explored: États explorés par le solver, pour le débit
+
+        Returns:
+            Dict: Temps par phase, histogrammes, frontière et débit
+        """
+        elapsed = self.elapsed_ns
+        measured = sum(self.totals_ns.values())
+        phases = {}
+        for phase in PHASES:
+            total = self.totals_ns[phase]
+            calls = self.calls[phase]
+            phases[phase] = {
+                'time': total / 1e9,
+                'calls': calls,
+                'mean_ns': total / calls if calls else 0.0,
+                'share': total / elapsed if elapsed else 0.0,
+                'histogram': {f"<{2 ** bucket}ns": count
+                              for bucket, count in sorted(self.histograms[phase].items())},
+            }
+        return {
+            'phases': phases,
+            'other_time': max(elapsed - measured, 0) / 1e9,
+            'total_time': elapsed / 1e9,
+            'states_per_second': states_explored / (elapsed / 1e9) if elapsed else 0.0,
+            'frontier_samples': list(self.frontier_samples),
+            'peak_frontier': max((size for _, _, size in self.frontier_samples), default=0),
+        }
+
+    def to_speedscope(self, name: str = "solve") -> Dict[str, Any]:
+        """
+        Trace au format speedscope : un profil échantillonné pondéré par le
+        temps propre de chaque phase, sous une racine ``solve``.
+        """
+        frames = [{'name': name}] + [{'name': phase} for phase in PHASES] + [{'name': 'other'}]
+        elapsed = self.elapsed_ns
+        samples, weights = [], []
+        for index, phase in enumerate(PHASES, start=1):
+            if self.totals_ns[phase]:
+                samples.append([0, index])
+                weights.append(self.totals_ns[phase])
+        other = max(elapsed - sum(self.totals_ns.values()), 0)
+        if other:
+            samples.append([0, len(PHASES) + 1])
+            weights.append(other)
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'PySokoban SolverProfiler',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'nanoseconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            }],
+        }
+
+    def export_speedscope(self, path: str, name: str = "solve"):
+        """Écrit la trace speedscope dans un fichier JSON."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_speedscope(name), f)
+
+
+def run_with_cprofile(func: Callable, path: str, *args, **kwargs):
+    """
+    Exécute une fonction sous cProfile et écrit les statistiques pstats.
+
+    Le fichier s'ouvre avec ``python -m pstats <path>`` ou snakeviz.
+
+    Args:
+        func: Fonction à profiler (typiquement ``solver.solve``)
+        path: Fichier .prof de sortie
+
+    Returns:
+        Le résultat de ``func``
+    """
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(func, *args, **kwargs)
+    finally:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        profile.dump_stats(path)
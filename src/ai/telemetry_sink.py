@@ -0,0 +1,200 @@
+"""
+Journal de télémétrie en flux, à mémoire bornée.
+
+Le contrôleur IA, le collecteur de métriques ML et le générateur de rapports
+gardaient chacun une liste de tous leurs enregistrements pour toute la durée
+du processus, et leurs exports écrivaient cette liste d'un bloc : en lot, la
+mémoire ne faisait que monter.
+
+``TelemetrySink`` écrit chaque enregistrement compact sur une ligne d'un
+fichier JSONL dès qu'il est produit. Le fichier tourne quand il dépasse sa
+taille maximale (``solves.jsonl`` -> ``solves.jsonl.1`` -> ...), en gardant
+un nombre fixe d'archives. Seul un tampon circulaire des derniers
+enregistrements reste en mémoire pour l'interface ; les exports relisent le
+disque ligne par ligne avec ``iter_records``.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_TELEMETRY_DIR = os.path.join(_PROJECT_ROOT, 'data', 'telemetry')
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+DEFAULT_BUFFER_SIZE = 100
+
+
+def level_hash(level) -> str:
+    """
+    Empreinte d'un niveau : plan, caisses et joueur de la position résolue.
+
+    Args:
+        level: Instance de Level
+
+    Returns:
+        str: 16 caractères hexadécimaux
+    """
+    key = (level.layout_key(), tuple(sorted(level.boxes)), tuple(level.player_pos))
+    return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16]
+
+
+class TelemetrySink:
+    """Journal JSONL à rotation, doublé d'un tampon circulaire en mémoire."""
+
+    def __init__(self, path: Optional[str], max_bytes: int = DEFAULT_MAX_BYTES,
+                 backups: int = DEFAULT_BACKUPS, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            path: Fichier JSONL, ou None pour ne garder que le tampon
+            max_bytes: Taille au-delà de laquelle le fichier tourne
+            backups: Nombre d'archives conservées (path.1 est la plus récente)
+            buffer_size: Nombre d'enregistrements gardés en mémoire
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.recent_records = deque(maxlen=buffer_size)
+        self.total_records = 0
+        self._lock = threading.Lock()
+
+    def record(self, entry: Dict[str, Any]):
+        """Ajoute un enregistrement au tampon et à la fin du journal."""
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str)
+        with self._lock:
+            self.recent_records.append(entry)
+            self.total_records += 1
+            if not self.path:
+                return
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                if (os.path.exists(self.path)
+                        and os.path.getsize(self.path) + len(line) + 1 > self.max_bytes):
+                    self._rotate()
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+            except OSError as e:
+                print(f"Télémétrie non écrite ({self.path}) : {e}")
+
+    def recent(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Derniers enregistrements du tampon, du plus ancien au plus récent."""
+        with self._lock:
+            records = list(self.recent_records)
+        return records if count is None else records[-count:] if count > 0 else []
+
+    def files(self) -> List[str]:
+        """Fichiers du journal existants, du plus ancien au plus récent."""
+        if not self.path:
+            return []
+        paths = [f"{self.path}.{index}" for index in range(self.backups, 0, -1)]
+        paths.append(self.path)
+        return [path for path in paths if os.path.exists(path)]
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Relit le journal sur disque, archives comprises, une ligne à la fois.
+
+        Sans fichier, parcourt le tampon. Les lignes illisibles (arrêt brutal
+        pendant une écriture) sont ignorées.
+        """
+        if not self.path:
+            yield from self.recent()
+            return
+        for path in self.files():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+            except OSError:
+                continue
+
+    def export(self, filepath: str, header: Optional[Dict[str, Any]] = None, key: str = 'records',
+               transform: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = None) -> int:
+        """
+        Exporte le journal en un document JSON sans le charger en mémoire.
+
+        Le document est ``header`` complété d'une liste ``key`` écrite
+        enregistrement par enregistrement ; sans header, c'est la liste seule.
+
+        Args:
+            filepath: Fichier d'export
+            header: Champs du document placés avant la liste
+            key: Nom de la liste dans le document
+            transform: Conversion de chaque enregistrement (None pour l'omettre)
+
+        Returns:
+            int: Nombre d'enregistrements exportés
+        """
+        count = 0
+        with open(filepath, 'w', encoding='utf-8') as f:
+            if header is None:
+                f.write('[')
+            else:
+                body = json.dumps(header, indent=2, ensure_ascii=False, default=str)
+                f.write(body[:-1].rstrip())
+                f.write(',\n  ' if header else '\n  ')
+                f.write(json.dumps(key) + ': [')
+            for entry in self.iter_records():
+                if transform is not None:
+                    entry = transform(entry)
+                    if entry is None:
+                        continue
+                f.write(',\n' if count else '\n')
+                f.write(json.dumps(entry, ensure_ascii=False, default=str))
+                count += 1
+            f.write('\n]' if header is None else '\n  ]\n}')
+            f.write('\n')
+        return count
+
+    def clear(self):
+        """Vide le tampon et supprime le journal et ses archives."""
+        with self._lock:
+            self.recent_records.clear()
+            for path in self.files():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _rotate(self):
+        """Décale les archives (path.1 -> path.2 ...) et archive le fichier courant."""
+        for index in range(self.backups, 0, -1):
+            source = self.path if index == 1 else f"{self.path}.{index - 1}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index}")
+        if self.backups == 0 and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# Instances globales, une par journal
+_telemetry_sinks: Dict[str, TelemetrySink] = {}
+
+
+def get_telemetry_sink(name: str) -> TelemetrySink:
+    """
+    Journal global ``data/telemetry/<name>.jsonl``.
+
+    Args:
+        name: Nom du journal ('solves', 'ml_metrics', 'ml_reports')
+
+    Returns:
+        TelemetrySink: Instance partagée
+    """
+    sink = _telemetry_sinks.get(name)
+    if sink is None:
+        sink = TelemetrySink(os.path.join(DEFAULT_TELEMETRY_DIR, f"{name}.jsonl"))
+        _telemetry_sinks[name] = sink
+    return sink
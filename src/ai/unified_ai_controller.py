@@ -6,14 +6,19 @@ refactorisé, incluant la sélection automatique d'algorithme, la collection
 de métriques ML, et l'intégration avec l'interface graphique.
 """
 
+import itertools
 import time
+from collections import deque
+from datetime import datetime
 from typing import Optional, Dict, Any, Callable, List
 from dataclasses import dataclass
 
-from .algorithm_selector import AlgorithmSelector, Algorithm
+from .algorithm_selector import AlgorithmSelector, Algorithm, SolvePlan, DEFAULT_SOLVER_LIMITS
 from .enhanced_sokolution_solver import EnhancedSokolutionSolver, SolutionData, SearchMode
 from .ml_metrics_collector import MLMetricsCollector
 from .ml_report_generator import MLReportGenerator
+from .ml_analysis_worker import MLAnalysisWorker
+from .telemetry_sink import TelemetrySink, DEFAULT_BUFFER_SIZE, get_telemetry_sink, level_hash
 
 
 @dataclass
@@ -22,10 +27,12 @@ class SolveRequest:
     level: Any
     algorithm: Optional[Algorithm] = None  # Si None, sélection automatique
     mode: SearchMode = SearchMode.FORWARD
-    max_states: int = 1000000
-    time_limit: float = 120.0
+    max_states: Optional[int] = None  # Si None, budget du sélecteur
+    time_limit: Optional[float] = None
     collect_ml_metrics: bool = True
     generate_report: bool = False
+    background_analysis: bool = True  # Métriques et rapport hors du chemin de résolution
+    report_formats: tuple = ()  # Fichiers du rapport à écrire ('json', 'html', 'csv')
 
 
 @dataclass
@@ -33,10 +40,11 @@ class SolveResult:
     """Résultat complet d'une résolution."""
     success: bool
     solution_data: Optional[SolutionData]
-    ml_metrics: Optional[Dict[str, Any]]
+    ml_metrics: Optional[Dict[str, Any]]  # Rempli à la fin de l'analyse en arrière-plan
     ml_report: Optional[Dict[str, Any]]
     algorithm_recommendation: Optional[Dict[str, Any]]
     error_message: Optional[str] = None
+    cost_report: Optional[Dict[str, Any]] = None  # Coûts prédits et réels
 
 
 class UnifiedAIController:
@@ -51,13 +59,25 @@ class UnifiedAIController:
     - Interface avec le système de rendu
     """
     
-    def __init__(self):
-        self.algorithm_selector = AlgorithmSelector()
+    def __init__(self, telemetry=None, sink: Optional[TelemetrySink] = None,
+                 history_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            telemetry: SolveTelemetryLog où consigner chaque résolution, ou None
+            sink: Journal des résolutions (par défaut data/telemetry/solves.jsonl)
+            history_size: Nombre de résultats complets gardés en mémoire
+        """
+        self.algorithm_selector = AlgorithmSelector(telemetry=telemetry)
         self.ml_metrics_collector = None  # Sera initialisé à la demande
         self.ml_report_generator = None   # Sera initialisé à la demande
+        self.ml_worker: Optional[MLAnalysisWorker] = None
         
-        # Historique des résolutions
-        self.solve_history: List[SolveResult] = []
+        # Historique des résolutions : les derniers résultats en mémoire,
+        # un enregistrement compact par résolution dans le journal
+        self.solve_history = deque(maxlen=history_size)
+        self.telemetry_sink = sink if sink is not None else get_telemetry_sink('solves')
+        self._success_totals = {'count': 0, 'solve_time': 0.0, 'moves': 0,
+                                'states_explored': 0, 'states_generated': 0}
         
         # Statistiques globales
         self.total_solves = 0
@@ -93,6 +113,8 @@ class UnifiedAIController:
         
         self.is_solving = True
         self.total_solves += 1
+        selected_algorithm = request.algorithm
+        plan = None
         
         try:
             # 1. Sélection d'algorithme (automatique ou manuel)
@@ -100,6 +122,7 @@ class UnifiedAIController:
             if request.algorithm is None:
                 algorithm_recommendation = self.algorithm_selector.get_algorithm_recommendation(request.level)
                 selected_algorithm = algorithm_recommendation['recommended_algorithm']
+                plan = algorithm_recommendation['budget']
                 
                 if progress_callback:
                     complexity_score = algorithm_recommendation['complexity_score']
@@ -107,62 +130,48 @@ class UnifiedAIController:
                     progress_callback(f"🎯 Niveau {category} (score: {complexity_score:.1f}) → Algorithme sélectionné: {selected_algorithm.value}")
             else:
                 selected_algorithm = request.algorithm
+                plan = SolvePlan(selected_algorithm, *DEFAULT_SOLVER_LIMITS, source='rules')
                 
                 if progress_callback:
                     progress_callback(f"🔧 Utilisation de l'algorithme spécifié: {selected_algorithm.value}")
             
+            # Des limites explicites dans la requête priment sur le budget du plan
+            if request.max_states is not None:
+                plan.max_states = request.max_states
+            if request.time_limit is not None:
+                plan.time_limit = request.time_limit
+            
             # 2. Initialisation du solver
             self.current_solver = EnhancedSokolutionSolver(
                 level=request.level,
-                max_states=request.max_states,
-                time_limit=request.time_limit
+                max_states=plan.max_states,
+                time_limit=plan.time_limit
             )
             
             if progress_callback:
-                solver_info = f"Limites: {request.max_states:,} états max, {request.time_limit:.0f}s timeout"
+                solver_info = f"Limites: {plan.max_states:,} états max, {plan.time_limit:.0f}s timeout"
                 progress_callback(f"⚙️ Initialisation solver {selected_algorithm.value} - {solver_info}")
             
             # 3. Résolution
             if progress_callback:
                 progress_callback(f"🚀 Démarrage de l'analyse algorithmique...")
             
+            start_time = time.time()
             solution_data = self._solve_with_fallback(
                 selected_algorithm=selected_algorithm,
                 request=request,
                 progress_callback=progress_callback
             )
+            cost_report = self.algorithm_selector.record_outcome(
+                level=request.level,
+                plan=plan,
+                states=self.current_solver.states_explored,
+                solve_time=time.time() - start_time,
+                success=solution_data is not None,
+                algorithm=selected_algorithm
+            )
             
-            # 4. Collection de métriques ML (si demandée)
-            ml_metrics = None
-            if request.collect_ml_metrics and solution_data:
-                if progress_callback:
-                    progress_callback("Collection des métriques ML...")
-                
-                if self.ml_metrics_collector is None:
-                    self._initialize_ml_components()
-                
-                ml_metrics = self.ml_metrics_collector.collect_solving_metrics(
-                    level=request.level,
-                    solution_data=solution_data,
-                    solver_stats=self.current_solver.get_comprehensive_statistics()
-                )
-            
-            # 5. Génération de rapport (si demandée)
-            ml_report = None
-            if request.generate_report and solution_data and ml_metrics:
-                if progress_callback:
-                    progress_callback("Génération du rapport ML...")
-                
-                if self.ml_report_generator is None:
-                    self._initialize_ml_components()
-                
-                ml_report = self.ml_report_generator.generate_comprehensive_report(
-                    level=request.level,
-                    solution_data=solution_data,
-                    metrics=ml_metrics
-                )
-            
-            # 6. Préparation du résultat
+            # 4. Préparation du résultat
             success = solution_data is not None
             if success:
                 self.successful_solves += 1
@@ -183,13 +192,18 @@ class UnifiedAIController:
             result = SolveResult(
                 success=success,
                 solution_data=solution_data,
-                ml_metrics=ml_metrics,
-                ml_report=ml_report,
-                algorithm_recommendation=algorithm_recommendation
+                ml_metrics=None,
+                ml_report=None,
+                algorithm_recommendation=algorithm_recommendation,
+                cost_report=cost_report
             )
             
+            # 5. Métriques ML et rapport (si demandés)
+            if request.collect_ml_metrics and solution_data:
+                self._submit_analysis(request, solution_data, result, progress_callback)
+            
             # Ajouter à l'historique
-            self.solve_history.append(result)
+            self._record_solve(request, selected_algorithm, plan, result)
             
             return result
             
@@ -200,7 +214,7 @@ class UnifiedAIController:
             if progress_callback:
                 progress_callback(f"❌ {error_message}")
             
-            return SolveResult(
+            result = SolveResult(
                 success=False,
                 solution_data=None,
                 ml_metrics=None,
@@ -208,10 +222,108 @@ class UnifiedAIController:
                 algorithm_recommendation=None,
                 error_message=error_message
             )
+            self._record_solve(request, selected_algorithm, plan, result)
+            return result
         
         finally:
             self.is_solving = False
     
+    def _submit_analysis(self, request: SolveRequest, solution_data: SolutionData, result: SolveResult,
+                         progress_callback: Optional[Callable[[str], None]] = None):
+        """
+        Confie la collecte des métriques ML et le rapport au worker.
+        
+        En arrière-plan, result.ml_metrics et result.ml_report sont remplis
+        quand l'analyse se termine (voir wait_for_analysis).
+        
+        Args:
+            request: Requête résolue
+            solution_data: Solution trouvée
+            result: Résultat à compléter
+            progress_callback: Callback pour les mises à jour
+        """
+        if self.ml_metrics_collector is None or self.ml_report_generator is None:
+            self._initialize_ml_components()
+        if self.ml_worker is None:
+            self.ml_worker = MLAnalysisWorker(self.ml_metrics_collector, self.ml_report_generator)
+        
+        solver_stats = self.current_solver.get_comprehensive_statistics()
+        options = dict(generate_report=request.generate_report, export_formats=request.report_formats)
+        
+        if not request.background_analysis:
+            if progress_callback:
+                progress_callback("Collection des métriques ML...")
+            result.ml_metrics, result.ml_report = self.ml_worker.analyze(
+                request.level, solution_data, solver_stats, **options)
+            return
+        
+        def on_done(metrics, report):
+            result.ml_metrics = metrics
+            result.ml_report = report
+        
+        if progress_callback:
+            progress_callback("Analyse ML programmée en arrière-plan")
+        self.ml_worker.submit(request.level, solution_data, solver_stats, on_done=on_done, **options)
+    
+    def wait_for_analysis(self):
+        """Attend la fin des analyses ML en arrière-plan."""
+        if self.ml_worker is not None:
+            self.ml_worker.wait_idle()
+    
+    def _record_solve(self, request: SolveRequest, algorithm: Optional[Algorithm],
+                      plan: Optional[SolvePlan], result: SolveResult):
+        """
+        Ajoute un résultat à l'historique en mémoire et son résumé au journal.
+        
+        Args:
+            request: Requête résolue
+            algorithm: Algorithme utilisé (None si l'échec précède la sélection)
+            plan: Budget appliqué (None si l'échec précède la sélection)
+            result: Résultat de la résolution
+        """
+        self.solve_history.append(result)
+        
+        solution_data = result.solution_data
+        if result.success and solution_data:
+            totals = self._success_totals
+            totals['count'] += 1
+            totals['solve_time'] += solution_data.solve_time
+            totals['moves'] += len(solution_data.moves)
+            totals['states_explored'] += solution_data.states_explored
+            totals['states_generated'] += solution_data.states_generated
+        
+        try:
+            level_id = level_hash(request.level)
+        except Exception:
+            level_id = None
+        entry = {
+            'timestamp': datetime.now().isoformat(),
+            'level_hash': level_id,
+            'algorithm': algorithm.value if algorithm is not None else None,
+            'mode': request.mode.value,
+            'max_states': plan.max_states if plan is not None else request.max_states,
+            'time_limit': plan.time_limit if plan is not None else request.time_limit,
+            'success': result.success,
+            'error_message': result.error_message
+        }
+        if solution_data:
+            entry.update({
+                'moves_count': len(solution_data.moves),
+                'solve_time': solution_data.solve_time,
+                'states_explored': solution_data.states_explored,
+                'states_generated': solution_data.states_generated,
+                'deadlocks_pruned': solution_data.deadlocks_pruned
+            })
+        elif self.current_solver is not None and plan is not None:
+            entry.update({
+                'states_explored': self.current_solver.states_explored,
+                'states_generated': self.current_solver.states_generated
+            })
+        if result.algorithm_recommendation:
+            entry['complexity_score'] = result.algorithm_recommendation['complexity_score']
+            entry['complexity_category'] = result.algorithm_recommendation['complexity_category']
+        self.telemetry_sink.record(entry)
+    
     def _solve_with_fallback(self, selected_algorithm: Algorithm, request: SolveRequest,
                            progress_callback: Optional[Callable[[str], None]] = None) -> Optional[SolutionData]:
         """
@@ -325,14 +437,15 @@ class UnifiedAIController:
             },
             'algorithm_selection': algorithm_stats,
             'performance_averages': avg_stats,
-            'recent_history_count': len(self.solve_history[-10:])  # 10 dernières résolutions
+            'recent_history_count': min(len(self.solve_history), 10)  # 10 dernières résolutions
         }
     
     def _calculate_average_performance_stats(self) -> Dict[str, float]:
-        """Calcule les statistiques de performance moyennes."""
-        successful_solves = [r for r in self.solve_history if r.success and r.solution_data]
+        """Calcule les statistiques de performance moyennes (totaux cumulés)."""
+        totals = self._success_totals
+        count = totals['count']
         
-        if not successful_solves:
+        if not count:
             return {
                 'avg_solve_time': 0.0,
                 'avg_moves_count': 0.0,
@@ -340,18 +453,11 @@ class UnifiedAIController:
                 'avg_states_generated': 0.0
             }
         
-        total_time = sum(r.solution_data.solve_time for r in successful_solves)
-        total_moves = sum(len(r.solution_data.moves) for r in successful_solves)
-        total_states_explored = sum(r.solution_data.states_explored for r in successful_solves)
-        total_states_generated = sum(r.solution_data.states_generated for r in successful_solves)
-        
-        count = len(successful_solves)
-        
         return {
-            'avg_solve_time': total_time / count,
-            'avg_moves_count': total_moves / count,
-            'avg_states_explored': total_states_explored / count,
-            'avg_states_generated': total_states_generated / count
+            'avg_solve_time': totals['solve_time'] / count,
+            'avg_moves_count': totals['moves'] / count,
+            'avg_states_explored': totals['states_explored'] / count,
+            'avg_states_generated': totals['states_generated'] / count
         }
     
     def get_recent_solve_history(self, count: int = 10) -> List[Dict[str, Any]]:
@@ -366,7 +472,7 @@ class UnifiedAIController:
         """
         recent_history = []
         
-        for result in self.solve_history[-count:]:
+        for result in list(self.solve_history)[-count:]:
             history_item = {
                 'success': result.success,
                 'error_message': result.error_message
@@ -388,57 +494,35 @@ class UnifiedAIController:
         
         return recent_history
     
-    def export_solve_history(self, filepath: str):
+    def export_solve_history(self, filepath: str) -> int:
         """
         Exporte l'historique complet des résolutions.
         
+        Les enregistrements sont relus un à un dans le journal, archives
+        comprises : l'export ne charge pas l'historique en mémoire.
+        
         Args:
             filepath: Chemin du fichier d'export
+            
+        Returns:
+            int: Nombre de résolutions exportées
         """
-        import json
-        from datetime import datetime
-        
-        export_data = {
+        header = {
             'export_timestamp': datetime.now().isoformat(),
-            'statistics': self.get_solve_statistics(),
-            'solve_history': []
+            'statistics': self.get_solve_statistics()
         }
+        solve_ids = itertools.count()
         
-        for i, result in enumerate(self.solve_history):
-            history_item = {
-                'solve_id': i,
-                'success': result.success,
-                'error_message': result.error_message
-            }
-            
-            if result.solution_data:
-                history_item['solution_data'] = {
-                    'moves': result.solution_data.moves,
-                    'solve_time': result.solution_data.solve_time,
-                    'states_explored': result.solution_data.states_explored,
-                    'states_generated': result.solution_data.states_generated,
-                    'deadlocks_pruned': result.solution_data.deadlocks_pruned,
-                    'algorithm_used': result.solution_data.algorithm_used.value,
-                    'search_mode': result.solution_data.search_mode.value,
-                    'memory_peak': result.solution_data.memory_peak,
-                    'heuristic_calls': result.solution_data.heuristic_calls,
-                    'macro_moves_used': result.solution_data.macro_moves_used
-                }
-            
-            if result.ml_metrics:
-                history_item['ml_metrics'] = result.ml_metrics
-            
-            if result.algorithm_recommendation:
-                history_item['algorithm_recommendation'] = result.algorithm_recommendation
-            
-            export_data['solve_history'].append(history_item)
+        def with_id(entry):
+            return dict(solve_id=next(solve_ids), **entry)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        return self.telemetry_sink.export(filepath, header=header, key='solve_history',
+                                          transform=with_id)
     
     def clear_history(self):
-        """Efface l'historique des résolutions."""
+        """Efface l'historique des résolutions en mémoire (le journal est conservé)."""
         self.solve_history.clear()
+        self._success_totals = dict.fromkeys(self._success_totals, 0)
         self.algorithm_selector.reset_statistics()
     
     def stop_current_solve(self):
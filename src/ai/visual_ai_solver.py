@@ -3,6 +3,9 @@ Interface visuelle pour le système IA Sokoban.
 
 Ce module gère l'intégration entre le système IA unifié et l'interface graphique,
 incluant l'animation en temps réel, le debugging visuel, et les contrôles utilisateur.
+
+L'animation ne bloque pas la boucle principale : elle est confiée à une
+SolutionPlayback que la boucle fait avancer à chaque image via update().
 """
 
 import time
@@ -12,6 +15,7 @@ from enum import Enum
 
 from .unified_ai_controller import UnifiedAIController, SolveRequest
 from .algorithm_selector import Algorithm
+from src.core.solution_playback import SolutionPlayback
 
 
 class AnimationSpeed(Enum):
@@ -46,6 +50,9 @@ class VisualAISolver:
         self.animation_speed = AnimationSpeed.NORMAL
         self.current_move_index = 0
         self.solution_moves = []
+        self.playback = None  # SolutionPlayback en cours
+        self._animated_level = None
+        self._animation_callback = None
         
         # État du debugging
         self.debug_mode = False
@@ -54,13 +61,17 @@ class VisualAISolver:
         
         # Données de la dernière résolution
         self.last_solve_result = None
-        self.last_solve_metrics = None
         
         # Interface utilisateur
         self.ui_elements = {}
         self.font = None
         self._initialize_ui()
     
+    @property
+    def last_solve_metrics(self):
+        """Métriques ML de la dernière résolution (None tant que l'analyse n'est pas terminée)."""
+        return self.last_solve_result.ml_metrics if self.last_solve_result else None
+    
     def _initialize_ui(self):
         """Initialise les éléments d'interface utilisateur."""
         try:
@@ -120,7 +131,6 @@ class VisualAISolver:
         
         # Stocker les résultats
         self.last_solve_result = solve_result
-        self.last_solve_metrics = solve_result.ml_metrics
         
         if solve_result.success and solve_result.solution_data:
             self.solution_moves = solve_result.solution_data.moves
@@ -131,16 +141,20 @@ class VisualAISolver:
         return {
             'success': solve_result.success,
             'solve_result': solve_result,
-            'animation_completed': animate_immediately and solve_result.success
+            'animation_completed': self.playback is not None and self.playback.finished,
+            'animation_started': animate_immediately and solve_result.success
         }
     
     def animate_solution(self, level, progress_callback: Optional[Callable[[str], None]] = None):
         """
-        Anime la solution step-by-step.
+        Lance l'animation de la solution, sans bloquer.
+        
+        Les mouvements sont joués par update(), à appeler à chaque image de
+        la boucle principale, puis render_overlay() après le rendu du niveau.
         
         Args:
             level: Niveau à animer
-            progress_callback: Callback pour les mises à jour
+            progress_callback: Callback pour les mises à jour (groupées)
         """
         if not self.solution_moves:
             if progress_callback:
@@ -150,97 +164,68 @@ class VisualAISolver:
         self.is_animating = True
         self.is_paused = False
         self.current_move_index = 0
+        self._animated_level = level
+        self._animation_callback = progress_callback
         
+        logger = None
         if progress_callback:
             total_moves = len(self.solution_moves)
             progress_callback(f"🎬 Animation: {total_moves} mouvements")
+            logger = lambda message: progress_callback(f"🤖 {message}")
         
-        try:
-            for i, move in enumerate(self.solution_moves):
-                if not self.is_animating:
-                    break
-                
-                # Gérer la pause
-                while self.is_paused and self.is_animating:
-                    self._handle_pause_events()
-                    pygame.time.wait(50)
-                
-                if not self.is_animating:
-                    break
-                
-                # Afficher les informations de debug si activé
-                if self.debug_mode and progress_callback:
-                    self._show_debug_info(i, move, progress_callback)
-                
-                # Exécuter le mouvement
-                success = self._execute_move(level, move)
-                self.current_move_index = i
-                
-                if progress_callback:
-                    progress = (i + 1) / len(self.solution_moves) * 100
-                    progress_callback(f"🤖 Mouvement {i+1}/{len(self.solution_moves)}: {move} -> {'✅' if success else '❌'} ({progress:.1f}%)")
-                
-                # Rendre l'état actuel
-                self._render_current_state(level)
-                
-                # Afficher les métriques si activé
-                if self.show_metrics:
-                    self._render_metrics_overlay()
-                
-                # Attendre selon la vitesse d'animation
-                pygame.time.wait(self.animation_speed.value)
-                
-                # Vérifier si le niveau est terminé
-                if level.is_completed():
-                    if progress_callback:
-                        progress_callback("🎉 Niveau résolu par l'IA!")
-                    
-                    # Afficher l'écran de victoire avec métriques
-                    self._show_completion_screen(level)
-                    break
+        # En mode debug, une ligne par mouvement ; sinon une ligne par lot
+        self.playback = SolutionPlayback(level, self.solution_moves, self.animation_speed.value,
+                                         logger=logger, log_interval=1 if self.debug_mode else 100)
+        self.playback.play()
+    
+    def update(self, current_time: Optional[int] = None) -> bool:
+        """
+        Fait avancer l'animation en cours. À appeler à chaque image.
+        
+        Args:
+            current_time: Temps courant en ms (pygame.time.get_ticks() par défaut)
             
-        except Exception as e:
-            if progress_callback:
-                progress_callback(f"❌ Erreur durant l'animation: {str(e)}")
+        Returns:
+            bool: True si des mouvements ont été joués (le niveau doit être redessiné)
+        """
+        playback = self.playback
+        if not self.is_animating or playback is None:
+            return False
         
-        finally:
+        if self.is_paused:
+            playback.pause()
+            return False
+        if not playback.playing and not playback.finished:
+            playback.play()
+        
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        moved = playback.tick(current_time)
+        self.current_move_index = max(0, playback.index - 1)
+        
+        if playback.finished:
+            level = self._animated_level
+            progress_callback = self._animation_callback
+            if playback.failed_at is not None:
+                if progress_callback:
+                    progress_callback(f"❌ Mouvement {playback.failed_at + 1} impossible")
+            elif level.is_completed():
+                if progress_callback:
+                    progress_callback("🎉 Niveau résolu par l'IA!")
+                # Afficher l'écran de victoire avec métriques
+                self._show_completion_screen(level)
             self.is_animating = False
             self.is_paused = False
-    
-    def _execute_move(self, level, move: str) -> bool:
-        """Exécute un mouvement sur le niveau."""
-        direction_map = {
-            'UP': (0, -1),
-            'DOWN': (0, 1),
-            'LEFT': (-1, 0),
-            'RIGHT': (1, 0)
-        }
         
-        if move in direction_map:
-            dx, dy = direction_map[move]
-            return level.move(dx, dy)
-        
-        return False
+        return moved > 0
     
-    def _render_current_state(self, level):
-        """Rend l'état actuel du niveau."""
-        if self.renderer:
-            # Utiliser le renderer existant
-            self.renderer.render_level(
-                level=level,
-                level_manager=None,  # Peut être None pour le rendu IA
-                show_grid=False,
-                zoom_level=1.0,
-                scroll_x=0,
-                scroll_y=0,
-                skin_manager=self.skin_manager,
-                show_completion_message=False
-            )
-            
-            # Ajouter des overlays IA
-            self._render_ai_overlay()
-            
-            pygame.display.flip()
+    def render_overlay(self):
+        """Dessine les overlays IA pendant l'animation (après le rendu du niveau)."""
+        if not self.is_animating:
+            return
+        self._render_ai_overlay()
+        if self.show_metrics:
+            self._render_metrics_overlay()
     
     def _render_ai_overlay(self):
         """Rend l'overlay d'information IA."""
@@ -324,28 +309,11 @@ class VisualAISolver:
                 info_surf = self.small_font.render(info, True, (255, 255, 255))
                 screen.blit(info_surf, (overlay_x, overlay_y + i * 20))
     
-    def _show_debug_info(self, move_index: int, move: str, progress_callback):
-        """Affiche les informations de debug pour un mouvement."""
-        debug_info = f"🔍 Debug - Mouvement {move_index + 1}: {move}"
-        
-        if self.last_solve_metrics:
-            movement_analysis = self.last_solve_metrics.get('movement_analysis', {})
-            direction_freq = movement_analysis.get('direction_frequency', {})
-            
-            if move in direction_freq:
-                freq = direction_freq[move]
-                debug_info += f" (Fréquence: {freq:.1%})"
-        
-        progress_callback(debug_info)
-    
     def _show_completion_screen(self, level):
         """Affiche l'écran de completion avec métriques IA."""
         if not self.renderer or not self.last_solve_result:
             return
         
-        # Attendre un moment pour que l'utilisateur voie la solution
-        pygame.time.wait(1000)
-        
         # Afficher les métriques finales
         if self.last_solve_result.solution_data:
             solution_data = self.last_solve_result.solution_data
@@ -356,19 +324,6 @@ class VisualAISolver:
             print(f"   États explorés: {solution_data.states_explored:,}")
             print(f"   Efficacité: {solution_data.states_explored/max(solution_data.states_generated, 1):.1%}")
     
-    def _handle_pause_events(self):
-        """Gère les événements pendant la pause."""
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    self.is_paused = False
-                elif event.key == pygame.K_ESCAPE:
-                    self.is_animating = False
-                    self.is_paused = False
-            elif event.type == pygame.QUIT:
-                self.is_animating = False
-                self.is_paused = False
-    
     def handle_events(self, events: List[pygame.event.Event]) -> bool:
         """
         Gère les événements liés à l'interface IA.
@@ -390,6 +345,10 @@ class VisualAISolver:
                     elif event.key == pygame.K_ESCAPE:
                         self.stop_animation()
                         handled = True
+                    elif event.key == pygame.K_END and self.playback:
+                        # Avance rapide : les mouvements restants sans rendu
+                        self.playback.finish()
+                        handled = True
                     elif event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS:
                         self.increase_speed()
                         handled = True
@@ -408,9 +367,11 @@ class VisualAISolver:
         return handled
     
     def stop_animation(self):
-        """Arrête l'animation en cours."""
+        """Arrête l'animation en cours (le niveau reste où il en est)."""
         self.is_animating = False
         self.is_paused = False
+        if self.playback:
+            self.playback.pause()
     
     def pause_animation(self):
         """Met en pause ou reprend l'animation."""
@@ -423,6 +384,8 @@ class VisualAISolver:
         current_index = speeds.index(self.animation_speed)
         if current_index > 0:
             self.animation_speed = speeds[current_index - 1]
+        if self.playback:
+            self.playback.set_speed(self.animation_speed.value)
     
     def decrease_speed(self):
         """Diminue la vitesse d'animation."""
@@ -430,10 +393,14 @@ class VisualAISolver:
         current_index = speeds.index(self.animation_speed)
         if current_index < len(speeds) - 1:
             self.animation_speed = speeds[current_index + 1]
+        if self.playback:
+            self.playback.set_speed(self.animation_speed.value)
     
     def set_animation_speed(self, speed: AnimationSpeed):
         """Définit la vitesse d'animation."""
         self.animation_speed = speed
+        if self.playback:
+            self.playback.set_speed(speed.value)
     
     def toggle_debug_mode(self):
         """Active/désactive le mode debug."""
@@ -497,14 +464,17 @@ class VisualAISolver:
         return info
     
     def export_last_ml_report(self, filepath: str) -> bool:
-        """Exporte le dernier rapport ML généré."""
-        if not self.last_solve_result or not self.last_solve_result.ml_report:
+        """Exporte le dernier rapport ML généré (attend la fin de son analyse)."""
+        if not self.last_solve_result:
+            return False
+        self.ai_controller.wait_for_analysis()
+        if not self.last_solve_result.ml_report:
             return False
         
         try:
             import json
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.last_solve_result.ml_report, f, indent=2, ensure_ascii=False, default=str)
+                json.dump(self.last_solve_result.ml_report.to_dict(), f, indent=2, ensure_ascii=False, default=str)
             return True
         except Exception as e:
             print(f"Erreur lors de l'export du rapport ML: {e}")
@@ -2,7 +2,8 @@
 Auto Solver for Sokoban levels.
 
 This module provides functionality to automatically solve Sokoban levels
-and animate the solution step by step.
+and animate the solution step by step. pygame is only imported by the live
+animation, so headless tools can solve levels without it.
 
 Solveur préféré : **Festival** (FESS, Yaron Shoham, MIT), quand son binaire est
 présent. Repli sur EnhancedSokolutionSolver sinon, pour que le jeu marche sans
@@ -15,10 +16,11 @@ l'installation du binaire.
 """
 
 import time
-import pygame
 from src.ai.algorithm_selector import AlgorithmSelector, Algorithm
 from src.ai.enhanced_sokolution_solver import EnhancedSokolutionSolver, SearchMode, SolutionData
 from src.ai.festival_solver import FestivalSolver, SolutionRefusee, disponible as festival_disponible
+from src.ai.solution_optimizer import DEFAULT_TIME_BUDGET, get_background_optimizer
+from src.core.solution_playback import SolutionPlayback
 
 
 # Map Algorithm enum to human-readable solver type strings
@@ -30,15 +32,6 @@ _SOLVER_TYPE_NAMES = {
     Algorithm.BIDIRECTIONAL_GREEDY: "Sokolution Bidirectional Greedy",
 }
 
-# Solver limits per algorithm: (max_states, time_limit)
-_SOLVER_LIMITS = {
-    Algorithm.BFS: (75000, 10.0),
-    Algorithm.ASTAR: (1000000, 120.0),
-    Algorithm.IDA_STAR: (2000000, 300.0),
-    Algorithm.GREEDY: (2000000, 600.0),
-    Algorithm.BIDIRECTIONAL_GREEDY: (2000000, 600.0),
-}
-
 # Budget accordé à Festival, en secondes. 600 s est la convention de la
 # recherche Sokoban pour un niveau. En pratique la médiane des 90 XSokoban est
 # à 1 s et le pire niveau à 101 s : le budget ne sert qu'aux cas pathologiques.
@@ -51,14 +44,28 @@ class AutoSolver:
     Delegates to EnhancedSokolutionSolver with algorithm selection via AlgorithmSelector.
     """
 
-    def __init__(self, level, renderer=None, skin_manager=None):
+    def __init__(self, level, renderer=None, skin_manager=None, telemetry=None, profile=False,
+                 optimize=False):
+        """
+        Args:
+            level: Level to solve.
+            renderer: Renderer used to animate the solution.
+            skin_manager: Skin manager used to animate the solution.
+            telemetry: Optional SolveTelemetryLog recording internal solver runs.
+            profile: Instrument the internal solver with per-phase timers.
+            optimize: Optimize each solution found with the shared background optimizer.
+        """
         self.level = level
         self.renderer = renderer
         self.skin_manager = skin_manager
 
-        self.selector = AlgorithmSelector()
+        self.selector = AlgorithmSelector(telemetry=telemetry)
         self.complexity_score = self.selector.complexity_analyzer.calculate_complexity_score(level)
-        self.algorithm = self.selector.select_optimal_algorithm(level)
+        self.plan = self.selector.plan_budget(level)
+        self.algorithm = self.plan.algorithm
+        self.cost_report = None
+        self.profile = profile
+        self.solver = None  # Internal solver of the last run, for its statistics
 
         # Festival d'abord s'il est installé. Le sélecteur d'algorithme reste
         # calculé : il sert au repli, et son score de complexité est affiché
@@ -72,14 +79,20 @@ class AutoSolver:
         self.is_solving = False
         self.is_animating = False
 
+        # Background push/move optimization of the solution found
+        self.optimize = optimize
+        self.optimized_solution = None
+        self.optimization_stats = None
+        self._optimizer = None
+
         category = self.selector._get_complexity_category(self.complexity_score)
-        max_states, time_limit = _SOLVER_LIMITS.get(self.algorithm, (1000000, 120.0))
         print(f"Level complexity: {category} (score: {self.complexity_score:.1f})")
         print(f"Using {self.solver_type} solver")
         if self.use_festival:
             print(f"Solver limits: {_FESTIVAL_BUDGET}s timeout, 1 core")
         else:
-            print(f"Solver limits: {max_states} states, {time_limit}s timeout")
+            print(f"Solver limits: {self.plan.max_states} states, {self.plan.time_limit}s timeout "
+                  f"({'learned budget' if self.plan.source == 'model' else 'default rules'})")
             print("Festival introuvable — repli sur le solveur interne, qui "
                   "résout 1 XSokoban sur 10. Voir src/ai/festival_solver.py.")
 
@@ -99,6 +112,8 @@ class AutoSolver:
         self.is_solving = True
         self.solution = None
         self._last_result = None
+        self.optimized_solution = None
+        self.optimization_stats = None
 
         try:
             if progress_callback:
@@ -107,13 +122,17 @@ class AutoSolver:
             if self.use_festival:
                 return self._solve_with_festival(progress_callback)
 
-            max_states, time_limit = _SOLVER_LIMITS.get(self.algorithm, (1000000, 120.0))
-            solver = EnhancedSokolutionSolver(self.level, max_states, time_limit)
+            solver = EnhancedSokolutionSolver(self.level, self.plan.max_states, self.plan.time_limit,
+                                              profile=self.profile)
+            self.solver = solver
 
             mode = SearchMode.BIDIRECTIONAL if self.algorithm == Algorithm.BIDIRECTIONAL_GREEDY else SearchMode.FORWARD
             algorithm = Algorithm.GREEDY if self.algorithm == Algorithm.BIDIRECTIONAL_GREEDY else self.algorithm
 
+            start_time = time.time()
             result = solver.solve(algorithm, mode, progress_callback)
+            self._record_cost(solver.states_explored, time.time() - start_time,
+                              bool(result and result.moves))
 
             if result and result.moves:
                 self.solution = result.moves
@@ -123,6 +142,8 @@ class AutoSolver:
                     progress_callback(f"Solution found! {len(self.solution)} moves")
 
                 self.is_solving = False
+                if self.optimize:
+                    self.start_optimization()
                 return True
             else:
                 if progress_callback:
@@ -138,6 +159,18 @@ class AutoSolver:
             self.is_solving = False
             return False
 
+    def _record_cost(self, states, solve_time, success):
+        """Record the run in the selector telemetry and report predicted vs actual cost."""
+        try:
+            self.cost_report = self.selector.record_outcome(
+                self.level, self.plan, states, solve_time, success)
+        except OSError as e:
+            print(f"Could not record solve telemetry: {e}")
+            return
+        if self.plan.source == 'model':
+            print(f"Predicted cost: {self.plan.predicted_states:.0f} states, {self.plan.predicted_time:.2f}s"
+                  f" — actual: {states} states, {solve_time:.2f}s")
+
     def _solve_with_festival(self, progress_callback=None):
         """Résoudre via Festival. Rend True si une solution VÉRIFIÉE existe.
 
@@ -171,6 +204,8 @@ class AutoSolver:
             self._last_result = result
             if progress_callback:
                 progress_callback(f"Solution found! {len(self.solution)} moves")
+            if self.optimize:
+                self.start_optimization()
             return True
         if progress_callback:
             progress_callback("No solution found")
@@ -190,14 +225,72 @@ class AutoSolver:
             'moves': len(self.solution),
             'solution': self.solution.copy(),
             'complexity_score': self.complexity_score,
-            'solver_type': self.solver_type
+            'solver_type': self.solver_type,
+            'cost_report': self.cost_report,
+            'optimization': self.optimization_stats
         }
 
+    def start_optimization(self, on_done=None, time_budget=DEFAULT_TIME_BUDGET):
+        """
+        Reduce the pushes and moves of the solution in the shared background optimizer.
+
+        Must be called while the level is still in the position the solution
+        starts from; the level can be played as soon as this returns. When
+        the optimizer finishes, optimized_solution and optimization_stats
+        are set. The solution being played is not replaced.
+
+        Args:
+            on_done (callable, optional): Called from the worker thread with
+                (optimized moves, stats).
+            time_budget (float): Maximum optimization time in seconds.
+
+        Returns:
+            bool: True if an optimization was started.
+        """
+        if not self.solution:
+            return False
+        if self._optimizer is None:
+            self._optimizer = get_background_optimizer()
+
+        def finished(moves, stats):
+            self.optimized_solution = moves
+            self.optimization_stats = stats
+            if on_done:
+                on_done(moves, stats)
+
+        self._optimizer.submit(self.level, self.solution, finished, time_budget)
+        return True
+
+    def wait_for_optimization(self):
+        """Wait until the background optimization, if any, has finished."""
+        if self._optimizer is not None:
+            self._optimizer.wait_idle()
+
+    def create_playback(self, move_delay=500, logger=None):
+        """
+        Create a playback of the solution on the level, to be ticked by a main loop.
+
+        Args:
+            move_delay (int): Delay between moves in milliseconds.
+            logger (callable, optional): Receives batched progress lines.
+
+        Returns:
+            SolutionPlayback: The playback, or None if there is no solution.
+        """
+        if not self.solution:
+            return None
+        return SolutionPlayback(self.level, self.solution, move_delay, logger=logger)
+
     def execute_solution_live(self, move_delay=500, show_grid=False, zoom_level=1.0,
-                            scroll_x=0, scroll_y=0, level_manager=None):
+                            scroll_x=0, scroll_y=0, level_manager=None, log_moves=False):
         """
         Execute the solution by taking control of the level and animating moves.
 
+        Moves are played by a SolutionPlayback at the given speed, with the
+        events handled and the level rendered once per frame.
+        SPACE pauses, +/- change the speed, END or ESC play the remaining
+        moves at once.
+
         Args:
             move_delay (int): Delay between moves in milliseconds.
             show_grid (bool): Whether to show grid.
@@ -205,65 +298,68 @@ class AutoSolver:
             scroll_x (int): Horizontal scroll offset.
             scroll_y (int): Vertical scroll offset.
             level_manager: Level manager for rendering context.
+            log_moves (bool): Print progress every 100 moves.
+
+        Returns:
+            bool: True if every move of the solution was played.
         """
         if not self.solution or not self.renderer:
             return False
 
+        # Imported here: solving and playback must not need pygame or a display
+        import pygame
+
         self.is_animating = True
+        playback = self.create_playback(move_delay, logger=print if log_moves else None)
+        clock = pygame.time.Clock()
 
         try:
             print(f"AI executing solution: {len(self.solution)} moves")
+            playback.play()
 
-            for i, move in enumerate(self.solution):
-                # Check for quit events
+            while not playback.finished:
+                skipped = False
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
-                        self.is_animating = False
                         return False
+                    if event.type == pygame.KEYDOWN:
+                        if event.key in (pygame.K_END, pygame.K_ESCAPE):
+                            playback.finish()
+                            skipped = True
+                        elif event.key == pygame.K_SPACE:
+                            playback.toggle_play()
+                        elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                            playback.set_speed(playback.move_delay // 2)
+                        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                            playback.set_speed(max(1, playback.move_delay) * 2)
+
+                # Render once per frame, only when moves were played; the
+                # renderer presents the changed cells itself
+                moved = playback.tick(pygame.time.get_ticks())
+                if (moved or skipped) and level_manager:
+                    self.renderer.render_level(
+                        self.level, level_manager, show_grid,
+                        zoom_level, scroll_x, scroll_y, self.skin_manager,
+                        show_completion_message=False
+                    )
+                clock.tick(60)
+
+            if playback.failed_at is not None:
+                print(f"AI move {playback.failed_at + 1}/{len(self.solution)} failed")
+                return False
 
-                # Convert move to direction
-                direction_map = {
-                    'UP': (0, -1),
-                    'DOWN': (0, 1),
-                    'LEFT': (-1, 0),
-                    'RIGHT': (1, 0)
-                }
-
-                if move in direction_map:
-                    dx, dy = direction_map[move]
-
-                    # Execute the move
-                    moved = self.level.move(dx, dy)
-
-                    print(f"AI Move {i+1}/{len(self.solution)}: {move} -> {'OK' if moved else 'FAIL'}")
-
-                    # Render the current state
-                    if self.renderer and level_manager:
-                        self.renderer.render_level(
-                            self.level, level_manager, show_grid,
-                            zoom_level, scroll_x, scroll_y, self.skin_manager,
-                            show_completion_message=False
-                        )
-                        pygame.display.flip()
-
-                    # Wait before next move
-                    pygame.time.wait(move_delay)
-
-                    # Check if level is completed
-                    if self.level.is_completed():
-                        print("Level solved by AI!")
-                        pygame.time.wait(1000)
-                        if hasattr(level_manager, '_show_level_completion_screen'):
-                            level_manager._show_level_completion_screen()
-                        self.is_animating = False
-                        return True
+            if self.level.is_completed():
+                print("Level solved by AI!")
+                pygame.time.wait(1000)
+                if hasattr(level_manager, '_show_level_completion_screen'):
+                    level_manager._show_level_completion_screen()
+            return True
 
         except Exception as e:
             print(f"Error during solution execution: {e}")
             return False
         finally:
             self.is_animating = False
-            return True
 
     def stop_solving(self):
         """Stop the current solving process."""
@@ -0,0 +1,122 @@
+"""
+Background Worker module for the Sokoban game.
+
+The deadlock monitor, the solution optimizer, the ML analysis and the
+thumbnail cache all run jobs off the UI thread. BackgroundWorker is the
+queue and daemon thread they share:
+
+- jobs run one at a time, in the order they were submitted, in a thread
+  started on the first submit;
+- every job is tagged with the generation current when it was queued.
+  Cancelling bumps the generation: pending jobs are dropped, and the
+  handler of the running job can check is_current before reporting;
+- stop() ends the thread with a sentinel job. A later submit starts a
+  new thread.
+"""
+
+import queue
+import threading
+
+
+# Queued by stop() to end the worker thread
+_STOP = object()
+
+
+class BackgroundWorker:
+    """
+    Runs jobs in a lazily started daemon thread.
+    """
+
+    def __init__(self, handler, name, error_message="Error in background job"):
+        """
+        Initialize the worker.
+
+        Args:
+            handler (callable): Called from the worker thread with
+                (job, generation) for every job that is still current.
+            name (str): Name of the worker thread.
+            error_message (str): Prefix of the message printed when the
+                handler raises.
+        """
+        self.handler = handler
+        self.name = name
+        self.error_message = error_message
+        self._lock = threading.Lock()
+        self._jobs = queue.Queue()
+        self._generation = 0
+        self._thread = None
+
+    def submit(self, job, replace=False):
+        """
+        Queue a job.
+
+        Args:
+            job: Passed to the handler.
+            replace (bool): Drop the pending jobs and the result of the running one.
+
+        Returns:
+            int: Generation of the job.
+        """
+        with self._lock:
+            if replace:
+                self._generation += 1
+            generation = self._generation
+            self._jobs.put((generation, job))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._work, name=self.name, daemon=True)
+                self._thread.start()
+        return generation
+
+    def cancel(self):
+        """Drop pending jobs and the result of the running one."""
+        with self._lock:
+            self._generation += 1
+
+    def is_current(self, generation):
+        """
+        Check that no job was cancelled or replaced since a job was queued.
+
+        Args:
+            generation (int): Generation of the job.
+
+        Returns:
+            bool: True if the result of the job is still wanted.
+        """
+        with self._lock:
+            return generation == self._generation
+
+    def stop(self):
+        """Drop pending jobs and end the worker thread."""
+        with self._lock:
+            self._generation += 1
+            if self._thread is not None and self._thread.is_alive():
+                self._jobs.put((self._generation, _STOP))
+                self._thread = None
+
+    def wait_idle(self):
+        """Wait until the worker has processed all queued jobs."""
+        self._jobs.join()
+
+    def pending(self):
+        """
+        Get the approximate number of queued jobs.
+
+        Returns:
+            int: Jobs not processed yet.
+        """
+        return self._jobs.qsize()
+
+    def _work(self):
+        """Worker thread: run queued jobs of the current generation."""
+        while True:
+            generation, job = self._jobs.get()
+            try:
+                if job is _STOP:
+                    return
+                if not self.is_current(generation):
+                    continue
+                self.handler(job, generation)
+            except Exception as e:
+                print(f"{self.error_message}: {e}")
+            finally:
+                self._jobs.task_done()
@@ -37,7 +37,8 @@ class ConfigManager:
             'display': {
                 'window_width': 900,
                 'window_height': 700,
-                'fullscreen': False
+                'fullscreen': False,
+                'show_frame_time': False
             },
             'game': {
                 'keyboard_layout': 'qwerty',
@@ -68,7 +69,8 @@ class ConfigManager:
                 'snapshot_save': 'f5',
                 'snapshot_load': 'f9',
                 'reverse_mode': 'x',
-                'optimize_solution': 'o'
+                'optimize_solution': 'o',
+                'frame_time': 'f3'
             }
         }
 
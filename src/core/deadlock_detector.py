@@ -82,11 +82,11 @@ class DeadlockDetector:
 
                 # Try to pull the box in all four directions
                 for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                    # Position of the player to pull the box
-                    player_x, player_y = x + dx, y + dy
+                    # Position the box would be pulled to (where the player stands)
+                    new_x, new_y = x + dx, y + dy
 
-                    # Position the box would be pulled to
-                    new_x, new_y = x - dx, y - dy
+                    # Position the player steps back to while pulling
+                    player_x, player_y = x + 2 * dx, y + 2 * dy
 
                     # Check if the pull is valid:
                     # 1. Player position must be within bounds and not a wall
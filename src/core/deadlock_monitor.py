@@ -0,0 +1,155 @@
+"""
+Deadlock Monitor module for the Sokoban game.
+
+Checking the whole position with DeadlockDetector.is_deadlock after every
+move runs the corral search (a level copy and a BFS of up to 0.1 s) on the
+UI thread. A deadlock can only appear when a box moves, so the monitor
+listens to pushes only:
+
+- on the UI thread, the moved box is checked against the precomputed
+  dead squares and its neighbourhood (wall lines, 2x2 blocks, frozen
+  boxes), which costs a few dictionary lookups;
+- the full analysis (lines, diagonals, bipartite matching, corrals) runs
+  in a background worker on a private copy of the level. Its result is
+  handed to a callback, which the GUI turns into a pygame user event.
+
+Results are tagged with the box positions they were computed for, so a
+result that arrives after an undo is recognized as stale.
+"""
+
+import copy
+
+from src.core.background_worker import BackgroundWorker
+from src.core.deadlock_detector import DeadlockDetector
+
+
+class DeadlockMonitor:
+    """
+    Push-driven deadlock checks for live play.
+    """
+
+    def __init__(self, level, on_result=None):
+        """
+        Initialize the monitor and precompute the dead squares of the level.
+
+        Args:
+            level: The Level being played.
+            on_result (callable, optional): Called from the worker thread with
+                a result dict (deadlock, boxes, player_pos) for every full
+                analysis that completes.
+        """
+        self.level = level
+        self.on_result = on_result
+        self.detector = DeadlockDetector(level)
+        self.targets = self.detector.targets
+
+        # Dead square bitmap: 1 where a box can never reach a target
+        self._width = level.width
+        self._dead = bytearray(level.width * level.height)
+        for x, y in self.detector.simple_deadlocks | self.detector.corner_deadlocks:
+            self._dead[y * self._width + x] = 1
+        # Cell -> directions along the wall of a wall-deadlock cell
+        self._wall_lines = {}
+        for x, y, dx, dy in self.detector.wall_deadlocks:
+            self._wall_lines.setdefault((x, y), []).append((dx, dy))
+
+        # Private level copy for the worker, never touched by the UI thread
+        self._worker_level = copy.deepcopy(level)
+        self._worker_detector = None
+
+        self._worker = BackgroundWorker(self._analyze, name="deadlock-monitor",
+                                        error_message="Error in deadlock analysis")
+
+        self.quick_checks = 0
+        self.full_checks = 0
+
+    def notify_push(self, box):
+        """
+        Check a position after a push and schedule the full analysis.
+
+        Args:
+            box (tuple): New (x, y) of the pushed box.
+
+        Returns:
+            bool: True if the local checks already found a deadlock.
+        """
+        self.quick_checks += 1
+        if self.is_local_deadlock(box):
+            return True
+        self.schedule_full_check()
+        return False
+
+    def is_local_deadlock(self, box):
+        """
+        Check the neighbourhood of a box for deadlocks.
+
+        Args:
+            box (tuple): (x, y) of the box.
+
+        Returns:
+            bool: True if the box is on a dead square, stuck along a wall,
+                part of a blocked 2x2 block, or frozen off target.
+        """
+        if box in self.targets:
+            return self._in_blocked_square(box)
+
+        x, y = box
+        if self._dead[y * self._width + x]:
+            return True
+
+        level = self.level
+        for dx, dy in self._wall_lines.get(box, ()):
+            if all(level.is_wall(x + m * dx, y + m * dy) or level.is_box(x + m * dx, y + m * dy)
+                   for m in (-1, 1)):
+                return True
+
+        return self._in_blocked_square(box) or self.detector._is_box_frozen(box)
+
+    def _in_blocked_square(self, box):
+        """Whether the box is in a 2x2 block of boxes and walls with a box off target."""
+        level = self.level
+        x, y = box
+        for ox, oy in ((0, 0), (-1, 0), (0, -1), (-1, -1)):
+            cells = [(x + ox + cx, y + oy + cy) for cx, cy in ((0, 0), (1, 0), (0, 1), (1, 1))]
+            if all(level.is_wall(*cell) or level.is_box(*cell) for cell in cells):
+                if any(level.is_box(*cell) and cell not in self.targets for cell in cells):
+                    return True
+        return False
+
+    def schedule_full_check(self):
+        """Queue the full analysis of the current position; older requests are dropped."""
+        self._worker.submit((self.level.player_pos, tuple(self.level.boxes)), replace=True)
+
+    def accept(self, result):
+        """
+        Check that a result describes the current position.
+
+        Args:
+            result (dict): Result passed to on_result.
+
+        Returns:
+            bool: True if the boxes have not moved since the analysis was queued.
+        """
+        return tuple(self.level.boxes) == result['boxes']
+
+    def wait_idle(self):
+        """Wait until the worker has processed all queued requests."""
+        self._worker.wait_idle()
+
+    def stop(self):
+        """Drop pending requests, stop reporting results and end the worker thread."""
+        self.on_result = None
+        self._worker.stop()
+
+    def _analyze(self, job, generation):
+        """Worker thread: run the full analysis of a position."""
+        player_pos, boxes = job
+        if self._worker_detector is None:
+            self._worker_detector = DeadlockDetector(self._worker_level)
+        self._worker_level.player_pos = player_pos
+        self._worker_level.boxes = list(boxes)
+        deadlock = self._worker_detector.is_deadlock()
+        self.full_checks += 1
+        callback = self.on_result
+        if self._worker.is_current(generation) and callback is not None:
+            callback({'deadlock': deadlock, 'boxes': boxes, 'player_pos': player_pos})
@@ -2,11 +2,11 @@
 Game History Manager with Choice Points for Sokoban Game.
 
 Tracks decision points where the player had multiple significant options
-(e.g., could push different boxes, multiple directions available).
+(e.g., could reach pushes of different boxes or in different directions).
 Provides navigation between choice points for efficient undo/redo.
 """
 
-from src.core.constants import WALL
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
 
 
 class GameHistoryManager:
@@ -14,11 +14,22 @@ class GameHistoryManager:
     Manages choice point detection and navigation within the level's history.
 
     A "choice point" is a state where the player has multiple meaningful
-    options: they can push in several directions, reach multiple boxes, etc.
+    options. Choices are made at the push level: a state is a choice point
+    when it is the first state of a box configuration (the start of the
+    level, or right after a push) and more than one box push is reachable
+    from it. Walking around between two pushes does not change the options,
+    so it creates no choice points.
     """
 
     def __init__(self):
         self.choice_points = []  # Indices into the level.history stack
+        # History index -> position after the move played from the choice point
+        self._keyframes = {}
+        # Player-reachable region of the last box configuration, only
+        # recomputed when the boxes change (i.e. after a push)
+        self._cached_boxes = None
+        self._cached_region = frozenset()
+        self._cached_pushes = 0
 
     def record_move(self, level, was_push):
         """
@@ -34,59 +45,70 @@ class GameHistoryManager:
         if history_index < 0:
             return
 
+        # Choice points from an abandoned branch (after undos), or whose move changed
+        while self.choice_points and self.choice_points[-1] >= history_index:
+            self._keyframes.pop(self.choice_points.pop(), None)
+
+        # Only the first state of a box configuration can be a choice point
+        if history_index > 0 and not level.history.changes_boxes(history_index - 1):
+            return
+
         # Check the state we just left (now in history)
-        state = level.history[history_index]
-        if self._is_choice_point(level, state, was_push):
-            if not self.choice_points or self.choice_points[-1] != history_index:
-                self.choice_points.append(history_index)
+        player_pos, boxes, _, _ = level.history.position(history_index)
+        if self._is_choice_point(level, player_pos, boxes):
+            self.choice_points.append(history_index)
+            self._keyframes[history_index] = (level.player_pos, tuple(level.boxes),
+                                              level.moves, level.pushes)
 
-    def _is_choice_point(self, level, state, was_push):
+    def _is_choice_point(self, level, player_pos, boxes):
         """
         Determine if a given state represents a meaningful choice point.
 
-        A state is a choice point if:
-        - The player could push a box (was_push=True) AND could also push
-          in at least one other direction, OR
-        - The player has 3+ free directions to move (intersection), OR
-        - The player is adjacent to 2+ pushable boxes
+        A state is a choice point if more than one box push (box and
+        direction) can be reached by the player without pushing.
+        """
+        return self.count_reachable_pushes(level, player_pos, boxes) >= 2
+
+    def count_reachable_pushes(self, level, player_pos, boxes):
+        """
+        Count the box pushes the player can reach without pushing.
+
+        Args:
+            level: The Level object.
+            player_pos (tuple): (x, y) of the player.
+            boxes (list): Box positions.
+
+        Returns:
+            int: Number of (box, direction) pushes available.
         """
-        player_pos = state['player_pos']
-        boxes = state['boxes']
-        px, py = player_pos
-
-        # Count available push directions
-        push_directions = 0
-        # Count adjacent pushable boxes
-        pushable_boxes = 0
-        # Count free move directions
-        free_directions = 0
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nx, ny = px + dx, py + dy
-
-            # Check if we can move there
-            if (0 <= nx < level.width and 0 <= ny < level.height and
-                    not level.is_wall(nx, ny)):
-
-                if (nx, ny) in boxes:
-                    # There's a box — can we push it?
-                    bx, by = nx + dx, ny + dy
-                    if (0 <= bx < level.width and 0 <= by < level.height and
-                            not level.is_wall(bx, by) and (bx, by) not in boxes):
-                        push_directions += 1
-                        pushable_boxes += 1
-                else:
-                    free_directions += 1
-
-        # Choice point criteria
-        if was_push and push_directions >= 2:
-            return True
-        if pushable_boxes >= 2:
-            return True
-        if free_directions >= 3:
-            return True
-
-        return False
+        key = tuple(boxes)
+        if key != self._cached_boxes or player_pos not in self._cached_region:
+            self._cached_region, self._cached_pushes = self._compute_pushes(level, player_pos, key)
+            self._cached_boxes = key
+        return self._cached_pushes
+
+    @staticmethod
+    def _compute_pushes(level, player_pos, boxes):
+        """Flood-fill the player region and count the pushes from its border."""
+        box_set = set(boxes)
+        is_wall = level.is_wall
+        region = {player_pos}
+        stack = [player_pos]
+        while stack:
+            x, y = stack.pop()
+            for dx, dy in DIRECTIONS:
+                cell = (x + dx, y + dy)
+                if cell not in region and cell not in box_set and not is_wall(*cell):
+                    region.add(cell)
+                    stack.append(cell)
+
+        pushes = 0
+        for bx, by in boxes:
+            for dx, dy in DIRECTIONS:
+                if ((bx - dx, by - dy) in region and not is_wall(bx + dx, by + dy)
+                        and (bx + dx, by + dy) not in box_set):
+                    pushes += 1
+        return frozenset(region), pushes
 
     def get_previous_choice_point(self, level):
         """
@@ -121,6 +143,9 @@ class GameHistoryManager:
         """
         Jump to a specific choice point by undoing moves.
 
+        The position of a recorded choice point is restored at once; the
+        undone moves go to the redo stack as a block.
+
         Args:
             level: The Level object.
             target_index: History index to jump to.
@@ -128,12 +153,12 @@ class GameHistoryManager:
         Returns:
             int: Number of undos performed.
         """
-        undos = 0
-        while len(level.history) > target_index + 1:
-            if not level.undo():
-                break
-            undos += 1
-        return undos
+        length = target_index + 1
+        position = self._keyframes.get(target_index)
+        # A keyframe is only valid if the history still leads to it
+        if position is not None and position[2] != level.moves - (len(level.history) - length):
+            position = None
+        return level.undo_to(length, position)
 
     def undo_to_previous_choice_point(self, level):
         """
@@ -156,3 +181,6 @@ class GameHistoryManager:
     def clear(self):
         """Clear all recorded choice points."""
         self.choice_points.clear()
+        self._keyframes.clear()
+        self._cached_boxes = None
+        self._cached_region = frozenset()
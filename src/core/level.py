@@ -2,9 +2,102 @@
 Level module for the Sokoban game.
 
 This module handles loading, parsing, and managing game levels.
+
+Besides the public map_data, boxes and targets lists, a Level keeps a flat
+bytearray of cell flags and position counters, so that cell queries and
+the completion test run in constant time. The public lists report their
+changes to the level, so code that edits them directly keeps working.
 """
 
 from src.core.constants import WALL, FLOOR, PLAYER, BOX, TARGET, PLAYER_ON_TARGET, BOX_ON_TARGET
+from src.core.move_history import DIRECTION_INDEX, MoveHistory, decode_step
+
+# Cell flags of the flat grid
+CELL_WALL = 1
+CELL_TARGET_MAP = 2   # Target character in map_data
+CELL_TARGET = 4       # Position listed in targets
+CELL_BOX = 8
+CELL_ANY_TARGET = CELL_TARGET_MAP | CELL_TARGET
+
+# Map character (as a latin-1 byte) -> map flags
+_MAP_FLAGS = bytearray(256)
+_MAP_FLAGS[ord(WALL)] = CELL_WALL
+_MAP_FLAGS[ord(TARGET)] = CELL_TARGET_MAP
+_MAP_FLAGS = bytes(_MAP_FLAGS)
+# Flags byte -> same byte without the box and target list flags
+_KEEP_MAP_FLAGS = bytes(flags & (CELL_WALL | CELL_TARGET_MAP) for flags in range(256))
+
+
+class _TrackedList(list):
+    """
+    List reporting the items it gains and loses to a callback.
+
+    Reads are plain list reads. Copies and slices are plain lists.
+    """
+
+    __slots__ = ('_on_change',)
+
+    def __init__(self, items=(), on_change=None):
+        super().__init__(items)
+        self._on_change = on_change
+
+    def _changed(self, removed, added):
+        if self._on_change is not None:
+            self._on_change(removed, added)
+
+    def append(self, item):
+        super().append(item)
+        self._changed((), (item,))
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self._changed((), items)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed((), (item,))
+
+    def remove(self, item):
+        super().remove(item)
+        self._changed((item,), ())
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed((item,), ())
+        return item
+
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self._changed(removed, ())
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            removed, value = self[index], list(value)
+        else:
+            removed, value = (self[index],), value
+        super().__setitem__(index, value)
+        self._changed(removed, value if isinstance(index, slice) else (value,))
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else (self[index],)
+        super().__delitem__(index)
+        self._changed(removed, ())
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, count):
+        removed = list(self)
+        super().__imul__(count)
+        self._changed(removed, list(self))
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # Copies (copy, deepcopy, pickle) are plain lists
+        return list, (list(self),)
 
 
 class Level:
@@ -29,16 +122,23 @@ class Level:
         Raises:
             ValueError: If neither level_data nor level_file is provided.
         """
-        self.map_data = []
+        self._cells = bytearray()
+        self._stride = 0
+        self._rows = 0
+        self._box_counts = {}  # Position -> number of boxes listed there
+        self._target_counts = {}  # Position -> number of times it is listed in targets
+        self._boxes_on_targets = 0
+        self._map_data = _TrackedList(on_change=self._on_map_changed)
+        self._boxes = _TrackedList(on_change=self._on_boxes_changed)
+        self._targets = _TrackedList(on_change=self._on_targets_changed)
+
         self.width = 0
         self.height = 0
-        self.player_pos = (0, 0)
-        self.boxes = []
-        self.targets = []
+        self._player_pos = (0, 0)
         self.moves = 0
         self.pushes = 0
-        self.history = []  # Stack to store game state for undo functionality
-        self.redo_stack = []  # Stack to store undone states for redo functionality
+        self._history = MoveHistory(level=self)  # Undo log, one step per move
+        self._redo_stack = MoveHistory(forward=True, level=self)  # Undone steps for redo
         self.reverse_mode = False  # Pull mode toggle
 
         # Metadata
@@ -53,6 +153,195 @@ class Level:
         else:
             raise ValueError("Either level_data or level_file must be provided")
 
+    @property
+    def player_pos(self):
+        """tuple: Player position as (x, y)."""
+        return self._player_pos
+
+    @player_pos.setter
+    def player_pos(self, pos):
+        if pos != self._player_pos:
+            self._record_jump()
+        self._player_pos = pos
+
+    @property
+    def history(self):
+        """MoveHistory: Undo log. Entry i is the state dict before the i-th move."""
+        return self._history
+
+    @history.setter
+    def history(self, log):
+        self._history = self._attach_log(log, forward=False)
+
+    @property
+    def redo_stack(self):
+        """MoveHistory: Redo log. Entry i is the state dict after the i-th undone move."""
+        return self._redo_stack
+
+    @redo_stack.setter
+    def redo_stack(self, log):
+        self._redo_stack = self._attach_log(log, forward=True)
+
+    def _attach_log(self, log, forward):
+        """Take ownership of a MoveHistory, or convert a list of state dicts."""
+        if not isinstance(log, MoveHistory):
+            log = MoveHistory.from_states(log, forward)
+        elif log.level is not None and log.level is not self:
+            log = log.copy()
+        log.level = self
+        return log
+
+    @property
+    def map_data(self):
+        """list: Rows of map characters (walls, floors and targets)."""
+        return self._map_data
+
+    @map_data.setter
+    def map_data(self, rows):
+        self._map_data = _TrackedList(
+            (self._track_row(y, row) for y, row in enumerate(rows)),
+            on_change=self._on_map_changed)
+        self._rebuild_grid()
+
+    @property
+    def boxes(self):
+        """list: Box positions as (x, y) tuples."""
+        return self._boxes
+
+    @boxes.setter
+    def boxes(self, positions):
+        positions = list(positions)
+        if positions != self._boxes:
+            self._record_jump()
+        self._set_boxes(positions)
+
+    def _set_boxes(self, positions):
+        self._boxes = _TrackedList(positions, on_change=self._on_boxes_changed)
+        self._rebuild_counts()
+
+    @property
+    def targets(self):
+        """list: Target positions as (x, y) tuples."""
+        return self._targets
+
+    @targets.setter
+    def targets(self, positions):
+        self._targets = _TrackedList(positions, on_change=self._on_targets_changed)
+        self._rebuild_counts()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('_cells', '_box_counts', '_target_counts', '_boxes_on_targets'):
+            del state[name]
+        state['_map_data'] = [list(row) for row in self._map_data]
+        state['_boxes'] = list(self._boxes)
+        state['_targets'] = list(self._targets)
+        state['_history'] = self._history.copy()
+        state['_redo_stack'] = self._redo_stack.copy()
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        map_data = state.pop('_map_data')
+        boxes = state.pop('_boxes')
+        targets = state.pop('_targets')
+        self.__dict__.update(state)
+        self._boxes = _TrackedList(boxes, on_change=self._on_boxes_changed)
+        self._targets = _TrackedList(targets, on_change=self._on_targets_changed)
+        self.map_data = map_data
+        self._history.level = self
+        self._redo_stack.level = self
+
+    def _track_row(self, y, row):
+        """Wrap a map row so that cell edits update the grid."""
+        return _TrackedList(row, on_change=lambda removed, added: self._refresh_row(y))
+
+    def _on_map_changed(self, removed, added):
+        """Rows were added, removed or replaced: rewrap them and rebuild the grid."""
+        self.map_data = list(self._map_data)
+
+    def _rebuild_grid(self):
+        """Rebuild the flat cell grid from map_data, boxes and targets."""
+        rows = self._map_data
+        self._rows = len(rows)
+        self._stride = max((len(row) for row in rows), default=0)
+        self._cells = bytearray().join(self._row_flags(row) for row in rows)
+        self._rebuild_counts()
+
+    def _row_flags(self, row):
+        """Map flags of a row, padded to the grid width."""
+        data = ''.join(row).encode('latin-1', 'replace')
+        return data.translate(_MAP_FLAGS).ljust(self._stride, b'\0')
+
+    def _refresh_row(self, y):
+        """Update the map flags of one row of the grid after it was edited."""
+        row = self._map_data[y]
+        if len(row) > self._stride:
+            self._rebuild_grid()
+            return
+        cells = self._cells
+        start = y * self._stride
+        for x, map_flags in enumerate(self._row_flags(row), start):
+            cells[x] = (cells[x] & ~(CELL_WALL | CELL_TARGET_MAP)) | map_flags
+
+    def _rebuild_counts(self):
+        """Recount boxes and targets by position and refresh their grid flags."""
+        self._cells = self._cells.translate(_KEEP_MAP_FLAGS)
+        self._box_counts = {}
+        self._target_counts = {}
+        self._boxes_on_targets = 0
+        self._on_targets_changed((), self._targets)
+        self._on_boxes_changed((), self._boxes)
+
+    def _set_flag(self, pos, flag, value):
+        """Set or clear a grid flag, ignoring positions outside the grid."""
+        x, y = pos
+        if 0 <= x < self._stride and 0 <= y < self._rows:
+            if value:
+                self._cells[y * self._stride + x] |= flag
+            else:
+                self._cells[y * self._stride + x] &= ~flag
+
+    def _on_boxes_changed(self, removed, added):
+        """Keep the box counters in sync with the boxes list."""
+        box_counts = self._box_counts
+        target_counts = self._target_counts
+        for pos in removed:
+            count = box_counts[pos] - 1
+            if count:
+                box_counts[pos] = count
+            else:
+                del box_counts[pos]
+                self._set_flag(pos, CELL_BOX, False)
+            if pos in target_counts:
+                self._boxes_on_targets -= 1
+        for pos in added:
+            count = box_counts.get(pos, 0)
+            if not count:
+                self._set_flag(pos, CELL_BOX, True)
+            box_counts[pos] = count + 1
+            if pos in target_counts:
+                self._boxes_on_targets += 1
+
+    def _on_targets_changed(self, removed, added):
+        """Keep the target counters in sync with the targets list."""
+        box_counts = self._box_counts
+        target_counts = self._target_counts
+        for pos in removed:
+            count = target_counts[pos] - 1
+            if count:
+                target_counts[pos] = count
+            else:
+                del target_counts[pos]
+                self._set_flag(pos, CELL_TARGET, False)
+                self._boxes_on_targets -= box_counts.get(pos, 0)
+        for pos in added:
+            count = target_counts.get(pos, 0)
+            if not count:
+                self._set_flag(pos, CELL_TARGET, True)
+                self._boxes_on_targets += box_counts.get(pos, 0)
+            target_counts[pos] = count + 1
+
     def load_from_string(self, level_string):
         """
         Load level data from a string.
@@ -93,9 +382,9 @@ class Level:
             lines (list): List of strings representing the level.
         """
         # Reset level data
-        self.map_data = []
-        self.boxes = []
-        self.targets = []
+        map_data = []
+        boxes = []
+        targets = []
 
         # Normalize line lengths while preserving original spacing
         max_width = max(len(line) for line in lines)
@@ -117,31 +406,35 @@ class Level:
             row = []
             for x, char in enumerate(line):
                 if char == PLAYER:
-                    self.player_pos = (x, y)
+                    self._player_pos = (x, y)
                     row.append(FLOOR)
                 elif char == PLAYER_ON_TARGET:
-                    self.player_pos = (x, y)
-                    self.targets.append((x, y))
+                    self._player_pos = (x, y)
+                    targets.append((x, y))
                     row.append(TARGET)
                 elif char == BOX:
-                    self.boxes.append((x, y))
+                    boxes.append((x, y))
                     row.append(FLOOR)
                 elif char == BOX_ON_TARGET:
-                    self.boxes.append((x, y))
-                    self.targets.append((x, y))
+                    boxes.append((x, y))
+                    targets.append((x, y))
                     row.append(TARGET)
                 elif char == TARGET:
-                    self.targets.append((x, y))
+                    targets.append((x, y))
                     row.append(TARGET)
                 else:
                     row.append(char)
-            self.map_data.append(row)
+            map_data.append(row)
+
+        self._boxes = _TrackedList(boxes, on_change=self._on_boxes_changed)
+        self._targets = _TrackedList(targets, on_change=self._on_targets_changed)
+        self.map_data = map_data
 
         # Reset game stats
         self.moves = 0
         self.pushes = 0
-        self.history = []
-        self.redo_stack = []
+        self._history.clear()
+        self._redo_stack.clear()
 
     def get_cell(self, x, y):
         """
@@ -169,7 +462,9 @@ class Level:
         Returns:
             bool: True if the cell is a wall, False otherwise.
         """
-        return self.get_cell(x, y) == WALL
+        if 0 <= x < self._stride and 0 <= y < self._rows:
+            return bool(self._cells[y * self._stride + x] & CELL_WALL)
+        return True  # Out-of-bounds cells are walls
 
     def is_box(self, x, y):
         """
@@ -182,7 +477,7 @@ class Level:
         Returns:
             bool: True if there is a box, False otherwise.
         """
-        return (x, y) in self.boxes
+        return (x, y) in self._box_counts
 
     def is_target(self, x, y):
         """
@@ -195,7 +490,9 @@ class Level:
         Returns:
             bool: True if the cell is a target, False otherwise.
         """
-        return (x, y) in self.targets or self.get_cell(x, y) == TARGET
+        if 0 <= x < self._stride and 0 <= y < self._rows:
+            return bool(self._cells[y * self._stride + x] & CELL_ANY_TARGET)
+        return (x, y) in self._target_counts
 
     def can_move(self, dx, dy):
         """
@@ -244,68 +541,125 @@ class Level:
         if not self.can_move(dx, dy):
             return False
 
-        # Save current state for undo
-        self._save_state()
-
-        x, y = self.player_pos
+        x, y = self._player_pos
         new_x, new_y = x + dx, y + dy
 
         # Check if we're pushing a box
-        pushing_box = False
-        for i, (box_x, box_y) in enumerate(self.boxes):
-            if (box_x, box_y) == (new_x, new_y):
-                # Move the box
-                self.boxes[i] = (box_x + dx, box_y + dy)
-                pushing_box = True
-                self.pushes += 1
-                break
+        box_index = None
+        if (new_x, new_y) in self._box_counts:
+            box_index = self._boxes.index((new_x, new_y))
+
+        # Log the move for undo
+        self._log_move(dx, dy, box_index)
+
+        if box_index is not None:
+            # Move the box
+            self._boxes[box_index] = (new_x + dx, new_y + dy)
+            self.pushes += 1
 
         # Move the player
-        self.player_pos = (new_x, new_y)
+        self._player_pos = (new_x, new_y)
         self.moves += 1
 
         return True
 
-    def _save_state(self):
+    def _log_move(self, dx, dy, box_index, pull=False):
         """
-        Save the current game state for undo functionality.
+        Log a move about to be played, for undo functionality.
         A new move invalidates the redo stack.
         """
-        state = {
-            'player_pos': self.player_pos,
-            'boxes': self.boxes.copy(),
-            'moves': self.moves,
-            'pushes': self.pushes
-        }
-        self.history.append(state)
-        self.redo_stack.clear()
+        if (dx, dy) in DIRECTION_INDEX:
+            self._history.push_move((dx, dy), box_index, pull)
+        else:
+            self._history.push_jump(self._position())
+        self._redo_stack.clear()
+
+    def _record_jump(self):
+        """
+        Log a position change made outside the game rules (replay, snapshot,
+        solver state) so that it can be undone. Consecutive changes are merged.
+        """
+        if not self._history.last_is_jump():
+            self._history.push_jump(self._position())
+        self._redo_stack.clear()
+
+    def _position(self):
+        """Current position as a jump keyframe: (player_pos, boxes, moves, pushes)."""
+        return self._player_pos, tuple(self._boxes), self.moves, self.pushes
+
+    def _restore(self, keyframe):
+        """Restore a position saved by _position."""
+        player_pos, boxes, self.moves, self.pushes = keyframe
+        self._player_pos = player_pos
+        self._set_boxes(boxes)
+
+    def _apply_step(self, step, sign):
+        """Play a logged move forwards (sign 1) or backwards (sign -1)."""
+        (dx, dy), box_index = decode_step(step)
+        dx, dy = dx * sign, dy * sign
+        x, y = self._player_pos
+        self._player_pos = (x + dx, y + dy)
+        self.moves += sign
+        if box_index is not None:
+            box_x, box_y = self._boxes[box_index]
+            self._boxes[box_index] = (box_x + dx, box_y + dy)
+            self.pushes += sign
 
     def undo(self):
         """
-        Undo the last move if possible. Saves current state to redo stack.
+        Undo the last move if possible. The move goes to the redo stack.
 
         Returns:
             bool: True if the undo was successful, False otherwise.
         """
-        if not self.history:
+        if not self._history:
             return False
 
-        # Save current state to redo stack before restoring
-        self.redo_stack.append({
-            'player_pos': self.player_pos,
-            'boxes': self.boxes.copy(),
-            'moves': self.moves,
-            'pushes': self.pushes
-        })
-
-        state = self.history.pop()
-        self.player_pos = state['player_pos']
-        self.boxes = state['boxes']
-        self.moves = state['moves']
-        self.pushes = state['pushes']
+        step, keyframe = self._history.pop()
+        if keyframe is not None:
+            self._redo_stack.push(step, self._position())
+            self._restore(keyframe)
+        else:
+            self._apply_step(step, -1)
+            self._redo_stack.push(step)
 
         return True
 
+    def undo_to(self, length, position=None):
+        """
+        Undo moves until the history has the given length.
+
+        Without jumps in the undone moves, the target position is restored
+        at once and the moves go to the redo stack in one block, as if they
+        had been undone one by one.
+
+        Args:
+            length (int): Length of the history to go back to.
+            position (tuple, optional): (player_pos, boxes, moves, pushes) at
+                that length, if known. Otherwise it is read from the history.
+
+        Returns:
+            int: Number of moves undone.
+        """
+        length = max(0, length)
+        count = len(self._history) - length
+        if count <= 0:
+            return 0
+
+        if self._history.has_jumps(len(self._history) - count):
+            undone = 0
+            while undone < count and self.undo():
+                undone += 1
+            return undone
+
+        if position is None:
+            position = self._history.position(length)
+        steps = self._history.pop_moves(count)
+        steps.reverse()
+        self._redo_stack.push_moves(steps)
+        self._restore(position)
+        return count
+
     def redo(self):
         """
         Redo the last undone move if possible.
@@ -313,22 +667,16 @@ class Level:
         Returns:
             bool: True if the redo was successful, False otherwise.
         """
-        if not self.redo_stack:
+        if not self._redo_stack:
             return False
 
-        # Save current state to history before restoring
-        self.history.append({
-            'player_pos': self.player_pos,
-            'boxes': self.boxes.copy(),
-            'moves': self.moves,
-            'pushes': self.pushes
-        })
-
-        state = self.redo_stack.pop()
-        self.player_pos = state['player_pos']
-        self.boxes = state['boxes']
-        self.moves = state['moves']
-        self.pushes = state['pushes']
+        step, keyframe = self._redo_stack.pop()
+        if keyframe is not None:
+            self._history.push(step, self._position())
+            self._restore(keyframe)
+        else:
+            self._apply_step(step, 1)
+            self._history.push(step)
 
         return True
 
@@ -339,10 +687,29 @@ class Level:
         Returns:
             bool: True if the level is completed, False otherwise.
         """
-        if len(self.boxes) != len(self.targets):
-            return False
+        return len(self._boxes) == len(self._targets) == self._boxes_on_targets
 
-        return all(box_pos in self.targets for box_pos in self.boxes)
+    def layout_key(self):
+        """
+        Get a hashable key describing the static layout of the level.
+
+        Two levels with the same map characters share the same key, whatever
+        the position of the player and the boxes.
+
+        Returns:
+            tuple: (width, height, map string).
+        """
+        return (self.width, self.height, ''.join(''.join(row) for row in self.map_data))
+
+    def state_key(self):
+        """
+        Get a hashable key describing the current position of the level.
+
+        Returns:
+            tuple: Layout key extended with player, box and target positions.
+        """
+        return (self.layout_key(), self.player_pos,
+                tuple(sorted(self.boxes)), tuple(sorted(self.targets)))
 
     def get_display_char(self, x, y):
         """
@@ -355,9 +722,19 @@ class Level:
         Returns:
             str: The display character at the specified position.
         """
+        if 0 <= x < self._stride and 0 <= y < self._rows:
+            flags = self._cells[y * self._stride + x]
+            if (x, y) == self.player_pos:
+                return PLAYER_ON_TARGET if flags & CELL_ANY_TARGET else PLAYER
+            if flags & CELL_BOX:
+                return BOX_ON_TARGET if flags & CELL_ANY_TARGET else BOX
+            if flags & CELL_ANY_TARGET:
+                return TARGET
+            return self.get_cell(x, y)
+
         if (x, y) == self.player_pos:
             return PLAYER_ON_TARGET if self.is_target(x, y) else PLAYER
-        elif (x, y) in self.boxes:
+        elif (x, y) in self._box_counts:
             return BOX_ON_TARGET if self.is_target(x, y) else BOX
         elif self.is_target(x, y):
             return TARGET
@@ -472,25 +849,25 @@ class Level:
         if not self.can_pull(dx, dy):
             return False
 
-        self._save_state()
-
-        x, y = self.player_pos
+        x, y = self._player_pos
         new_x, new_y = x + dx, y + dy
 
         # Check if there's a box behind the player (opposite of move direction)
         behind_x, behind_y = x - dx, y - dy
-        pulling_box = False
+        box_index = None
+        if (behind_x, behind_y) in self._box_counts:
+            box_index = self._boxes.index((behind_x, behind_y))
+
+        # Log the move for undo: the box moves along with the player
+        self._log_move(dx, dy, box_index, pull=True)
 
-        for i, (box_x, box_y) in enumerate(self.boxes):
-            if (box_x, box_y) == (behind_x, behind_y):
-                # Pull the box into the player's old position
-                self.boxes[i] = (x, y)
-                pulling_box = True
-                self.pushes += 1
-                break
+        if box_index is not None:
+            # Pull the box into the player's old position
+            self._boxes[box_index] = (x, y)
+            self.pushes += 1
 
         # Move the player
-        self.player_pos = (new_x, new_y)
+        self._player_pos = (new_x, new_y)
         self.moves += 1
 
         return True
@@ -499,12 +876,12 @@ class Level:
         """
         Reset the level to its initial state.
         """
-        if self.history:
-            # Get the initial state (first move)
-            initial_state = self.history[0]
-            self.player_pos = initial_state['player_pos']
-            self.boxes = initial_state['boxes'].copy()
+        if self._history:
+            # Get the initial state (before the first move)
+            initial_state = self._history[0]
+            self._player_pos = initial_state['player_pos']
+            self._set_boxes(initial_state['boxes'])
             self.moves = 0
             self.pushes = 0
-            self.history = []
-            self.redo_stack = []
+            self._history.clear()
+            self._redo_stack.clear()
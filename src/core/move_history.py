@@ -0,0 +1,466 @@
+"""
+Move History module for the Sokoban game.
+
+Undo and redo logs of a Level, stored as one integer per move instead of
+one copy of the level state per move. A step records the direction of
+the move and the index of the box it moved, if any. Undo and redo apply
+the step backwards or forwards to the level.
+
+Positions set from outside the game rules (replays, snapshots, solver
+states) are logged as jump steps, which keep the full position they
+replaced so that they can be undone too.
+
+States are materialized on demand: indexing a log returns the same dict
+as the former list of state copies.
+
+Logs only grow at the end, so a HistoryView (used by snapshots) can share
+the step array of a live log: the log copies its steps only when it has
+to drop some of them (undo, clear) while a view shares them.
+"""
+
+from array import array
+
+
+# Direction index of a step -> (dx, dy)
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(DIRECTIONS)}
+
+# LURD letter of each direction index
+LURD_LETTERS = 'udlr'
+
+# Step encoding: bits 0-1 direction, bit 2 jump, bit 3 pull, bits 4+ moved box index + 1 (0: no box)
+_DIRECTION_MASK = 0b11
+_JUMP = 0b100
+_PULL = 0b1000
+_BOX_SHIFT = 4
+
+
+def encode_step(direction, box_index=None, pull=False):
+    """
+    Encode a move as a step.
+
+    Args:
+        direction (tuple): (dx, dy) of the player.
+        box_index (int, optional): Index in level.boxes of the moved box.
+        pull (bool): Whether the box was pulled (reverse mode) rather than pushed.
+
+    Returns:
+        int: The encoded step.
+    """
+    box = 0 if box_index is None else box_index + 1
+    return (box << _BOX_SHIFT) | (_PULL if pull else 0) | DIRECTION_INDEX[direction]
+
+
+def decode_step(step):
+    """
+    Decode a move step.
+
+    Args:
+        step (int): Encoded step.
+
+    Returns:
+        tuple: ((dx, dy), box index or None), or None for a jump step.
+    """
+    if step & _JUMP:
+        return None
+    box = step >> _BOX_SHIFT
+    return DIRECTIONS[step & _DIRECTION_MASK], (box - 1 if box else None)
+
+
+def steps_to_lurd(steps):
+    """
+    Convert steps to a LURD string (lowercase: move, uppercase: push).
+
+    Args:
+        steps: Iterable of encoded steps.
+
+    Returns:
+        str: The LURD string, or None if a step is a jump or a pull.
+    """
+    letters = []
+    for step in steps:
+        if step & (_JUMP | _PULL):
+            return None
+        letter = LURD_LETTERS[step & _DIRECTION_MASK]
+        letters.append(letter.upper() if step >> _BOX_SHIFT else letter)
+    return ''.join(letters)
+
+
+class MoveHistory:
+    """
+    Stack of steps of a level, used for its undo log and its redo log.
+
+    Entry i of the undo log is the state before step i; entry i of the redo
+    log is the state after step i. Only the steps are stored: entries are
+    computed from the current position of the level when they are read.
+    """
+
+    def __init__(self, forward=False, level=None):
+        """
+        Initialize an empty log.
+
+        Args:
+            forward (bool): True for a redo log (steps are replayed forwards
+                to read entries), False for an undo log.
+            level (Level, optional): Level whose position the log is relative to.
+        """
+        self.forward = forward
+        self.level = level
+        self._steps = array('I')
+        self._keyframes = []  # (player_pos, boxes, moves, pushes) of the jump steps, in order
+        self._shared = False  # Steps shared with a HistoryView
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.states()[index]
+        if index < 0:
+            index += len(self._steps)
+        if not 0 <= index < len(self._steps):
+            raise IndexError("history index out of range")
+        return self._state_dict(self._walk(len(self._steps) - 1 - index))
+
+    def __iter__(self):
+        return iter(self.states())
+
+    def __eq__(self, other):
+        if isinstance(other, MoveHistory):
+            return (self.forward == other.forward and self._steps == other._steps
+                    and self._keyframes == other._keyframes)
+        if isinstance(other, list):
+            return len(other) == len(self) and self.states() == other
+        return NotImplemented
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getstate__(self):
+        # Logs are stored detached from their level
+        state = self.__dict__.copy()
+        state['level'] = None
+        state['_steps'] = array('I', self._steps)
+        state['_keyframes'] = list(self._keyframes)
+        state['_shared'] = False
+        return state
+
+    def copy(self):
+        """
+        Copy the log, detached from its level.
+
+        Returns:
+            MoveHistory: The copy.
+        """
+        log = MoveHistory(self.forward)
+        log._steps = array('I', self._steps)
+        log._keyframes = list(self._keyframes)
+        return log
+
+    def view(self):
+        """
+        Take a read-only view of the log in O(1).
+
+        The view shares the steps of the log; the log copies them before it
+        drops any step.
+
+        Returns:
+            HistoryView: The view.
+        """
+        self._shared = True
+        return HistoryView(self.forward, self._steps, len(self._steps),
+                           self._keyframes, len(self._keyframes))
+
+    def clear(self):
+        """Remove all steps."""
+        self._steps = array('I')
+        self._keyframes = []
+        self._shared = False
+
+    def push_move(self, direction, box_index=None, pull=False):
+        """
+        Log a move.
+
+        Args:
+            direction (tuple): (dx, dy) of the player.
+            box_index (int, optional): Index in level.boxes of the moved box.
+            pull (bool): Whether the box was pulled rather than pushed.
+        """
+        self._steps.append(encode_step(direction, box_index, pull))
+
+    def push_jump(self, keyframe):
+        """
+        Log a jump to a new position.
+
+        Args:
+            keyframe (tuple): (player_pos, boxes, moves, pushes) of the other
+                end of the jump: the position before it in an undo log, after
+                it in a redo log.
+        """
+        self._steps.append(_JUMP)
+        self._keyframes.append(keyframe)
+
+    def last_is_jump(self):
+        """
+        Check whether the last step is a jump.
+
+        Returns:
+            bool: True if the log ends with a jump step.
+        """
+        return bool(self._steps) and bool(self._steps[-1] & _JUMP)
+
+    def pop(self):
+        """
+        Remove the last step.
+
+        Returns:
+            tuple: (step, keyframe or None).
+        """
+        if self._shared:
+            self._steps = array('I', self._steps)
+            self._keyframes = list(self._keyframes)
+            self._shared = False
+        step = self._steps.pop()
+        keyframe = self._keyframes.pop() if step & _JUMP else None
+        return step, keyframe
+
+    def changes_boxes(self, index):
+        """
+        Check whether a step moved a box or jumped to a new position.
+
+        Args:
+            index (int): Index of the step.
+
+        Returns:
+            bool: True for a push, a pull or a jump step.
+        """
+        step = self._steps[index]
+        return bool(step & _JUMP) or step >> _BOX_SHIFT > 0
+
+    def has_jumps(self, start=0):
+        """
+        Check whether the log has jump steps from an index on.
+
+        Args:
+            start (int): Index of the first step to check.
+
+        Returns:
+            bool: True if a step from start on is a jump.
+        """
+        if len(self._keyframes) == 0:
+            return False
+        return any(step & _JUMP for step in self._steps[start:])
+
+    def pop_moves(self, count):
+        """
+        Remove the last count steps in one block. They must not be jumps.
+
+        Args:
+            count (int): Number of steps to remove.
+
+        Returns:
+            array: The removed steps, in log order.
+        """
+        if self._shared:
+            self._steps = array('I', self._steps)
+            self._keyframes = list(self._keyframes)
+            self._shared = False
+        start = len(self._steps) - count
+        steps = self._steps[start:]
+        del self._steps[start:]
+        return steps
+
+    def push_moves(self, steps):
+        """
+        Add move steps in one block (no jumps).
+
+        Args:
+            steps (array): Encoded steps, in log order.
+        """
+        self._steps.extend(steps)
+
+    def push(self, step, keyframe=None):
+        """
+        Add a step returned by pop, to move it between the undo and redo logs.
+
+        Args:
+            step (int): Encoded step.
+            keyframe (tuple, optional): Keyframe of a jump step.
+        """
+        self._steps.append(step)
+        if step & _JUMP:
+            self._keyframes.append(keyframe)
+
+    def states(self):
+        """
+        Materialize all entries.
+
+        Returns:
+            list: State dicts, in log order.
+        """
+        if not self._steps:
+            return []
+        position = self._current_position()
+        keyframes = len(self._keyframes)
+        states = []
+        for i in range(len(self._steps) - 1, -1, -1):
+            position, keyframes = self._apply(self._steps[i], position, keyframes)
+            states.append(self._state_dict(position))
+        states.reverse()
+        return states
+
+    def position(self, index):
+        """
+        Get an entry as a position tuple, without building its state dict.
+
+        Args:
+            index (int): Index of the entry.
+
+        Returns:
+            tuple: (player_pos, boxes, moves, pushes) of the entry.
+        """
+        if not 0 <= index < len(self._steps):
+            raise IndexError("history index out of range")
+        return self._walk(len(self._steps) - 1 - index)
+
+    def to_lurd(self):
+        """
+        Get the logged moves as a LURD string.
+
+        Returns:
+            str: The LURD string, or None if the log has jumps or pulls.
+        """
+        return steps_to_lurd(self._steps)
+
+    def get_statistics(self):
+        """
+        Get the memory used by the log.
+
+        Returns:
+            dict: Number of steps, of jump keyframes, and bytes used by the steps.
+        """
+        return {
+            'steps': len(self._steps),
+            'keyframes': len(self._keyframes),
+            'step_bytes': len(self._steps) * self._steps.itemsize,
+        }
+
+    def _current_position(self):
+        if self.level is None:
+            raise ValueError("History is not attached to a level")
+        level = self.level
+        return level.player_pos, list(level.boxes), level.moves, level.pushes
+
+    def _walk(self, count):
+        """Position reached by applying the last count + 1 steps."""
+        position = self._current_position()
+        keyframes = len(self._keyframes)
+        for i in range(len(self._steps) - 1, len(self._steps) - 2 - count, -1):
+            position, keyframes = self._apply(self._steps[i], position, keyframes)
+        return position
+
+    def _apply(self, step, position, keyframes):
+        """Apply one step (backwards in an undo log) to a position copy."""
+        if step & _JUMP:
+            keyframes -= 1
+            player_pos, boxes, moves, pushes = self._keyframes[keyframes]
+            return (player_pos, list(boxes), moves, pushes), keyframes
+
+        player_pos, boxes, moves, pushes = position
+        (dx, dy), box_index = decode_step(step)
+        sign = 1 if self.forward else -1
+        dx, dy = dx * sign, dy * sign
+        player_pos = (player_pos[0] + dx, player_pos[1] + dy)
+        if box_index is not None:
+            box_x, box_y = boxes[box_index]
+            boxes[box_index] = (box_x + dx, box_y + dy)
+            pushes += sign
+        return (player_pos, boxes, moves + sign, pushes), keyframes
+
+    @staticmethod
+    def _state_dict(position):
+        player_pos, boxes, moves, pushes = position
+        return {'player_pos': player_pos, 'boxes': list(boxes), 'moves': moves, 'pushes': pushes}
+
+    @classmethod
+    def from_states(cls, states, forward=False):
+        """
+        Build a log from a list of state dicts, as stored by older versions.
+
+        Every entry becomes a jump step keeping its state.
+
+        Args:
+            states (list): State dicts with player_pos, boxes, moves and pushes.
+            forward (bool): True for a redo log.
+
+        Returns:
+            MoveHistory: The log, detached from any level.
+        """
+        log = cls(forward)
+        for state in states:
+            log.push_jump((state['player_pos'], tuple(state['boxes']),
+                           state['moves'], state['pushes']))
+        return log
+
+
+class HistoryView:
+    """
+    Read-only, O(1) view of the first steps of a MoveHistory.
+
+    Used by snapshots: the view keeps the prefix of the log that existed
+    when it was taken, even if the log later grows or drops steps.
+    """
+
+    __slots__ = ('forward', '_steps', '_length', '_keyframes', '_keyframe_count')
+
+    def __init__(self, forward, steps, length, keyframes, keyframe_count):
+        self.forward = forward
+        self._steps = steps
+        self._length = length
+        self._keyframes = keyframes
+        self._keyframe_count = keyframe_count
+
+    def __len__(self):
+        return self._length
+
+    def to_history(self):
+        """
+        Copy the viewed steps into a new log.
+
+        Returns:
+            MoveHistory: The log, detached from any level.
+        """
+        log = MoveHistory(self.forward)
+        log._steps = self._steps[:self._length]
+        log._keyframes = self._keyframes[:self._keyframe_count]
+        return log
+
+    def to_lurd(self):
+        """
+        Get the viewed moves as a LURD string.
+
+        Returns:
+            str: The LURD string, or None if the steps have jumps or pulls.
+        """
+        return steps_to_lurd(self._steps[:self._length])
+
+    def start_position(self, position):
+        """
+        Walk back the viewed steps from the position they lead to.
+
+        Args:
+            position (tuple): (player_pos, boxes, moves, pushes) after the steps.
+
+        Returns:
+            tuple: (player_pos, boxes, moves, pushes) before the first step.
+        """
+        log = self.to_history()
+        player_pos, boxes, moves, pushes = position
+        position = (player_pos, list(boxes), moves, pushes)
+        keyframes = len(log._keyframes)
+        for i in range(len(log._steps) - 1, -1, -1):
+            position, keyframes = log._apply(log._steps[i], position, keyframes)
+        return position
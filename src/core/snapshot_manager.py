@@ -3,9 +3,12 @@ Snapshot Manager for Sokoban Game.
 
 Provides named save/load of complete game states, allowing players to
 explore multiple solution branches and return to any saved point.
+
+Taking a snapshot is O(1) in the length of the game: the snapshot keeps a
+HistoryView sharing the undo log of the level instead of a copy of it.
+Snapshots can also be persisted across sessions through a SnapshotStore.
 """
 
-import copy
 import time
 
 
@@ -15,22 +18,43 @@ class Snapshot:
     __slots__ = ('name', 'timestamp', 'player_pos', 'boxes', 'moves',
                  'pushes', 'history')
 
-    def __init__(self, name, player_pos, boxes, moves, pushes, history):
+    def __init__(self, name, player_pos, boxes, moves, pushes, history, timestamp=None):
         self.name = name
-        self.timestamp = time.time()
+        self.timestamp = time.time() if timestamp is None else timestamp
         self.player_pos = player_pos
         self.boxes = boxes
         self.moves = moves
         self.pushes = pushes
-        self.history = history
+        self.history = history  # HistoryView of the undo log, or None
+
+    def start_position(self):
+        """
+        Get the position the undo history of the snapshot starts from.
+
+        Returns:
+            tuple: (player_pos, boxes) before the first logged move.
+        """
+        if self.history is None:
+            return self.player_pos, list(self.boxes)
+        player_pos, boxes, _, _ = self.history.start_position(
+            (self.player_pos, self.boxes, self.moves, self.pushes))
+        return player_pos, boxes
 
 
 class SnapshotManager:
     """Manages named snapshots of game state."""
 
-    def __init__(self):
+    def __init__(self, store=None):
+        """
+        Initialize the snapshot manager.
+
+        Args:
+            store (SnapshotStore, optional): Store persisting the snapshots on disk.
+        """
         self.snapshots = {}
         self._auto_counter = 0
+        self.store = store
+        self._board = None  # Level whose board the snapshots belong to
 
     def save_snapshot(self, level, name=None):
         """
@@ -46,6 +70,9 @@ class SnapshotManager:
         if name is None:
             self._auto_counter += 1
             name = f"Quick Save #{self._auto_counter}"
+            while name in self.snapshots:
+                self._auto_counter += 1
+                name = f"Quick Save #{self._auto_counter}"
 
         snapshot = Snapshot(
             name=name,
@@ -53,9 +80,12 @@ class SnapshotManager:
             boxes=list(level.boxes),
             moves=level.moves,
             pushes=level.pushes,
-            history=copy.deepcopy(level.history)
+            history=level.history.view()
         )
         self.snapshots[name] = snapshot
+        self._board = level
+        if self.store is not None:
+            self.store.save(level, snapshot)
         return name
 
     def load_snapshot(self, level, name):
@@ -77,7 +107,7 @@ class SnapshotManager:
         level.boxes = list(snapshot.boxes)
         level.moves = snapshot.moves
         level.pushes = snapshot.pushes
-        level.history = copy.deepcopy(snapshot.history)
+        level.history = snapshot.history.to_history() if snapshot.history is not None else []
         level.redo_stack = []
         return True
 
@@ -109,7 +139,7 @@ class SnapshotManager:
 
     def delete_snapshot(self, name):
         """
-        Delete a named snapshot.
+        Delete a named snapshot, also from the store.
 
         Args:
             name: Name of the snapshot to delete.
@@ -119,10 +149,31 @@ class SnapshotManager:
         """
         if name in self.snapshots:
             del self.snapshots[name]
+            if self.store is not None and self._board is not None:
+                self.store.delete(self._board, name)
             return True
         return False
 
+    def load_stored(self, level):
+        """
+        Load the snapshots saved on disk for the board of a level.
+
+        Args:
+            level: The Level object.
+
+        Returns:
+            int: Number of snapshots loaded.
+        """
+        if self.store is None:
+            return 0
+        self._board = level
+        snapshots = self.store.load(level)
+        for snapshot in snapshots:
+            self.snapshots[snapshot.name] = snapshot
+        return len(snapshots)
+
     def clear(self):
         """Clear all snapshots."""
         self.snapshots.clear()
         self._auto_counter = 0
+        self._board = None
@@ -0,0 +1,281 @@
+"""
+Snapshot Store for Sokoban Game.
+
+Persists named snapshots across sessions in a compact format: one JSON
+file per board, in which each snapshot is the LURD string of its moves
+from a start position (lowercase: move, uppercase: push).
+
+Files are keyed by a hash of the board layout, so a snapshot is only
+offered for the board it was taken on. On load, every snapshot is
+replayed from its start position: each move must be legal, each push
+must match the case of its letter, and the final position must match the
+stored state hash. Invalid snapshots are skipped. Each board keeps at
+most MAX_SNAPSHOTS_PER_BOARD snapshots; the oldest are pruned on save.
+
+Snapshots whose history cannot be written as LURD (jumps from replays or
+solver states, pulls from reverse mode) are stored as a position only
+and restored without undo history.
+"""
+
+import hashlib
+import json
+import os
+
+from src.core.move_history import DIRECTIONS, LURD_LETTERS, MoveHistory
+from src.core.snapshot_manager import Snapshot
+
+
+# Default snapshot directory (data/snapshots at the project root)
+DEFAULT_SNAPSHOT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'data', 'snapshots'
+)
+
+STORE_VERSION = 1
+
+# Snapshots kept per board, the oldest are pruned beyond this
+MAX_SNAPSHOTS_PER_BOARD = 20
+
+# LURD letter -> (dx, dy)
+LURD_DIRECTIONS = {letter: DIRECTIONS[index] for index, letter in enumerate(LURD_LETTERS)}
+
+
+def board_hash(level):
+    """
+    Hash the static layout of a level (walls, floor and targets).
+
+    Args:
+        level: The Level object.
+
+    Returns:
+        str: Hex digest identifying the board.
+    """
+    return hashlib.sha1(repr(level.layout_key()).encode('utf-8')).hexdigest()[:16]
+
+
+def state_hash(player_pos, boxes):
+    """
+    Hash a position of the player and the boxes.
+
+    Args:
+        player_pos (tuple): (x, y) of the player.
+        boxes: Iterable of (x, y) box positions.
+
+    Returns:
+        str: Hex digest identifying the position.
+    """
+    key = (tuple(player_pos), tuple(sorted(tuple(box) for box in boxes)))
+    return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16]
+
+
+class SnapshotStore:
+    """Saves and restores snapshots on disk, one file per board."""
+
+    def __init__(self, directory=DEFAULT_SNAPSHOT_DIR, max_per_board=MAX_SNAPSHOTS_PER_BOARD):
+        """
+        Initialize the snapshot store.
+
+        Args:
+            directory (str): Directory of the snapshot files.
+            max_per_board (int): Maximum number of snapshots kept per board.
+        """
+        self.directory = directory
+        self.max_per_board = max_per_board
+
+    def save(self, level, snapshot):
+        """
+        Save a snapshot of a level, replacing a snapshot with the same name.
+
+        The oldest snapshots of the board are pruned beyond max_per_board.
+
+        Args:
+            level: The Level object the snapshot was taken on.
+            snapshot (Snapshot): The snapshot to save.
+
+        Returns:
+            bool: True if saved successfully.
+        """
+        entries = [entry for entry in self._read(level)['snapshots']
+                   if entry.get('name') != snapshot.name]
+        entries.append(self.encode(snapshot))
+        if len(entries) > self.max_per_board:
+            entries.sort(key=lambda entry: entry.get('timestamp', 0))
+            entries = entries[-self.max_per_board:]
+        return self._write(level, entries)
+
+    def load(self, level):
+        """
+        Load and validate the saved snapshots of a level.
+
+        Args:
+            level: The Level object, in any position.
+
+        Returns:
+            list[Snapshot]: Valid snapshots, oldest first.
+        """
+        snapshots = []
+        for entry in self._read(level)['snapshots']:
+            try:
+                snapshot = self.decode(level, entry)
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Warning: Skipping invalid snapshot {entry.get('name')!r}: {e}")
+                continue
+            snapshots.append(snapshot)
+        snapshots.sort(key=lambda s: s.timestamp)
+        return snapshots
+
+    def delete(self, level, name):
+        """
+        Delete a saved snapshot of a level.
+
+        Args:
+            level: The Level object.
+            name: Name of the snapshot to delete.
+
+        Returns:
+            bool: True if a snapshot was deleted.
+        """
+        entries = self._read(level)['snapshots']
+        kept = [entry for entry in entries if entry.get('name') != name]
+        if len(kept) == len(entries):
+            return False
+        return self._write(level, kept)
+
+    @staticmethod
+    def encode(snapshot):
+        """
+        Encode a snapshot as a JSON-compatible dict.
+
+        Args:
+            snapshot (Snapshot): The snapshot.
+
+        Returns:
+            dict: The entry, with a LURD string if the history allows it.
+        """
+        entry = {
+            'name': snapshot.name,
+            'timestamp': snapshot.timestamp,
+            'moves': snapshot.moves,
+            'pushes': snapshot.pushes,
+            'state': state_hash(snapshot.player_pos, snapshot.boxes),
+        }
+        history = snapshot.history
+        lurd = history.to_lurd() if history is not None and len(history) == snapshot.moves else None
+        if lurd is not None:
+            start = snapshot.start_position()
+            entry['lurd'] = lurd
+            entry['start'] = {'player': list(start[0]), 'boxes': [list(box) for box in start[1]]}
+        else:
+            entry['lurd'] = None
+            entry['player'] = list(snapshot.player_pos)
+            entry['boxes'] = [list(box) for box in snapshot.boxes]
+        return entry
+
+    @staticmethod
+    def decode(level, entry):
+        """
+        Rebuild a snapshot from an entry, replaying and validating its moves.
+
+        Args:
+            level: The Level object of the board.
+            entry (dict): Entry written by encode.
+
+        Returns:
+            Snapshot: The snapshot, with its undo history.
+
+        Raises:
+            ValueError: If the entry does not describe a legal position of the board.
+        """
+        if entry['lurd'] is None:
+            player_pos = tuple(entry['player'])
+            boxes = [tuple(box) for box in entry['boxes']]
+            _check_position(level, player_pos, boxes)
+            if state_hash(player_pos, boxes) != entry['state']:
+                raise ValueError("state hash mismatch")
+            return Snapshot(entry['name'], player_pos, boxes, entry['moves'], entry['pushes'],
+                            None, timestamp=entry['timestamp'])
+
+        start = entry['start']
+        player_pos = tuple(start['player'])
+        boxes = [tuple(box) for box in start['boxes']]
+        _check_position(level, player_pos, boxes)
+
+        # Replay the moves, rebuilding the undo history step by step
+        history = MoveHistory()
+        push_move = history.push_move
+        box_index = {box: index for index, box in enumerate(boxes)}
+        x, y = player_pos
+        pushes = 0
+        for letter in entry['lurd']:
+            direction = LURD_DIRECTIONS.get(letter.lower())
+            if direction is None:
+                raise ValueError(f"invalid move {letter!r}")
+            dx, dy = direction
+            x, y = x + dx, y + dy
+            index = box_index.get((x, y))
+            if level.is_wall(x, y) or (index is not None) != letter.isupper():
+                raise ValueError(f"illegal move {letter!r} after {len(history)} moves")
+            if index is not None:
+                target = (x + dx, y + dy)
+                if level.is_wall(*target) or target in box_index:
+                    raise ValueError(f"illegal push {letter!r} after {len(history)} moves")
+                del box_index[(x, y)]
+                box_index[target] = index
+                boxes[index] = target
+                pushes += 1
+            push_move(direction, index)
+        player_pos = (x, y)
+
+        if (len(history), pushes) != (entry['moves'], entry['pushes']):
+            raise ValueError("move count mismatch")
+        if state_hash(player_pos, boxes) != entry['state']:
+            raise ValueError("state hash mismatch")
+        return Snapshot(entry['name'], player_pos, boxes, len(history), pushes,
+                        history.view(), timestamp=entry['timestamp'])
+
+    def _path(self, level):
+        """Path of the snapshot file of a board."""
+        return os.path.join(self.directory, board_hash(level) + '.json')
+
+    def _read(self, level):
+        """Read the snapshot file of a board, or an empty one if missing or invalid."""
+        empty = {'version': STORE_VERSION, 'board': board_hash(level), 'snapshots': []}
+        path = self._path(level)
+        if not os.path.exists(path):
+            return empty
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Warning: Could not load snapshots: {e}")
+            return empty
+        if (not isinstance(data, dict) or data.get('version') != STORE_VERSION
+                or data.get('board') != empty['board'] or not isinstance(data.get('snapshots'), list)):
+            return empty
+        return data
+
+    def _write(self, level, entries):
+        """Write the snapshot file of a board atomically."""
+        path = self._path(level)
+        data = {'version': STORE_VERSION, 'board': board_hash(level), 'snapshots': entries}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"Warning: Could not save snapshots: {e}")
+            return False
+
+
+def _check_position(level, player_pos, boxes):
+    """Raise ValueError if a position does not fit the board."""
+    if len(boxes) != len(level.targets) or len(set(boxes)) != len(boxes):
+        raise ValueError("wrong number of boxes")
+    for x, y in [player_pos] + boxes:
+        if not (0 <= x < level.width and 0 <= y < level.height) or level.is_wall(x, y):
+            raise ValueError(f"position {(x, y)} is not on the floor")
+    if player_pos in boxes:
+        raise ValueError("player is on a box")
@@ -0,0 +1,178 @@
+"""
+Solution Playback module for the Sokoban game.
+
+Plays a solution on a level from inside the main loop instead of a
+blocking loop with one render and one wait per move. Each tick applies
+the moves that are due since the previous tick according to the speed
+setting: several moves per frame at high speed, none on most frames at
+low speed. The caller renders once per frame, and the incremental game
+view only redraws the cells that changed.
+
+Seeking to any move index plays or undoes the moves without rendering.
+Progress logging is optional and batched.
+"""
+
+
+DIRECTION_MAP = {
+    'UP': (0, -1),
+    'DOWN': (0, 1),
+    'LEFT': (-1, 0),
+    'RIGHT': (1, 0),
+}
+
+
+class SolutionPlayback:
+    """
+    Time-driven playback of a list of moves on a level.
+    """
+
+    def __init__(self, level, moves, move_delay=300, logger=None, log_interval=100,
+                 max_moves_per_tick=None):
+        """
+        Initialize the playback. The level is played from its current position.
+
+        Args:
+            level (Level): Level to play the moves on.
+            moves (list): Move strings ('UP', 'DOWN', 'LEFT', 'RIGHT').
+            move_delay (int): Milliseconds per move; 0 plays every move on the next tick.
+            logger (callable, optional): Receives one progress line per batch of moves.
+            log_interval (int): Number of moves per log line.
+            max_moves_per_tick (int, optional): Cap on the moves applied by one tick.
+        """
+        self.level = level
+        self.moves = list(moves)
+        self.move_delay = max(0, move_delay)
+        self.logger = logger
+        self.log_interval = max(1, log_interval)
+        self.max_moves_per_tick = max_moves_per_tick
+
+        self.index = 0  # Number of moves played
+        self.playing = False
+        self.failed_at = None  # Index of a move the level refused
+
+        self._base = len(level.history)
+        self._last_tick = None
+        self._pending_ms = 0
+        self._logged = 0
+
+    @property
+    def total(self):
+        """Number of moves of the solution."""
+        return len(self.moves)
+
+    @property
+    def finished(self):
+        """Whether all moves were played or a move failed."""
+        return self.failed_at is not None or self.index >= len(self.moves)
+
+    def play(self):
+        """Start or resume playback. The next move is played on the next tick."""
+        if self.finished:
+            return
+        self.playing = True
+        self._last_tick = None
+        self._pending_ms = self.move_delay
+
+    def pause(self):
+        """Pause playback."""
+        self.playing = False
+
+    def toggle_play(self):
+        """Toggle play/pause."""
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+
+    def set_speed(self, move_delay):
+        """
+        Set the playback speed.
+
+        Args:
+            move_delay (int): Milliseconds per move.
+        """
+        self.move_delay = max(0, move_delay)
+
+    def tick(self, now_ms):
+        """
+        Apply the moves due at the given time. Call once per frame.
+
+        Args:
+            now_ms (int): Current time in milliseconds (e.g. pygame.time.get_ticks()).
+
+        Returns:
+            int: Number of moves applied; the level needs a redraw if it is not 0.
+        """
+        if not self.playing or self.finished:
+            return 0
+
+        if self._last_tick is not None:
+            self._pending_ms += max(0, now_ms - self._last_tick)
+        self._last_tick = now_ms
+
+        if self.move_delay == 0:
+            due = len(self.moves) - self.index
+        else:
+            due = self._pending_ms // self.move_delay
+        if self.max_moves_per_tick is not None and due > self.max_moves_per_tick:
+            due = self.max_moves_per_tick
+            # Drop the backlog instead of catching up on later frames
+            self._pending_ms = due * self.move_delay
+
+        applied = self._apply(due)
+        self._pending_ms -= applied * self.move_delay
+        if self.finished:
+            self.playing = False
+        return applied
+
+    def seek(self, index):
+        """
+        Go to a move index without rendering: play or undo the moves in between.
+
+        Args:
+            index (int): Number of moves to have played, clamped to the solution.
+
+        Returns:
+            int: The move index reached.
+        """
+        index = max(0, min(index, len(self.moves)))
+        if index < self.index:
+            self.index -= self.level.undo_to(self._base + index)
+            self.failed_at = None
+            self._logged = min(self._logged, self.index)
+        elif index > self.index:
+            self._apply(index - self.index)
+        return self.index
+
+    def finish(self):
+        """Play all remaining moves at once and stop."""
+        self.seek(len(self.moves))
+        self.playing = False
+
+    def _apply(self, count):
+        """Play up to count moves on the level."""
+        applied = 0
+        while applied < count and not self.finished:
+            move = self.moves[self.index]
+            direction = DIRECTION_MAP.get(move)
+            if direction is None or not self.level.move(*direction):
+                self.failed_at = self.index
+                self._log_progress(failed=True)
+                return applied
+            self.index += 1
+            applied += 1
+        if applied:
+            self._log_progress()
+        return applied
+
+    def _log_progress(self, failed=False):
+        """Send one line for the moves played since the last one."""
+        if self.logger is None:
+            return
+        if self.index > self._logged and (self.index - self._logged >= self.log_interval
+                                          or self.finished):
+            self.logger(f"Moves {self._logged + 1}-{self.index}/{len(self.moves)} OK")
+            self._logged = self.index
+        if failed:
+            self.logger(f"Move {self.failed_at + 1}/{len(self.moves)} "
+                        f"({self.moves[self.failed_at]}) FAILED")
@@ -46,6 +46,7 @@ class EditorOperations:
         elif self.editor.current_element == WALL:
             # Set cell to wall
             self.editor.current_level.map_data[y][x] = WALL
+            self.editor.level_metrics.update_cell(self.editor.current_level, x, y)
 
             # Remove any objects at this position
             if (x, y) == self.editor.current_level.player_pos:
@@ -57,6 +58,7 @@ class EditorOperations:
         elif self.editor.current_element == FLOOR:
             # Set cell to floor
             self.editor.current_level.map_data[y][x] = FLOOR
+            self.editor.level_metrics.update_cell(self.editor.current_level, x, y)
 
         self.editor.unsaved_changes = True
 
@@ -86,6 +88,7 @@ class EditorOperations:
 
         # Always set cell to floor
         self.editor.current_level.map_data[y][x] = FLOOR
+        self.editor.level_metrics.update_cell(self.editor.current_level, x, y)
 
         self.editor.unsaved_changes = True
 
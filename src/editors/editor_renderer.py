@@ -181,14 +181,12 @@ class EditorRenderer:
             icon_rect = pygame.Rect(item_rect.x + icon_margin, item_rect.y + (item_rect.height - icon_size) // 2,
                                    icon_size, icon_size)
 
-            # Get the skin from the skin manager
-            skin = self.editor.skin_manager.get_skin()
+            # Get the skin sprites at icon size from the skin manager
+            skin = self.editor.skin_manager.get_scaled_skin(icon_size)
 
             # Draw the element using the skin
             if element['char'] in skin:
-                # Scale the sprite to the icon size
-                scaled_sprite = pygame.transform.scale(skin[element['char']], (icon_size, icon_size))
-                self.editor.screen.blit(scaled_sprite, icon_rect)
+                self.editor.screen.blit(skin[element['char']], icon_rect)
             else:
                 # Fallback to the hardcoded color if sprite not found
                 pygame.draw.rect(self.editor.screen, element['color'], icon_rect)
@@ -235,7 +233,7 @@ class EditorRenderer:
         map_start_y = self.editor.map_area_y + self.editor.scroll_y
 
         # Draw level elements
-        skin = self.editor.skin_manager.get_skin()
+        skin = self.editor.skin_manager.get_scaled_skin(cell_size)
         for y in range(self.editor.current_level.height):
             for x in range(self.editor.current_level.width):
                 cell_x = map_start_x + x * cell_size
@@ -253,8 +251,7 @@ class EditorRenderer:
 
                 # Draw cell
                 if char in skin:
-                    scaled_sprite = pygame.transform.scale(skin[char], (cell_size, cell_size))
-                    self.editor.screen.blit(scaled_sprite, (cell_x, cell_y))
+                    self.editor.screen.blit(skin[char], (cell_x, cell_y))
 
         # Draw grid if enabled (moved after drawing level elements to be in foreground)
         if self.editor.show_grid and self.editor.zoom_level >= 0.3:  # Show grid at lower zoom levels
@@ -716,8 +713,9 @@ class EditorRenderer:
         self.editor.screen.blit(title_surface, title_rect)
 
         # Calculate level statistics
-        wall_count = sum(row.count(WALL) for row in self.editor.current_level.map_data)
-        floor_count = sum(row.count(FLOOR) for row in self.editor.current_level.map_data)
+        structure = self.editor.level_metrics.get_structure(self.editor.current_level)
+        wall_count = structure.totals['walls']
+        floor_count = structure.totals['floors']
         total_cells = self.editor.current_level.width * self.editor.current_level.height
 
         # Check if level is valid
@@ -845,8 +843,9 @@ class EditorRenderer:
         self.editor.screen.blit(metrics_title, (self.editor.right_panel_x + self.editor.ui_margin, self.editor.metrics_y))
 
         # Calculate level statistics
-        wall_count = sum(row.count(WALL) for row in self.editor.current_level.map_data)
-        floor_count = sum(row.count(FLOOR) for row in self.editor.current_level.map_data)
+        structure = self.editor.level_metrics.get_structure(self.editor.current_level)
+        wall_count = structure.totals['walls']
+        floor_count = structure.totals['floors']
         total_cells = self.editor.current_level.width * self.editor.current_level.height
 
         # Check if level is valid
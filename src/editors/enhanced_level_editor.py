@@ -26,6 +26,7 @@ from ..core.level import Level
 from ..level_management.level_manager import LevelManager
 from ..ui.skins.enhanced_skin_manager import EnhancedSkinManager
 from ..generation.procedural_generator import ProceduralGenerator
+from ..generation.level_metrics import LevelMetrics
 from ..ui.interactive_highlight import EditorHighlight
 from .editor_renderer import EditorRenderer
 from .editor_event_handler import EditorEventHandler
@@ -161,6 +162,9 @@ class EnhancedLevelEditor:
         # Interactive highlighting system for editor
         self.highlight_system = EditorHighlight()
 
+        # Cached structural metrics, updated cell by cell while painting
+        self.level_metrics = LevelMetrics()
+
         # Initialize delegate objects (composition pattern)
         # Must be created before _update_fonts() and _create_new_level() which delegate to them
         self.renderer = EditorRenderer(self)
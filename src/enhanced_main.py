@@ -11,10 +11,23 @@ This module provides an enhanced version of the Sokoban game with additional fea
 - Unified AI System with advanced solving capabilities
 - ML analytics and performance metrics
 - Algorithm benchmarking and comparison
+
+Startup only builds what the main menu needs. The game, the editor, the
+skin manager and the AI stack are created on first use, and the level
+index and the modules they need are loaded in a background thread once
+the menu is on screen. Run with --startup-profile to print the startup
+milestones and the time to the first frame.
 """
 
+import time
+
+_IMPORT_START = time.perf_counter()
+
+import argparse
+import importlib
 import os
 import sys
+import threading
 
 # Add the parent directory to sys.path to allow imports to work in both
 # development and when packaged as an executable
@@ -25,22 +38,85 @@ if parent_dir not in sys.path:
 
 import pygame
 
-# Import the new unified AI system
-from src.ai.unified_ai_controller import UnifiedAIController
 from src.core.config_manager import get_config_manager
 from src.core.constants import TITLE
-from src.editors.enhanced_level_editor import EnhancedLevelEditor
-from src.gui_main import GUIGame
-from src.level_management.level_manager import LevelManager
+from src.level_management.level_library import get_level_library
 from src.ui.event_dispatcher import EventDispatcher
 from src.ui.menu_system import MenuSystem
-from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
+
+# Modules of the components created on first use, imported in the background
+# after the first frame (see EnhancedSokoban._prewarm)
+DEFERRED_MODULES = (
+    'src.gui_main',
+    'src.editors.enhanced_level_editor',
+    'src.ai.unified_ai_controller',
+)
 
 # Import for window maximization on Windows
 if sys.platform == "win32":
     pass
 
 
+class StartupProfile:
+    """
+    Wall-clock milestones of the startup, printed with --startup-profile.
+    """
+
+    def __init__(self, start=None):
+        """
+        Initialize the profile.
+
+        Args:
+            start (float, optional): perf_counter() value of the start of the
+                startup. Defaults to the start of the import of this module.
+        """
+        self.start = _IMPORT_START if start is None else start
+        self.marks = []  # (milestone, seconds since start), in order
+
+    def mark(self, name):
+        """
+        Record a milestone.
+
+        Args:
+            name (str): Name of the milestone.
+
+        Returns:
+            float: Seconds since the start.
+        """
+        elapsed = time.perf_counter() - self.start
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def elapsed(self, name):
+        """
+        Get the time of a milestone.
+
+        Args:
+            name (str): Name of the milestone.
+
+        Returns:
+            float: Seconds since the start, or None if it was not reached.
+        """
+        for mark, elapsed in self.marks:
+            if mark == name:
+                return elapsed
+        return None
+
+    def report(self):
+        """
+        Format the milestones, with the time spent since the previous one.
+
+        Returns:
+            str: One line per milestone.
+        """
+        lines = ["Startup profile:"]
+        previous = 0.0
+        for name, elapsed in self.marks:
+            lines.append(f"  {name:<28} {elapsed * 1000:8.1f} ms  (+{(elapsed - previous) * 1000:.1f} ms)")
+            previous = elapsed
+        return "\n".join(lines)
+
+
 class EnhancedSokoban:
     """
     Enhanced Sokoban game with additional features.
@@ -53,14 +129,21 @@ class EnhancedSokoban:
     - Live testing of levels
     """
 
-    def __init__(self, levels_dir='src/levels'):
+    def __init__(self, levels_dir='src/levels', startup_profile=None):
         """
         Initialize the enhanced Sokoban game.
 
+        Only the window, the event dispatcher and the menu are created here.
+
         Args:
             levels_dir (str, optional): Directory containing level files.
                                        Defaults to 'levels'.
+            startup_profile (StartupProfile, optional): Profile receiving the
+                                       startup milestones.
         """
+        self.startup_profile = startup_profile
+        self._mark('imports')
+
         pygame.init()
 
         # Initialize config manager
@@ -97,11 +180,16 @@ class EnhancedSokoban:
 
         # Get actual screen size after maximizing or setting fullscreen
         self.screen_width, self.screen_height = self.screen.get_size()
+        self._mark('display')
 
-        # Initialize managers
+        # Components created on first use (see the properties below)
         self.levels_dir = levels_dir
-        self.level_manager = LevelManager(levels_dir)
-        self.skin_manager = EnhancedSkinManager()
+        self._level_manager = None
+        self._skin_manager = None
+        self._game = None
+        self._editor = None
+        self._ai_controller = None
+        self._prewarm_thread = None
 
         # Check if levels directory exists, create it if not
         if not os.path.exists(levels_dir):
@@ -111,9 +199,6 @@ class EnhancedSokoban:
         self.running = False
         self.current_state = 'menu'  # 'menu', 'playing', 'editor'
 
-        # Get keyboard layout from config
-        keyboard_layout = self.config_manager.get('game', 'keyboard_layout', 'qwerty')
-
         # Create event dispatcher (central event handling)
         self.event_dispatcher = EventDispatcher(
             on_quit=self._handle_quit,
@@ -123,20 +208,84 @@ class EnhancedSokoban:
             is_fullscreen=lambda: self.fullscreen,
         )
 
-        # Create components
-        self.menu_system = MenuSystem(self.screen, self.screen_width, self.screen_height, levels_dir, self.skin_manager)
-        self.game = GUIGame(levels_dir, keyboard_layout=keyboard_layout, skin_manager=self.skin_manager,
-                            event_dispatcher=self.event_dispatcher)
-        self.editor = EnhancedLevelEditor(levels_dir, screen=self.screen, event_dispatcher=self.event_dispatcher)
-
-        # Initialize the unified AI system
-        self.ai_controller = UnifiedAIController()
+        # The menu gets the skin manager when the skins menu is opened
+        self.menu_system = MenuSystem(self.screen, self.screen_width, self.screen_height, levels_dir)
 
         # Set up menu actions
         self._setup_menu_actions()
 
         # Update all components with the maximized screen size
         self._update_components_screen_size()
+        self._mark('menu')
+
+    @property
+    def level_manager(self):
+        """LevelManager: Level manager of the levels directory, created on first use."""
+        if self._level_manager is None:
+            from src.level_management.level_manager import LevelManager
+            self._level_manager = LevelManager(self.levels_dir)
+        return self._level_manager
+
+    @property
+    def skin_manager(self):
+        """EnhancedSkinManager: Shared skin manager, created on first use."""
+        if self._skin_manager is None:
+            from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
+            self._skin_manager = EnhancedSkinManager()
+        return self._skin_manager
+
+    @property
+    def game(self):
+        """GUIGame: Game, created the first time a level is played."""
+        if self._game is None:
+            from src.gui_main import GUIGame
+            keyboard_layout = self.config_manager.get('game', 'keyboard_layout', 'qwerty')
+            self._game = GUIGame(self.levels_dir, keyboard_layout=keyboard_layout, skin_manager=self.skin_manager,
+                                 event_dispatcher=self.event_dispatcher)
+            self._update_game_screen_size()
+        return self._game
+
+    @property
+    def editor(self):
+        """EnhancedLevelEditor: Level editor, created the first time it is opened."""
+        if self._editor is None:
+            from src.editors.enhanced_level_editor import EnhancedLevelEditor
+            self._editor = EnhancedLevelEditor(self.levels_dir, screen=self.screen,
+                                               event_dispatcher=self.event_dispatcher)
+            self._update_editor_screen_size()
+        return self._editor
+
+    @property
+    def ai_controller(self):
+        """UnifiedAIController: Unified AI system, created on first use."""
+        if self._ai_controller is None:
+            from src.ai.unified_ai_controller import UnifiedAIController
+            self._ai_controller = UnifiedAIController()
+        return self._ai_controller
+
+    def _mark(self, name):
+        """Record a startup milestone if the startup is profiled."""
+        if self.startup_profile is not None:
+            self.startup_profile.mark(name)
+
+    def _start_prewarm(self):
+        """Start loading the level index and the deferred modules in the background."""
+        if self._prewarm_thread is None:
+            self._prewarm_thread = threading.Thread(target=self._prewarm, name="startup-prewarm", daemon=True)
+            self._prewarm_thread.start()
+
+    def _prewarm(self):
+        """Prewarm thread: index the level files and import the deferred modules."""
+        try:
+            get_level_library().list_files(self.levels_dir)
+            self._mark('level index (background)')
+            for module in DEFERRED_MODULES:
+                importlib.import_module(module)
+            self._mark('modules (background)')
+            if self.startup_profile is not None:
+                print(self.startup_profile.report())
+        except Exception as e:
+            print(f"Error while prewarming: {e}")
 
     def _handle_quit(self):
         """Handle a QUIT event from the dispatcher."""
@@ -176,6 +325,11 @@ class EnhancedSokoban:
             events = self.event_dispatcher.pump()
             self.menu_system.handle_events(events)
             self.menu_system.states[self.menu_system.current_state]()
+            if self._prewarm_thread is None:
+                self._mark('first frame')
+                if self.startup_profile is not None:
+                    print(self.startup_profile.report())
+                self._start_prewarm()
             clock.tick(60)
 
         # Transition logic: determine next state after menu exits
@@ -195,8 +349,8 @@ class EnhancedSokoban:
 
             if level_info['type'] == 'collection_level':
                 try:
-                    from src.level_management.level_collection_parser import LevelCollectionParser
-                    collection = LevelCollectionParser.parse_file(level_info['collection_file'])
+                    from src.level_management.level_library import get_level_library
+                    collection = get_level_library().get_collection(level_info['collection_file'])
                     level_title, level = collection.get_level(level_info['level_index'])
 
                     level.title = level_title
@@ -248,6 +402,10 @@ class EnhancedSokoban:
 
         self.game.running = True
         self.skin_manager.reset_sprite_history()
+        # Offer the snapshots saved in earlier sessions for this board
+        self.game.snapshot_manager.clear()
+        if self.game.level_manager.current_level:
+            self.game.snapshot_manager.load_stored(self.game.level_manager.current_level)
         self.game.game_loop()
 
         # When game is closed, return to level selector (play menu)
@@ -294,7 +452,8 @@ class EnhancedSokoban:
 
     def _show_skins(self):
         """Show the skins menu."""
-        # For now, just change the menu state
+        # The skins menu edits the skin manager shared with the game
+        self.menu_system.skin_manager = self.skin_manager
         self.menu_system._change_state('skins')
 
     def _show_credits(self):
@@ -917,15 +1076,11 @@ class EnhancedSokoban:
             self.menu_system._create_main_menu_buttons()  # Attempt old method
             self._setup_menu_actions()
 
-        # Update editor
-        self.editor.screen = self.screen
-        self.editor.screen_width = self.screen_width
-        self.editor.screen_height = self.screen_height
-
-        # Update game renderer if needed
-        if hasattr(self.game, 'renderer'):
-            self.game.renderer.window_size = (self.screen_width, self.screen_height)
-            self.game.renderer.screen = self.screen
+        # Update the editor and the game, if they were created
+        if self._editor is not None:
+            self._update_editor_screen_size()
+        if self._game is not None:
+            self._update_game_screen_size()
 
         # Update level selector if it exists
         if hasattr(self.menu_system, 'level_selector') and self.menu_system.level_selector:
@@ -939,6 +1094,18 @@ class EnhancedSokoban:
         if hasattr(self.menu_system, '_update_fonts'):
             self.menu_system._update_fonts()
 
+    def _update_editor_screen_size(self):
+        """Give the editor the current screen and its size."""
+        self._editor.screen = self.screen
+        self._editor.screen_width = self.screen_width
+        self._editor.screen_height = self.screen_height
+
+    def _update_game_screen_size(self):
+        """Give the game renderer the current screen and its size."""
+        if hasattr(self._game, 'renderer'):
+            self._game.renderer.window_size = (self.screen_width, self.screen_height)
+            self._game.renderer.screen = self.screen
+
     def _setup_menu_actions(self):
         """Set up the actions for menu buttons."""
         # With the new layout: Play, Editor, AI Features, Settings, Skins, Credits, Exit (7 buttons)
@@ -992,9 +1159,22 @@ class EnhancedSokoban:
         self.menu_system.running = False
 
 
-def main():
-    """Main function to run the enhanced Sokoban game."""
-    game = EnhancedSokoban()
+def main(argv=None):
+    """
+    Main function to run the enhanced Sokoban game.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description='PySokoban - Enhanced Sokoban game.')
+    parser.add_argument('--levels', '-l', default='src/levels',
+                        help='Directory containing level files (default: src/levels)')
+    parser.add_argument('--startup-profile', action='store_true',
+                        help='Print the startup milestones and the time to the first frame')
+    args = parser.parse_args(argv)
+
+    profile = StartupProfile() if args.startup_profile else None
+    game = EnhancedSokoban(args.levels, startup_profile=profile)
     game.start()
 
 
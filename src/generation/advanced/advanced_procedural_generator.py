@@ -85,8 +85,9 @@ class AdvancedProceduralGenerator:
         # Generate level with integrated parameters
         level = self._generate_with_parameters(generation_params)
         
-        # Calculate metrics for feedback
-        metrics = self.metrics.calculate_metrics(level)
+        # Calculate metrics for feedback, reusing the solution found above
+        metrics = self.metrics.calculate_metrics(level, self.generation_stats.get('solution'),
+                                                 self.solver)
         
         # Record generation for learning
         self.ml_system.record_generation(level, metrics, generation_params)
@@ -6,10 +6,119 @@ such as size, difficulty, and solution complexity.
 """
 
 import math
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from src.core.constants import WALL, FLOOR
 from src.core.level import Level
 from src.generation.level_solver import SokobanSolver
 
 
+class StructuralAnalysis:
+    """
+    Structural counts of a level computed from a NumPy wall grid.
+
+    Every count used by LevelMetrics (playable area, walls, corners,
+    corridors, open spaces and dead ends) is computed in a single
+    vectorized pass. When one cell changes, only the cell and its four
+    neighbours are re-classified and the totals are adjusted.
+    """
+
+    PATTERNS = ('corners', 'corridors', 'open_spaces', 'dead_ends')
+
+    def __init__(self, level):
+        """
+        Analyze a level.
+
+        Args:
+            level (Level): The level to analyze.
+        """
+        self.width = level.width
+        self.height = level.height
+        self.cells = np.array([list(row) for row in level.map_data],
+                              dtype='<U1').reshape(self.height, self.width)
+
+        # Out-of-bounds cells count as walls, like Level.is_wall does.
+        self.walls = np.ones((self.height + 2, self.width + 2), dtype=bool)
+        self.walls[1:-1, 1:-1] = self.cells == WALL
+
+        # Pattern counts only consider cells away from the border.
+        self.interior = np.zeros((self.height, self.width), dtype=bool)
+        self.interior[1:-1, 1:-1] = True
+
+        self.totals = self._region_counts(0, self.height, 0, self.width)
+
+    def _region_counts(self, y0, y1, x0, x1):
+        """
+        Count walls, floors and patterns inside a rectangular region.
+
+        Args:
+            y0 (int): First row (inclusive).
+            y1 (int): Last row (exclusive).
+            x0 (int): First column (inclusive).
+            x1 (int): Last column (exclusive).
+
+        Returns:
+            dict: Counts for the region.
+        """
+        walls = self.walls
+        centre = walls[y0 + 1:y1 + 1, x0 + 1:x1 + 1]
+        north = walls[y0:y1, x0 + 1:x1 + 1]
+        south = walls[y0 + 2:y1 + 2, x0 + 1:x1 + 1]
+        west = walls[y0 + 1:y1 + 1, x0:x1]
+        east = walls[y0 + 1:y1 + 1, x0 + 2:x1 + 2]
+
+        adjacent_walls = (north.astype(np.int8) + south + west + east)
+        open_cells = ~centre & self.interior[y0:y1, x0:x1]
+        corridor = (west & east & ~north & ~south) | (north & south & ~west & ~east)
+
+        return {
+            'walls': int(centre.sum()),
+            'floors': int((self.cells[y0:y1, x0:x1] == FLOOR).sum()),
+            'playable_area': int((~centre).sum()),
+            'corners': int((open_cells & (adjacent_walls >= 2)).sum()),
+            'corridors': int((open_cells & corridor).sum()),
+            'open_spaces': int((open_cells & (adjacent_walls <= 1)).sum()),
+            'dead_ends': int((open_cells & (adjacent_walls == 3)).sum()),
+        }
+
+    def update_cell(self, x, y, char):
+        """
+        Apply a single-cell change and adjust the totals incrementally.
+
+        Args:
+            x (int): X coordinate of the changed cell.
+            y (int): Y coordinate of the changed cell.
+            char (str): New map character of the cell.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+
+        # The cell and its four neighbours are the only cells whose
+        # classification depends on (x, y).
+        y0, y1 = max(0, y - 1), min(self.height, y + 2)
+        x0, x1 = max(0, x - 1), min(self.width, x + 2)
+
+        before = self._region_counts(y0, y1, x0, x1)
+        self.cells[y, x] = char
+        self.walls[y + 1, x + 1] = char == WALL
+        after = self._region_counts(y0, y1, x0, x1)
+
+        for key in self.totals:
+            self.totals[key] += after[key] - before[key]
+
+    def as_dict(self):
+        """
+        Get the structural counts.
+
+        Returns:
+            dict: Copy of the current totals.
+        """
+        return dict(self.totals)
+
+
 class LevelMetrics:
     """
     Class for calculating metrics for Sokoban levels.
@@ -18,13 +127,143 @@ class LevelMetrics:
     of Sokoban levels based on various metrics.
     """
     
+    # Number of layouts kept in each cache.
+    CACHE_SIZE = 256
+
     def __init__(self):
         """
         Initialize the metrics calculator.
         """
         self.solver = SokobanSolver()
+
+        # Structural analyses keyed by layout, solutions keyed by full state.
+        self._structure_cache = OrderedDict()
+        self._solution_cache = OrderedDict()
+        # Last analysis computed for each live level, used by update_cell.
+        self._level_structures = weakref.WeakKeyDictionary()
+
+        self.solver_calls = 0
+        self._difficulty_estimator = None
+
+    @property
+    def difficulty_estimator(self):
+        """The shared search-effort difficulty estimator, imported on first use."""
+        if self._difficulty_estimator is None:
+            from src.ai.difficulty_estimator import get_difficulty_estimator
+            self._difficulty_estimator = get_difficulty_estimator()
+        return self._difficulty_estimator
+
+    def _remember(self, cache, key, value):
+        """Store a value in one of the bounded caches."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def get_structure(self, level):
+        """
+        Get the structural analysis of a level, computing it if needed.
+
+        Args:
+            level (Level): The level to analyze.
+
+        Returns:
+            StructuralAnalysis: The cached analysis for the level layout.
+        """
+        key = level.layout_key()
+        structure = self._structure_cache.get(key)
+        if structure is None:
+            structure = StructuralAnalysis(level)
+            self._remember(self._structure_cache, key, structure)
+        else:
+            self._structure_cache.move_to_end(key)
+        self._level_structures[level] = (key, structure)
+        return structure
+
+    def update_cell(self, level, x, y):
+        """
+        Update the cached analysis after a single cell of a level changed.
+
+        Intended for the editor: only the neighbourhood of the cell is
+        re-analyzed instead of the whole grid.
+
+        Args:
+            level (Level): The level that was modified.
+            x (int): X coordinate of the changed cell.
+            y (int): Y coordinate of the changed cell.
+        """
+        entry = self._level_structures.get(level)
+        if entry is None:
+            return
+        old_key, structure = entry
+        if (structure.width, structure.height) != (level.width, level.height):
+            del self._level_structures[level]
+            return
+
+        # Another level with the same layout may share this analysis: update
+        # a private copy then. Otherwise the old layout entry is now stale.
+        shared = any(other is not level and entry[1] is structure
+                     for other, entry in self._level_structures.items())
+        if shared:
+            structure = self._copy_structure(structure)
+        elif self._structure_cache.get(old_key) is structure:
+            del self._structure_cache[old_key]
+        structure.update_cell(x, y, level.get_cell(x, y))
+
+        key = level.layout_key()
+        self._remember(self._structure_cache, key, structure)
+        self._level_structures[level] = (key, structure)
+
+    def _copy_structure(self, structure):
+        """Copy a structural analysis without recomputing it."""
+        clone = StructuralAnalysis.__new__(StructuralAnalysis)
+        clone.width = structure.width
+        clone.height = structure.height
+        clone.cells = structure.cells.copy()
+        clone.walls = structure.walls.copy()
+        clone.interior = structure.interior
+        clone.totals = dict(structure.totals)
+        return clone
+
+    def cache_solution(self, level, solution, solver=None):
+        """
+        Remember a solution for the current starting position of a level.
+
+        Args:
+            level (Level): The solved level.
+            solution (list): The moves of the solution.
+            solver (SokobanSolver, optional): The solver that just found the
+                solution. Its effort gives the difficulty score, so the
+                level is not searched again by the difficulty estimator.
+        """
+        self._remember(self._solution_cache, level.state_key(), list(solution))
+        if solver is not None and solution:
+            self.difficulty_estimator.record_search(level, solver.states_explored,
+                                                    solver.solve_time, len(solution))
+
+    def get_solution(self, level):
+        """
+        Get a solution for a level, solving it only if none is cached.
+
+        Args:
+            level (Level): The level to solve.
+
+        Returns:
+            list: The solution moves, or an empty list if unsolvable.
+        """
+        key = level.state_key()
+        solution = self._solution_cache.get(key)
+        if solution is None:
+            self.solver_calls += 1
+            if self.solver.is_solvable(level):
+                solution = self.solver.get_solution()
+                self.cache_solution(level, solution, self.solver)
+            else:
+                solution = []
+                self._remember(self._solution_cache, key, solution)
+        return solution
     
-    def calculate_metrics(self, level, solution=None):
+    def calculate_metrics(self, level, solution=None, solver=None):
         """
         Calculate various metrics for a level.
         
@@ -32,16 +271,18 @@ class LevelMetrics:
             level (Level): The level to calculate metrics for.
             solution (list, optional): A pre-computed solution. If None, the solver
                                       will be used to find a solution.
+            solver (SokobanSolver, optional): The solver that found the
+                                      pre-computed solution, whose effort is
+                                      reused for the difficulty score.
                                       
         Returns:
             dict: A dictionary of metrics.
         """
-        # If no solution is provided, try to solve the level
+        # If no solution is provided, reuse a cached one or solve the level
         if solution is None:
-            if self.solver.is_solvable(level):
-                solution = self.solver.get_solution()
-            else:
-                solution = []
+            solution = self.get_solution(level)
+        else:
+            self.cache_solution(level, solution, solver)
         
         # Calculate metrics
         metrics = {
@@ -83,12 +324,7 @@ class LevelMetrics:
         Returns:
             int: The number of non-wall tiles.
         """
-        playable_tiles = 0
-        for y in range(level.height):
-            for x in range(level.width):
-                if not level.is_wall(x, y):
-                    playable_tiles += 1
-        return playable_tiles
+        return self.get_structure(level).totals['playable_area']
     
     def _estimate_difficulty(self, level, solution):
         """
@@ -109,18 +345,14 @@ class LevelMetrics:
             'spatial_complexity': self._estimate_spatial_complexity(level)
         }
         
-        # Calculate overall difficulty score (0-100)
-        # This is a simple weighted sum of the individual metrics
-        # In a real implementation, this would be more sophisticated
-        overall_score = (
-            difficulty['solution_length'] * 0.4 +
-            difficulty['box_count'] * 15 +
-            difficulty['push_complexity'] * 20 +
-            difficulty['spatial_complexity'] * 25
-        )
-        
-        # Cap at 100
-        difficulty['overall_score'] = min(100, overall_score)
+        # The overall score (0-100) comes from the measured effort of a
+        # bounded push search rather than from weights on the metrics above.
+        # A level solved by this class or by a generator reuses that effort.
+        report = self.difficulty_estimator.estimate(level)
+        difficulty['search_effort'] = report.to_dict()
+        difficulty['predicted_solve_time'] = report.predicted_solve_time
+        difficulty['category'] = report.category
+        difficulty['overall_score'] = report.score
         
         return difficulty
     
@@ -160,11 +392,7 @@ class LevelMetrics:
             float: A score representing spatial complexity.
         """
         # Calculate the ratio of walls to total area
-        wall_count = 0
-        for y in range(level.height):
-            for x in range(level.width):
-                if level.is_wall(x, y):
-                    wall_count += 1
+        wall_count = self.get_structure(level).totals['walls']
         
         total_area = level.width * level.height
         wall_ratio = wall_count / total_area if total_area > 0 else 0
@@ -228,60 +456,29 @@ class LevelMetrics:
         """
         Count the number of corner configurations in the level.
         
+        A corner is an interior floor tile with at least two adjacent walls.
+        
         Args:
             level (Level): The level to analyze.
             
         Returns:
             int: The number of corners.
         """
-        corners = 0
-        for y in range(1, level.height - 1):
-            for x in range(1, level.width - 1):
-                # Skip walls
-                if level.is_wall(x, y):
-                    continue
-                
-                # Check for corner configurations (two adjacent walls)
-                adjacent_walls = 0
-                if level.is_wall(x - 1, y):
-                    adjacent_walls += 1
-                if level.is_wall(x + 1, y):
-                    adjacent_walls += 1
-                if level.is_wall(x, y - 1):
-                    adjacent_walls += 1
-                if level.is_wall(x, y + 1):
-                    adjacent_walls += 1
-                
-                if adjacent_walls >= 2:
-                    corners += 1
-        
-        return corners
+        return self.get_structure(level).totals['corners']
     
     def _count_corridors(self, level):
         """
         Count the number of corridor tiles in the level.
         
+        A corridor tile has exactly two opposite walls.
+        
         Args:
             level (Level): The level to analyze.
             
         Returns:
             int: The number of corridor tiles.
         """
-        corridors = 0
-        for y in range(1, level.height - 1):
-            for x in range(1, level.width - 1):
-                # Skip walls
-                if level.is_wall(x, y):
-                    continue
-                
-                # Check for corridor configurations (exactly two opposite walls)
-                if ((level.is_wall(x - 1, y) and level.is_wall(x + 1, y) and
-                     not level.is_wall(x, y - 1) and not level.is_wall(x, y + 1)) or
-                    (not level.is_wall(x - 1, y) and not level.is_wall(x + 1, y) and
-                     level.is_wall(x, y - 1) and level.is_wall(x, y + 1))):
-                    corridors += 1
-        
-        return corridors
+        return self.get_structure(level).totals['corridors']
     
     def _count_rooms(self, level):
         """
@@ -293,61 +490,23 @@ class LevelMetrics:
         Returns:
             int: The estimated number of rooms.
         """
-        # This is a very simple heuristic
-        # In a real implementation, this would use flood fill to identify separate rooms
-        open_spaces = 0
-        for y in range(1, level.height - 1):
-            for x in range(1, level.width - 1):
-                if not level.is_wall(x, y):
-                    # Count tiles with at least 3 adjacent non-wall tiles
-                    adjacent_open = 0
-                    if not level.is_wall(x - 1, y):
-                        adjacent_open += 1
-                    if not level.is_wall(x + 1, y):
-                        adjacent_open += 1
-                    if not level.is_wall(x, y - 1):
-                        adjacent_open += 1
-                    if not level.is_wall(x, y + 1):
-                        adjacent_open += 1
-                    
-                    if adjacent_open >= 3:
-                        open_spaces += 1
-        
+        # Tiles with at least 3 adjacent non-wall tiles are open spaces.
         # Rough estimate: one room per 9 open spaces
-        return max(1, open_spaces // 9)
+        return max(1, self.get_structure(level).totals['open_spaces'] // 9)
     
     def _count_dead_ends(self, level):
         """
         Count the number of dead ends in the level.
         
+        A dead end is an interior floor tile with exactly three adjacent walls.
+        
         Args:
             level (Level): The level to analyze.
             
         Returns:
             int: The number of dead ends.
         """
-        dead_ends = 0
-        for y in range(1, level.height - 1):
-            for x in range(1, level.width - 1):
-                # Skip walls
-                if level.is_wall(x, y):
-                    continue
-                
-                # Check for dead end configurations (exactly three adjacent walls)
-                adjacent_walls = 0
-                if level.is_wall(x - 1, y):
-                    adjacent_walls += 1
-                if level.is_wall(x + 1, y):
-                    adjacent_walls += 1
-                if level.is_wall(x, y - 1):
-                    adjacent_walls += 1
-                if level.is_wall(x, y + 1):
-                    adjacent_walls += 1
-                
-                if adjacent_walls == 3:
-                    dead_ends += 1
-        
-        return dead_ends
+        return self.get_structure(level).totals['dead_ends']
 
 
 def test_metrics():
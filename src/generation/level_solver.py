@@ -36,6 +36,7 @@ class SokobanSolver:
         self.visited_states = set()
         self.solution = None
         self.states_explored = 0
+        self.solve_time = 0.0
     
     def is_solvable(self, level):
         """
@@ -47,7 +48,9 @@ class SokobanSolver:
         Returns:
             bool: True if the level is solvable, False otherwise.
         """
+        start_time = time.time()
         self.solution = self._solve(level)
+        self.solve_time = time.time() - start_time
         return self.solution is not None
     
     def get_solution(self):
@@ -114,7 +114,7 @@ class ProceduralGenerator:
 
                     # Calculate metrics for the level
                     solution = self.solver.get_solution()
-                    self.level_metrics = self.metrics.calculate_metrics(level, solution)
+                    self.level_metrics = self.metrics.calculate_metrics(level, solution, self.solver)
 
                     # Report final progress
                     if progress_callback:
@@ -19,12 +19,23 @@ from src.core.auto_solver import AutoSolver
 from src.core.config_manager import get_config_manager
 from src.ai.visual_ai_solver import VisualAISolver
 from src.ai.algorithm_selector import Algorithm
-from src.core.deadlock_detector import DeadlockDetector
+from src.core.deadlock_monitor import DeadlockMonitor
 from src.ui.mouse_navigation import MouseNavigationSystem
 from src.core.snapshot_manager import SnapshotManager
+from src.core.snapshot_store import SnapshotStore
 from src.core.game_history import GameHistoryManager
 from src.ui.solution_replay import SolutionReplayController
-from src.ai.solution_optimizer import SolutionOptimizer
+from src.ai.solution_optimizer import BackgroundOptimizer, SolutionOptimizer
+
+# Event posted by the deadlock monitor when a background analysis completes
+DEADLOCK_EVENT = pygame.USEREVENT + 1
+# Event posted when the background optimization of an AI solution completes
+SOLUTION_OPTIMIZED_EVENT = pygame.USEREVENT + 2
+# Events whose handlers never draw over the game view, or invalidate it
+# themselves when they show a popup, a menu or another screen
+PASSIVE_EVENTS = frozenset((pygame.MOUSEMOTION, pygame.KEYDOWN, pygame.KEYUP,
+                            pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                            DEADLOCK_EVENT, SOLUTION_OPTIMIZED_EVENT))
 
 
 class GUIGame(Game):
@@ -62,8 +73,8 @@ class GUIGame(Game):
         renderer = GUIRenderer(window_title=TITLE)
         super().__init__(level_manager, renderer, keyboard_layout)
 
-        # Initialize deadlock detector
-        self.deadlock_detector = None
+        # Initialize deadlock monitor (created on the first push of a level)
+        self.deadlock_monitor = None
         self.deadlock_notification_shown = False
 
         # Load deadlock display setting from config
@@ -100,8 +111,8 @@ class GUIGame(Game):
         # Advanced mouse navigation system
         self.mouse_navigation = MouseNavigationSystem()
 
-        # Snapshot manager for save/load game states
-        self.snapshot_manager = SnapshotManager()
+        # Snapshot manager for save/load game states, persisted across sessions
+        self.snapshot_manager = SnapshotManager(store=SnapshotStore())
 
         # Game history manager for choice point navigation
         self.history_manager = GameHistoryManager()
@@ -109,8 +120,9 @@ class GUIGame(Game):
         # Solution replay controller (active during replay)
         self.replay_controller = None
 
-        # Solution optimizer
+        # Solution optimizer, and its background push optimization of AI solutions
         self.solution_optimizer = SolutionOptimizer()
+        self.background_optimizer = BackgroundOptimizer(self.solution_optimizer)
 
         # Load custom keybindings from config
         self.custom_keybindings = self.config_manager.get_keybindings()
@@ -119,6 +131,11 @@ class GUIGame(Game):
         self.custom_movement_keys = {}
         self._update_movement_keys()
 
+        # Event-driven redraws: the game view is only drawn when it changed
+        self.redraw_needed = True
+        self._overlay_rects = []
+        self._presented_screen = None
+
     def start(self):
         """
         Start the game.
@@ -126,8 +143,8 @@ class GUIGame(Game):
         self.running = True
         self.renderer.render_welcome_screen(self.custom_keybindings)
 
-        # Reset sprite history at the start of the game
-        self.skin_manager.reset_sprite_history()
+        # Reset per-level state at the start of the game (also loads saved snapshots)
+        self._reset_level_state()
 
         # Wait for a key press to start
         waiting_for_start = True
@@ -153,6 +170,8 @@ class GUIGame(Game):
         self.show_deadlocks = self.config_manager.get('game', 'show_deadlocks', True)
         self._update_movement_keys()
 
+        self.redraw_needed = True
+
         while self.running:
             current_time = pygame.time.get_ticks()
 
@@ -181,6 +200,12 @@ class GUIGame(Game):
                         self.last_move_time = current_time
                 elif event.type == pygame.KEYUP:
                     self.keys_pressed.discard(event.key)
+                elif event.type == SOLUTION_OPTIMIZED_EVENT:
+                    self._on_solution_optimized(event.moves, event.stats)
+                elif event.type == DEADLOCK_EVENT:
+                    if (self.deadlock_monitor and self.deadlock_monitor.accept(event.result)
+                            and event.result['deadlock']):
+                        self._on_deadlock_detected()
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     self._handle_mouse_click(event)
                 elif event.type == pygame.MOUSEWHEEL:
@@ -194,36 +219,92 @@ class GUIGame(Game):
                     config_manager = get_config_manager()
                     config_manager.set_display_config(event.w, event.h)
 
+            if events:
+                self.redraw_needed = True
+                # Other events (zoom, resize) change the whole game view
+                if any(event.type not in PASSIVE_EVENTS for event in events):
+                    self.renderer.invalidate()
+
             # Handle continuous movement
             if self.keys_pressed and current_time - self.last_move_time > self.move_delay:
                 self._handle_continuous_movement()
                 self.last_move_time = current_time
+                self.redraw_needed = True
 
             # Update mouse navigation system
-            self._update_mouse_navigation(current_time)
-
-            # Render the current state
-            if self.show_help:
-                self.renderer.render_help(self.custom_keybindings)
-            else:
-                # Get current mouse position for interactive highlighting
-                mouse_pos = pygame.mouse.get_pos()
-                self.renderer.render_level(self.level_manager.current_level, self.level_manager,
-                                         self.show_grid, self.zoom_level, self.scroll_x, self.scroll_y, self.skin_manager,
-                                         show_completion_message=True, mouse_pos=mouse_pos)
+            if self._update_mouse_navigation(current_time):
+                self.redraw_needed = True
+
+            # Advance a running AI solution animation (moves due this frame)
+            if self.visual_ai_solver.update(current_time):
+                self.redraw_needed = True
+
+            # Resizes and fullscreen toggles are handled by the event dispatcher
+            screen = self.renderer.screen
+            if (screen, screen.get_size()) != self._presented_screen:
+                self._presented_screen = (screen, screen.get_size())
+                self.renderer.invalidate()
+                self.redraw_needed = True
+
+            # Render the current state, only when it changed
+            if (self.redraw_needed or self.mouse_navigation.is_animating
+                    or self.visual_ai_solver.is_animating):
+                self.redraw_needed = False
+                if self.show_help:
+                    self.renderer.render_help(self.custom_keybindings)
+                else:
+                    self._render_frame()
 
-                # Render mouse navigation overlay
-                self._render_mouse_navigation()
+            # Cap the frame rate
+            clock.tick(60)
 
-                # Render reverse mode indicator
-                if self.level_manager.current_level and self.level_manager.current_level.reverse_mode:
-                    self._render_reverse_mode_indicator()
+    def _render_frame(self):
+        """
+        Compose the level and its overlays, then present the frame once.
 
-                # Update the display to show all rendered content
-                pygame.display.flip()
+        The level only updates its dirty rects. The areas of the overlays
+        drawn this frame and the previous one are updated with them; the AI
+        animation overlay presents the whole screen, this frame and the next.
+        """
+        # Get current mouse position for interactive highlighting
+        mouse_pos = pygame.mouse.get_pos()
+        self.renderer.render_level(self.level_manager.current_level, self.level_manager,
+                                 self.show_grid, self.zoom_level, self.scroll_x, self.scroll_y, self.skin_manager,
+                                 show_completion_message=True, mouse_pos=mouse_pos, present=False)
+
+        # Render mouse navigation overlay
+        overlay_rects = self._render_mouse_navigation()
+
+        # Render reverse mode indicator
+        if self.level_manager.current_level and self.level_manager.current_level.reverse_mode:
+            overlay_rects.append(self._render_reverse_mode_indicator())
+
+        # Render the AI animation overlay
+        ai_overlay = self.visual_ai_solver.is_animating
+        if ai_overlay:
+            self.visual_ai_solver.render_overlay()
+
+        # Present the level and overlays in a single display update, erasing
+        # the overlays of the previous frame
+        self.renderer.present(full=ai_overlay, extra_rects=overlay_rects + self._overlay_rects)
+        self._overlay_rects = overlay_rects
+        if ai_overlay:
+            self.renderer.invalidate()
+
+    def _present_level(self):
+        """
+        Present the level without overlays before another screen takes over.
 
-            # Cap the frame rate
-            clock.tick(60)
+        The screen shown next covers the game view, so the renderer is
+        invalidated and the whole frame is presented when the game resumes.
+        """
+        mouse_pos = pygame.mouse.get_pos()
+        self.renderer.render_level(self.level_manager.current_level, self.level_manager,
+                                 self.show_grid, self.zoom_level, self.scroll_x, self.scroll_y, self.skin_manager,
+                                 show_completion_message=False, mouse_pos=mouse_pos, present=False)
+        self.renderer.present(full=True)
+        self.renderer.invalidate()
+        self.redraw_needed = True
 
     def _handle_key_event(self, event):
         """
@@ -344,6 +425,7 @@ class GUIGame(Game):
                             self.level_manager.current_level):
                         self.skin_manager.reset_sprite_history()
                         self.mouse_navigation.clear_navigation()
+                        self.history_manager.clear()
                         self._show_in_game_popup("Snapshot", "Loaded latest snapshot", timeout=1500)
                 elif action == 'reverse_mode':
                     is_reverse = self.level_manager.current_level.toggle_reverse_mode()
@@ -355,6 +437,8 @@ class GUIGame(Game):
                     self.show_help = True
                 elif action == 'grid':
                     self.show_grid = not self.show_grid
+                elif action == 'frame_time':
+                    self.renderer.show_frame_time = not self.renderer.show_frame_time
                 elif action == 'solve':
                     self._solve_current_level()
 
@@ -450,34 +534,19 @@ class GUIGame(Game):
             # Get the player sprite with advance_animation=True to move to the next frame
             player_sprite = self.skin_manager.get_player_sprite(advance_animation=True)
 
-            # Check for deadlocks after the move
-            if self.deadlock_detector is None:
-                self.deadlock_detector = DeadlockDetector(self.level_manager.current_level)
-
-            if self.deadlock_detector.is_deadlock() and not self.deadlock_notification_shown:
-                # Only show deadlock notification if the setting is enabled
-                if self.show_deadlocks:
-                    # Render the current level state
-                    mouse_pos = pygame.mouse.get_pos()
-                    self.renderer.render_level(self.level_manager.current_level, self.level_manager,
-                                             self.show_grid, self.zoom_level, self.scroll_x, self.scroll_y, self.skin_manager,
-                                             show_completion_message=False, mouse_pos=mouse_pos)
-                    pygame.display.flip()
-
-                    # Show deadlock notification
-                    self._show_deadlock_notification()
-
-                # Set the flag to indicate that the notification has been shown
-                self.deadlock_notification_shown = True
+            # Only pushes can create a deadlock: check the pushed box now and
+            # let the monitor analyze the whole position in the background
+            if is_pushing:
+                if self.deadlock_monitor is None:
+                    self.deadlock_monitor = DeadlockMonitor(self.level_manager.current_level,
+                                                            on_result=self._post_deadlock_result)
+                if self.deadlock_monitor.notify_push((new_x + dx, new_y + dy)):
+                    self._on_deadlock_detected()
 
         # Check if level is completed after the move
         if moved and self.level_manager.current_level_completed():
             # Render the completed level without showing completion message
-            mouse_pos = pygame.mouse.get_pos()
-            self.renderer.render_level(self.level_manager.current_level, self.level_manager,
-                                     self.show_grid, self.zoom_level, self.scroll_x, self.scroll_y, self.skin_manager,
-                                     show_completion_message=False, mouse_pos=mouse_pos)
-            pygame.display.flip()
+            self._present_level()
 
             # Wait for a moment
             pygame.time.wait(1000)
@@ -496,11 +565,16 @@ class GUIGame(Game):
     def _reset_level_state(self):
         """Reset all per-level state trackers."""
         self.skin_manager.reset_sprite_history()
-        self.deadlock_detector = None
+        if self.deadlock_monitor:
+            self.deadlock_monitor.stop()
+        self.deadlock_monitor = None
+        self.background_optimizer.cancel()
         self.deadlock_notification_shown = False
         self.mouse_navigation.clear_navigation()
         self.history_manager.clear()
         self.snapshot_manager.clear()
+        if self.level_manager.current_level:
+            self.snapshot_manager.load_stored(self.level_manager.current_level)
 
     def _next_level(self):
         """
@@ -596,6 +670,38 @@ class GUIGame(Game):
             # Small delay to prevent CPU hogging
             pygame.time.wait(10)
 
+        # The popup covered the game view
+        self.renderer.invalidate()
+
+    def _post_deadlock_result(self, result):
+        """
+        Hand a background deadlock analysis result to the game loop.
+
+        Called from the deadlock monitor worker thread.
+
+        Args:
+            result (dict): Result of the analysis.
+        """
+        pygame.event.post(pygame.event.Event(DEADLOCK_EVENT, result=result))
+
+    def _on_deadlock_detected(self):
+        """
+        Notify the player of a deadlock, once per level.
+        """
+        if self.deadlock_notification_shown:
+            return
+
+        # Only show deadlock notification if the setting is enabled
+        if self.show_deadlocks:
+            # Render the current level state
+            self._present_level()
+
+            # Show deadlock notification
+            self._show_deadlock_notification()
+
+        # Set the flag to indicate that the notification has been shown
+        self.deadlock_notification_shown = True
+
     def _show_deadlock_notification(self):
         """
         Show a notification when a deadlock is detected.
@@ -706,6 +812,7 @@ class GUIGame(Game):
         # Show algorithm selection menu
         selected_algorithm = self._show_algorithm_selection_menu()
         if selected_algorithm is None:
+            self.renderer.invalidate()  # The menu covered the game view
             return  # User cancelled
 
         # Show initial solving message
@@ -752,6 +859,9 @@ class GUIGame(Game):
                     if event.type == pygame.KEYDOWN or event.type == pygame.QUIT:
                         waiting = False
 
+        # The solving overlays and result popups covered the game view
+        self.renderer.invalidate()
+
     def _show_algorithm_selection_menu(self) -> Optional[Algorithm]:
         """
         Show algorithm selection menu and return selected algorithm using game's UI standards.
@@ -1252,8 +1362,13 @@ class GUIGame(Game):
         if not moves:
             return
 
-        # Store last solution for optimizer
+        # Store last solution for optimizer, and reduce its pushes in the
+        # background while the replay runs
         self._last_solution_moves = list(moves)
+        self.background_optimizer.submit(
+            self.level_manager.current_level, moves,
+            lambda optimized, stats: pygame.event.post(pygame.event.Event(
+                SOLUTION_OPTIMIZED_EVENT, moves=optimized, stats=stats)))
 
         # Create replay controller and enter replay mode
         self.replay_controller = SolutionReplayController(
@@ -1288,6 +1403,9 @@ class GUIGame(Game):
             rc.apply_state(self.level_manager.current_level)
             self.replay_controller = None
             self.skin_manager.reset_sprite_history()
+            # The VCR controls are still on the display
+            self.renderer.invalidate()
+            self.redraw_needed = True
             return
 
         # Apply current state to the level for rendering
@@ -1304,12 +1422,13 @@ class GUIGame(Game):
             self.scroll_y,
             self.skin_manager,
             show_completion_message=False,
-            mouse_pos=mouse_pos
+            mouse_pos=mouse_pos,
+            present=False
         )
 
-        # Render VCR controls overlay
+        # Render VCR controls overlay, presented with the level
         rc.render_controls(self.renderer.screen)
-        pygame.display.flip()
+        self.renderer.present(full=True)
 
     def _execute_ai_move(self, move: str) -> bool:
         """Execute a move from the AI solution."""
@@ -1334,19 +1453,23 @@ class GUIGame(Game):
                 break
 
         # Render final state
-        mouse_pos = pygame.mouse.get_pos()
-        self.renderer.render_level(
-            self.level_manager.current_level,
-            self.level_manager,
-            self.show_grid,
-            self.zoom_level,
-            self.scroll_x,
-            self.scroll_y,
-            self.skin_manager,
-            show_completion_message=False,
-            mouse_pos=mouse_pos
-        )
-        pygame.display.flip()
+        self._present_level()
+
+    def _on_solution_optimized(self, moves, stats):
+        """
+        Keep the background-optimized AI solution for the optimizer key.
+
+        Args:
+            moves (list): Optimized moves.
+            stats (dict): Before/after statistics of the optimization.
+        """
+        if not stats['verified']:
+            return
+        print(f"Solution optimized: pushes {stats['original_pushes']} -> {stats['optimized_pushes']}, "
+              f"moves {stats['original_moves']} -> {stats['optimized_moves']} "
+              f"({stats['elapsed']:.2f}s)")
+        if stats['optimized_moves'] < len(self._last_solution_moves):
+            self._last_solution_moves = list(moves)
 
     def _optimize_last_solution(self):
         """Optimize the last AI solution and show results."""
@@ -1368,14 +1491,20 @@ class GUIGame(Game):
         self._show_in_game_popup("Optimized!", msg, timeout=3000)
 
     def _render_reverse_mode_indicator(self):
-        """Render a visual indicator when reverse (pull) mode is active."""
+        """
+        Render a visual indicator when reverse (pull) mode is active.
+
+        Returns:
+            pygame.Rect: Screen area of the indicator.
+        """
         screen = self.renderer.screen
         font = pygame.font.Font(None, 24)
         text = font.render("REVERSE MODE (Pull)", True, (255, 100, 100))
         bg = pygame.Surface((text.get_width() + 16, text.get_height() + 8), pygame.SRCALPHA)
         bg.fill((0, 0, 0, 160))
-        screen.blit(bg, (screen.get_width() - bg.get_width() - 10, 10))
+        bg_rect = screen.blit(bg, (screen.get_width() - bg.get_width() - 10, 10))
         screen.blit(text, (screen.get_width() - text.get_width() - 18, 14))
+        return bg_rect
 
     def _handle_mouse_click(self, event):
         """Handle mouse click events for navigation and box pushing."""
@@ -1395,9 +1524,12 @@ class GUIGame(Game):
 
         Args:
             current_time: Current time in milliseconds.
+
+        Returns:
+            bool: True if a movement was executed this frame.
         """
         if not self.level_manager.current_level or self.show_help:
-            return
+            return False
 
         # Update mouse navigation with current level
         self.mouse_navigation.set_level(self.level_manager.current_level)
@@ -1448,24 +1580,27 @@ class GUIGame(Game):
                 self.mouse_navigation.clear_navigation()
 
                 # Show level completion screen
-                mouse_pos = pygame.mouse.get_pos()
-                self.renderer.render_level(self.level_manager.current_level, self.level_manager,
-                                         self.show_grid, self.zoom_level, self.scroll_x, self.scroll_y, self.skin_manager,
-                                         show_completion_message=False, mouse_pos=mouse_pos)
-                pygame.display.flip()
+                self._present_level()
                 pygame.time.wait(1000)
                 self._show_level_completion_screen()
+            return True
+        return False
 
     def _render_mouse_navigation(self):
-        """Render the mouse navigation overlay."""
+        """
+        Render the mouse navigation overlay.
+
+        Returns:
+            list[pygame.Rect]: Screen areas of the guideline and highlights drawn.
+        """
         if not self.level_manager.current_level or self.show_help:
-            return
+            return []
 
         # Calculate map area parameters
         map_area_x, map_area_y, cell_size = self._get_map_area_params()
 
         # Render navigation guideline and highlights
-        self.mouse_navigation.render_navigation(
+        return self.mouse_navigation.render_navigation(
             self.renderer.screen, map_area_x, map_area_y, cell_size
         )
 
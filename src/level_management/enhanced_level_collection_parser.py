@@ -5,8 +5,11 @@ This module handles parsing level collection files in various formats,
 automatically detecting the structure and extracting levels with their metadata.
 """
 
+import io
+import os
 import re
-from typing import List, Dict, Optional, Tuple, Any
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from src.core.level import Level
 
 
@@ -81,99 +84,253 @@ class EnhancedLevelCollectionParser:
     METADATA_PATTERNS = [
         r'^(Title|Author|Date|Comment|Description|Collection|Email|Blog|Copyright):\s*(.+)$',
     ]
+    _METADATA_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in METADATA_PATTERNS]
     
     @staticmethod
     def parse_file(filepath: str) -> EnhancedLevelCollection:
         """Parse a level collection file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
-            return EnhancedLevelCollectionParser.parse_string(content)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Level collection file not found: {filepath}")
+        collection = EnhancedLevelCollection()
+        for metadata, level_lines, _, _ in EnhancedLevelCollectionParser.scan(filepath, collection):
+            level = EnhancedLevelCollectionParser._create_level_from_lines(level_lines)
+            if level:
+                collection.add_level(metadata, level)
+        return collection
     
     @staticmethod
     def parse_string(content: str) -> EnhancedLevelCollection:
         """Parse a level collection from string content."""
-        lines = content.split('\n')
         collection = EnhancedLevelCollection()
-        
-        # Step 1: Parse collection metadata and find where levels start
-        level_start_index = EnhancedLevelCollectionParser._parse_collection_metadata(lines, collection)
-        
-        # Step 2: Find all level blocks using wall structure analysis
-        level_blocks = EnhancedLevelCollectionParser._find_level_blocks(lines[level_start_index:])
-        
-        # Step 3: Parse each level block
-        for level_lines, start_line_idx in level_blocks:
-            # Look for metadata after this level
-            metadata = EnhancedLevelCollectionParser._find_metadata_for_level(
-                lines, level_start_index + start_line_idx, len(level_lines)
-            )
-            
-            # Create level object
+        lines = ((line, None, None) for line in content.split('\n'))
+        for metadata, level_lines, _, _ in EnhancedLevelCollectionParser._scan_lines(lines, collection):
             level = EnhancedLevelCollectionParser._create_level_from_lines(level_lines)
             if level:
                 collection.add_level(metadata, level)
-        
         return collection
     
     @staticmethod
-    def _parse_collection_metadata(lines: List[str], collection: EnhancedLevelCollection) -> int:
-        """Parse collection-level metadata and return the index where levels start."""
-        i = 0
+    def iter_levels(source, collection: Optional[EnhancedLevelCollection] = None
+                    ) -> Iterator[Tuple[LevelMetadata, str]]:
+        """
+        Stream the levels of a collection one at a time.
         
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines and comments (but not level lines that start with #)
-            if not line or line.startswith(';'):
-                i += 1
+        The file is read in a single pass and only the current level block and
+        a few lines of lookahead are kept in memory, so collections of any size
+        are parsed in constant memory.
+        
+        Args:
+            source: Path to the collection file, or an open file handle (binary or
+                text) or mmap positioned at the start of the collection
+            collection: If given, receives the collection title, description,
+                author and metadata (its level list is left untouched)
+        
+        Yields:
+            Tuple[LevelMetadata, str]: Metadata and text of each level
+        """
+        for metadata, level_lines, _, _ in EnhancedLevelCollectionParser.scan(source, collection):
+            yield metadata, '\n'.join(level_lines)
+    
+    @staticmethod
+    def iter_range(source, start: int, stop: Optional[int] = None,
+                   collection: Optional[EnhancedLevelCollection] = None
+                   ) -> Iterator[Tuple[LevelMetadata, str]]:
+        """
+        Stream the levels of a collection with index in [start, stop).
+        
+        Levels before start are only located, not extracted, and reading stops
+        as soon as the last requested level is found.
+        
+        Args:
+            source: Path, file handle or mmap (see iter_levels)
+            start: Index of the first level
+            stop: Index after the last level, or None for the end of the collection
+            collection: If given, receives the collection metadata
+        
+        Yields:
+            Tuple[LevelMetadata, str]: Metadata and text of each level
+        """
+        if stop is not None and stop <= start:
+            return
+        scan = EnhancedLevelCollectionParser.scan(source, collection, start=start)
+        for index, (metadata, level_lines, _, _) in enumerate(scan):
+            if index < start:
+                continue
+            yield metadata, '\n'.join(level_lines)
+            if stop is not None and index + 1 >= stop:
+                scan.close()
+                return
+    
+    @staticmethod
+    def count_levels(source, collection: Optional[EnhancedLevelCollection] = None) -> int:
+        """
+        Count the levels of a collection without extracting them.
+        
+        Args:
+            source: Path, file handle or mmap (see iter_levels)
+            collection: If given, receives the collection metadata
+        
+        Returns:
+            int: Number of levels
+        """
+        scan = EnhancedLevelCollectionParser.scan(source, collection, count_only=True)
+        return sum(1 for _ in scan)
+    
+    @staticmethod
+    def scan(source, collection: Optional[EnhancedLevelCollection] = None,
+             start: int = 0, count_only: bool = False
+             ) -> Iterator[Tuple[Optional[LevelMetadata], List[str], Optional[int], Optional[int]]]:
+        """
+        Stream the level blocks of a collection with their location.
+        
+        Args:
+            source: Path, file handle or mmap (see iter_levels)
+            collection: If given, receives the collection metadata
+            start: Metadata is only looked up from this level index on
+            count_only: Skip the metadata lookup of every level
+        
+        Yields:
+            Tuple: (metadata or None, level lines, start byte offset, end byte offset).
+            Byte offsets are only known for paths, binary handles and mmaps; the
+            end offset excludes the line break of the last level line.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            try:
+                file = open(source, 'rb')
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Level collection file not found: {source}")
+            with file:
+                yield from EnhancedLevelCollectionParser._scan_lines(
+                    EnhancedLevelCollectionParser._read_lines(file), collection, start, count_only)
+        else:
+            yield from EnhancedLevelCollectionParser._scan_lines(
+                EnhancedLevelCollectionParser._read_lines(source), collection, start, count_only)
+    
+    @staticmethod
+    def _read_lines(handle) -> Iterator[Tuple[str, Optional[int], Optional[int]]]:
+        """Read (line, start offset, end offset) from a file handle or mmap."""
+        # File objects iterate by line; mmap objects only offer readline
+        raw_lines = handle if isinstance(handle, io.IOBase) else iter(handle.readline, b'')
+        offset = 0
+        for raw in raw_lines:
+            if isinstance(raw, str):
+                yield (raw[:-1] if raw.endswith('\n') else raw), None, None
                 continue
+            line_start = offset
+            offset += len(raw)
+            # Same line breaks as text mode: drop \n and a \r before it
+            if raw.endswith(b'\r\n'):
+                raw = raw[:-2]
+            elif raw.endswith(b'\n'):
+                raw = raw[:-1]
+            yield raw.decode('utf-8'), line_start, line_start + len(raw)
+    
+    @staticmethod
+    def _scan_lines(lines: Iterator[Tuple[str, Optional[int], Optional[int]]],
+                    collection: Optional[EnhancedLevelCollection] = None,
+                    start: int = 0, count_only: bool = False):
+        """Single pass over the lines of a collection; see scan."""
+        reader = _LineReader(lines)
+        parser = EnhancedLevelCollectionParser
+        if collection is None:
+            collection = EnhancedLevelCollection()
+        
+        # Collection metadata, up to the first level line
+        i = 0
+        while reader.get(i) is not None and parser._parse_header_line(reader.get(i).strip(), collection):
+            i += 1
+        
+        # Level blocks, delimited by wall structure analysis
+        count = 0
+        while True:
+            line = reader.get(i)
+            if line is None:
+                return
+            reader.release(i)
+            stripped = line.strip()
             
-            # Skip comment lines that start with # but are clearly comments (not level content)
-            if line.startswith('#') and not EnhancedLevelCollectionParser._looks_like_level_content(line):
+            # Skip empty lines, metadata and anything that does not start a level with walls
+            if not stripped or parser._is_metadata_line(stripped) or not parser._is_wall_line(stripped):
                 i += 1
                 continue
             
-            # Check if this line looks like level content first
-            if EnhancedLevelCollectionParser._looks_like_level_content(line):
-                return i
+            level_start = i
+            level_lines = [line.rstrip()]
+            i += 1
             
-            # Check if this line contains metadata
-            metadata_found = False
-            for pattern in EnhancedLevelCollectionParser.METADATA_PATTERNS:
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    field_name = match.group(1).strip()
-                    field_value = match.group(2).strip()
-                    
-                    # Handle collection-level metadata
-                    if field_name.lower() == "title" and not collection.title:
-                        collection.title = field_value
-                    elif field_name.lower() == "description":
-                        collection.description = field_value
-                    elif field_name.lower() == "author" and not collection.author:
-                        collection.author = field_value
-                    else:
-                        collection.collection_metadata[field_name] = field_value
-                    
-                    metadata_found = True
+            # Collect all lines until we find the end of the level
+            while True:
+                current_line = reader.get(i)
+                if current_line is None:
                     break
-            
-            if metadata_found:
+                current_line_stripped = current_line.strip()
+                
+                # If we hit metadata, this level is done
+                if parser._is_metadata_line(current_line_stripped):
+                    break
+                
+                # An empty line followed by a wall line separates levels
+                if not current_line_stripped:
+                    next_i = i + 1
+                    while reader.get(next_i) is not None and not reader.get(next_i).strip():
+                        next_i += 1
+                    next_line = reader.get(next_i)
+                    if next_line is not None and parser._is_wall_line(next_line.strip()):
+                        break
+                
+                level_lines.append(current_line.rstrip())
                 i += 1
-                continue
             
-            # Check if this is a separator line (like ::::::::::)
-            if re.match(r'^[:=\-#]{5,}$', line):
-                i += 1
+            # Clean up the level lines and validate
+            level_lines = parser._clean_level_lines(level_lines)
+            if not level_lines or not parser._is_valid_level(level_lines):
                 continue
             
-            # If we can't categorize this line, assume levels start here
-            return i
+            metadata = None
+            if not count_only and count >= start:
+                metadata = parser._read_level_metadata(reader, level_start + len(level_lines))
+            last_line = level_start + len(level_lines) - 1
+            yield metadata, level_lines, reader.start_offset(level_start), reader.end_offset(last_line)
+            count += 1
+    
+    @staticmethod
+    def _parse_header_line(line: str, collection: EnhancedLevelCollection) -> bool:
+        """
+        Parse a stripped line of the collection header.
+        
+        Returns:
+            bool: True if the line belongs to the header, False if levels start at this line
+        """
+        # Skip empty lines and comments (but not level lines that start with #)
+        if not line or line.startswith(';'):
+            return True
+        
+        # Check if this line looks like level content first
+        if EnhancedLevelCollectionParser._looks_like_level_content(line):
+            return False
+        
+        # Skip comment lines that start with # (they do not look like level content)
+        if line.startswith('#'):
+            return True
+        
+        # Check if this line contains metadata
+        for pattern in EnhancedLevelCollectionParser.METADATA_PATTERNS:
+            match = re.match(pattern, line, re.IGNORECASE)
+            if match:
+                field_name = match.group(1).strip()
+                field_value = match.group(2).strip()
+                
+                # Handle collection-level metadata
+                if field_name.lower() == "title" and not collection.title:
+                    collection.title = field_value
+                elif field_name.lower() == "description":
+                    collection.description = field_value
+                elif field_name.lower() == "author" and not collection.author:
+                    collection.author = field_value
+                else:
+                    collection.collection_metadata[field_name] = field_value
+                return True
         
-        return i
+        # Separator lines (like ::::::::::) belong to the header; anything else starts the levels
+        return bool(re.match(r'^[:=\-#]{5,}$', line))
     
     @staticmethod
     def _looks_like_level_content(line: str) -> bool:
@@ -202,75 +359,13 @@ class EnhancedLevelCollectionParser:
         # Line should contain only walls (#) and spaces
         return all(c in '# ' for c in line) and '#' in line
     
-    @staticmethod
-    def _find_level_blocks(lines: List[str]) -> List[Tuple[List[str], int]]:
-        """Find all level blocks in the lines using wall structure analysis."""
-        level_blocks = []
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines and metadata
-            if not line or EnhancedLevelCollectionParser._is_metadata_line(line):
-                i += 1
-                continue
-            
-            # Check if this looks like the start of a level (wall line)
-            if EnhancedLevelCollectionParser._is_wall_line(line):
-                level_start = i
-                level_lines = [lines[i].rstrip()]
-                i += 1
-                
-                # Collect all lines until we find the end wall line
-                while i < len(lines):
-                    current_line = lines[i]
-                    current_line_stripped = current_line.strip()
-                    
-                    # If we hit metadata, this level is done
-                    if EnhancedLevelCollectionParser._is_metadata_line(current_line_stripped):
-                        break
-                    
-                    # If empty line, check if next line starts a new level
-                    if not current_line_stripped:
-                        # Look ahead to see if next non-empty line is a new level start
-                        next_i = i + 1
-                        while next_i < len(lines) and not lines[next_i].strip():
-                            next_i += 1
-                        
-                        if (next_i < len(lines) and
-                            EnhancedLevelCollectionParser._is_wall_line(lines[next_i].strip())):
-                            # This empty line separates levels
-                            break
-                        
-                        # Otherwise, add the empty line and continue
-                        level_lines.append(current_line.rstrip())
-                    else:
-                        # Add non-empty line
-                        level_lines.append(current_line.rstrip())
-                    
-                    i += 1
-                
-                # Clean up the level lines and validate
-                level_lines = EnhancedLevelCollectionParser._clean_level_lines(level_lines)
-                
-                if level_lines and EnhancedLevelCollectionParser._is_valid_level(level_lines):
-                    level_blocks.append((level_lines, level_start))
-            else:
-                i += 1
-        
-        return level_blocks
-    
     @staticmethod
     def _is_metadata_line(line: str) -> bool:
         """Check if a line is a metadata line."""
         if not line:
             return False
         
-        for pattern in EnhancedLevelCollectionParser.METADATA_PATTERNS:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
-        return False
+        return any(pattern.match(line) for pattern in EnhancedLevelCollectionParser._METADATA_REGEXES)
     
     @staticmethod
     def _looks_like_new_level_start(line: str, current_level_lines: List[str]) -> bool:
@@ -325,7 +420,7 @@ class EnhancedLevelCollectionParser:
             return False
         
         # Must have some sokoban characters
-        sokoban_chars = sum(1 for c in level_content if c in EnhancedLevelCollectionParser.SOKOBAN_CHARS)
+        sokoban_chars = sum(level_content.count(c) for c in EnhancedLevelCollectionParser.SOKOBAN_CHARS)
         if sokoban_chars < 5:  # Minimum threshold
             return False
         
@@ -337,19 +432,16 @@ class EnhancedLevelCollectionParser:
         return True
     
     @staticmethod
-    def _find_metadata_for_level(lines: List[str], level_start: int, level_length: int) -> LevelMetadata:
-        """Find metadata associated with a level."""
+    def _read_level_metadata(reader: '_LineReader', search_start: int) -> LevelMetadata:
+        """Read the metadata found in the 10 lines after a level."""
         metadata = LevelMetadata()
         
-        # Look for metadata after the level
-        search_start = level_start + level_length
-        search_end = min(search_start + 10, len(lines))  # Look at next 10 lines max
-        
-        for i in range(search_start, search_end):
-            if i >= len(lines):
+        for i in range(search_start, search_start + 10):
+            line = reader.get(i)
+            if line is None:
                 break
             
-            line = lines[i].strip()
+            line = line.strip()
             if not line:
                 continue
             
@@ -385,18 +477,8 @@ class EnhancedLevelCollectionParser:
     def get_collection_info(filepath: str) -> Dict[str, Any]:
         """Get basic information about a level collection without parsing all levels."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            lines = content.split('\n')
             collection = EnhancedLevelCollection()
-            
-            # Parse collection metadata
-            level_start_index = EnhancedLevelCollectionParser._parse_collection_metadata(lines, collection)
-            
-            # Count levels by finding level blocks
-            level_blocks = EnhancedLevelCollectionParser._find_level_blocks(lines[level_start_index:])
-            level_count = len(level_blocks)
+            level_count = EnhancedLevelCollectionParser.count_levels(filepath, collection)
             
             return {
                 'title': collection.title,
@@ -410,6 +492,57 @@ class EnhancedLevelCollectionParser:
             return {'title': '', 'description': '', 'author': '', 'level_count': 0, 'collection_metadata': {}}
 
 
+class _LineReader:
+    """
+    Forward-only window over a stream of lines, addressed by absolute line index.
+    
+    Lines are read on demand when a later line is requested and dropped once
+    released, so the parser can look ahead without holding the whole file.
+    """
+    
+    def __init__(self, lines: Iterator[Tuple[str, Optional[int], Optional[int]]]):
+        self._lines = lines
+        self._buffer = deque()  # (line, start offset, end offset) from line self._base on
+        self._base = 0
+        self._eof = False
+    
+    def get(self, index: int) -> Optional[str]:
+        """Get a line, or None past the end of the stream."""
+        position = index - self._base
+        if position < len(self._buffer):
+            return self._buffer[position][0]
+        entry = self._entry(index)
+        return entry[0] if entry else None
+    
+    def start_offset(self, index: int) -> Optional[int]:
+        """Byte offset of the start of a line."""
+        return self._entry(index)[1]
+    
+    def end_offset(self, index: int) -> Optional[int]:
+        """Byte offset of the end of a line, before its line break."""
+        return self._entry(index)[2]
+    
+    def release(self, index: int):
+        """Drop the lines before index: they will not be requested again."""
+        while self._buffer and self._base < index:
+            self._buffer.popleft()
+            self._base += 1
+    
+    def _entry(self, index: int):
+        position = index - self._base
+        if position < len(self._buffer):
+            return self._buffer[position]
+        while index >= self._base + len(self._buffer):
+            if self._eof:
+                return None
+            try:
+                self._buffer.append(next(self._lines))
+            except StopIteration:
+                self._eof = True
+                return None
+        return self._buffer[index - self._base]
+
+
 # Backward compatibility - create aliases for the original classes
 LevelCollection = EnhancedLevelCollection
 LevelCollectionParser = EnhancedLevelCollectionParser
\ No newline at end of file
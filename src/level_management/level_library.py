@@ -0,0 +1,322 @@
+"""
+Level Library module for the Sokoban game.
+
+Parsing every collection file into Level objects at startup makes startup
+time and memory grow with the size of the library. This module keeps a
+lightweight index of the level files instead: for each file, the byte
+offsets of its level blocks with their titles, dimensions and box counts.
+
+The index is persisted to a cache file and each entry is validated by the
+file modification time and size, so unchanged files are never read again.
+Levels are only materialized on demand, by seeking to their offset.
+The LevelManager, the level selector and the terminal front end share the
+same library instance.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.core.level import Level
+from src.level_management.enhanced_level_collection_parser import (
+    EnhancedLevelCollection,
+    EnhancedLevelCollectionParser
+)
+
+
+# Default index cache file (data/level_index.json at the project root)
+DEFAULT_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'data', 'level_index.json'
+)
+
+INDEX_VERSION = 1
+
+
+@dataclass
+class LevelEntry:
+    """Location and summary of one level block in a file."""
+    offset: int
+    length: int
+    title: str
+    width: int
+    height: int
+    boxes: int
+
+
+@dataclass
+class FileIndex:
+    """Index of one level file, valid while its mtime and size are unchanged."""
+    mtime_ns: int
+    size: int
+    title: str = ""
+    description: str = ""
+    author: str = ""
+    levels: List[LevelEntry] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FileIndex':
+        levels = [LevelEntry(**entry) for entry in data.get('levels', [])]
+        return cls(mtime_ns=data['mtime_ns'], size=data['size'], title=data.get('title', ''),
+                   description=data.get('description', ''), author=data.get('author', ''),
+                   levels=levels)
+
+
+class IndexedLevelCollection:
+    """
+    Level collection backed by a file index.
+
+    Offers the LevelCollection interface (title, description, author,
+    get_level_count, get_level) but only reads a level from disk when it
+    is requested. Each get_level call returns a new Level object.
+    """
+
+    def __init__(self, filepath: str, index: FileIndex):
+        """
+        Initialize an indexed collection.
+
+        Args:
+            filepath (str): Path to the level file
+            index (FileIndex): Index of the file
+        """
+        self.filepath = filepath
+        self.index = index
+        self.title = index.title
+        self.description = index.description
+        self.author = index.author
+
+    def get_level_count(self) -> int:
+        """
+        Get the number of levels in the collection.
+
+        Returns:
+            int: Number of levels
+        """
+        return len(self.index.levels)
+
+    def get_entry(self, index: int) -> LevelEntry:
+        """
+        Get the index entry of a level without reading it.
+
+        Args:
+            index (int): Level index
+
+        Returns:
+            LevelEntry: Offset, title, dimensions and box count of the level
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if 0 <= index < len(self.index.levels):
+            return self.index.levels[index]
+        raise IndexError(f"Level index {index} out of range")
+
+    def get_level_title(self, index: int) -> str:
+        """
+        Get the title of a level without reading it.
+
+        Args:
+            index (int): Level index
+
+        Returns:
+            str: Level title
+        """
+        return self.get_entry(index).title
+
+    def get_level_text(self, index: int) -> str:
+        """
+        Read the text of a level block from disk.
+
+        Args:
+            index (int): Level index
+
+        Returns:
+            str: Level lines joined with newlines
+        """
+        entry = self.get_entry(index)
+        with open(self.filepath, 'rb') as file:
+            file.seek(entry.offset)
+            data = file.read(entry.length)
+        return '\n'.join(line.rstrip() for line in data.decode('utf-8').split('\n'))
+
+    def get_level(self, index: int) -> Tuple[str, Level]:
+        """
+        Get a level by index, reading it from disk.
+
+        Args:
+            index (int): Level index
+
+        Returns:
+            Tuple[str, Level]: Level title and a new Level object
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        entry = self.get_entry(index)
+        return entry.title, Level(level_data=self.get_level_text(index), title=entry.title)
+
+
+class LevelLibrary:
+    """
+    Persistent index of level files shared by all front ends.
+    """
+
+    def __init__(self, cache_path: Optional[str] = DEFAULT_INDEX_PATH):
+        """
+        Initialize the level library.
+
+        Args:
+            cache_path (str): Path to the index cache file, or None to keep the index in memory only
+        """
+        self.cache_path = cache_path
+        self._lock = threading.RLock()
+        self._files: Dict[str, FileIndex] = {}
+        self._dirty = False
+        self.files_indexed = 0
+        self._load_cache()
+
+    def list_files(self, levels_dir: str) -> List[str]:
+        """
+        Index every .txt file under a directory and save the index.
+
+        Args:
+            levels_dir (str): Directory containing level files
+
+        Returns:
+            List[str]: Sorted paths of the level files
+        """
+        paths = []
+        for root, dirs, files in os.walk(levels_dir):
+            for file in files:
+                if file.endswith('.txt'):
+                    paths.append(os.path.join(root, file))
+        paths.sort()
+
+        with self._lock:
+            for path in paths:
+                try:
+                    self._get_index(path)
+                except ValueError:
+                    # Not a readable level collection (e.g. not UTF-8): indexed on demand
+                    pass
+            self.save()
+        return paths
+
+    def get_collection(self, filepath: str) -> IndexedLevelCollection:
+        """
+        Get the indexed collection of a level file, indexing it if needed.
+
+        Args:
+            filepath (str): Path to the level file
+
+        Returns:
+            IndexedLevelCollection: The collection
+
+        Raises:
+            FileNotFoundError: If the file cannot be found
+            ValueError: If the file is not valid UTF-8 text
+        """
+        with self._lock:
+            index = self._get_index(filepath)
+            self.save()
+        return IndexedLevelCollection(filepath, index)
+
+    def save(self):
+        """Write the index cache file if the index changed."""
+        with self._lock:
+            if not self._dirty or not self.cache_path:
+                return
+            data = {
+                'version': INDEX_VERSION,
+                'files': {path: asdict(index) for path, index in self._files.items()},
+            }
+            try:
+                directory = os.path.dirname(self.cache_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{self.cache_path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(temp_path, self.cache_path)
+                self._dirty = False
+            except OSError as e:
+                print(f"Warning: Could not save level index: {e}")
+
+    def _load_cache(self):
+        """Load the index cache file, ignoring it if it is missing or invalid."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION:
+                return
+            self._files = {path: FileIndex.from_dict(index) for path, index in data['files'].items()}
+        except (json.JSONDecodeError, KeyError, TypeError, OSError) as e:
+            print(f"Warning: Could not load level index: {e}")
+            self._files = {}
+
+    def _get_index(self, filepath: str) -> FileIndex:
+        """Get the index of a file, rebuilding it if the file changed."""
+        key = os.path.abspath(filepath)
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            raise FileNotFoundError(f"Level collection file not found: {filepath}")
+
+        index = self._files.get(key)
+        if index is None or index.mtime_ns != stat.st_mtime_ns or index.size != stat.st_size:
+            index = self.index_file(filepath, stat.st_mtime_ns, stat.st_size)
+            self._files[key] = index
+            self._dirty = True
+            self.files_indexed += 1
+        return index
+
+    @staticmethod
+    def index_file(filepath: str, mtime_ns: int = 0, size: int = 0) -> FileIndex:
+        """
+        Scan a level file and locate its level blocks.
+
+        Streams the file through EnhancedLevelCollectionParser.scan, so the
+        indexed levels are exactly the levels the parser would return.
+
+        Args:
+            filepath (str): Path to the level file
+            mtime_ns (int): Modification time to record
+            size (int): File size to record
+
+        Returns:
+            FileIndex: The file index
+        """
+        collection = EnhancedLevelCollection()
+        levels = []
+        for metadata, level_lines, start, end in EnhancedLevelCollectionParser.scan(filepath, collection):
+            levels.append(LevelEntry(
+                offset=start,
+                length=end - start,
+                title=metadata.title or "Untitled Level",
+                width=max(len(line) for line in level_lines),
+                height=len(level_lines),
+                boxes=sum(line.count('$') + line.count('*') for line in level_lines),
+            ))
+        return FileIndex(mtime_ns=mtime_ns, size=size, title=collection.title,
+                         description=collection.description, author=collection.author, levels=levels)
+
+
+# Global level library instance
+_level_library = None
+
+
+def get_level_library() -> LevelLibrary:
+    """
+    Get the global level library instance.
+
+    Returns:
+        LevelLibrary: The shared level library
+    """
+    global _level_library
+    if _level_library is None:
+        _level_library = LevelLibrary()
+    return _level_library
@@ -9,7 +9,7 @@ generating random levels using the procedural generator.
 import os
 from src.core.level import Level
 from src.generation.procedural_generator import ProceduralGenerator
-from src.level_management.level_collection_parser import LevelCollectionParser, LevelCollection
+from src.level_management.level_library import get_level_library
 
 
 class LevelManager:
@@ -20,17 +20,20 @@ class LevelManager:
     and providing methods to navigate between levels.
     """
 
-    def __init__(self, levels_dir='levels'):
+    def __init__(self, levels_dir='levels', library=None):
         """
         Initialize the level manager.
 
         Args:
             levels_dir (str, optional): Directory containing level files.
                                        Defaults to 'levels'.
+            library (LevelLibrary, optional): Level index to use.
+                                       Defaults to the shared level library.
         """
         self.levels_dir = levels_dir
+        self.library = library if library is not None else get_level_library()
         self.level_files = []
-        self.level_collections = {}  # Dict: filepath -> LevelCollection
+        self.level_collections = {}  # Dict: filepath -> IndexedLevelCollection
         self.current_level_index = -1
         self.current_level = None
         self.current_level_metrics = None
@@ -46,34 +49,28 @@ class LevelManager:
     def _load_level_files(self):
         """
         Load all level files from the levels directory and subdirectories.
-        Also parse level collections.
+        Level collections are indexed by the level library: their levels
+        are only read when loaded.
         """
         if not os.path.exists(self.levels_dir):
             print(f"Warning: Levels directory '{self.levels_dir}' not found.")
             return
 
-        self.level_files = []
         self.level_collections = {}
 
-        # Get all .txt files in the levels directory and subdirectories
-        for root, dirs, files in os.walk(self.levels_dir):
-            for file in files:
-                if file.endswith('.txt'):
-                    filepath = os.path.join(root, file)
-                    self.level_files.append(filepath)
-
-                    # Try to parse as a level collection
-                    try:
-                        collection = LevelCollectionParser.parse_file(filepath)
-                        if collection.get_level_count() > 1:
-                            self.level_collections[filepath] = collection
-                            print(f"Loaded collection '{collection.title}' with {collection.get_level_count()} levels")
-                    except Exception as e:
-                        # If it fails, treat as a single level file
-                        pass
-
-        # Sort level files alphabetically
-        self.level_files.sort()
+        # Get all .txt files in the levels directory and subdirectories, sorted alphabetically
+        self.level_files = self.library.list_files(self.levels_dir)
+
+        for filepath in self.level_files:
+            # Try to open as a level collection
+            try:
+                collection = self.library.get_collection(filepath)
+                if collection.get_level_count() > 1:
+                    self.level_collections[filepath] = collection
+                    print(f"Loaded collection '{collection.title}' with {collection.get_level_count()} levels")
+            except Exception as e:
+                # If it fails, treat as a single level file
+                pass
 
     def load_level(self, level_index):
         """
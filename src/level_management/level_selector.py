@@ -7,10 +7,10 @@ This module provides a level selection interface organized by categories/folders
 import os
 import pygame
 from src.core.constants import TITLE, CELL_SIZE, WALL, FLOOR, PLAYER, BOX, TARGET, PLAYER_ON_TARGET, BOX_ON_TARGET
-from src.core.level import Level
-from src.level_management.level_collection_parser import LevelCollectionParser
+from src.level_management.level_library import get_level_library
 from src.ui.level_preview import LevelPreview
 from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
+from src.ui.thumbnail_cache import get_thumbnail_cache
 from src.ui.widgets import Button
 
 class LevelCategory:
@@ -157,11 +157,12 @@ class LevelSelector:
         # Initialize skin manager to use the configured skin
         self.skin_manager = EnhancedSkinManager()
 
-        # Hover preview
+        # Hover preview, drawn from cached level thumbnails
         self.hovered_level_info = None
-        self.hover_preview_level = None
+        self.thumbnails = get_thumbnail_cache()
 
-        # Load level categories
+        # Load level categories from the shared level index
+        self.library = get_level_library()
         self.categories = self._load_level_categories()
 
         # No UI layout containers needed in the original implementation
@@ -215,11 +216,11 @@ class LevelSelector:
                     for file_path in files_in_subdir:
                         try:
                             # Try to parse as collection
-                            collection = LevelCollectionParser.parse_file(file_path)
+                            collection = self.library.get_collection(file_path)
                             if collection.get_level_count() > 1:
                                 # This is a collection, add each level as a separate entry
                                 for i in range(collection.get_level_count()):
-                                    level_title, _ = collection.get_level(i)
+                                    level_title = collection.get_level_title(i)
                                     display_title = level_title if level_title else f"Niveau {i+1}"
                                     level_infos.append(LevelInfo(display_title, file_path, i, True))
                             else:
@@ -252,12 +253,12 @@ class LevelSelector:
 
                 # Try to parse as collection first
                 try:
-                    collection = LevelCollectionParser.parse_file(file_path)
+                    collection = self.library.get_collection(file_path)
                     if collection.get_level_count() > 1:
                         # This is a collection, add each level as a separate entry
                         level_infos = []
                         for i in range(collection.get_level_count()):
-                            level_title, _ = collection.get_level(i)
+                            level_title = collection.get_level_title(i)
                             display_title = level_title if level_title else f"Niveau {i+1}"
                             level_infos.append(LevelInfo(display_title, file_path, i, True))
 
@@ -395,6 +396,15 @@ class LevelSelector:
             )
             self.level_buttons.append(button)
 
+        # Build the hover thumbnails of the visible page in the background
+        preview_width, preview_height = self._get_hover_preview_size()
+        self.thumbnails.prefetch(
+            self.skin_manager,
+            [(info.collection_file, info.level_index if info.is_from_collection else -1)
+             for info in self.selected_category.levels[start_level:end_level]],
+            preview_width - 20, preview_height - 40
+        )
+
     def _create_back_button(self):
         """Create the back button."""
         self.back_button = Button(
@@ -537,6 +547,17 @@ class LevelSelector:
                     self.scroll_offset = max(0, min(new_scroll, scrollbar['max_scroll']))
                     self._create_level_buttons()
 
+    def _get_hover_preview_size(self):
+        """
+        Get the size of the hover preview box, responsive to screen size.
+
+        Returns:
+            tuple: (width, height) in pixels.
+        """
+        preview_width = min(250, max(150, int(self.screen_width * 0.15)))
+        preview_height = min(250, max(150, int(self.screen_height * 0.25)))
+        return preview_width, preview_height
+
     def _render_hover_preview(self, level_info):
         """
         Render a preview of the level when hovering over its button.
@@ -544,27 +565,19 @@ class LevelSelector:
         Args:
             level_info: LevelInfo object containing level information
         """
-        # Always load the level when this method is called to ensure fresh data
-        try:
-            if level_info.is_from_collection and level_info.level_index >= 0:
-                collection = LevelCollectionParser.parse_file(level_info.collection_file)
-                _, level = collection.get_level(level_info.level_index)
-            else:
-                level = Level(level_file=level_info.collection_file)
-            self.hover_preview_level = level
-            # Update the hovered_level_info to the current level_info
-            self.hovered_level_info = level_info
-        except Exception as e:
-            print(f"Error loading level for hover preview: {e}")
+        preview_width, preview_height = self._get_hover_preview_size()
+
+        # The thumbnail is rendered once per level, skin and size, then cached
+        level_index = level_info.level_index if level_info.is_from_collection else -1
+        thumbnail = self.thumbnails.get(self.skin_manager, level_info.collection_file, level_index,
+                                        preview_width - 20, preview_height - 40)
+        if thumbnail is None:
             return
+        self.hovered_level_info = level_info
 
         # Get mouse position for positioning the preview
         mouse_pos = pygame.mouse.get_pos()
 
-        # Define preview dimensions - responsive to screen size
-        preview_width = min(250, max(150, int(self.screen_width * 0.15)))
-        preview_height = min(250, max(150, int(self.screen_height * 0.25)))
-
         # Position the preview near the mouse cursor but ensure it stays on screen
         preview_x = min(mouse_pos[0] + 20, self.screen_width - preview_width - 10)
         preview_y = min(mouse_pos[1] + 20, self.screen_height - preview_height - 10)
@@ -581,42 +594,11 @@ class LevelSelector:
         title_rect = title_surface.get_rect(center=(preview_x + preview_width // 2, preview_y + 15))
         self.screen.blit(title_surface, title_rect)
 
-        # Calculate cell size to fit the level in the preview area
-        level = self.hover_preview_level
-        max_cell_width = (preview_width - 20) // max(1, level.width)
-        max_cell_height = (preview_height - 40) // max(1, level.height)
-        cell_size = min(max_cell_width, max_cell_height, 20)  # Max 20px per cell
-
-        # Calculate actual preview dimensions
-        actual_width = level.width * cell_size
-        actual_height = level.height * cell_size
-
         # Center the preview
+        actual_width, actual_height = thumbnail.get_size()
         level_preview_x = preview_x + (preview_width - actual_width) // 2
         level_preview_y = preview_y + 30 + (preview_height - 40 - actual_height) // 2
-
-        # Draw level cells
-        for y in range(level.height):
-            for x in range(level.width):
-                cell_x = level_preview_x + x * cell_size
-                cell_y = level_preview_y + y * cell_size
-
-                # Get the display character for this position
-                display_char = level.get_display_char(x, y)
-
-                # Get the skin from the skin manager
-                skin = self.skin_manager.get_skin()
-
-                # Draw the cell using the skin
-                if display_char in skin:
-                    # Scale the sprite to the cell size
-                    scaled_sprite = pygame.transform.scale(skin[display_char], (cell_size, cell_size))
-                    self.screen.blit(scaled_sprite, (cell_x, cell_y))
-                else:
-                    # Fallback to a colored rectangle if sprite not found
-                    pygame.draw.rect(self.screen, (220, 220, 220), (cell_x, cell_y, cell_size, cell_size))
-
-                # Grid lines are completely removed from hover preview
+        self.screen.blit(thumbnail, (level_preview_x, level_preview_y))
 
     def start(self):
         """Start the level selector."""
@@ -44,10 +44,11 @@ def run_gui_game(levels_dir='levels', keyboard_layout=None):
     game.start()
 
 
-def run_enhanced_game(levels_dir='levels'):
+def run_enhanced_game(levels_dir='levels', startup_profile=False):
     """Run the enhanced version of the Sokoban game with menu, editor, etc."""
-    from src.enhanced_main import EnhancedSokoban
-    game = EnhancedSokoban(levels_dir)
+    from src.enhanced_main import EnhancedSokoban, StartupProfile
+    profile = StartupProfile() if startup_profile else None
+    game = EnhancedSokoban(levels_dir, startup_profile=profile)
     game.start()
 
 
@@ -73,6 +74,8 @@ def main():
 
     parser.add_argument('--keyboard', '-k', choices=['qwerty', 'azerty'], default=default_keyboard,
                         help=f'Keyboard layout to use (default: {default_keyboard})')
+    parser.add_argument('--startup-profile', action='store_true',
+                        help='Print the startup milestones and the time to the first frame (enhanced mode)')
 
     args = parser.parse_args()
 
@@ -84,7 +87,7 @@ def main():
     elif args.mode == 'editor':
         run_level_editor(args.levels)
     else:  # enhanced is the default
-        run_enhanced_game(args.levels)
+        run_enhanced_game(args.levels, args.startup_profile)
 
 
 if __name__ == '__main__':
@@ -6,12 +6,15 @@ using Pygame.
 """
 
 import os
+import time
+from collections import deque
 import pygame
 from dataclasses import dataclass
 from src.core.constants import WALL, FLOOR, PLAYER, BOX, TARGET, PLAYER_ON_TARGET, BOX_ON_TARGET, CELL_SIZE
 from src.core.config_manager import get_config_manager
 from src.renderers import AbstractRenderer
 from src.ui.interactive_highlight import GameplayHighlight
+from src.ui.skins.sprite_cache import get_sprite_cache
 
 
 @dataclass
@@ -28,6 +31,14 @@ class _RenderContext:
     stats_font: object
 
 
+@dataclass
+class _StaticLayer:
+    """Prerendered floor, walls and targets for one level, zoom and skin."""
+    key: tuple
+    map_data: list
+    surface: object
+
+
 class GUIRenderer(AbstractRenderer):
     """
     Class for rendering the Sokoban game with a GUI using Pygame.
@@ -80,6 +91,23 @@ class GUIRenderer(AbstractRenderer):
         # Font for rendering text
         self.font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 36)
+        self._fonts = {}
+        self._text_cache = {}
+
+        # Incremental game view: prerendered static board and the dynamic
+        # content presented last frame, used to compute the dirty rects
+        self._static_layer = None
+        self._presented_frame = None
+        self._completion_overlay = None
+        # Dirty rects composed by render_level and not presented yet (None: whole screen)
+        self._pending_update = []
+
+        # Frame-time counter (milliseconds from render_level to present)
+        self._frame_start = None
+        self.frame_times = deque(maxlen=120)
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.show_frame_time = display_config.get('show_frame_time', False)
 
     def _load_assets(self):
         """
@@ -195,7 +223,7 @@ class GUIRenderer(AbstractRenderer):
                                      CELL_SIZE*2//3, CELL_SIZE*2//3))
         return surface
 
-    def render_level(self, level, level_manager=None, show_grid=False, zoom_level=1.0, scroll_x=0, scroll_y=0, skin_manager=None, show_completion_message=True, mouse_pos=None):
+    def render_level(self, level, level_manager=None, show_grid=False, zoom_level=1.0, scroll_x=0, scroll_y=0, skin_manager=None, show_completion_message=True, mouse_pos=None, present=True):
         """
         Render the current level state in the GUI.
 
@@ -209,10 +237,21 @@ class GUIRenderer(AbstractRenderer):
             skin_manager: Optional enhanced skin manager for directional sprites.
             show_completion_message: Whether to show the level completion message.
             mouse_pos: Optional mouse position for interactive highlighting.
+            present: Whether to push the frame to the display. Callers that
+                draw overlays on top pass False and call present() once the
+                frame is complete, so that each frame is presented only once.
+
+        The floor, walls and targets are prerendered once per level, zoom and
+        skin; each frame blits that layer, draws the boxes and the player on
+        top, and only pushes the rectangles whose content changed since the
+        last frame to the display. Anything else that draws on the screen must
+        call invalidate() or present the whole frame with present(full=True).
 
         Returns:
             pygame.Surface: The updated screen surface.
         """
+        self._frame_start = time.perf_counter()
+
         # Get current screen size
         current_screen_width, current_screen_height = self.screen.get_size()
 
@@ -221,15 +260,12 @@ class GUIRenderer(AbstractRenderer):
             level, zoom_level, scroll_x, scroll_y, current_screen_width, current_screen_height
         )
 
-        # Clear the screen
-        self.screen.fill(self.colors['background'])
-
         # Prepare scaled assets and layers
         scaled_assets, background_layer, foreground_layer = self._prepare_scaled_assets(skin_manager)
 
         # Build render context
         cell_size_scaled = int(CELL_SIZE * self.scale_factor)
-        stats_font = pygame.font.Font(None, int(24 * max(1, self.scale_factor)))
+        stats_font = self._get_font(int(24 * max(1, self.scale_factor)))
         ctx = _RenderContext(
             screen_width=current_screen_width,
             screen_height=current_screen_height,
@@ -242,26 +278,222 @@ class GUIRenderer(AbstractRenderer):
             stats_font=stats_font,
         )
 
-        # Render layers
-        self._render_background(ctx, level)
-        self._render_foreground(ctx, level, skin_manager)
+        # Render layers: static board, then the dynamic cells on top
+        static_layer = self._ensure_static_layer(ctx, level, skin_manager)
+        self.screen.blit(static_layer, (0, 0))
+        dynamic_cells = self._render_dynamic_cells(ctx, level, skin_manager)
 
         if show_grid:
             self._render_grid_lines(ctx, level)
 
-        self._render_highlight(ctx, level, mouse_pos, scroll_x, scroll_y)
-        self._render_stats(ctx, level)
-        self._render_level_info(ctx, level, level_manager)
-        self._render_metadata(ctx, level, level_manager)
+        highlight_rect = self._render_highlight(ctx, level, mouse_pos, scroll_x, scroll_y)
+        hud_texts = (
+            self._render_stats(ctx, level),
+            self._render_level_info(ctx, level, level_manager),
+            self._render_metadata(ctx, level, level_manager),
+        )
 
-        if level.is_completed() and show_completion_message:
+        show_overlay = level.is_completed() and show_completion_message
+        if show_overlay:
             self._render_completion_overlay(ctx, level_manager)
 
-        # Update the display
-        pygame.display.flip()
+        frame = {
+            'key': (static_layer, show_grid, show_overlay, self.show_frame_time),
+            'cells': dynamic_cells,
+            'highlight': highlight_rect,
+            'hud': hud_texts,
+        }
+        frame_time_rect = self._render_frame_time() if self.show_frame_time else None
+
+        # Queue the changed areas for the display update
+        dirty_rects = self._compute_dirty_rects(ctx, level, frame)
+        if dirty_rects is not None and frame_time_rect:
+            dirty_rects.append(frame_time_rect)
+        self._pending_update = dirty_rects
+        self._presented_frame = frame
 
+        if present:
+            self.present()
         return self.screen
 
+    def present(self, full=False, extra_rects=()):
+        """
+        Push the frame composed by the last render_level call to the display.
+
+        This is the only place the game view is flipped, so overlays drawn
+        between render_level(present=False) and this call show up in the
+        same frame as the level instead of in a second flip.
+
+        Args:
+            full (bool): Present the whole screen, e.g. when overlays were
+                drawn this frame or the previous one.
+            extra_rects (iterable): Additional screen areas drawn since
+                render_level that must be updated with the level changes.
+        """
+        dirty_rects = self._pending_update
+        if full or dirty_rects is None:
+            pygame.display.flip()
+            self.full_updates += 1
+        else:
+            dirty_rects = dirty_rects + list(extra_rects)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            self.partial_updates += 1
+        self._pending_update = []
+
+        if self._frame_start is not None:
+            self.frame_times.append((time.perf_counter() - self._frame_start) * 1000.0)
+            self._frame_start = None
+
+    def invalidate(self):
+        """Force the next render_level call to present the whole frame."""
+        self._presented_frame = None
+
+    def get_frame_time_stats(self):
+        """
+        Get statistics about the recent render_level frame times.
+
+        Returns:
+            dict: Frame count, average and worst frame time in milliseconds,
+                the frame rate they allow, and the number of full and
+                partial (dirty-rect) display updates.
+        """
+        frames = len(self.frame_times)
+        average_ms = sum(self.frame_times) / frames if frames else 0.0
+        return {
+            'frames': frames,
+            'average_ms': average_ms,
+            'max_ms': max(self.frame_times, default=0.0),
+            'max_fps': 1000.0 / average_ms if average_ms else 0.0,
+            'full_updates': self.full_updates,
+            'partial_updates': self.partial_updates,
+        }
+
+    def _get_font(self, size):
+        """
+        Get a default font of a given size, created once and reused.
+
+        Args:
+            size (int): Font size in points.
+
+        Returns:
+            pygame.font.Font: The cached font.
+        """
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+
+    def _render_text(self, font, text, color):
+        """
+        Render a line of text, reusing the surface rendered on earlier frames.
+
+        Args:
+            font: Font returned by _get_font.
+            text (str): Text to render.
+            color (tuple): Text color.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) > 256:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def _ensure_static_layer(self, ctx, level, skin_manager):
+        """
+        Prerender the static board (floor, walls, targets) if needed.
+
+        The layer is a screen-sized surface rebuilt only when the level, zoom,
+        scroll, window size or skin changes.
+
+        Args:
+            ctx: _RenderContext with per-frame rendering values.
+            level: The Level object to render.
+            skin_manager: Optional enhanced skin manager.
+
+        Returns:
+            pygame.Surface: The static layer, a new surface whenever it was rebuilt.
+        """
+        skin_key = None
+        if skin_manager:
+            skin_key = (skin_manager.get_current_skin_name(), skin_manager.get_current_tile_size())
+        key = (level.width, level.height, ctx.screen_width, ctx.screen_height,
+               ctx.cell_size_scaled, ctx.offset_x, ctx.offset_y, skin_key)
+
+        layer = self._static_layer
+        # The layer keeps a reference to map_data, so its identity is reliable
+        if layer is not None and layer.key == key and layer.map_data is level.map_data:
+            return layer.surface
+
+        surface = pygame.Surface((ctx.screen_width, ctx.screen_height)).convert()
+        surface.fill(self.colors['background'])
+        self._render_background(ctx, level, surface)
+        self._render_static_foreground(ctx, level, surface)
+        self._static_layer = _StaticLayer(key=key, map_data=level.map_data, surface=surface)
+        return surface
+
+    def _compute_dirty_rects(self, ctx, level, frame):
+        """
+        Compute the screen rectangles that changed since the presented frame.
+
+        Args:
+            ctx: _RenderContext with per-frame rendering values.
+            level: The Level object rendered.
+            frame (dict): Description of the frame just drawn.
+
+        Returns:
+            list: Dirty rectangles, or None when the whole frame must be presented.
+        """
+        previous = self._presented_frame
+        if previous is None or previous['key'] != frame['key']:
+            return None
+
+        cell = ctx.cell_size_scaled
+        changed = set()
+        old_cells, new_cells = previous['cells'], frame['cells']
+        for pos in old_cells.keys() | new_cells.keys():
+            if old_cells.get(pos) != new_cells.get(pos):
+                changed.add(pos)
+
+        # Inflate by one pixel so grid lines on the cell borders are included
+        dirty_rects = [pygame.Rect(ctx.offset_x + x * cell - 1, ctx.offset_y + y * cell - 1,
+                                   cell + 2, cell + 2)
+                       for x, y in changed]
+        if previous['highlight'] != frame['highlight']:
+            dirty_rects.extend(rect.inflate(2, 2) for rect in (previous['highlight'], frame['highlight'])
+                               if rect)
+
+        if previous['hud'] != frame['hud']:
+            hud_top = int(ctx.offset_y + level.height * cell)
+            dirty_rects.append(pygame.Rect(0, hud_top, ctx.screen_width, ctx.screen_height - hud_top))
+
+        return dirty_rects
+
+    def _render_frame_time(self):
+        """
+        Render the frame-time counter in the top-left corner.
+
+        Returns:
+            pygame.Rect: Area covered by the counter.
+        """
+        stats = self.get_frame_time_stats()
+        text = (f"{stats['average_ms']:.2f} ms/frame  "
+                f"({stats['full_updates']} full, {stats['partial_updates']} partial)")
+        surface = self._get_font(20).render(text, True, self.colors['black'], self.colors['background'])
+        rect = surface.get_rect(topleft=(5, 5))
+        # Cover the previous, possibly longer, text as well
+        area = pygame.Rect(rect.left, rect.top, max(rect.width, 400), rect.height)
+        self.screen.fill(self.colors['background'], area)
+        self.screen.blit(surface, rect)
+        return area
+
     def _compute_render_layout(self, level, zoom_level, scroll_x, scroll_y, screen_width, screen_height):
         """
         Compute layout offsets and set self.scale_factor.
@@ -312,167 +544,127 @@ class GUIRenderer(AbstractRenderer):
         """
         Prepare scaled assets and layer dictionaries for rendering.
 
+        Sprites come from the shared sprite cache, so they are only scaled and
+        converted to the display format when the skin, zoom or window size changes.
+
         Args:
             skin_manager: Optional enhanced skin manager for directional sprites.
 
         Returns:
             tuple: (scaled_assets, background_layer, foreground_layer) dictionaries.
         """
-        # Get assets from skin manager if available, otherwise use default
-        if skin_manager:
-            assets_to_use = skin_manager.get_skin()
-            # Update tile size if different
-            if skin_manager.get_current_tile_size() != CELL_SIZE:
-                # Scale assets to match expected cell size
-                scaled_assets = {}
-                target_size = int(CELL_SIZE * self.scale_factor)
-                for key, asset in assets_to_use.items():
-                    scaled_assets[key] = pygame.transform.scale(asset, (target_size, target_size))
-            else:
-                # Scale assets if needed
-                scaled_assets = {}
-                if self.scale_factor != 1.0:
-                    scaled_size = int(CELL_SIZE * self.scale_factor)
-                    for key, asset in assets_to_use.items():
-                        scaled_assets[key] = pygame.transform.scale(asset, (scaled_size, scaled_size))
-                else:
-                    scaled_assets = assets_to_use
-        else:
-            # Use default assets
-            scaled_assets = {}
-            if self.scale_factor != 1.0:
-                scaled_size = int(CELL_SIZE * self.scale_factor)
-                for key, asset in self.assets.items():
-                    scaled_assets[key] = pygame.transform.scale(asset, (scaled_size, scaled_size))
-            else:
-                scaled_assets = self.assets
+        scaled_size = int(CELL_SIZE * self.scale_factor)
 
-        # Get layer assets if skin manager is available
-        background_layer = {}
-        foreground_layer = {}
+        if not skin_manager:
+            # Use default assets
+            scaled_assets = get_sprite_cache().get_all(('renderer', id(self)), self.assets, scaled_size)
+            return scaled_assets, {}, {}
 
-        if skin_manager:
-            # Get layers from skin manager
-            background_layer = skin_manager.get_layer('background')
-            foreground_layer = skin_manager.get_layer('foreground')
-
-            # Scale assets if needed
-            if self.scale_factor != 1.0:
-                scaled_size = int(CELL_SIZE * self.scale_factor)
-
-                # Scale background layer
-                scaled_background = {}
-                for key, asset in background_layer.items():
-                    scaled_background[key] = pygame.transform.scale(asset, (scaled_size, scaled_size))
-                background_layer = scaled_background
-
-                # Scale foreground layer
-                scaled_foreground = {}
-                for key, asset in foreground_layer.items():
-                    scaled_foreground[key] = pygame.transform.scale(asset, (scaled_size, scaled_size))
-                foreground_layer = scaled_foreground
+        scaled_assets = skin_manager.get_scaled_skin(scaled_size)
+        background_layer = skin_manager.get_scaled_layer('background', scaled_size)
+        foreground_layer = skin_manager.get_scaled_layer('foreground', scaled_size)
 
         return scaled_assets, background_layer, foreground_layer
 
-    def _render_background(self, ctx, level):
+    def _render_background(self, ctx, level, surface):
         """
         Render the background layer (floor tiles).
 
         Args:
             ctx: _RenderContext with per-frame rendering values.
             level: The Level object to render.
+            surface (pygame.Surface): Surface to draw on.
         """
+        floor = self._floor_sprite(ctx)
+        if floor is None:
+            return
         for y in range(level.height):
             for x in range(level.width):
                 pos_x = ctx.offset_x + x * ctx.cell_size_scaled
                 pos_y = ctx.offset_y + y * ctx.cell_size_scaled
-                pos = (pos_x, pos_y)
 
                 # Always render floor in background
-                if FLOOR in ctx.background_layer:
-                    self.screen.blit(ctx.background_layer[FLOOR], pos)
-                elif FLOOR in ctx.scaled_assets:
-                    self.screen.blit(ctx.scaled_assets[FLOOR], pos)
+                surface.blit(floor, (pos_x, pos_y))
 
-    def _render_foreground(self, ctx, level, skin_manager):
+    def _floor_sprite(self, ctx):
+        """Get the floor sprite of the background layer, or None."""
+        if FLOOR in ctx.background_layer:
+            return ctx.background_layer[FLOOR]
+        return ctx.scaled_assets.get(FLOOR)
+
+    def _layer_sprite(self, ctx, char):
+        """Get the sprite drawn for a character, preferring the foreground layer."""
+        if char in ctx.foreground_layer:
+            return ctx.foreground_layer[char]
+        return ctx.scaled_assets.get(char)
+
+    def _render_static_foreground(self, ctx, level, surface):
+        """
+        Render the static part of the foreground layer (walls and targets).
+
+        Args:
+            ctx: _RenderContext with per-frame rendering values.
+            level: The Level object to render.
+            surface (pygame.Surface): Surface to draw on.
+        """
+        for y, row in enumerate(level.map_data):
+            for x, char in enumerate(row):
+                if char not in (WALL, TARGET):
+                    continue
+                sprite = self._layer_sprite(ctx, char)
+                if sprite:
+                    surface.blit(sprite, (ctx.offset_x + x * ctx.cell_size_scaled,
+                                          ctx.offset_y + y * ctx.cell_size_scaled))
+
+    def _render_dynamic_cells(self, ctx, level, skin_manager):
         """
-        Render the foreground layer (walls, targets, player, boxes).
+        Render the boxes and the player over the static layer.
+
+        Each dynamic cell is redrawn from the floor up, exactly as the cell
+        would look when drawing the whole board.
 
         Args:
             ctx: _RenderContext with per-frame rendering values.
             level: The Level object to render.
             skin_manager: Optional enhanced skin manager for directional sprites.
+
+        Returns:
+            dict: (x, y) -> sprites drawn in the cell, to detect changes.
         """
-        for y in range(level.height):
-            for x in range(level.width):
-                char = level.get_display_char(x, y)
-                pos_x = ctx.offset_x + x * ctx.cell_size_scaled
-                pos_y = ctx.offset_y + y * ctx.cell_size_scaled
-                pos = (pos_x, pos_y)
-
-                if char == WALL:
-                    # Render wall
-                    if WALL in ctx.foreground_layer:
-                        self.screen.blit(ctx.foreground_layer[WALL], pos)
-                    elif WALL in ctx.scaled_assets:
-                        self.screen.blit(ctx.scaled_assets[WALL], pos)
-
-                elif char == TARGET:
-                    # Render target
-                    if TARGET in ctx.foreground_layer:
-                        self.screen.blit(ctx.foreground_layer[TARGET], pos)
-                    elif TARGET in ctx.scaled_assets:
-                        self.screen.blit(ctx.scaled_assets[TARGET], pos)
-
-                elif char == PLAYER:
-                    # Render player
-                    if skin_manager:
-                        player_sprite = skin_manager.get_player_sprite(advance_animation=False)
-                        if player_sprite:
-                            # Scale the sprite if needed
-                            if self.scale_factor != 1.0:
-                                target_size = int(CELL_SIZE * self.scale_factor)
-                                player_sprite = pygame.transform.scale(player_sprite, (target_size, target_size))
-                            self.screen.blit(player_sprite, pos)
-                    elif PLAYER in ctx.foreground_layer:
-                        self.screen.blit(ctx.foreground_layer[PLAYER], pos)
-                    elif PLAYER in ctx.scaled_assets:
-                        self.screen.blit(ctx.scaled_assets[PLAYER], pos)
-
-                elif char == BOX:
-                    # Render box
-                    if BOX in ctx.foreground_layer:
-                        self.screen.blit(ctx.foreground_layer[BOX], pos)
-                    elif BOX in ctx.scaled_assets:
-                        self.screen.blit(ctx.scaled_assets[BOX], pos)
-
-                elif char == PLAYER_ON_TARGET:
-                    # Render target first
-                    if TARGET in ctx.foreground_layer:
-                        self.screen.blit(ctx.foreground_layer[TARGET], pos)
-                    elif TARGET in ctx.scaled_assets:
-                        self.screen.blit(ctx.scaled_assets[TARGET], pos)
-
-                    # Then render player on top
-                    if skin_manager:
-                        player_sprite = skin_manager.get_player_sprite(advance_animation=False)
-                        if player_sprite:
-                            # Scale the sprite if needed
-                            if self.scale_factor != 1.0:
-                                target_size = int(CELL_SIZE * self.scale_factor)
-                                player_sprite = pygame.transform.scale(player_sprite, (target_size, target_size))
-                            self.screen.blit(player_sprite, pos)
-                    elif PLAYER in ctx.foreground_layer:
-                        self.screen.blit(ctx.foreground_layer[PLAYER], pos)
-                    elif PLAYER_ON_TARGET in ctx.scaled_assets:  # Fallback to combined sprite
-                        self.screen.blit(ctx.scaled_assets[PLAYER_ON_TARGET], pos)
-
-                elif char == BOX_ON_TARGET:
-                    # Use the specific box_on_target sprite as requested
-                    if BOX_ON_TARGET in ctx.foreground_layer:
-                        self.screen.blit(ctx.foreground_layer[BOX_ON_TARGET], pos)
-                    elif BOX_ON_TARGET in ctx.scaled_assets:
-                        self.screen.blit(ctx.scaled_assets[BOX_ON_TARGET], pos)
+        floor = self._floor_sprite(ctx)
+        cells = {}
+
+        def blit_cell(pos, sprites):
+            screen_pos = (ctx.offset_x + pos[0] * ctx.cell_size_scaled,
+                          ctx.offset_y + pos[1] * ctx.cell_size_scaled)
+            if floor:
+                self.screen.blit(floor, screen_pos)
+            for sprite in sprites:
+                if sprite:
+                    self.screen.blit(sprite, screen_pos)
+            cells[pos] = tuple(sprites)
+
+        for box in level.boxes:
+            if box == level.player_pos:
+                continue
+            char = BOX_ON_TARGET if level.is_target(*box) else BOX
+            blit_cell(box, [self._layer_sprite(ctx, char)])
+
+        player_on_target = level.is_target(*level.player_pos)
+        if skin_manager:
+            player = skin_manager.get_player_sprite(advance_animation=False)
+            if player:
+                player = skin_manager.get_scaled_sprite(player, ctx.cell_size_scaled)
+        elif PLAYER in ctx.foreground_layer:
+            player = ctx.foreground_layer[PLAYER]
+        else:
+            # Fallback to the combined sprite
+            player = ctx.scaled_assets.get(PLAYER_ON_TARGET if player_on_target else PLAYER)
+
+        sprites = [self._layer_sprite(ctx, TARGET)] if player_on_target else []
+        blit_cell(level.player_pos, sprites + [player])
+
+        return cells
 
     def _render_grid_lines(self, ctx, level):
         """
@@ -515,9 +707,12 @@ class GUIRenderer(AbstractRenderer):
             mouse_pos: Optional mouse position for interactive highlighting.
             scroll_x: Horizontal scroll offset.
             scroll_y: Vertical scroll offset.
+
+        Returns:
+            pygame.Rect: Screen area of the highlighted tile, or None.
         """
         if not mouse_pos:
-            return
+            return None
 
         # Update player position for movement hints
         self.highlight_system.set_player_position(level.player_pos)
@@ -539,6 +734,14 @@ class GUIRenderer(AbstractRenderer):
             self.screen, map_area_x, map_area_y, ctx.cell_size_scaled, scroll_x, scroll_y
         )
 
+        # The highlight system adds the scroll to the map origin once more
+        pos = self.highlight_system.current_highlight_pos
+        if pos is None:
+            return None
+        cell = ctx.cell_size_scaled
+        return pygame.Rect(int(map_area_x + scroll_x + pos[0] * cell),
+                           int(map_area_y + scroll_y + pos[1] * cell), cell, cell)
+
     def _render_stats(self, ctx, level):
         """
         Render game statistics (moves and pushes counters).
@@ -546,11 +749,15 @@ class GUIRenderer(AbstractRenderer):
         Args:
             ctx: _RenderContext with per-frame rendering values.
             level: The Level object to render.
+
+        Returns:
+            str: The rendered text.
         """
         stats_text = f"Moves: {level.moves}  Pushes: {level.pushes}"
-        stats_surface = ctx.stats_font.render(stats_text, True, self.colors['black'])
+        stats_surface = self._render_text(ctx.stats_font, stats_text, self.colors['black'])
         stats_pos = (ctx.offset_x + 10, ctx.offset_y + level.height * ctx.cell_size_scaled + 10)
         self.screen.blit(stats_surface, stats_pos)
+        return stats_text
 
     def _render_level_info(self, ctx, level, level_manager):
         """
@@ -560,12 +767,15 @@ class GUIRenderer(AbstractRenderer):
             ctx: _RenderContext with per-frame rendering values.
             level: The Level object to render.
             level_manager: Optional LevelManager object for additional information.
+
+        Returns:
+            tuple: The rendered texts.
         """
         if not level_manager:
-            return
+            return ()
 
         level_info = f"Level {level_manager.get_current_level_number()} of {level_manager.get_level_count()}"
-        level_surface = ctx.stats_font.render(level_info, True, self.colors['black'])
+        level_surface = self._render_text(ctx.stats_font, level_info, self.colors['black'])
         level_rect = level_surface.get_rect()
         level_rect.right = ctx.screen_width - 10
         level_rect.top = ctx.offset_y + level.height * ctx.cell_size_scaled + 10
@@ -573,21 +783,24 @@ class GUIRenderer(AbstractRenderer):
 
         # Render collection information if available
         collection_info = level_manager.get_current_collection_info()
-        if collection_info:
-            collection_text = f"Collection: {collection_info['title']}"
-            if collection_info['current_level_title']:
-                collection_text += f" - {collection_info['current_level_title']}"
-            collection_surface = ctx.stats_font.render(collection_text, True, self.colors['blue'])
-            collection_pos = (ctx.offset_x + 10, ctx.offset_y + level.height * ctx.cell_size_scaled + 35)
-            self.screen.blit(collection_surface, collection_pos)
-
-            # Show collection progress
-            progress_text = f"Level {collection_info['current_level_index']} of {collection_info['level_count']} in collection"
-            progress_surface = ctx.stats_font.render(progress_text, True, self.colors['gray'])
-            progress_rect = progress_surface.get_rect()
-            progress_rect.right = ctx.screen_width - 10
-            progress_rect.top = ctx.offset_y + level.height * ctx.cell_size_scaled + 35
-            self.screen.blit(progress_surface, progress_rect)
+        if not collection_info:
+            return (level_info,)
+
+        collection_text = f"Collection: {collection_info['title']}"
+        if collection_info['current_level_title']:
+            collection_text += f" - {collection_info['current_level_title']}"
+        collection_surface = self._render_text(ctx.stats_font, collection_text, self.colors['blue'])
+        collection_pos = (ctx.offset_x + 10, ctx.offset_y + level.height * ctx.cell_size_scaled + 35)
+        self.screen.blit(collection_surface, collection_pos)
+
+        # Show collection progress
+        progress_text = f"Level {collection_info['current_level_index']} of {collection_info['level_count']} in collection"
+        progress_surface = self._render_text(ctx.stats_font, progress_text, self.colors['gray'])
+        progress_rect = progress_surface.get_rect()
+        progress_rect.right = ctx.screen_width - 10
+        progress_rect.top = ctx.offset_y + level.height * ctx.cell_size_scaled + 35
+        self.screen.blit(progress_surface, progress_rect)
+        return (level_info, collection_text, progress_text)
 
     def _render_metadata(self, ctx, level, level_manager):
         """
@@ -597,20 +810,23 @@ class GUIRenderer(AbstractRenderer):
             ctx: _RenderContext with per-frame rendering values.
             level: The Level object to render.
             level_manager: Optional LevelManager object for additional information.
+
+        Returns:
+            tuple: The rendered title, author and description.
         """
         metadata = level_manager.get_level_metadata() if level_manager else {}
         y_offset = ctx.offset_y + level.height * ctx.cell_size_scaled + (60 if level_manager and level_manager.get_current_collection_info() else 35)
 
         if metadata.get('title') and metadata['title'] != '':
             title_text = f"Title: {metadata['title']}"
-            title_surface = ctx.stats_font.render(title_text, True, self.colors['black'])
+            title_surface = self._render_text(ctx.stats_font, title_text, self.colors['black'])
             title_pos = (ctx.offset_x + 10, y_offset)
             self.screen.blit(title_surface, title_pos)
             y_offset += 25
 
         if metadata.get('author') and metadata['author'] != '':
             author_text = f"Author: {metadata['author']}"
-            author_surface = ctx.stats_font.render(author_text, True, self.colors['black'])
+            author_surface = self._render_text(ctx.stats_font, author_text, self.colors['black'])
             author_pos = (ctx.offset_x + 10, y_offset)
             self.screen.blit(author_surface, author_pos)
             y_offset += 25
@@ -636,15 +852,17 @@ class GUIRenderer(AbstractRenderer):
 
                 for i, line in enumerate(lines[:2]):  # Show max 2 lines
                     desc_text = f"Description: {line}" if i == 0 else f"             {line}"
-                    desc_surface = ctx.stats_font.render(desc_text, True, self.colors['black'])
+                    desc_surface = self._render_text(ctx.stats_font, desc_text, self.colors['black'])
                     desc_pos = (ctx.offset_x + 10, y_offset + i * 20)
                     self.screen.blit(desc_surface, desc_pos)
             else:
                 desc_text = f"Description: {description}"
-                desc_surface = ctx.stats_font.render(desc_text, True, self.colors['black'])
+                desc_surface = self._render_text(ctx.stats_font, desc_text, self.colors['black'])
                 desc_pos = (ctx.offset_x + 10, y_offset)
                 self.screen.blit(desc_surface, desc_pos)
 
+        return tuple(metadata.get(field) for field in ('title', 'author', 'description'))
+
     def _render_completion_overlay(self, ctx, level_manager):
         """
         Render the level completion overlay message.
@@ -657,15 +875,18 @@ class GUIRenderer(AbstractRenderer):
         if level_manager and level_manager.has_next_level():
             completion_text += " Press 'n' for next level."
 
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((ctx.screen_width, ctx.screen_height))
-        overlay.set_alpha(150)
-        overlay.fill(self.colors['black'])
+        # Create a semi-transparent overlay (reused while the window size is unchanged)
+        overlay = self._completion_overlay
+        if overlay is None or overlay.get_size() != (ctx.screen_width, ctx.screen_height):
+            overlay = pygame.Surface((ctx.screen_width, ctx.screen_height))
+            overlay.set_alpha(150)
+            overlay.fill(self.colors['black'])
+            self._completion_overlay = overlay
         self.screen.blit(overlay, (0, 0))
 
         # Render the completion message with scaled font
-        completion_font = pygame.font.Font(None, int(36 * max(1, self.scale_factor)))
-        completion_surface = completion_font.render(completion_text, True, self.colors['white'])
+        completion_font = self._get_font(int(36 * max(1, self.scale_factor)))
+        completion_surface = self._render_text(completion_font, completion_text, self.colors['white'])
         completion_rect = completion_surface.get_rect(center=(ctx.screen_width // 2, ctx.screen_height // 2))
         self.screen.blit(completion_surface, completion_rect)
 
@@ -762,6 +983,7 @@ class GUIRenderer(AbstractRenderer):
 
         # Update the display
         pygame.display.flip()
+        self.invalidate()
 
         return self.screen
 
@@ -826,6 +1048,7 @@ class GUIRenderer(AbstractRenderer):
 
         # Update the display
         pygame.display.flip()
+        self.invalidate()
 
         return self.screen
 
@@ -913,6 +1136,7 @@ class GUIRenderer(AbstractRenderer):
 
         # Update the display
         pygame.display.flip()
+        self.invalidate()
 
         return self.screen
 
@@ -9,7 +9,7 @@ import keyboard
 from src.level_management.level_manager import LevelManager
 from src.renderers.terminal_renderer import TerminalRenderer
 from src.core.game import Game
-from src.level_management.level_collection_parser import LevelCollectionParser
+from src.level_management.level_library import get_level_library
 from src.core.constants import KEY_BINDINGS
 from src.core.config_manager import get_config_manager
 
@@ -84,7 +84,7 @@ class TerminalGame:
                         for file_path in files_in_subdir:
                             try:
                                 # Try to parse as a collection
-                                collection = LevelCollectionParser.parse_file(file_path)
+                                collection = get_level_library().get_collection(file_path)
                                 level_count = collection.get_level_count()
                                 if level_count > 1:
                                     total_levels += level_count
@@ -118,7 +118,7 @@ class TerminalGame:
                     for file_path in all_files:
                         try:
                             # Try to parse as a collection
-                            collection = LevelCollectionParser.parse_file(file_path)
+                            collection = get_level_library().get_collection(file_path)
                             level_count = collection.get_level_count()
                             if level_count > 1:
                                 total_levels += level_count
@@ -409,7 +409,7 @@ class TerminalGame:
 
         # Check if this is a collection file with multiple levels
         try:
-            collection = LevelCollectionParser.parse_file(level_path)
+            collection = get_level_library().get_collection(level_path)
             level_count = collection.get_level_count()
 
             if level_count > 1:
@@ -5,10 +5,9 @@ This module provides a popup interface for previewing levels before playing them
 """
 
 import pygame
-from src.core.level import Level
 from src.core.constants import WALL, FLOOR, PLAYER, BOX, TARGET, PLAYER_ON_TARGET, BOX_ON_TARGET
-from src.level_management.level_collection_parser import LevelCollectionParser
 from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
+from src.ui.thumbnail_cache import get_thumbnail_cache
 from src.ui.widgets import Button
 
 class LevelPreview:
@@ -34,6 +33,7 @@ class LevelPreview:
 
         # Initialize skin manager to use the configured skin
         self.skin_manager = EnhancedSkinManager()
+        self.thumbnails = get_thumbnail_cache()
 
         # Define colors
         self.colors = {
@@ -149,11 +149,8 @@ class LevelPreview:
 
         # Load the level
         try:
-            if level_info.is_from_collection and level_info.level_index >= 0:
-                collection = LevelCollectionParser.parse_file(level_info.collection_file)
-                _, self.level = collection.get_level(level_info.level_index)
-            else:
-                self.level = Level(level_file=level_info.collection_file)
+            level_index = level_info.level_index if level_info.is_from_collection else -1
+            self.level = self.thumbnails.load_level(level_info.collection_file, level_index)
         except Exception as e:
             print(f"Error loading level: {e}")
             return 'back'
@@ -292,14 +289,15 @@ class LevelPreview:
         if not self.level:
             return
 
-        # Calculate cell size to fit the level in the preview area
-        max_cell_width = self.preview_width // max(1, self.level.width)
-        max_cell_height = self.preview_height // max(1, self.level.height)
-        cell_size = min(max_cell_width, max_cell_height, 20)  # Max 20px per cell
+        # The thumbnail is rendered once per level, skin, size and grid setting
+        level_index = self.level_info.level_index if self.level_info.is_from_collection else -1
+        thumbnail = self.thumbnails.get(self.skin_manager, self.level_info.collection_file, level_index,
+                                        self.preview_width, self.preview_height, show_grid=self.show_grid)
+        if thumbnail is None:
+            return
 
         # Calculate actual preview dimensions
-        actual_width = self.level.width * cell_size
-        actual_height = self.level.height * cell_size
+        actual_width, actual_height = thumbnail.get_size()
 
         # Center the preview
         preview_start_x = self.preview_x + (self.preview_width - actual_width) // 2
@@ -311,31 +309,7 @@ class LevelPreview:
                         (preview_start_x - border_margin, preview_start_y - border_margin, 
                          actual_width + 2 * border_margin, actual_height + 2 * border_margin), 2)
 
-        # Get the skin from the skin manager
-        skin = self.skin_manager.get_skin()
-
-        # Draw level cells
-        for y in range(self.level.height):
-            for x in range(self.level.width):
-                cell_x = preview_start_x + x * cell_size
-                cell_y = preview_start_y + y * cell_size
-
-                # Get the display character for this position
-                display_char = self.level.get_display_char(x, y)
-
-                # Draw the cell using the skin
-                if display_char in skin:
-                    # Scale the sprite to the cell size
-                    scaled_sprite = pygame.transform.scale(skin[display_char], (cell_size, cell_size))
-                    self.screen.blit(scaled_sprite, (cell_x, cell_y))
-                else:
-                    # Fallback to a colored rectangle if sprite not found
-                    pygame.draw.rect(self.screen, (220, 220, 220), (cell_x, cell_y, cell_size, cell_size))
-
-                # Draw grid lines for better visibility (only if cells are large enough and show_grid is True)
-                if self.show_grid and cell_size > 8:
-                    pygame.draw.rect(self.screen, (180, 180, 180), 
-                                   (cell_x, cell_y, cell_size, cell_size), 1)
+        self.screen.blit(thumbnail, (preview_start_x, preview_start_y))
 
         # Draw level stats
         stats_y = preview_start_y + actual_height + 20
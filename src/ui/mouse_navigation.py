@@ -7,11 +7,16 @@ YASC-style mouse controls:
 - Click on destination (while box lifted): plans and executes full push sequence
 - Right-click / click same box: cancels lift
 - White guideline overlay showing planned path
+
+Walking paths are read from a BFS distance/parent field computed once
+from the player position. The field is kept until the player or a box
+moves, so hover previews cost one walk up the parent array per cell
+change instead of a search.
 """
 
-import heapq
 import pygame
 import math
+from array import array
 from enum import Enum, auto
 from collections import deque
 from typing import List, Tuple, Optional
@@ -27,28 +32,36 @@ class MouseMode(Enum):
 
 class BoxPushPathfinder:
     """
-    BFS pathfinder that computes a sequence of pushes to move a box from
-    position A to position B, including the player walks between pushes.
+    Plans the pushes that move one box to every cell it can reach.
 
-    State: (box_pos, player_pos)
-    """
+    plan() explores each (box cell, player region) state once, fewest
+    pushes first. Whether the player can walk between two sides of the box
+    is read from a depth-first labelling of the board computed once per
+    plan: removing the box cell splits the board exactly along the DFS
+    subtrees that have no back edge above it. No walk is searched while
+    planning; walks are only computed for the path that is executed.
 
-    MAX_PUSHES = 50  # Safety bound
+    State: (box_pos, player region around the box)
+    """
 
-    def __init__(self, level, player_path_func):
+    def __init__(self, level):
         """
         Args:
             level: The Level object.
-            player_path_func: Callable(start, goal) -> list[(x,y)] or []
-                              A* path for the player avoiding boxes.
         """
         self.level = level
-        self._player_path = player_path_func
+        self.box_start = None
+        self.player_pos = None
+        self._boxes = None
+        self._reached = {}  # box cell index -> first state reaching it
+        self._parents = {}  # state -> (previous state, push direction)
 
     def find_push_path(self, box_start, box_goal, player_pos):
         """
         Find a sequence of pushes to move a box from box_start to box_goal.
 
+        Reuses the current plan if it was made for the same position.
+
         Returns:
             list of (push_direction, player_walk_path) tuples, or
             [] if box is already at goal, or
@@ -56,146 +69,301 @@ class BoxPushPathfinder:
         """
         if box_start == box_goal:
             return []
+        if not self.matches(box_start, player_pos):
+            self.plan(box_start, player_pos)
 
-        # The box at box_start is in self.level.boxes. During simulation it
-        # moves, so we must exclude its *original* position from level.boxes
-        # and track its *current* BFS position separately.
-        self._original_box_pos = box_start
-
-        # BFS on (box_pos, player_pos) states
-        start_state = (box_start, player_pos)
-        queue = deque([(start_state, [])])
-        visited = {start_state}
-
-        while queue:
-            (box_pos, p_pos), pushes = queue.popleft()
-
-            if len(pushes) >= self.MAX_PUSHES:
-                continue
-
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                new_box = (box_pos[0] + dx, box_pos[1] + dy)
-                push_origin = (box_pos[0] - dx, box_pos[1] - dy)
-
-                # Validate positions
-                if not self._is_free(new_box[0], new_box[1], box_pos):
-                    continue
-                if not self._is_free_for_player(push_origin[0], push_origin[1], box_pos):
-                    continue
-
-                # Can the player reach the push origin?
-                walk_path = self._player_path_avoiding_box(
-                    p_pos, push_origin, box_pos
-                )
-                if walk_path is None:
-                    continue
-
-                new_pushes = pushes + [((dx, dy), walk_path)]
-                new_state = (new_box, box_pos)  # player ends at old box pos
-
-                if new_box == box_goal:
-                    return new_pushes
-
-                if new_state not in visited:
-                    visited.add(new_state)
-                    queue.append((new_state, new_pushes))
+        directions = self._push_directions(box_goal)
+        if directions is None:
+            return None
 
-        return None
+        # Walk the player between pushes on the simulated board
+        others = [box for box in self.level.boxes if box != box_start]
+        walls = PlayerDistanceField.wall_grid(self.level)
+        box, player = box_start, player_pos
+        pushes = []
+        for dx, dy in directions:
+            origin = (box[0] - dx, box[1] - dy)
+            if origin == player:
+                walk_path = [player]
+            else:
+                field = PlayerDistanceField(self.level, player, walls, boxes=others + [box])
+                walk_path = field.path_to(origin)
+            if not walk_path:
+                return None
+            pushes.append(((dx, dy), walk_path))
+            player = box
+            box = (box[0] + dx, box[1] + dy)
+        return pushes
+
+    def box_path(self, box_goal):
+        """
+        Cells visited by the box on its way to box_goal, from the planned start.
 
-    def _is_free(self, x, y, current_box_pos):
-        """Check if position is free for a box (not wall, not another box)."""
-        if not (0 <= x < self.level.width and 0 <= y < self.level.height):
-            return False
-        if self.level.is_wall(x, y):
-            return False
-        # Check other boxes — skip the moved box's original position in
-        # level.boxes (it's no longer there in the simulation)
-        for bx, by in self.level.boxes:
-            if (bx, by) == self._original_box_pos:
-                continue
-            if (bx, by) == (x, y):
-                return False
-        return True
+        Returns:
+            list of (x, y), or None if the box cannot reach box_goal.
+        """
+        if box_goal == self.box_start:
+            return [self.box_start]
+        directions = self._push_directions(box_goal)
+        if directions is None:
+            return None
+        path = [self.box_start]
+        for dx, dy in directions:
+            path.append((path[-1][0] + dx, path[-1][1] + dy))
+        return path
+
+    @property
+    def destinations(self):
+        """Cells the box can be pushed to, including its start."""
+        width = self.level.width
+        return {(index % width, index // width) for index in self._reached}
+
+    def matches(self, box_start, player_pos):
+        """Whether the current plan was made for this box, player and board."""
+        return (self._boxes is not None and box_start == self.box_start
+                and player_pos == self.player_pos and tuple(self.level.boxes) == self._boxes)
+
+    def plan(self, box_start, player_pos):
+        """
+        Compute the fewest-pushes route of the box to every reachable cell.
 
-    def _is_free_for_player(self, x, y, current_box_pos):
-        """Check if position is free for player movement."""
-        if not (0 <= x < self.level.width and 0 <= y < self.level.height):
-            return False
-        if self.level.is_wall(x, y):
-            return False
-        # Check other boxes — skip the moved box's original position
-        for bx, by in self.level.boxes:
-            if (bx, by) == self._original_box_pos:
-                continue
-            if (bx, by) == (x, y):
-                return False
-        # Player can't stand on the box's current simulated position
-        if (x, y) == current_box_pos:
-            return False
-        return True
+        Args:
+            box_start: (x, y) of the box to move.
+            player_pos: (x, y) of the player.
+        """
+        level = self.level
+        width, height = level.width, level.height
+        self.box_start = box_start
+        self.player_pos = player_pos
+        self._boxes = tuple(level.boxes)
+        self._reached = {}
+        self._parents = {}
+
+        # Free cells: floor without the other boxes (the moved box is free)
+        free = PlayerDistanceField.wall_grid(level)
+        for i in range(len(free)):
+            free[i] ^= 1
+        for bx, by in self._boxes:
+            if (bx, by) != box_start and 0 <= bx < width and 0 <= by < height:
+                free[by * width + bx] = 0
+
+        def index_of(pos):
+            x, y = pos
+            if 0 <= x < width and 0 <= y < height and free[y * width + x]:
+                return y * width + x
+            return -1
+
+        start, player = index_of(box_start), index_of(player_pos)
+        if start < 0 or player < 0:
+            return
 
-    def _player_path_avoiding_box(self, start, goal, current_box_pos):
-        """BFS path for player, avoiding the box at its current simulated position."""
-        if start == goal:
-            return [start]
+        label = self._label_regions(free, width, start)
+        start_state = (start, label(start, player))
+        self._reached[start] = start_state
+        self._parents[start_state] = None
+        if start_state[1] is None:
+            return  # The player cannot reach the box
 
-        queue = deque([start])
-        visited = {start}
-        parent = {start: None}
+        steps = []
+        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            step = dy * width + dx
+            steps.append(((dx, dy), step, dx))
 
+        queue = deque([start_state])
         while queue:
-            current = queue.popleft()
-            if current == goal:
-                path = []
-                c = current
-                while c is not None:
-                    path.append(c)
-                    c = parent[c]
-                return list(reversed(path))
-
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = current[0] + dx, current[1] + dy
-                npos = (nx, ny)
-                if npos in visited:
-                    continue
-                if not (0 <= nx < self.level.width and 0 <= ny < self.level.height):
+            state = queue.popleft()
+            box, region = state
+            x = box % width
+            for direction, step, dx in steps:
+                # Horizontal pushes need a cell on both sides within the row
+                if dx and not 0 < x < width - 1:
                     continue
-                if self.level.is_wall(nx, ny):
+                target, origin = box + step, box - step
+                if not (0 <= target < len(free) and 0 <= origin < len(free)):
                     continue
-                # Can't walk through the box's current position
-                if npos == current_box_pos:
+                if not free[target] or not free[origin] or label(box, origin) != region:
                     continue
-                # Check other boxes — skip the moved box's original position
-                is_other_box = False
-                for bx, by in self.level.boxes:
-                    if (bx, by) == self._original_box_pos:
-                        continue
-                    if (bx, by) == npos:
-                        is_other_box = True
-                        break
-                if is_other_box:
+                new_state = (target, label(target, box))
+                if new_state in self._parents:
                     continue
-                visited.add(npos)
-                parent[npos] = current
-                queue.append(npos)
+                self._parents[new_state] = (state, direction)
+                self._reached.setdefault(target, new_state)
+                queue.append(new_state)
+
+    def _push_directions(self, box_goal):
+        """Push directions of the planned route to box_goal, or None."""
+        x, y = box_goal
+        width = self.level.width
+        if not (0 <= x < width and 0 <= y < self.level.height):
+            return None
+        state = self._reached.get(y * width + x)
+        if state is None:
+            return None
+        directions = []
+        while self._parents[state] is not None:
+            state, direction = self._parents[state]
+            directions.append(direction)
+        directions.reverse()
+        return directions
 
-            if len(visited) > 500:
-                break
+    @staticmethod
+    def _label_regions(free, width, root):
+        """
+        Label the board around each possible box cell.
 
-        return None
+        Runs an iterative DFS over the free cells connected to root and
+        returns label(box, cell): an id of the region containing cell when
+        the box stands on box, equal for two cells exactly when the player
+        can walk between them, or None if cell is not connected to root.
+        """
+        size = len(free)
+        disc = array('i', [-1]) * size
+        low = array('i', [0]) * size
+        last = array('i', [0]) * size  # Highest discovery time in the subtree
+        children = {}
+
+        def neighbours(index):
+            x = index % width
+            result = []
+            if index >= width and free[index - width]:
+                result.append(index - width)
+            if index + width < size and free[index + width]:
+                result.append(index + width)
+            if x > 0 and free[index - 1]:
+                result.append(index - 1)
+            if x < width - 1 and free[index + 1]:
+                result.append(index + 1)
+            return result
+
+        disc[root] = low[root] = 0
+        timer = 1
+        stack = [(root, -1, iter(neighbours(root)))]
+        while stack:
+            cell, parent, pending = stack[-1]
+            for neighbour in pending:
+                if disc[neighbour] < 0:
+                    disc[neighbour] = low[neighbour] = timer
+                    timer += 1
+                    children.setdefault(cell, []).append(neighbour)
+                    stack.append((neighbour, cell, iter(neighbours(neighbour))))
+                    break
+                if neighbour != parent and disc[neighbour] < low[cell]:
+                    low[cell] = disc[neighbour]
+            else:
+                stack.pop()
+                last[cell] = timer - 1
+                if parent >= 0 and low[cell] < low[parent]:
+                    low[parent] = low[cell]
 
+        def label(box, cell):
+            if disc[cell] < 0 or disc[box] < 0:
+                return None
+            if disc[box] < disc[cell] <= last[box]:
+                # Below the box: cut off unless its subtree climbs above it
+                for child in children[box]:
+                    if disc[child] <= disc[cell] <= last[child]:
+                        return child if low[child] >= disc[box] else -1
+            return -1  # Connected through the parent of the box
 
-class PathNode:
-    """Node for A* pathfinding."""
-    __slots__ = ('x', 'y', 'g_cost', 'h_cost', 'f_cost', 'parent')
+        return label
 
-    def __init__(self, x, y, g_cost, h_cost, parent=None):
-        self.x = x
-        self.y = y
-        self.g_cost = g_cost
-        self.h_cost = h_cost
-        self.f_cost = g_cost + h_cost
-        self.parent = parent
+
+class PlayerDistanceField:
+    """
+    BFS distances and parents from one player position, in flat arrays
+    indexed by y * width + x. Walls and boxes block the player.
+    """
+
+    def __init__(self, level, source, walls=None, boxes=None):
+        """
+        Args:
+            level: The Level object.
+            source: (x, y) the distances are measured from.
+            walls: Optional bytearray of wall flags (1 = wall) in the same
+                   layout, to skip rebuilding it from the level.
+            boxes: Optional box positions to use instead of level.boxes.
+        """
+        width, height = level.width, level.height
+        self.width = width
+        self.height = height
+        self.source = source
+        self.boxes = tuple(level.boxes if boxes is None else boxes)
+
+        size = width * height
+        blocked = bytearray(walls) if walls is not None else self.wall_grid(level)
+        for bx, by in self.boxes:
+            if 0 <= bx < width and 0 <= by < height:
+                blocked[by * width + bx] = 1
+
+        self.distance = array('i', [-1]) * size
+        self.parent = array('i', [-1]) * size
+        self.order = []  # Reached cell indices, nearest first
+
+        sx, sy = source
+        if not (0 <= sx < width and 0 <= sy < height):
+            return
+        start = sy * width + sx
+        distance, parent, order = self.distance, self.parent, self.order
+        distance[start] = 0
+        order.append(start)
+        # The order list doubles as the BFS queue
+        head = 0
+        while head < len(order):
+            index = order[head]
+            head += 1
+            x = index % width
+            next_distance = distance[index] + 1
+            for neighbour, inside in ((index - width, index >= width),
+                                      (index + width, index + width < size),
+                                      (index - 1, x > 0),
+                                      (index + 1, x < width - 1)):
+                if inside and not blocked[neighbour] and distance[neighbour] < 0:
+                    distance[neighbour] = next_distance
+                    parent[neighbour] = index
+                    order.append(neighbour)
+
+    @staticmethod
+    def wall_grid(level):
+        """Flat bytearray with 1 on the wall cells of a level."""
+        return bytearray(1 if level.is_wall(x, y) else 0
+                         for y in range(level.height) for x in range(level.width))
+
+    def matches(self, level, source):
+        """Whether the field is still valid for this source and box layout."""
+        return (source == self.source and level.width == self.width
+                and level.height == self.height and tuple(level.boxes) == self.boxes)
+
+    def distance_to(self, pos):
+        """Number of moves to reach pos, or -1 if unreachable."""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return -1
+        return self.distance[y * self.width + x]
+
+    def path_to(self, pos):
+        """Path from the source to pos (both included), or [] if unreachable."""
+        if self.distance_to(pos) < 0:
+            return []
+        width, parent = self.width, self.parent
+        index = pos[1] * width + pos[0]
+        path = []
+        while index >= 0:
+            path.append((index % width, index // width))
+            index = parent[index]
+        path.reverse()
+        return path
+
+    def closest_to(self, goal):
+        """Reachable cell nearest to goal (Manhattan distance, then moves)."""
+        width = self.width
+        gx, gy = goal
+        best, best_key = self.source, None
+        for index in self.order:
+            x, y = index % width, index // width
+            key = abs(x - gx) + abs(y - gy)
+            if best_key is None or key < best_key:
+                best, best_key = (x, y), key
+        return best
 
 
 class MouseNavigationSystem:
@@ -211,8 +379,9 @@ class MouseNavigationSystem:
         self.player_position = None
         self.level = None
 
-        # Pathfinding
-        self.max_path_length = 100
+        # Pathfinding: distance field of the current player position
+        self._distance_field = None
+        self._walls = None
 
         # Guideline rendering
         self.guideline_color = (255, 255, 255)
@@ -230,6 +399,7 @@ class MouseNavigationSystem:
         self.lifted_box_pos = None
         self.lift_push_path = None
         self.lift_target_pos = None
+        self._push_planner = None  # Push plan of the lifted box
 
     def set_enabled(self, enabled: bool):
         self.enabled = enabled
@@ -237,6 +407,9 @@ class MouseNavigationSystem:
             self.clear_navigation()
 
     def set_level(self, level):
+        if level is not self.level:
+            self._distance_field = None
+            self._walls = None
         self.level = level
         self.player_position = level.player_pos if level else None
 
@@ -254,6 +427,13 @@ class MouseNavigationSystem:
         self.lift_push_path = None
         self.lift_target_pos = None
 
+    @property
+    def is_animating(self) -> bool:
+        """Whether the view changes without input: queued moves or a pulsing lifted box."""
+        if self.movement_queue:
+            return True
+        return self.mouse_mode == MouseMode.BOX_LIFTED and self.lifted_box_pos is not None
+
     # ------------------------------------------------------------------
     # Mouse position update (called every frame)
     # ------------------------------------------------------------------
@@ -287,10 +467,12 @@ class MouseNavigationSystem:
             self._update_lift_preview(grid_pos)
             return grid_pos
 
-        # Only recalculate if target changed and not currently moving
-        if grid_pos != self.target_position and not self.is_moving:
+        # Only recalculate if target or board changed and not currently moving
+        field = self._distance_field
+        board_changed = field is None or not field.matches(self.level, self.player_position)
+        if (grid_pos != self.target_position or board_changed) and not self.is_moving:
             self.target_position = grid_pos
-            # Path from player to cursor (A* avoids walls and boxes)
+            # Path from player to cursor (avoids walls and boxes)
             self.current_path = self._calculate_path(
                 self.player_position, grid_pos
             )
@@ -308,19 +490,12 @@ class MouseNavigationSystem:
             self.current_path = [self.lifted_box_pos] if self.lifted_box_pos else []
             return
 
-        pathfinder = BoxPushPathfinder(self.level, self._calculate_path)
-        push_path = pathfinder.find_push_path(
-            self.lifted_box_pos, target_pos, self.level.player_pos
-        )
-        self.lift_push_path = push_path
-
-        if push_path is not None and len(push_path) > 0:
-            preview = [self.lifted_box_pos]
-            current_box = self.lifted_box_pos
-            for (dx, dy), _ in push_path:
-                current_box = (current_box[0] + dx, current_box[1] + dy)
-                preview.append(current_box)
-            self.current_path = preview
+        # Walks are planned on drop; the preview only needs the box route
+        box_path = self._get_push_planner().box_path(target_pos)
+        self.lift_push_path = box_path
+
+        if box_path is not None:
+            self.current_path = box_path
         else:
             # No valid push path: show only the lifted box (no line through walls)
             self.current_path = [self.lifted_box_pos]
@@ -414,8 +589,7 @@ class MouseNavigationSystem:
             self.lift_push_path = None
             return True
 
-        pathfinder = BoxPushPathfinder(self.level, self._calculate_path)
-        push_path = pathfinder.find_push_path(
+        push_path = self._get_push_planner().find_push_path(
             self.lifted_box_pos, target_pos, self.level.player_pos
         )
 
@@ -488,23 +662,27 @@ class MouseNavigationSystem:
     # ------------------------------------------------------------------
 
     def render_navigation(self, screen: pygame.Surface, map_area_x: int,
-                          map_area_y: int, cell_size: int):
-        """Render guideline and visual feedback."""
+                          map_area_y: int, cell_size: int) -> List[pygame.Rect]:
+        """Render guideline and visual feedback. Returns the screen areas drawn."""
         if not self.enabled or not self.level:
-            return
+            return []
+
+        rects = []
 
         # Lifted box highlight
         if self.mouse_mode == MouseMode.BOX_LIFTED and self.lifted_box_pos:
-            self._render_lifted_box(screen, map_area_x, map_area_y, cell_size)
+            rects.append(self._render_lifted_box(screen, map_area_x, map_area_y, cell_size))
 
         # Guideline
         if self.current_path and len(self.current_path) > 1:
             if self.mouse_mode == MouseMode.BOX_LIFTED:
                 color = (100, 200, 255) if self.lift_push_path is not None else (255, 80, 80)
-                self._render_guideline(screen, map_area_x, map_area_y, cell_size, color)
+                rects.extend(self._render_guideline(screen, map_area_x, map_area_y, cell_size, color))
             else:
-                self._render_guideline(screen, map_area_x, map_area_y, cell_size,
-                                       self.guideline_color)
+                rects.extend(self._render_guideline(screen, map_area_x, map_area_y, cell_size,
+                                                    self.guideline_color))
+
+        return rects
 
     def _render_lifted_box(self, screen, map_area_x, map_area_y, cell_size):
         bx, by = self.lifted_box_pos
@@ -517,12 +695,13 @@ class MouseNavigationSystem:
         highlight = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
         highlight.fill((100, 200, 255, min(alpha, 200)))
         screen.blit(highlight, (sx, sy))
-        pygame.draw.rect(screen, (100, 200, 255), (sx, sy, cell_size, cell_size), 3)
+        return pygame.draw.rect(screen, (100, 200, 255), (sx, sy, cell_size, cell_size), 3)
 
     def _render_guideline(self, screen, map_area_x, map_area_y, cell_size, color):
         if len(self.current_path) < 2:
-            return
+            return []
 
+        rects = []
         screen_points = []
         for x, y in self.current_path:
             sx = map_area_x + x * cell_size + cell_size // 2
@@ -533,19 +712,21 @@ class MouseNavigationSystem:
             start_pos = screen_points[i]
             end_pos = screen_points[i + 1]
             try:
-                pygame.draw.aaline(screen, color, start_pos, end_pos, self.guideline_width)
+                rects.append(pygame.draw.aaline(screen, color, start_pos, end_pos, self.guideline_width))
             except Exception:
-                pygame.draw.line(screen, color, start_pos, end_pos, self.guideline_width)
+                rects.append(pygame.draw.line(screen, color, start_pos, end_pos, self.guideline_width))
 
             if i == len(screen_points) - 2:
-                self._draw_arrow(screen, start_pos, end_pos, color)
+                rects.extend(self._draw_arrow(screen, start_pos, end_pos, color))
+
+        return rects
 
     def _draw_arrow(self, surface, start, end, color):
         dx = end[0] - start[0]
         dy = end[1] - start[1]
         length = math.sqrt(dx * dx + dy * dy)
         if length == 0:
-            return
+            return []
 
         dx /= length
         dy /= length
@@ -558,100 +739,52 @@ class MouseNavigationSystem:
         ax2 = end[0] - arrow_length * (dx * math.cos(-angle) - dy * math.sin(-angle))
         ay2 = end[1] - arrow_length * (dy * math.cos(-angle) + dx * math.sin(-angle))
 
-        pygame.draw.line(surface, color, end, (int(ax1), int(ay1)), 3)
-        pygame.draw.line(surface, color, end, (int(ax2), int(ay2)), 3)
+        return [pygame.draw.line(surface, color, end, (int(ax1), int(ay1)), 3),
+                pygame.draw.line(surface, color, end, (int(ax2), int(ay2)), 3)]
 
     # ------------------------------------------------------------------
-    # A* Pathfinding
+    # Pathfinding
     # ------------------------------------------------------------------
 
     def _calculate_path(self, start: Tuple[int, int],
                         goal: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """A* pathfinding from start to goal, avoiding walls and boxes."""
+        """
+        Shortest path from start to goal, avoiding walls and boxes.
+
+        If goal is unreachable, the path leads to the reachable cell closest
+        to it. Returns [] when there is nowhere to go.
+        """
         if not start or not goal or start == goal:
             return []
 
-        counter = 0
-        open_set = []
-        closed_set = set()
-
-        start_node = PathNode(start[0], start[1], 0, self._heuristic(start, goal))
-        heapq.heappush(open_set, (start_node.f_cost, counter, start_node))
-        counter += 1
-        nodes_dict = {start: start_node}
-
-        while open_set:
-            _, _, current = heapq.heappop(open_set)
-            current_pos = (current.x, current.y)
-
-            if current_pos in closed_set:
-                continue
-            closed_set.add(current_pos)
-
-            if current_pos == goal:
-                return self._reconstruct_path(current)
-
-            if len(closed_set) > self.max_path_length:
-                break
+        field = self._get_distance_field(start)
+        path = field.path_to(goal)
+        if path:
+            return path
 
-            for ddx, ddy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = current.x + ddx, current.y + ddy
-                npos = (nx, ny)
-
-                if npos in closed_set or not self._is_valid_position(nx, ny):
-                    continue
-
-                g_cost = current.g_cost + 1
-                h_cost = self._heuristic(npos, goal)
-
-                if npos in nodes_dict:
-                    if g_cost < nodes_dict[npos].g_cost:
-                        node = PathNode(nx, ny, g_cost, h_cost, current)
-                        nodes_dict[npos] = node
-                        heapq.heappush(open_set, (node.f_cost, counter, node))
-                        counter += 1
-                else:
-                    node = PathNode(nx, ny, g_cost, h_cost, current)
-                    nodes_dict[npos] = node
-                    heapq.heappush(open_set, (node.f_cost, counter, node))
-                    counter += 1
-
-        return self._find_closest_reachable_path(start, goal)
-
-    def _find_closest_reachable_path(self, start, goal):
-        """BFS fallback: find path to closest reachable position to goal."""
-        queue = deque([start])
-        visited = {start}
-        parent_map = {start: None}
-        closest_pos = start
-        closest_dist = self._heuristic(start, goal)
-
-        while queue:
-            current = queue.popleft()
-            dist = self._heuristic(current, goal)
-            if dist < closest_dist:
-                closest_dist = dist
-                closest_pos = current
-
-            for ddx, ddy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = current[0] + ddx, current[1] + ddy
-                npos = (nx, ny)
-                if npos not in visited and self._is_valid_position(nx, ny):
-                    visited.add(npos)
-                    parent_map[npos] = current
-                    queue.append(npos)
-                    if len(visited) > self.max_path_length:
-                        break
-
-        if closest_pos == start:
+        closest = field.closest_to(goal)
+        if closest == start:
             return []
-
-        path = []
-        c = closest_pos
-        while c is not None:
-            path.append(c)
-            c = parent_map[c]
-        return list(reversed(path))
+        return field.path_to(closest)
+
+    def _get_push_planner(self):
+        """Push plan of the lifted box, made once per lift and board position."""
+        planner = self._push_planner
+        if planner is None or planner.level is not self.level:
+            planner = self._push_planner = BoxPushPathfinder(self.level)
+        if not planner.matches(self.lifted_box_pos, self.level.player_pos):
+            planner.plan(self.lifted_box_pos, self.level.player_pos)
+        return planner
+
+    def _get_distance_field(self, source):
+        """Distance field from source, rebuilt only if the source or a box moved."""
+        field = self._distance_field
+        if field is None or not field.matches(self.level, source):
+            if self._walls is None or len(self._walls) != self.level.width * self.level.height:
+                self._walls = PlayerDistanceField.wall_grid(self.level)
+            field = PlayerDistanceField(self.level, source, self._walls)
+            self._distance_field = field
+        return field
 
     def _is_valid_position(self, x, y):
         """Position is in bounds, not wall, not box."""
@@ -659,17 +792,6 @@ class MouseNavigationSystem:
             return False
         return not self.level.is_wall(x, y) and not self.level.is_box(x, y)
 
-    @staticmethod
-    def _heuristic(pos1, pos2):
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-
-    def _reconstruct_path(self, node):
-        path = []
-        while node:
-            path.append((node.x, node.y))
-            node = node.parent
-        return list(reversed(path))
-
     def _path_to_movements(self, path: List[Tuple[int, int]]) -> List[str]:
         """Convert path coordinates to direction strings."""
         if len(path) < 2:
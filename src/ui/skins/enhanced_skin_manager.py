@@ -14,6 +14,7 @@ import os
 import pygame
 from src.core.constants import WALL, FLOOR, PLAYER, BOX, TARGET, PLAYER_ON_TARGET, BOX_ON_TARGET, CELL_SIZE
 from src.core.config_manager import get_config_manager
+from src.ui.skins.sprite_cache import get_sprite_cache
 
 class EnhancedSkinManager:
     """
@@ -507,6 +508,8 @@ class EnhancedSkinManager:
     def set_tile_size(self, size):
         """Set the tile size and reload skins."""
         if size in self.available_tile_sizes:
+            # Skins are reloaded from disk: drop their previously scaled sprites
+            get_sprite_cache().invalidate(self.current_skin)
             self.tile_size = size
             # Save to configuration
             self.config_manager.set_skin_config(self.current_skin, self.tile_size)
@@ -880,6 +883,54 @@ class EnhancedSkinManager:
             return self.layers[layer_name]
         return {}
 
+    def get_scaled_skin(self, size):
+        """
+        Get the current skin sprites scaled to a pixel size.
+
+        Sprites come from the shared sprite cache: they are scaled and converted
+        to the display format once per skin and size, not on every frame.
+
+        Args:
+            size (int): Width and height of a cell in pixels.
+
+        Returns:
+            dict: Dictionary containing all skin sprites at the requested size.
+        """
+        return get_sprite_cache().get_all(self._cache_key(), self.get_skin(), size)
+
+    def get_scaled_layer(self, layer_name, size):
+        """
+        Get the sprites of a layer scaled to a pixel size.
+
+        Args:
+            layer_name (str): Name of the layer ('background' or 'foreground').
+            size (int): Width and height of a cell in pixels.
+
+        Returns:
+            dict: Dictionary containing the layer sprites at the requested size.
+        """
+        return get_sprite_cache().get_all(self._cache_key() + (layer_name,),
+                                          self.get_layer(layer_name), size)
+
+    def get_scaled_sprite(self, sprite, size):
+        """
+        Get any sprite of the current skin (e.g. a player frame) scaled to a pixel size.
+
+        Such sprites have no stable name, so they are cached per surface object.
+
+        Args:
+            sprite (pygame.Surface): Sprite returned by this skin manager.
+            size (int): Width and height in pixels.
+
+        Returns:
+            pygame.Surface: The scaled sprite.
+        """
+        return get_sprite_cache().get(self._cache_key(), None, sprite, size)
+
+    def _cache_key(self):
+        """Key identifying the loaded sprites of the current skin in the sprite cache."""
+        return (self.current_skin, self.tile_size)
+
     def get_background(self):
         """Get the background image if available."""
         return self.background
@@ -0,0 +1,149 @@
+"""
+Shared sprite cache for the Sokoban game.
+
+Every view that draws a level (game renderer, editor map, level preview,
+selector hover preview) needs the skin sprites at some pixel size. Scaling
+them on every frame, and blitting surfaces that are not in the display pixel
+format, dominates rendering time. This module keeps one process-wide cache of
+scaled, display-format sprites keyed by (skin, sprite key, pixel size), so a
+sprite is scaled and converted once per skin, zoom or window size change.
+"""
+
+import threading
+from collections import OrderedDict
+
+import pygame
+
+
+class SpriteCache:
+    """
+    LRU cache of scaled sprites in the display pixel format.
+
+    Sprites are identified by (skin key, sprite key): two skin managers that
+    loaded the same skin at the same tile size share their scaled sprites.
+    Sprites that have no stable name within a skin (animation frames, for
+    instance) are keyed by the source surface itself; the entry keeps a
+    reference to that surface, so its id cannot be reused while cached.
+
+    The cache is thread-safe: thumbnails are rendered from a background thread.
+    """
+
+    def __init__(self, max_entries=2048):
+        """
+        Initialize the sprite cache.
+
+        Args:
+            max_entries (int): Maximum number of scaled sprites kept.
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, skin_key, sprite_key, surface, size):
+        """
+        Get a sprite scaled to a square pixel size.
+
+        Args:
+            skin_key: Identifier of the skin the sprite belongs to.
+            sprite_key: Identifier of the sprite within the skin, or None to
+                key by the source surface object.
+            surface (pygame.Surface): Source sprite.
+            size (int): Target width and height in pixels.
+
+        Returns:
+            pygame.Surface: The scaled sprite, converted to the display format when possible.
+        """
+        if sprite_key is None:
+            sprite_key = ('surface', id(surface))
+        key = (skin_key, sprite_key, size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            self.misses += 1
+            scaled = surface
+            if surface.get_size() != (size, size):
+                scaled = pygame.transform.scale(surface, (size, size))
+            scaled = self._to_display_format(scaled)
+
+            self._entries[key] = (surface, scaled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return scaled
+
+    def get_all(self, skin_key, sprites, size):
+        """
+        Scale a whole sprite dictionary.
+
+        Args:
+            skin_key: Identifier of the skin the sprites belong to.
+            sprites (dict): Sprite key to source surface.
+            size (int): Target width and height in pixels.
+
+        Returns:
+            dict: Sprite key to scaled surface.
+        """
+        return {key: self.get(skin_key, key, surface, size) for key, surface in sprites.items()}
+
+    def invalidate(self, skin_name=None):
+        """
+        Drop cached sprites, e.g. after a skin's files changed on disk.
+
+        Args:
+            skin_name: Only drop the sprites of this skin, whatever the tile size
+                or layer. Defaults to all skins.
+        """
+        with self._lock:
+            if skin_name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0][0] == skin_name]:
+                del self._entries[key]
+
+    def get_statistics(self):
+        """
+        Get cache counters.
+
+        Returns:
+            dict: Hits, misses, hit ratio and number of cached sprites.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+        }
+
+    @staticmethod
+    def _to_display_format(surface):
+        """Convert a surface to the display pixel format, keeping per-pixel alpha."""
+        if pygame.display.get_surface() is None:
+            # No video mode yet (headless tools, early startup): keep as is
+            return surface
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+
+# Global sprite cache instance
+_sprite_cache = None
+
+
+def get_sprite_cache():
+    """
+    Get the global sprite cache instance.
+
+    Returns:
+        SpriteCache: The shared sprite cache.
+    """
+    global _sprite_cache
+    if _sprite_cache is None:
+        _sprite_cache = SpriteCache()
+    return _sprite_cache
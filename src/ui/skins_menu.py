@@ -12,6 +12,7 @@ import os
 import pygame
 from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
 from src.ui.skins.custom_skin_importer import CustomSkinImporter
+from src.ui.skins.sprite_cache import get_sprite_cache
 from src.core.constants import WALL, FLOOR, PLAYER, BOX, TARGET, TITLE
 
 class SkinsMenu:
@@ -219,6 +220,9 @@ class SkinsMenu:
             imported_skin_name = self.skin_importer.import_skin(current_tile_size)
             
             if imported_skin_name:
+                # An import may overwrite a skin: drop its previously scaled sprites
+                get_sprite_cache().invalidate(imported_skin_name)
+
                 # Refresh the available skins
                 self._refresh_skins()
                 
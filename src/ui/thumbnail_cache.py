@@ -0,0 +1,325 @@
+"""
+Level thumbnail cache for the Sokoban game.
+
+The level selector hover preview and the level preview popup draw a
+miniature of a level. Parsing the collection file and drawing the level
+cell by cell on every frame makes the menus stutter on large collections.
+This module renders each level once into a small surface and keeps it:
+
+- in an in-memory LRU, for the current session;
+- on disk as a PNG, keyed by the level file modification time, the level
+  index, the skin and the requested size, for the next sessions.
+
+Thumbnails for the visible page of the selector are generated by a
+background thread, so scrolling stays at full frame rate.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from src.core.background_worker import BackgroundWorker
+from src.core.level import Level
+from src.level_management.level_library import get_level_library
+
+
+# Default on-disk thumbnail directory (data/thumbnails at the project root)
+DEFAULT_THUMBNAIL_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'data', 'thumbnails'
+)
+
+# Color of cells whose character has no sprite in the skin
+FALLBACK_CELL_COLOR = (220, 220, 220)
+GRID_COLOR = (180, 180, 180)
+
+
+class ThumbnailCache:
+    """
+    Renders level thumbnails once and caches them in memory and on disk.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_THUMBNAIL_DIR, max_entries=256, use_disk=True):
+        """
+        Initialize the thumbnail cache.
+
+        Args:
+            cache_dir (str): Directory of the on-disk PNG cache.
+            max_entries (int): Maximum number of thumbnails kept in memory.
+            use_disk (bool): Whether to read and write the on-disk cache.
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.use_disk = use_disk
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Thumbnails produced by the worker, converted on first use by the main thread
+        self._ready = {}
+
+        self._worker = BackgroundWorker(self._build_queued, name="thumbnail-cache",
+                                        error_message="Error building thumbnail")
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+
+    def get(self, skin_manager, level_file, level_index, max_width, max_height,
+            max_cell=20, show_grid=False, wait=True):
+        """
+        Get the thumbnail of a level.
+
+        The cell size is the largest that fits the level in the requested
+        area, capped at max_cell pixels.
+
+        Args:
+            skin_manager: Skin manager providing the sprites.
+            level_file (str): Path to the level or collection file.
+            level_index (int): Index of the level in the collection, or -1 for a single level file.
+            max_width (int): Maximum thumbnail width in pixels.
+            max_height (int): Maximum thumbnail height in pixels.
+            max_cell (int): Maximum cell size in pixels.
+            show_grid (bool): Whether to draw cell borders.
+            wait (bool): Render the thumbnail now if it is not cached yet.
+                Otherwise return None and let the background thread build it.
+
+        Returns:
+            pygame.Surface: The thumbnail, or None if it is not available.
+        """
+        key = self._make_key(skin_manager, level_file, level_index,
+                             max_width, max_height, max_cell, show_grid)
+        if key is None:
+            return None
+
+        with self._lock:
+            surface = self._entries.get(key)
+            if surface is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return surface
+            surface = self._ready.pop(key, None)
+
+        if surface is None:
+            if not wait:
+                self._enqueue([(skin_manager, level_file, level_index, max_width,
+                                max_height, max_cell, show_grid)], reset=False)
+                return None
+            surface = self._build(key, skin_manager, level_file, level_index,
+                                  max_width, max_height, max_cell, show_grid)
+            if surface is None:
+                return None
+
+        surface = self._to_display_format(surface)
+        self._store(key, surface)
+        return surface
+
+    def prefetch(self, skin_manager, levels, max_width, max_height, max_cell=20, show_grid=False):
+        """
+        Build thumbnails in the background thread.
+
+        Pending requests from an earlier call are dropped: only the last
+        requested page is generated.
+
+        Args:
+            skin_manager: Skin manager providing the sprites.
+            levels: Iterable of (level_file, level_index) pairs.
+            max_width (int): Maximum thumbnail width in pixels.
+            max_height (int): Maximum thumbnail height in pixels.
+            max_cell (int): Maximum cell size in pixels.
+            show_grid (bool): Whether to draw cell borders.
+        """
+        self._enqueue([(skin_manager, level_file, level_index, max_width, max_height, max_cell, show_grid)
+                       for level_file, level_index in levels], reset=True)
+
+    def wait_idle(self):
+        """Wait until the background thread has processed all queued requests."""
+        self._worker.wait_idle()
+
+    def load_level(self, level_file, level_index):
+        """
+        Load a level, reading only its block through the shared level index.
+
+        Args:
+            level_file (str): Path to the level or collection file.
+            level_index (int): Index of the level in the collection, or -1 for a single level file.
+
+        Returns:
+            Level: The loaded level.
+        """
+        if level_index < 0:
+            return Level(level_file=level_file)
+
+        _, level = get_level_library().get_collection(level_file).get_level(level_index)
+        return level
+
+    def get_statistics(self):
+        """
+        Get cache counters.
+
+        Returns:
+            dict: Memory hits, disk hits, renders and cached thumbnails.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'renders': self.renders,
+                'entries': len(self._entries),
+            }
+
+    def clear(self):
+        """Drop the in-memory thumbnails (the on-disk cache is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._ready.clear()
+
+    def _make_key(self, skin_manager, level_file, level_index,
+                  max_width, max_height, max_cell, show_grid):
+        """Build the cache key of a thumbnail, or None if the file is missing."""
+        try:
+            stat = os.stat(level_file)
+        except OSError:
+            return None
+        return (os.path.abspath(level_file), stat.st_mtime_ns, stat.st_size, level_index,
+                skin_manager.get_current_skin_name(), skin_manager.get_current_tile_size(),
+                max_width, max_height, max_cell, bool(show_grid))
+
+    def _disk_path(self, key):
+        """Path of the PNG file caching a thumbnail."""
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + '.png')
+
+    def _build(self, key, skin_manager, level_file, level_index,
+               max_width, max_height, max_cell, show_grid):
+        """
+        Load a thumbnail from disk or render it. Safe to call from the worker thread.
+
+        Returns:
+            pygame.Surface: The thumbnail, not yet in the display format, or None on error.
+        """
+        path = self._disk_path(key)
+        if self.use_disk and os.path.exists(path):
+            try:
+                surface = pygame.image.load(path)
+                with self._lock:
+                    self.disk_hits += 1
+                return surface
+            except pygame.error:
+                pass
+
+        try:
+            level = self.load_level(level_file, level_index)
+        except Exception as e:
+            print(f"Error loading level for thumbnail: {e}")
+            return None
+
+        surface = self.render(level, skin_manager, max_width, max_height, max_cell, show_grid)
+        with self._lock:
+            self.renders += 1
+
+        if self.use_disk:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temp_path = f"{path}.{threading.get_ident()}.tmp.png"
+                pygame.image.save(surface, temp_path)
+                os.replace(temp_path, path)
+            except (OSError, pygame.error) as e:
+                print(f"Warning: Could not save thumbnail: {e}")
+        return surface
+
+    @staticmethod
+    def render(level, skin_manager, max_width, max_height, max_cell=20, show_grid=False):
+        """
+        Render a level into a new thumbnail surface.
+
+        The tiles come scaled from the shared sprite cache, like in the game
+        and editor views.
+
+        Args:
+            level (Level): Level to render, in its current state.
+            skin_manager: Skin manager providing the scaled sprites.
+            max_width (int): Maximum thumbnail width in pixels.
+            max_height (int): Maximum thumbnail height in pixels.
+            max_cell (int): Maximum cell size in pixels.
+            show_grid (bool): Whether to draw cell borders.
+
+        Returns:
+            pygame.Surface: Transparent surface of level.width x level.height cells.
+        """
+        cell_size = max(0, min(max_width // max(1, level.width),
+                               max_height // max(1, level.height), max_cell))
+        surface = pygame.Surface((level.width * cell_size, level.height * cell_size), pygame.SRCALPHA)
+        if cell_size == 0:
+            return surface
+
+        scaled = skin_manager.get_scaled_skin(cell_size)
+        for y in range(level.height):
+            for x in range(level.width):
+                sprite = scaled.get(level.get_display_char(x, y))
+                cell_rect = (x * cell_size, y * cell_size, cell_size, cell_size)
+                if sprite is not None:
+                    surface.blit(sprite, cell_rect)
+                else:
+                    surface.fill(FALLBACK_CELL_COLOR, cell_rect)
+
+                if show_grid and cell_size > 8:
+                    pygame.draw.rect(surface, GRID_COLOR, cell_rect, 1)
+        return surface
+
+    def _store(self, key, surface):
+        """Insert a thumbnail in the in-memory LRU."""
+        with self._lock:
+            self._entries[key] = surface
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _enqueue(self, requests, reset):
+        """Queue thumbnail requests for the worker thread."""
+        if reset:
+            self._worker.cancel()
+        for request in requests:
+            self._worker.submit(request)
+
+    def _build_queued(self, request, generation):
+        """Worker thread: build a queued thumbnail."""
+        key = self._make_key(*request)
+        if key is None:
+            return
+        with self._lock:
+            if key in self._entries or key in self._ready:
+                return
+        surface = self._build(key, *request)
+        if surface is not None:
+            with self._lock:
+                self._ready[key] = surface
+                # Drop the oldest unused thumbnails
+                while len(self._ready) > self.max_entries:
+                    del self._ready[next(iter(self._ready))]
+
+    @staticmethod
+    def _to_display_format(surface):
+        """Convert a thumbnail to the display pixel format, keeping its transparency."""
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
+
+
+# Global thumbnail cache instance
+_thumbnail_cache = None
+
+
+def get_thumbnail_cache():
+    """
+    Get the global thumbnail cache instance.
+
+    Returns:
+        ThumbnailCache: The shared thumbnail cache.
+    """
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache
@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.level_management import level_library
+
+
+@pytest.fixture(autouse=True)
+def isolated_level_library(tmp_path, monkeypatch):
+    """Keep the shared level library index out of the repository's data/ directory."""
+    library = level_library.LevelLibrary(cache_path=str(tmp_path / 'level_index.json'))
+    monkeypatch.setattr(level_library, '_level_library', library)
+    return library
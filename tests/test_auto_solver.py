@@ -83,3 +83,26 @@ class TestAutoSolver:
         info = solver.get_solution_info()
         assert info is not None
         assert 'moves' in info or 'move_count' in info or isinstance(info, dict)
+
+    def test_background_optimization(self, simple):
+        solver = AutoSolver(simple, optimize=True)
+        assert solver.solve_level()
+        solver.wait_for_optimization()
+        stats = solver.optimization_stats
+        assert stats['verified']
+        assert stats['optimized_pushes'] <= stats['original_pushes']
+        assert len(solver.optimized_solution) <= len(solver.solution)
+        assert solver.get_solution_info()['optimization'] is stats
+
+    def test_optimization_disabled(self, trivial):
+        solver = AutoSolver(trivial, optimize=False)
+        assert solver.solve_level()
+        solver.wait_for_optimization()
+        assert solver.optimization_stats is None
+
+    def test_optimization_off_by_default(self, trivial):
+        solver = AutoSolver(trivial)
+        assert solver.solve_level()
+        assert solver._optimizer is None
+        assert solver.optimization_stats is None
+
@@ -0,0 +1,66 @@
+"""Tests for BackgroundWorker: ordered jobs, generations and shutdown."""
+
+import threading
+
+from src.core.background_worker import BackgroundWorker
+
+
+class TestBackgroundWorker:
+
+    def test_jobs_run_in_order(self):
+        done = []
+        worker = BackgroundWorker(lambda job, generation: done.append(job), name="test-worker")
+        for job in range(5):
+            worker.submit(job)
+        worker.wait_idle()
+        assert done == [0, 1, 2, 3, 4]
+        assert worker.pending() == 0
+
+    def test_replace_drops_pending_jobs(self):
+        started, release = threading.Event(), threading.Event()
+        done = []
+
+        def handler(job, generation):
+            if job == 'blocking':
+                started.set()
+                release.wait(5)
+            done.append((job, worker.is_current(generation)))
+
+        worker = BackgroundWorker(handler, name="test-worker")
+        worker.submit('blocking')
+        started.wait(5)
+        worker.submit('stale')
+        worker.submit('latest', replace=True)
+        release.set()
+        worker.wait_idle()
+        assert done == [('blocking', False), ('latest', True)]
+
+    def test_error_does_not_stop_the_worker(self, capsys):
+        done = []
+
+        def handler(job, generation):
+            if job is None:
+                raise ValueError("bad job")
+            done.append(job)
+
+        worker = BackgroundWorker(handler, name="test-worker", error_message="Error in test job")
+        worker.submit(None)
+        worker.submit(1)
+        worker.wait_idle()
+        assert done == [1]
+        assert "Error in test job: bad job" in capsys.readouterr().out
+
+    def test_stop_ends_thread_and_submit_restarts_it(self):
+        done = []
+        worker = BackgroundWorker(lambda job, generation: done.append(job), name="test-worker")
+        worker.submit(1)
+        worker.wait_idle()
+        thread = worker._thread
+        worker.stop()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+        worker.submit(2)
+        worker.wait_idle()
+        assert done == [1, 2]
+        worker.stop()
@@ -0,0 +1,103 @@
+"""Tests for the headless batch solve tool."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOL = os.path.join(ROOT, "tools", "batch_solve.py")
+
+COLLECTION = (
+    "Title: Small\n"
+    "\n"
+    "######\n"
+    "#    #\n"
+    "# @$ #\n"
+    "#  . #\n"
+    "######\n"
+    "Title: One\n"
+    "\n"
+    "########\n"
+    "#  .   #\n"
+    "# @$$ .#\n"
+    "#   ## #\n"
+    "########\n"
+    "Title: Two\n"
+)
+
+
+@pytest.fixture(scope="module")
+def batch_solve():
+    spec = importlib.util.spec_from_file_location("batch_solve", TOOL)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that the worker processes can unpickle its functions
+    sys.modules["batch_solve"] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules["batch_solve"]
+
+
+@pytest.fixture
+def collection(tmp_path):
+    path = tmp_path / "Small.txt"
+    path.write_text(COLLECTION, encoding="utf-8")
+    return path
+
+
+def test_moves_are_converted_to_verified_lurd(batch_solve):
+    text = "#####\n#@$.#\n#####"
+    assert batch_solve.coups_en_lurd(text, ["RIGHT"]) == "R"
+    assert batch_solve.coups_en_lurd(text, ["LEFT"]) is None
+    assert batch_solve.rejouer_lurd(text, "R")
+    assert not batch_solve.rejouer_lurd(text, "lR")
+
+
+def test_solutions_round_trip(batch_solve, tmp_path):
+    path = str(tmp_path / "Small.sok")
+    batch_solve.ecrire_solutions(path, "Small", {2: ("Two", "drURR"), 1: ("1", "urD")})
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert "Level 2\nTitle: Two\nSolution (5/3)\ndrURR\n" in text
+    assert batch_solve.lire_solutions(path) == {1: "urD", 2: "drURR"}
+
+
+def test_collections_are_found_by_glob_and_directory(batch_solve, collection):
+    (collection.parent / "Notes.sok").write_text("", encoding="utf-8")
+    expected = [str(collection)]
+    assert batch_solve.trouver_collections([str(collection.parent / "*.txt")]) == expected
+    assert batch_solve.trouver_collections([str(collection.parent)]) == expected
+    assert batch_solve.trouver_collections(["Original & Extra"])[0].endswith("Original.txt")
+
+
+def test_batch_writes_solutions_and_resumes(batch_solve, collection, capsys):
+    assert batch_solve.main([str(collection), "--solveur", "interne", "--workers", "2"]) == 0
+    solutions = batch_solve.lire_solutions(str(collection.with_suffix(".sok")))
+    assert sorted(solutions) == [1, 2]
+    assert "résolus et vérifiés : 2/2" in capsys.readouterr().out
+
+    # A verified solution is kept, a broken one is solved again
+    batch_solve.ecrire_solutions(str(collection.with_suffix(".sok")), "Small",
+                                 {1: ("One", solutions[1]), 2: ("Two", "dr")})
+    assert batch_solve.main([str(collection), "--solveur", "interne"]) == 0
+    out = capsys.readouterr().out
+    assert "2 niveaux, 1 déjà résolus, 1 à résoudre" in out
+    assert batch_solve.lire_solutions(str(collection.with_suffix(".sok"))) == solutions
+
+
+def test_tool_does_not_import_pygame(collection):
+    code = (
+        "import importlib.util, sys\n"
+        f"spec = importlib.util.spec_from_file_location('batch_solve', {TOOL!r})\n"
+        "module = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(module)\n"
+        f"assert module.main([{str(collection)!r}, '--solveur', 'interne']) == 0\n"
+        "print('pygame' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                            text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "False"
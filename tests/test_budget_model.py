@@ -0,0 +1,152 @@
+"""Tests for the learned solver budgets and their use by AlgorithmSelector."""
+
+import random
+
+import pytest
+from src.core.level import Level
+from src.ai.algorithm_selector import AlgorithmSelector, Algorithm, SOLVER_LIMITS
+from src.ai.budget_model import (
+    BudgetModel, SolveRecord, SolveTelemetryLog, FEATURE_NAMES, extract_features,
+)
+from src.ai.telemetry_sink import TelemetrySink
+
+
+SIMPLE_LEVEL = (
+    "######\n"
+    "#    #\n"
+    "# @$ #\n"
+    "#  . #\n"
+    "######"
+)
+
+
+def _synthetic_records(count=60, seed=0):
+    """BFS succeeds cheaply on easy levels only; A* succeeds everywhere at a higher cost."""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        hardness = rng.random()
+        features = {name: hardness * (i + 1) for i, name in enumerate(FEATURE_NAMES)}
+        records.append(SolveRecord(features, Algorithm.BFS.value,
+                                   states=int(100 * 10 ** (2 * hardness)),
+                                   time=0.01 * 10 ** (2 * hardness),
+                                   success=hardness < 0.5))
+        records.append(SolveRecord(features, Algorithm.ASTAR.value,
+                                   states=int(500 * 10 ** hardness),
+                                   time=0.05 * 10 ** hardness,
+                                   success=True))
+    return records
+
+
+def _features(hardness):
+    return {name: hardness * (i + 1) for i, name in enumerate(FEATURE_NAMES)}
+
+
+class TestBudgetModel:
+
+    def test_untrained_without_enough_data(self):
+        model = BudgetModel().fit(_synthetic_records(count=2))
+        assert not model.is_trained
+        assert model.best(_features(0.1)) is None
+
+    def test_prefers_cheap_algorithm_when_it_succeeds(self):
+        model = BudgetModel().fit(_synthetic_records())
+        assert model.best(_features(0.05)).algorithm == Algorithm.BFS.value
+        assert model.best(_features(0.95)).algorithm == Algorithm.ASTAR.value
+
+    def test_cost_prediction_tracks_data(self):
+        model = BudgetModel().fit(_synthetic_records())
+        astar = {p.algorithm: p for p in model.predict(_features(0.5))}[Algorithm.ASTAR.value]
+        assert astar.predicted_states == pytest.approx(500 * 10 ** 0.5, rel=0.2)
+        max_states, time_limit = model.budget_for(astar)
+        assert max_states > astar.predicted_states
+        assert time_limit >= 1.0
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = str(tmp_path / "model.json")
+        model = BudgetModel().fit(_synthetic_records())
+        model.save(path)
+        loaded = BudgetModel.load(path)
+        assert loaded.best(_features(0.05)).algorithm == Algorithm.BFS.value
+        assert BudgetModel.load(str(tmp_path / "missing.json")) is None
+
+    def test_telemetry_log_round_trip(self, tmp_path):
+        log = SolveTelemetryLog(str(tmp_path / "telemetry.jsonl"))
+        records = _synthetic_records(count=3)
+        for record in records:
+            log.append(record)
+        with open(log.path, 'a') as f:
+            f.write('{"truncated": ')
+        assert log.load() == records
+
+
+class TestSelectorBudgets:
+
+    def test_falls_back_to_rules_without_model(self):
+        selector = AlgorithmSelector(budget_model=BudgetModel())
+        plan = selector.plan_budget(Level(level_data=SIMPLE_LEVEL))
+        assert plan.source == 'rules'
+        assert (plan.max_states, plan.time_limit) == SOLVER_LIMITS[plan.algorithm]
+
+    def test_uses_learned_budget(self):
+        level = Level(level_data=SIMPLE_LEVEL)
+        features = extract_features(level)
+        records = [SolveRecord(features, Algorithm.ASTAR.value, states=200 + i, time=0.1, success=True)
+                   for i in range(10)]
+        selector = AlgorithmSelector(budget_model=BudgetModel().fit(records))
+
+        plan = selector.plan_budget(level)
+        assert plan.source == 'model'
+        assert plan.algorithm == Algorithm.ASTAR
+        assert plan.predicted_states == pytest.approx(204.5, rel=0.05)
+        assert plan.max_states < SOLVER_LIMITS[Algorithm.ASTAR][0]
+
+    def test_record_outcome_reports_and_logs(self, tmp_path):
+        level = Level(level_data=SIMPLE_LEVEL)
+        log = SolveTelemetryLog(str(tmp_path / "telemetry.jsonl"))
+        selector = AlgorithmSelector(budget_model=BudgetModel(), telemetry=log)
+        plan = selector.plan_budget(level)
+
+        report = selector.record_outcome(level, plan, states=42, solve_time=0.5, success=True)
+        assert report['actual_states'] == 42
+        assert report['predicted_states'] is None
+        assert list(selector.cost_reports) == [report]
+
+        [record] = log.load()
+        assert record.algorithm == plan.algorithm.value
+        assert record.states == 42
+        assert set(record.features) == set(FEATURE_NAMES)
+
+    def test_cost_reports_are_bounded(self, monkeypatch):
+        from src.ai import algorithm_selector
+        monkeypatch.setattr(algorithm_selector, 'COST_REPORT_HISTORY', 3)
+        level = Level(level_data=SIMPLE_LEVEL)
+        selector = AlgorithmSelector(budget_model=BudgetModel())
+        plan = selector.plan_budget(level)
+        for states in range(5):
+            selector.record_outcome(level, plan, states=states, solve_time=0.1, success=True)
+        assert [report['actual_states'] for report in selector.cost_reports] == [2, 3, 4]
+
+    def test_shares_the_rotated_solve_journal(self, tmp_path):
+        sink = TelemetrySink(str(tmp_path / "solves.jsonl"), max_bytes=2000, backups=1)
+        sink.record({'algorithm': 'BFS', 'success': True})
+        log = SolveTelemetryLog(sink=sink)
+        records = _synthetic_records(count=20)
+        for record in records:
+            log.append(record)
+        # The journal rotates and keeps a bounded history of whole records
+        assert len(sink.files()) == 2
+        loaded = log.load()
+        assert 0 < len(loaded) < len(records)
+        assert loaded == records[-len(loaded):]
+
+    def test_unwritable_telemetry_does_not_fail_the_solve(self, tmp_path, capsys):
+        level = Level(level_data=SIMPLE_LEVEL)
+        # The log path is a directory: every append fails with an OSError
+        selector = AlgorithmSelector(budget_model=BudgetModel(),
+                                     telemetry=SolveTelemetryLog(str(tmp_path)))
+        plan = selector.plan_budget(level)
+
+        report = selector.record_outcome(level, plan, states=42, solve_time=0.5, success=True)
+        assert report['success']
+        assert "non écrite" in capsys.readouterr().out
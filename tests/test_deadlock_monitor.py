@@ -0,0 +1,131 @@
+"""Tests for DeadlockMonitor: local push checks and background analysis."""
+
+import pytest
+from src.core.level import Level
+from src.core.deadlock_detector import DeadlockDetector
+from src.core.deadlock_monitor import DeadlockMonitor
+
+
+LEVEL_DATA = (
+    "#######\n"
+    "#     #\n"
+    "# $ . #\n"
+    "#@    #\n"
+    "#######"
+)
+
+TWO_BOX_LEVEL = (
+    "#######\n"
+    "#  .. #\n"
+    "# $$  #\n"
+    "#@    #\n"
+    "#######"
+)
+
+SQUARE_LEVEL = (
+    "#########\n"
+    "#   ..  #\n"
+    "#  $$   #\n"
+    "# $ $.. #\n"
+    "#@      #\n"
+    "#########"
+)
+
+
+@pytest.fixture
+def level():
+    return Level(level_data=LEVEL_DATA)
+
+
+@pytest.fixture
+def results():
+    return []
+
+
+def push(level, dx, dy):
+    """Push and return the new position of the pushed box."""
+    x, y = level.player_pos
+    assert level.is_box(x + dx, y + dy)
+    assert level.move(dx, dy)
+    return (x + 2 * dx, y + 2 * dy)
+
+
+class TestLocalChecks:
+
+    def test_dead_square(self, level, results):
+        monitor = DeadlockMonitor(level, on_result=results.append)
+        level.move(1, 0)
+        assert monitor.notify_push(push(level, 0, -1))
+        # Found on the UI thread: no background analysis needed
+        monitor.wait_idle()
+        assert results == []
+
+    def test_blocked_square(self):
+        level = Level(level_data=SQUARE_LEVEL)
+        monitor = DeadlockMonitor(level)
+        level.move(0, -1)
+        box = push(level, 1, 0)
+        assert not monitor._dead[box[1] * level.width + box[0]]
+        assert monitor.notify_push(box)
+
+    def test_live_push_is_not_local_deadlock(self, level):
+        monitor = DeadlockMonitor(level)
+        level.move(0, -1)
+        assert not monitor.notify_push(push(level, 1, 0))
+
+
+class TestBackgroundAnalysis:
+
+    def test_result_posted(self, level, results):
+        monitor = DeadlockMonitor(level, on_result=results.append)
+        level.move(0, -1)
+        monitor.notify_push(push(level, 1, 0))
+        monitor.wait_idle()
+        assert results == [{'deadlock': False, 'boxes': ((3, 2),), 'player_pos': (2, 2)}]
+        assert monitor.accept(results[0])
+        assert monitor.full_checks == 1
+
+    def test_matches_detector(self):
+        level = Level(level_data=TWO_BOX_LEVEL)
+        results = []
+        monitor = DeadlockMonitor(level, on_result=results.append)
+        level.move(1, 0)
+        level.move(1, 0)
+        monitor.notify_push(push(level, 0, -1))
+        monitor.wait_idle()
+        assert results[-1]['deadlock'] == DeadlockDetector(level).is_deadlock()
+
+    def test_stale_after_undo(self, level, results):
+        monitor = DeadlockMonitor(level, on_result=results.append)
+        level.move(0, -1)
+        monitor.notify_push(push(level, 1, 0))
+        monitor.wait_idle()
+        level.undo()
+        assert not monitor.accept(results[0])
+
+    def test_stop_drops_results(self, level, results):
+        monitor = DeadlockMonitor(level, on_result=results.append)
+        monitor.stop()
+        level.move(0, -1)
+        monitor.notify_push(push(level, 1, 0))
+        monitor.wait_idle()
+        assert results == []
+
+    def test_stop_ends_worker_thread(self, level, results):
+        monitor = DeadlockMonitor(level, on_result=results.append)
+        level.move(0, -1)
+        monitor.notify_push(push(level, 1, 0))
+        monitor.wait_idle()
+        worker = monitor._worker._thread
+        assert worker.is_alive()
+        monitor.stop()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+    def test_worker_does_not_touch_level(self, level):
+        monitor = DeadlockMonitor(level)
+        level.move(0, -1)
+        monitor.notify_push(push(level, 1, 0))
+        monitor.wait_idle()
+        assert len(level.history) == 2
+        assert level.player_pos == (2, 2)
@@ -0,0 +1,154 @@
+"""Tests for the push engine and the search-effort difficulty estimator."""
+
+import os
+
+import pytest
+from src.core.level import Level
+from src.level_management.level_collection_parser import LevelCollectionParser
+from src.ai import difficulty_estimator
+from src.ai.algorithm_selector import AlgorithmSelector
+from src.ai.budget_model import BudgetModel
+from src.ai.push_engine import PushEngine
+from src.ai.difficulty_estimator import DifficultyEstimator, effective_branching_factor
+
+
+TRIVIAL_LEVEL = (
+    "#####\n"
+    "#@$.#\n"
+    "#####"
+)
+
+TWO_BOX_LEVEL = (
+    "#######\n"
+    "#     #\n"
+    "# $ $ #\n"
+    "#  @  #\n"
+    "# . . #\n"
+    "#######"
+)
+
+# The box sits in a corner without target: no push sequence can succeed
+DEAD_LEVEL = (
+    "#####\n"
+    "#$  #\n"
+    "# @.#\n"
+    "#####"
+)
+
+# The box in the doorway fences off the upper room: a PI-corral
+CORRAL_LEVEL = (
+    "########\n"
+    "#  .   #\n"
+    "#      #\n"
+    "####$###\n"
+    "#@   $.#\n"
+    "########"
+)
+
+ORIGINAL_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'src', 'levels', 'Original & Extra', 'Original.txt')
+
+
+def _replay(level_data, moves):
+    level = Level(level_data=level_data)
+    deltas = {'UP': (0, -1), 'DOWN': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+    for move in moves:
+        assert level.move(*deltas[move])
+    return level
+
+
+class TestPushEngine:
+
+    def test_dead_squares_are_corners_without_targets(self):
+        engine = PushEngine(Level(level_data=DEAD_LEVEL))
+        assert engine.index(1, 1) in engine.dead_squares
+        assert engine.index(3, 2) not in engine.dead_squares
+
+    def test_search_solves_and_expands_to_valid_moves(self):
+        engine = PushEngine(Level(level_data=TWO_BOX_LEVEL))
+        result = engine.search()
+        assert result.solved
+        assert len(result.pushes) == 4
+        moves = engine.pushes_to_moves(result.pushes)
+        assert _replay(TWO_BOX_LEVEL, moves).is_completed()
+
+    def test_pi_corral_restricts_pushes_to_barrier(self):
+        engine = PushEngine(Level(level_data=CORRAL_LEVEL))
+        boxes = engine.initial_boxes
+        reachable = engine.reachable(engine.initial_player, boxes)
+        pushes = engine.legal_pushes(reachable, boxes)
+        assert len(pushes) == 2
+        assert engine.corral_restriction(reachable, boxes, pushes) == [(engine.index(4, 3), 0)]
+
+        result = engine.search()
+        assert result.solved
+        assert result.stats.corral_prunes > 0
+
+    def test_unsolvable_level_is_exhausted(self):
+        result = PushEngine(Level(level_data=DEAD_LEVEL)).search()
+        assert not result.solved
+        assert result.exhausted
+
+
+class TestDifficultyEstimator:
+
+    def test_effective_branching_factor(self):
+        # 2 + 4 + 8 = 14 nodes at depth 3 -> b* = 2
+        assert effective_branching_factor(14, 3) == pytest.approx(2.0, rel=1e-6)
+        assert effective_branching_factor(0, 3) == 0.0
+
+    def test_branching_factor_at_real_depths(self):
+        # b*^depth is far beyond the float range; only its logarithm is used
+        b = effective_branching_factor(10 ** 9, 500)
+        assert 1.0 < b < 1.1
+        assert effective_branching_factor(7000, 88) == pytest.approx(1.0725, abs=1e-4)
+
+    def test_unsolved_probe_on_original_level(self):
+        _, level = LevelCollectionParser.parse_file(ORIGINAL_FILE).get_level(0)
+        report = DifficultyEstimator(max_nodes=3000).estimate(level)
+        assert not report.effort.solved
+        assert report.effort.effective_branching_factor > 1.0
+        assert report.effort.nodes_expanded * 2 <= report.estimated_nodes <= 1e12
+        assert 0.0 < report.score <= 100.0
+
+    def test_trivial_level_records_effort(self):
+        report = DifficultyEstimator().estimate(Level(level_data=TRIVIAL_LEVEL))
+        assert report.effort.solved
+        assert report.effort.solution_pushes == 1
+        assert report.effort.nodes_expanded >= 1
+        assert 0.0 <= report.score < 25
+        assert report.category == "Simple"
+
+    def test_harder_level_scores_higher(self):
+        estimator = DifficultyEstimator()
+        trivial = estimator.estimate(Level(level_data=TRIVIAL_LEVEL))
+        harder = estimator.estimate(Level(level_data=TWO_BOX_LEVEL))
+        assert harder.effort.nodes_expanded > trivial.effort.nodes_expanded
+        assert harder.score > trivial.score
+
+    def test_unsolvable_level(self):
+        report = DifficultyEstimator().estimate(Level(level_data=DEAD_LEVEL))
+        assert report.effort.exhausted
+        assert report.category == "Unsolvable"
+
+    def test_reports_are_cached_per_level(self):
+        estimator = DifficultyEstimator()
+        first = estimator.estimate(Level(level_data=TWO_BOX_LEVEL))
+        second = estimator.estimate(Level(level_data=TWO_BOX_LEVEL))
+        assert second is first
+        assert estimator.cache_hits == 1
+        assert estimator.cache_misses == 1
+
+    def test_recommendation_does_not_run_the_probe(self, monkeypatch):
+        estimator = DifficultyEstimator()
+        monkeypatch.setattr(difficulty_estimator, '_difficulty_estimator', estimator)
+        level = Level(level_data=TWO_BOX_LEVEL)
+        # Untrained: a learned budget would probe the level for its features
+        selector = AlgorithmSelector(budget_model=BudgetModel())
+
+        assert selector.get_algorithm_recommendation(level)['difficulty'] is None
+        assert estimator.cache_misses == 0
+
+        report = estimator.estimate(level)
+        assert selector.get_algorithm_recommendation(level)['difficulty'] == report.to_dict()
+        assert estimator.cache_misses == 1
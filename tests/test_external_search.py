@@ -0,0 +1,80 @@
+"""Tests for the memory-bounded search that spills its frontier to disk."""
+
+import numpy as np
+import pytest
+from src.core.level import Level
+from src.ai.algorithm_selector import Algorithm
+from src.ai.enhanced_sokolution_solver import EnhancedSokolutionSolver
+from src.ai.external_search import ExternalMemorySearch
+
+
+TWO_BOX_LEVEL = (
+    "#######\n"
+    "#     #\n"
+    "# $ $ #\n"
+    "#  @  #\n"
+    "# . . #\n"
+    "#######"
+)
+
+# The box sits in a corner without target: the search must exhaust
+DEAD_LEVEL = (
+    "#####\n"
+    "#$  #\n"
+    "# @.#\n"
+    "#####"
+)
+
+_DELTAS = {'UP': (0, -1), 'DOWN': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+
+
+def _replay(level_data, moves):
+    level = Level(level_data=level_data)
+    for move in moves:
+        assert level.move(*_DELTAS[move])
+    return level
+
+
+class TestExternalMemorySearch:
+
+    @pytest.mark.parametrize('algorithm', [Algorithm.ASTAR, Algorithm.GREEDY])
+    def test_solves_with_spilled_frontier(self, algorithm, tmp_path):
+        solver = EnhancedSokolutionSolver(Level(level_data=TWO_BOX_LEVEL),
+                                          memory_limit_mb=0.001, spill_dir=str(tmp_path))
+        result = solver.solve(algorithm)
+
+        assert result is not None
+        assert _replay(TWO_BOX_LEVEL, result.moves).is_completed()
+        stats = solver.get_comprehensive_statistics()['external_memory']
+        assert stats['spilled_records'] > 0
+        assert stats['peak_memory_records'] <= stats['max_memory_records'] + 1
+        # Temporary runs are removed once the search is over
+        assert list(tmp_path.iterdir()) == []
+
+    def test_astar_matches_in_memory_solution_length(self):
+        in_memory = EnhancedSokolutionSolver(Level(level_data=TWO_BOX_LEVEL)).solve(Algorithm.ASTAR)
+        external = EnhancedSokolutionSolver(Level(level_data=TWO_BOX_LEVEL),
+                                            memory_limit_mb=0.001).solve(Algorithm.ASTAR)
+        assert len(external.moves) == len(in_memory.moves)
+
+    def test_exhausts_unsolvable_level(self):
+        solver = EnhancedSokolutionSolver(Level(level_data=DEAD_LEVEL), memory_limit_mb=0.001)
+        assert solver.solve(Algorithm.ASTAR) is None
+        assert solver.get_comprehensive_statistics()['external_memory']['closed_records'] > 0
+
+    def test_key_round_trip_with_zero_cells(self):
+        solver = EnhancedSokolutionSolver(Level(level_data=TWO_BOX_LEVEL))
+        search = ExternalMemorySearch(solver)
+        boxes = frozenset({(0, 0), (2, 2)})
+        key = search.encode((0, 0), boxes)
+        stored = np.array([(key, 0, 0)], dtype=search.dtype)
+        assert search.decode(stored['key'].tolist()[0]) == ((0, 0), boxes)
+
+    def test_unique_keeps_lowest_cost(self):
+        solver = EnhancedSokolutionSolver(Level(level_data=TWO_BOX_LEVEL))
+        search = ExternalMemorySearch(solver)
+        a = search.encode((1, 1), frozenset({(2, 2), (4, 2)}))
+        b = search.encode((2, 1), frozenset({(2, 2), (4, 2)}))
+        records = np.array([(a, 7, 0), (b, 3, 1), (a, 2, 2)], dtype=search.dtype)
+        unique = search._unique(records)
+        assert sorted(zip(unique['key'].tolist(), unique['g'].tolist())) == sorted([(a, 2), (b, 3)])
@@ -122,3 +122,69 @@ class TestNavigation:
         undos = manager.jump_to_choice_point(choice_level, 0)
         assert undos == 2
         assert choice_level.moves == 1
+
+
+class TestPushLevelChoicePoints:
+
+    def test_walking_creates_no_choice_points(self, choice_level, manager):
+        """Only the first state of a box configuration is a choice point."""
+        for dx, dy in [(1, 0), (0, 1), (-1, 0), (-1, 0)]:
+            assert choice_level.move(dx, dy)
+            manager.record_move(choice_level, was_push=False)
+        assert manager.choice_points == [0]
+
+    def test_push_starts_new_configuration(self, choice_level, manager):
+        choice_level.move(0, 1)
+        manager.record_move(choice_level, was_push=False)
+        choice_level.move(1, 0)
+        manager.record_move(choice_level, was_push=False)
+        choice_level.move(0, -1)
+        manager.record_move(choice_level, was_push=False)
+        choice_level.move(0, -1)  # push box (3,2) to (3,1)
+        manager.record_move(choice_level, was_push=True)
+        choice_level.move(1, 0)
+        manager.record_move(choice_level, was_push=False)
+        assert manager.choice_points == [0, 4]
+
+    def test_region_cached_between_pushes(self, choice_level, manager, monkeypatch):
+        calls = []
+        compute = GameHistoryManager._compute_pushes
+        monkeypatch.setattr(GameHistoryManager, '_compute_pushes',
+                            staticmethod(lambda *args: calls.append(1) or compute(*args)))
+        for position in [(2, 3), (1, 3), (1, 4)]:
+            manager.count_reachable_pushes(choice_level, position, choice_level.boxes)
+        assert len(calls) == 1
+        # A push changes the boxes: the region is computed again
+        manager.count_reachable_pushes(choice_level, (2, 3), [(2, 1), (3, 2)])
+        assert len(calls) == 2
+
+    def test_reachable_pushes(self, choice_level, corridor_level, manager):
+        # Two boxes side by side in an open room: each can be pushed up and
+        # down, but not sideways into the other one
+        assert manager.count_reachable_pushes(
+            choice_level, choice_level.player_pos, choice_level.boxes) == 4
+        assert manager.count_reachable_pushes(
+            corridor_level, corridor_level.player_pos, corridor_level.boxes) == 1
+
+    def test_jump_matches_repeated_undo(self, choice_level, manager):
+        other = Level(level_data=CHOICE_LEVEL)
+        for dx, dy in [(0, 1), (1, 0), (0, -1), (0, -1), (1, 0), (0, 1)]:
+            pushes = choice_level.pushes
+            for level in (choice_level, other):
+                assert level.move(dx, dy)
+            manager.record_move(choice_level, was_push=choice_level.pushes > pushes)
+        assert manager.choice_points == [0, 4]
+
+        undos = manager.jump_to_choice_point(choice_level, 0)
+        assert undos == 5
+        for _ in range(undos):
+            other.undo()
+
+        assert choice_level.player_pos == other.player_pos
+        assert choice_level.boxes == other.boxes
+        assert (choice_level.moves, choice_level.pushes) == (other.moves, other.pushes)
+        assert choice_level.redo_stack == other.redo_stack
+        while choice_level.redo():
+            other.redo()
+        assert choice_level.state_key() == other.state_key()
+        assert choice_level.moves == 6
@@ -0,0 +1,169 @@
+"""Tests for the incremental game view of GUIRenderer."""
+
+import os
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.core.level import Level
+from src.renderers.gui_renderer import GUIRenderer
+from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
+
+
+LEVEL = (
+    "#######\n"
+    "#     #\n"
+    "# @$ .#\n"
+    "#     #\n"
+    "#######"
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    """Initialize pygame with the dummy video driver."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def presented(monkeypatch):
+    """Record the display updates issued by the renderer."""
+    calls = []
+    monkeypatch.setattr(pygame.display, 'flip', lambda: calls.append(None))
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: calls.append(list(rects)))
+    return calls
+
+
+@pytest.fixture
+def renderer():
+    return GUIRenderer()
+
+
+@pytest.fixture
+def skin_manager():
+    return EnhancedSkinManager()
+
+
+class TestIncrementalRendering:
+
+    def test_first_frame_is_presented_whole(self, renderer, skin_manager, presented):
+        renderer.render_level(Level(level_data=LEVEL), skin_manager=skin_manager)
+        assert presented == [None]
+        assert renderer.full_updates == 1
+
+    def test_static_layer_is_reused(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        renderer.render_level(level, skin_manager=skin_manager)
+        layer = renderer._static_layer
+        renderer.render_level(level, skin_manager=skin_manager)
+
+        assert renderer._static_layer is layer
+        # Nothing changed: nothing is pushed to the display
+        assert presented == [None]
+        assert renderer.partial_updates == 1
+
+    def test_move_updates_only_changed_cells(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        renderer.render_level(level, skin_manager=skin_manager)
+        cell = renderer._static_layer.key[4]
+        assert level.move(1, 0)
+        renderer.render_level(level, skin_manager=skin_manager)
+
+        rects = presented[-1]
+        # Player and box cells, plus the moves/pushes counters
+        cell_rects = [rect for rect in rects if rect.width == cell + 2]
+        assert len(cell_rects) == 3
+        screen_width = renderer.screen.get_width()
+        assert sum(rect.width == screen_width for rect in rects) == 1
+
+    def test_incremental_frame_matches_full_redraw(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        renderer.render_level(level, skin_manager=skin_manager, show_grid=True)
+        level.move(1, 0)
+        level.move(0, 1)
+        renderer.render_level(level, skin_manager=skin_manager, show_grid=True)
+        incremental = pygame.image.tobytes(renderer.screen, 'RGB')
+
+        renderer.invalidate()
+        renderer._static_layer = None
+        renderer.render_level(level, skin_manager=skin_manager, show_grid=True)
+        assert pygame.image.tobytes(renderer.screen, 'RGB') == incremental
+        assert presented[-1] is None
+
+    def test_new_level_rebuilds_static_layer(self, renderer, skin_manager, presented):
+        renderer.render_level(Level(level_data=LEVEL), skin_manager=skin_manager)
+        layer = renderer._static_layer
+        renderer.render_level(Level(level_data=LEVEL), skin_manager=skin_manager)
+        assert renderer._static_layer is not layer
+        assert presented == [None, None]
+
+    def test_frame_time_counter(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        for _ in range(3):
+            renderer.render_level(level, skin_manager=skin_manager)
+        stats = renderer.get_frame_time_stats()
+        assert stats['frames'] == 3
+        assert stats['average_ms'] > 0
+        assert stats['full_updates'] + stats['partial_updates'] == 3
+
+    def test_fonts_are_cached(self, renderer):
+        assert renderer._get_font(24) is renderer._get_font(24)
+
+    def test_scrolled_highlight_is_updated_where_it_is_drawn(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        scroll = 20
+        renderer.render_level(level, skin_manager=skin_manager, scroll_x=scroll)
+        key = renderer._static_layer.key
+        cell, offset_x, offset_y = key[4], key[5], key[6]
+
+        # The map origin already includes the scroll; the highlight adds it again
+        mouse = (int(offset_x) + scroll + 2 * cell + 1, int(offset_y) + 2 * cell + 1)
+        renderer.render_level(level, skin_manager=skin_manager, scroll_x=scroll, mouse_pos=mouse)
+        assert renderer.highlight_system.current_highlight_pos == (2, 2)
+        drawn = pygame.Rect(int(offset_x + scroll + 2 * cell), int(offset_y + 2 * cell), cell, cell)
+        assert drawn.inflate(2, 2) in presented[-1]
+
+        renderer.render_level(level, skin_manager=skin_manager, scroll_x=scroll)
+        assert drawn.inflate(2, 2) in presented[-1]
+
+
+class TestSinglePresent:
+
+    def test_composed_frame_is_presented_once(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        renderer.render_level(level, skin_manager=skin_manager, present=False)
+        assert presented == []
+        renderer.present()
+        assert presented == [None]
+        assert renderer.get_frame_time_stats()['frames'] == 1
+
+    def test_overlay_rects_join_the_level_update(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        renderer.render_level(level, skin_manager=skin_manager)
+        level.move(1, 0)
+        renderer.render_level(level, skin_manager=skin_manager, present=False)
+        overlay = pygame.Rect(0, 0, 40, 20)
+        renderer.present(extra_rects=[overlay])
+
+        assert len(presented) == 2
+        assert overlay in presented[-1]
+        assert len(presented[-1]) > 1
+
+    def test_full_present_after_overlay(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        renderer.render_level(level, skin_manager=skin_manager)
+        renderer.render_level(level, skin_manager=skin_manager, present=False)
+        renderer.present(full=True)
+        assert presented == [None, None]
+        assert renderer.full_updates == 2
+
+    def test_full_screens_invalidate_the_game_view(self, renderer, skin_manager, presented):
+        level = Level(level_data=LEVEL)
+        renderer.render_level(level, skin_manager=skin_manager)
+        renderer.render_help()
+        renderer.render_level(level, skin_manager=skin_manager)
+        assert presented == [None, None, None]
@@ -0,0 +1,64 @@
+"""Import budget of the headless solver path, measured with python -X importtime."""
+
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a script needs to parse, solve and check levels without a display
+HEADLESS_MODULES = (
+    'src.core.level',
+    'src.core.deadlock_detector',
+    'src.level_management.level_collection_parser',
+    'src.ai.festival_solver',
+    'src.ai.enhanced_sokolution_solver',
+    'src.core.auto_solver',
+)
+
+# Importing pygame alone takes about 300 ms; the headless path takes about 100 ms
+IMPORT_BUDGET_MS = 250
+
+
+def _import_times(modules):
+    """Run a fresh interpreter and return {module: cumulative microseconds}."""
+    code = "import " + ", ".join(modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        # One space after the separator, then two more per nesting level
+        times[name[1:].rstrip()] = int(cumulative)
+    return times
+
+
+def test_headless_path_does_not_import_pygame_or_numpy():
+    names = {name.strip() for name in _import_times(HEADLESS_MODULES)}
+    assert not {name for name in names if name.split('.')[0] in ('pygame', 'numpy')}
+    assert 'src.ai.visual_ai_solver' not in names
+    assert 'src.ai.unified_ai_controller' not in names
+
+
+def test_headless_path_import_budget():
+    times = _import_times(HEADLESS_MODULES)
+    # Top-level entries are not indented; their cumulative times add up to the total
+    total_us = sum(us for name, us in times.items() if not name.startswith(" "))
+    assert total_us / 1000 < IMPORT_BUDGET_MS, sorted(times.items(), key=lambda item: -item[1])[:10]
+
+
+def test_package_exports_are_loaded_on_access():
+    code = ("import sys, src.ai\n"
+            "assert 'src.ai.unified_ai_controller' not in sys.modules\n"
+            "from src.ai import Algorithm, UnifiedAIController\n"
+            "assert 'src.ai.unified_ai_controller' in sys.modules\n"
+            "assert 'pygame' not in sys.modules\n"
+            "print(src.ai.VisualAISolver.__name__)\n")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                            text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "VisualAISolver"
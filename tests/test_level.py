@@ -329,3 +329,64 @@ class TestDisplay:
         state = level.get_state_string(show_fess_coordinates=False)
         assert '@' in state
         assert '$' in state
+
+
+# ---------------------------------------------------------------------------
+# Grid and counters kept in sync with the public lists
+# ---------------------------------------------------------------------------
+
+class TestGridSync:
+
+    def test_box_list_edits(self, level):
+        level.boxes.append((2, 3))
+        assert level.is_box(2, 3)
+        level.boxes.remove((2, 3))
+        assert not level.is_box(2, 3)
+        level.boxes[0] = (3, 1)
+        assert level.is_box(3, 1) and not level.is_box(1, 2)
+        assert level.get_display_char(3, 1) == '*'
+
+    def test_target_list_edits(self, level):
+        level.targets.append((2, 3))
+        assert level.is_target(2, 3)
+        level.targets.remove((2, 3))
+        assert not level.is_target(2, 3)
+
+    def test_map_cell_edits(self, level):
+        level.map_data[3][2] = '#'
+        assert level.is_wall(2, 3)
+        assert level.get_display_char(2, 3) == '#'
+        level.map_data[3][2] = ' '
+        assert not level.is_wall(2, 3)
+
+    def test_assigning_lists(self):
+        lvl = Level(level_data=TWO_BOX_LEVEL)
+        lvl.boxes = [(4, 1), (4, 2)]
+        assert lvl.is_completed()
+        lvl.targets = [(4, 1)]
+        assert not lvl.is_completed()
+        lvl.map_data = [list(row) for row in lvl.map_data]
+        assert lvl.is_wall(0, 0)
+        assert not lvl.is_wall(1, 1)
+
+    def test_completion_counter_follows_moves_and_undo(self, push_level):
+        push_level.move(1, 0)
+        assert push_level.is_completed()
+        push_level.undo()
+        assert not push_level.is_completed()
+        push_level.redo()
+        assert push_level.is_completed()
+
+    def test_copies_are_independent(self, level):
+        import copy
+        clone = copy.deepcopy(level)
+        clone.boxes.append((2, 3))
+        assert clone.is_box(2, 3)
+        assert not level.is_box(2, 3)
+        assert type(level.boxes.copy()) is list
+
+    def test_out_of_bounds(self, level):
+        assert level.is_wall(-1, 0)
+        assert level.is_wall(level.width, 0)
+        assert not level.is_box(-1, 0)
+        assert not level.is_target(99, 99)
@@ -0,0 +1,119 @@
+"""Tests for the lazy, persisted level library index."""
+
+import os
+import pytest
+
+from src.level_management.level_collection_parser import LevelCollectionParser
+from src.level_management.level_library import LevelLibrary
+from src.level_management.level_manager import LevelManager
+
+
+LEVELS_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'levels')
+ORIGINAL_FILE = os.path.join(LEVELS_DIR, 'Original & Extra', 'Original.txt')
+
+COLLECTION = """Title: Test collection
+Author: Tester
+
+; Level 1
+#####
+#@$.#
+#####
+Title: First
+
+; Level 2
+######
+#@ $.#
+# $. #
+######
+Title: Second
+"""
+
+
+@pytest.fixture
+def collection_file(tmp_path):
+    path = tmp_path / "collection.txt"
+    path.write_text(COLLECTION)
+    return str(path)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "level_index.json")
+
+
+class TestLevelLibrary:
+
+    def test_index_entries(self, collection_file):
+        collection = LevelLibrary(cache_path=None).get_collection(collection_file)
+        assert collection.title == "Test collection"
+        assert collection.author == "Tester"
+        assert collection.get_level_count() == 2
+        entry = collection.get_entry(1)
+        assert (entry.title, entry.width, entry.height, entry.boxes) == ("Second", 6, 4, 2)
+
+    def test_levels_are_read_on_demand(self, collection_file):
+        collection = LevelLibrary(cache_path=None).get_collection(collection_file)
+        title, level = collection.get_level(1)
+        assert title == "Second"
+        assert level.title == "Second"
+        assert len(level.boxes) == 2
+        # Each call returns a fresh level
+        assert collection.get_level(1)[1] is not level
+
+    def test_index_is_persisted(self, collection_file, cache_path):
+        LevelLibrary(cache_path=cache_path).get_collection(collection_file)
+        assert os.path.exists(cache_path)
+
+        library = LevelLibrary(cache_path=cache_path)
+        assert library.get_collection(collection_file).get_level_count() == 2
+        assert library.files_indexed == 0
+
+    def test_modified_file_is_indexed_again(self, collection_file, cache_path):
+        LevelLibrary(cache_path=cache_path).get_collection(collection_file)
+        with open(collection_file, 'a') as f:
+            f.write("\n#####\n#@*.#\n#####\nTitle: Third\n")
+
+        library = LevelLibrary(cache_path=cache_path)
+        collection = library.get_collection(collection_file)
+        assert library.files_indexed == 1
+        assert collection.get_level_title(2) == "Third"
+
+    def test_crlf_file(self, tmp_path):
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(COLLECTION.replace('\n', '\r\n').encode('utf-8'))
+        _, level = LevelLibrary(cache_path=None).get_collection(str(path)).get_level(0)
+        assert level.width == 5
+        assert level.player_pos == (1, 1)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            LevelLibrary(cache_path=None).get_collection(str(tmp_path / "missing.txt"))
+
+
+@pytest.mark.skipif(not os.path.isfile(ORIGINAL_FILE), reason="Level files not found")
+class TestLevelLibraryMatchesParser:
+
+    def test_original_collection(self):
+        expected = LevelCollectionParser.parse_file(ORIGINAL_FILE)
+        collection = LevelLibrary(cache_path=None).get_collection(ORIGINAL_FILE)
+        assert collection.get_level_count() == 90
+
+        for i in range(collection.get_level_count()):
+            expected_title, expected_level = expected.get_level(i)
+            title, level = collection.get_level(i)
+            assert title == expected_title
+            assert level.map_data == expected_level.map_data
+            assert level.boxes == expected_level.boxes
+            assert level.player_pos == expected_level.player_pos
+            assert collection.get_entry(i).boxes == len(expected_level.boxes)
+
+    def test_level_manager_uses_library(self, cache_path):
+        library = LevelLibrary(cache_path=cache_path)
+        manager = LevelManager(LEVELS_DIR, library=library)
+        assert manager.current_level is not None
+        assert os.path.abspath(ORIGINAL_FILE) in {os.path.abspath(p) for p in manager.level_collections}
+
+        # A second start reads no level file
+        other = LevelLibrary(cache_path=cache_path)
+        LevelManager(LEVELS_DIR, library=other)
+        assert other.files_indexed == 0
@@ -1,8 +1,14 @@
 """Tests for level collection parsing and LevelManager."""
 
+import io
+import mmap
 import os
 import pytest
 from src.core.level import Level
+from src.level_management.enhanced_level_collection_parser import (
+    EnhancedLevelCollection,
+    EnhancedLevelCollectionParser
+)
 from src.level_management.level_collection_parser import LevelCollectionParser
 from src.level_management.level_manager import LevelManager
 
@@ -47,6 +53,68 @@ class TestLevelCollectionParser:
         assert len(level.boxes) == len(level.targets)
 
 
+# ---------------------------------------------------------------------------
+# Streaming Parser
+# ---------------------------------------------------------------------------
+
+@pytest.mark.skipif(not has_levels(), reason="Level files not found")
+class TestStreamingParser:
+
+    def test_matches_parse_file(self):
+        collection = EnhancedLevelCollectionParser.parse_file(ORIGINAL_FILE)
+        streamed = list(EnhancedLevelCollectionParser.iter_levels(ORIGINAL_FILE))
+        assert len(streamed) == collection.get_level_count()
+        for (metadata, text), (expected_metadata, level) in zip(streamed, collection.levels):
+            assert metadata.to_dict() == expected_metadata.to_dict()
+            assert Level(level_data=text).map_data == level.map_data
+
+    def test_count_levels(self):
+        info = EnhancedLevelCollection()
+        assert EnhancedLevelCollectionParser.count_levels(ORIGINAL_FILE, info) == 90
+        assert info.title == EnhancedLevelCollectionParser.parse_file(ORIGINAL_FILE).title
+
+    def test_iter_range(self):
+        streamed = list(EnhancedLevelCollectionParser.iter_levels(ORIGINAL_FILE))
+        ranged = list(EnhancedLevelCollectionParser.iter_range(ORIGINAL_FILE, 40, 45))
+        assert [text for _, text in ranged] == [text for _, text in streamed[40:45]]
+        assert [m.title for m, _ in ranged] == [m.title for m, _ in streamed[40:45]]
+        assert len(list(EnhancedLevelCollectionParser.iter_range(ORIGINAL_FILE, 88))) == 2
+
+    def test_file_handles_and_mmap(self):
+        expected = [text for _, text in EnhancedLevelCollectionParser.iter_levels(ORIGINAL_FILE)]
+        with open(ORIGINAL_FILE, 'rb') as file:
+            assert [text for _, text in EnhancedLevelCollectionParser.iter_levels(file)] == expected
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                assert [text for _, text in EnhancedLevelCollectionParser.iter_levels(mapped)] == expected
+        with open(ORIGINAL_FILE, 'r', encoding='utf-8') as file:
+            assert [text for _, text in EnhancedLevelCollectionParser.iter_levels(file)] == expected
+
+    def test_scan_offsets(self):
+        with open(ORIGINAL_FILE, 'rb') as file:
+            data = file.read()
+        for _, level_lines, start, end in EnhancedLevelCollectionParser.scan(ORIGINAL_FILE):
+            block = data[start:end].decode('utf-8').replace('\r\n', '\n').split('\n')
+            assert [line.rstrip() for line in block] == level_lines
+
+
+class TestStreamingParserFormats:
+
+    def test_levels_separated_by_blank_lines(self):
+        content = "#####\n#@$.#\n#####\n\n######\n#@ $.#\n######\nTitle: Second\n"
+        streamed = list(EnhancedLevelCollectionParser.iter_levels(io.StringIO(content)))
+        assert [text for _, text in streamed] == ["#####\n#@$.#\n#####", "######\n#@ $.#\n######"]
+        assert [m.title for m, _ in streamed] == ["", "Second"]
+
+    def test_large_collection_stops_early(self):
+        content = "".join(f"; {i}\n#####\n#@$.#\n#####\nTitle: L{i}\n\n" for i in range(1000))
+        source = io.StringIO(content)
+        ranged = list(EnhancedLevelCollectionParser.iter_range(source, 2, 4))
+        assert [m.title for m, _ in ranged] == ["L2", "L3"]
+        # Reading stopped after the last requested level
+        assert source.tell() < len(content) // 10
+        assert EnhancedLevelCollectionParser.count_levels(io.StringIO(content)) == 1000
+
+
 # ---------------------------------------------------------------------------
 # Level Manager
 # ---------------------------------------------------------------------------
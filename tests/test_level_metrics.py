@@ -0,0 +1,152 @@
+"""Tests for LevelMetrics: vectorized structural counts, incremental updates, caching."""
+
+import random
+
+import pytest
+from src.core.constants import WALL, FLOOR
+from src.core.level import Level
+from src.ai.difficulty_estimator import DifficultyEstimator
+from src.generation.level_metrics import LevelMetrics, StructuralAnalysis
+from src.generation.level_solver import SokobanSolver
+
+
+ROOM_LEVEL = (
+    "#######\n"
+    "#     #\n"
+    "# $.$ #\n"
+    "# .@. #\n"
+    "# $.$ #\n"
+    "#     #\n"
+    "#######"
+)
+
+CORRIDOR_LEVEL = (
+    "  #####\n"
+    "###   #\n"
+    "#.@$  #\n"
+    "### $.#\n"
+    "#.##$ #\n"
+    "# # . ##\n"
+    "#$ *$$.#\n"
+    "#   .  #\n"
+    "########"
+)
+
+
+def _reference_counts(level):
+    """Per-cell reference implementation of the structural counts."""
+    counts = {'walls': 0, 'floors': 0, 'playable_area': 0,
+              'corners': 0, 'corridors': 0, 'open_spaces': 0, 'dead_ends': 0}
+    for y in range(level.height):
+        for x in range(level.width):
+            if level.is_wall(x, y):
+                counts['walls'] += 1
+            else:
+                counts['playable_area'] += 1
+            if level.get_cell(x, y) == FLOOR:
+                counts['floors'] += 1
+    for y in range(1, level.height - 1):
+        for x in range(1, level.width - 1):
+            if level.is_wall(x, y):
+                continue
+            w, e = level.is_wall(x - 1, y), level.is_wall(x + 1, y)
+            n, s = level.is_wall(x, y - 1), level.is_wall(x, y + 1)
+            adjacent = w + e + n + s
+            counts['corners'] += adjacent >= 2
+            counts['corridors'] += (w and e and not n and not s) or (n and s and not w and not e)
+            counts['open_spaces'] += adjacent <= 1
+            counts['dead_ends'] += adjacent == 3
+    return counts
+
+
+class CountingSolver:
+    """Solver double that records how often it is asked to solve."""
+
+    def __init__(self):
+        self.calls = 0
+        self.states_explored = 12
+        self.solve_time = 0.01
+
+    def is_solvable(self, level):
+        self.calls += 1
+        return True
+
+    def get_solution(self):
+        return ['right']
+
+
+@pytest.mark.parametrize('level_data', [ROOM_LEVEL, CORRIDOR_LEVEL])
+def test_vectorized_counts_match_reference(level_data):
+    level = Level(level_data=level_data)
+    assert StructuralAnalysis(level).as_dict() == _reference_counts(level)
+
+
+def test_incremental_update_matches_full_analysis():
+    level = Level(level_data=CORRIDOR_LEVEL)
+    metrics = LevelMetrics()
+    metrics.get_structure(level)
+
+    rng = random.Random(0)
+    for _ in range(60):
+        x, y = rng.randrange(level.width), rng.randrange(level.height)
+        level.map_data[y][x] = rng.choice([WALL, FLOOR])
+        metrics.update_cell(level, x, y)
+        assert metrics.get_structure(level).as_dict() == _reference_counts(level)
+
+
+def test_update_does_not_leak_into_level_with_same_layout():
+    edited = Level(level_data=ROOM_LEVEL)
+    other = Level(level_data=ROOM_LEVEL)
+    metrics = LevelMetrics()
+    metrics.get_structure(edited)
+    metrics.get_structure(other)
+
+    edited.map_data[1][1] = WALL
+    metrics.update_cell(edited, 1, 1)
+
+    assert metrics.get_structure(other).as_dict() == _reference_counts(other)
+    assert metrics.get_structure(edited).as_dict() == _reference_counts(edited)
+
+
+def test_patterns_use_structure():
+    level = Level(level_data=ROOM_LEVEL)
+    result = LevelMetrics().calculate_metrics(level, solution=['up'])
+    reference = _reference_counts(level)
+    assert result['size']['playable_area'] == reference['playable_area']
+    assert result['patterns']['corners'] == reference['corners']
+    assert result['patterns']['dead_ends'] == reference['dead_ends']
+
+
+def test_solution_cached_per_layout():
+    metrics = LevelMetrics()
+    metrics.solver = CountingSolver()
+
+    metrics.calculate_metrics(Level(level_data=ROOM_LEVEL))
+    metrics.calculate_metrics(Level(level_data=ROOM_LEVEL))
+    assert metrics.solver.calls == 1
+
+
+def test_provided_solution_is_reused():
+    metrics = LevelMetrics()
+    metrics.solver = CountingSolver()
+    level = Level(level_data=ROOM_LEVEL)
+
+    metrics.calculate_metrics(level, solution=['up', 'down'])
+    result = metrics.calculate_metrics(level)
+    assert metrics.solver.calls == 0
+    assert result['solution_length'] == 2
+
+
+def test_solver_effort_replaces_difficulty_probe():
+    metrics = LevelMetrics()
+    metrics._difficulty_estimator = DifficultyEstimator()
+    level = Level(level_data="######\n#@$ .#\n# $ .#\n######")
+    solver = SokobanSolver()
+    assert solver.is_solvable(level)
+
+    result = metrics.calculate_metrics(level, solver.get_solution(), solver)
+    effort = result['difficulty']['search_effort']['effort']
+    assert effort['nodes_expanded'] == solver.states_explored
+    assert effort['solved']
+    assert metrics.difficulty_estimator.cache_misses == 0
+    assert 0.0 < result['difficulty']['overall_score'] <= 100.0
@@ -0,0 +1,142 @@
+"""Tests for the lazy ML metrics and reports and their background analysis."""
+
+import json
+
+import pytest
+from src.core.level import Level
+from src.ai.ml_analysis_worker import MLAnalysisWorker
+from src.ai.ml_metrics_collector import LazySections, MLMetricsCollector, METRIC_SECTIONS
+from src.ai.ml_report_generator import MLReportGenerator
+from src.ai.telemetry_sink import TelemetrySink
+from src.ai.unified_ai_controller import UnifiedAIController, SolveRequest
+
+
+TWO_BOX_LEVEL = (
+    "########\n"
+    "#  .   #\n"
+    "# @$$ .#\n"
+    "#   ## #\n"
+    "########"
+)
+
+
+def _controller(tmp_path):
+    """Controller whose journals and reports stay in tmp_path."""
+    controller = UnifiedAIController(sink=TelemetrySink(None))
+    controller.ml_metrics_collector = MLMetricsCollector(sink=TelemetrySink(None))
+    controller.ml_report_generator = MLReportGenerator(
+        output_dir=str(tmp_path / "reports"), sink=TelemetrySink(str(tmp_path / "ml_reports.jsonl")))
+    return controller
+
+
+class TestLazySections:
+    def test_sections_are_computed_once_on_first_read(self):
+        calls = []
+
+        def build():
+            calls.append('b')
+            return 2
+
+        sections = LazySections({'a': lambda: sections['b'] + 1, 'b': build}, {'fixed': 0})
+        assert list(sections) == ['fixed', 'a', 'b']
+        assert sections.computed_sections() == ['fixed']
+        assert sections['a'] == 3
+        assert sections['b'] == 2
+        assert calls == ['b']
+        assert sections.get('missing') is None
+
+    def test_to_dict_computes_nested_sections(self):
+        inner = LazySections({'x': lambda: 1})
+        sections = LazySections({'inner': lambda: inner})
+        assert json.loads(json.dumps(sections.to_dict())) == {'inner': {'x': 1}}
+
+
+class TestMetricsCollector:
+    def test_only_feature_sections_are_computed(self, tmp_path):
+        controller = _controller(tmp_path)
+        request = SolveRequest(level=Level(level_data=TWO_BOX_LEVEL), background_analysis=False)
+        metrics = controller.solve_level(request).ml_metrics
+
+        assert not metrics.is_computed('correlation_analysis')
+        assert not metrics.is_computed('solution_quality')
+        assert set(METRIC_SECTIONS) <= set(metrics)
+        assert metrics['solution_quality']['optimality_estimate'] == pytest.approx(1.0)
+
+    def test_structure_is_cached_per_level(self, tmp_path, monkeypatch):
+        controller = _controller(tmp_path)
+        collector = controller.ml_metrics_collector
+        calls = []
+        analyze = collector._analyze_level_structure
+        monkeypatch.setattr(collector, '_analyze_level_structure',
+                            lambda level: calls.append(1) or analyze(level))
+
+        for _ in range(3):
+            request = SolveRequest(level=Level(level_data=TWO_BOX_LEVEL), background_analysis=False)
+            controller.solve_level(request)
+        assert calls == [1]
+        assert collector.get_metrics_summary()['total_collections'] == 3
+
+    def test_level_structure(self, tmp_path):
+        collector = MLMetricsCollector(sink=TelemetrySink(None))
+        structure = collector._analyze_level_structure(Level(level_data=TWO_BOX_LEVEL))
+
+        # 15 cells in the room and a dead end below (6, 2)
+        assert structure['space_distribution']['free_area'] == 16
+        assert structure['bottleneck_analysis']['bottleneck_positions'] == [(6, 2)]
+        assert structure['connectivity_analysis']['bridges_count'] == 1
+        assert structure['corridor_analysis']['dead_ends'] == 1
+
+
+class TestBackgroundAnalysis:
+    def test_report_is_built_in_background_without_files(self, tmp_path):
+        controller = _controller(tmp_path)
+        request = SolveRequest(level=Level(level_data=TWO_BOX_LEVEL), generate_report=True)
+        result = controller.solve_level(request)
+        assert result.success
+
+        controller.wait_for_analysis()
+        report = result.ml_report
+        assert isinstance(report, LazySections)
+        assert result.ml_metrics is not None
+        assert not report.is_computed('recommendations')
+        assert not (tmp_path / "reports").exists()
+
+        generator = controller.ml_report_generator
+        paths = generator.export_report(report)
+        assert sorted(path.suffix for path in paths) == ['.csv', '.html', '.json']
+        with open(paths[0], encoding='utf-8') as f:
+            data = json.load(f)
+        assert set(data) == {'metadata', 'executive_summary', 'performance_analysis', 'algorithm_analysis',
+                             'level_analysis', 'movement_analysis', 'spatial_analysis',
+                             'efficiency_analysis', 'ml_features', 'comparative_analysis',
+                             'recommendations', 'visualizations', 'raw_data'}
+        assert generator.telemetry_sink.total_records == 1
+
+    def test_report_formats_write_files(self, tmp_path):
+        controller = _controller(tmp_path)
+        for _ in range(3):
+            request = SolveRequest(level=Level(level_data=TWO_BOX_LEVEL), generate_report=True,
+                                   report_formats=('json',))
+            controller.solve_level(request)
+        controller.wait_for_analysis()
+
+        assert len(list((tmp_path / "reports").glob("report_*.json"))) == 3
+        generator = controller.ml_report_generator
+        latest = generator.report_history[-1]
+        assert latest['comparative_analysis']['ranking_percentile'] >= 0
+        assert generator.get_report_history_summary()['total_reports'] == 3
+        assert generator.export_training_dataset(str(tmp_path / "dataset.json")) == 3
+
+    def test_worker_copies_the_level(self, tmp_path):
+        level = Level(level_data=TWO_BOX_LEVEL)
+        collector = MLMetricsCollector(sink=TelemetrySink(None))
+        worker = MLAnalysisWorker(collector)
+        controller = _controller(tmp_path)
+        solution = controller.solve_level(SolveRequest(level=level, collect_ml_metrics=False)).solution_data
+
+        done = []
+        worker.submit(level, solution, {}, on_done=lambda metrics, report: done.append(metrics))
+        level.move(0, -1)
+        worker.wait_idle()
+        assert worker.completed == 1
+        assert done[0]['movement_analysis']['push_pull_analysis']['pushes'] > 0
@@ -1,9 +1,10 @@
 """Tests for MouseNavigationSystem: YASC-style pathfinding, lift-and-drop, BoxPushPathfinder."""
 
 import pytest
+from collections import deque
 from src.core.level import Level
 from src.ui.mouse_navigation import (
-    MouseNavigationSystem, MouseMode, BoxPushPathfinder
+    MouseNavigationSystem, MouseMode, BoxPushPathfinder, PlayerDistanceField
 )
 
 
@@ -89,6 +90,66 @@ class TestPathfinding:
         assert movements == ['right', 'down', 'down']
 
 
+    def test_unreachable_goal_leads_to_closest_cell(self, nav):
+        lvl = Level(level_data="######\n#@ #.#\n#$ ###\n######")
+        nav.set_level(lvl)
+        path = nav._calculate_path((1, 1), (4, 1))
+        assert path == [(1, 1), (2, 1)]
+
+    def test_long_path(self, nav):
+        """Paths are not cut off after a fixed number of explored cells."""
+        width = 150
+        lvl = Level(level_data="#" * width + "\n#@" + " " * (width - 4) + ".#\n#$"
+                    + " " * (width - 3) + "#\n" + "#" * width)
+        nav.set_level(lvl)
+        path = nav._calculate_path((1, 1), (width - 2, 1))
+        assert len(path) == width - 2
+        assert path[-1] == (width - 2, 1)
+
+
+class TestDistanceField:
+
+    def test_distances(self, open_level):
+        field = PlayerDistanceField(open_level, open_level.player_pos)
+        assert field.distance_to((2, 3)) == 0
+        assert field.distance_to((2, 2)) == -1  # box
+        assert field.distance_to((0, 0)) == -1  # wall
+        assert field.distance_to((2, 1)) == 4
+        assert field.path_to((2, 1))[0] == (2, 3)
+
+    def test_field_reused_while_board_unchanged(self, nav, open_level):
+        nav.set_level(open_level)
+        nav._calculate_path((2, 3), (1, 1))
+        field = nav._distance_field
+        nav._calculate_path((2, 3), (3, 4))
+        nav._calculate_path((2, 3), (1, 4))
+        assert nav._distance_field is field
+
+    def test_field_rebuilt_after_push_and_undo(self, nav, open_level):
+        nav.set_level(open_level)
+        nav._calculate_path((2, 3), (2, 1))
+        field = nav._distance_field
+        open_level.move(0, -1)  # push the box up
+        open_level.move(0, 1)
+        assert nav._calculate_path((2, 3), (2, 2)) == [(2, 3), (2, 2)]
+        assert nav._distance_field is not field
+        open_level.undo()
+        open_level.undo()
+        assert (2, 2) not in nav._calculate_path((2, 3), (2, 1))
+
+    def test_hover_path_refreshed_after_push(self, nav, open_level):
+        nav.set_level(open_level)
+        nav.update_mouse_position((50, 50), 0, 0, 32)  # cell (1, 1)
+        before = nav.current_path
+        open_level.move(1, 0)
+        open_level.move(-1, 0)
+        open_level.move(0, -1)  # push the box up
+        nav.update_mouse_position((50, 50), 0, 0, 32)
+        assert nav.current_path != before
+        assert nav.current_path[0] == (2, 2)
+        assert nav.current_path[-1] == (1, 1)
+
+
 # ---------------------------------------------------------------------------
 # YASC-style Lift-and-Drop
 # ---------------------------------------------------------------------------
@@ -163,6 +224,36 @@ class TestLiftAndDrop:
         assert nav.is_moving is True
         assert nav.movement_queue == ['down']
 
+    def test_view_animates_while_lifted_or_moving(self, nav, push_level):
+        nav.set_level(push_level)
+        assert not nav.is_animating
+        nav.mouse_mode = MouseMode.BOX_LIFTED
+        nav.lifted_box_pos = (2, 2)
+        assert nav.is_animating
+        nav.clear_navigation()
+        nav.movement_queue = ['left']
+        assert nav.is_animating
+
+    def test_render_returns_drawn_areas(self, nav, open_level):
+        import pygame
+        screen = pygame.Surface((200, 200))
+        nav.set_level(open_level)
+        assert nav.render_navigation(screen, 0, 0, 32) == []
+
+        nav.current_path = [(2, 3), (2, 4), (3, 4)]
+        rects = nav.render_navigation(screen, 0, 0, 32)
+        assert rects
+        area = rects[0].unionall(rects[1:])
+        # The guideline joins the cell centers of the path
+        assert area.collidepoint(2 * 32 + 16, 3 * 32 + 16)
+        assert area.collidepoint(3 * 32 + 15, 4 * 32 + 16)
+        assert area.right < 4 * 32 and area.bottom < 5 * 32
+
+        nav.mouse_mode = MouseMode.BOX_LIFTED
+        nav.lifted_box_pos = (2, 2)
+        rects = nav.render_navigation(screen, 0, 0, 32)
+        assert pygame.Rect(2 * 32, 2 * 32, 32, 32) in rects
+
 
 # ---------------------------------------------------------------------------
 # BoxPushPathfinder
@@ -173,7 +264,7 @@ class TestBoxPushPathfinder:
     def test_simple_push(self, push_level):
         nav = MouseNavigationSystem()
         nav.set_level(push_level)
-        pf = BoxPushPathfinder(push_level, nav._calculate_path)
+        pf = BoxPushPathfinder(push_level)
         result = pf.find_push_path((2, 2), (2, 1), push_level.player_pos)
         assert result is not None
         assert len(result) >= 1
@@ -181,7 +272,7 @@ class TestBoxPushPathfinder:
     def test_multi_push(self, push_level):
         nav = MouseNavigationSystem()
         nav.set_level(push_level)
-        pf = BoxPushPathfinder(push_level, nav._calculate_path)
+        pf = BoxPushPathfinder(push_level)
         result = pf.find_push_path((2, 2), (1, 1), push_level.player_pos)
         assert result is not None
         assert len(result) == 2
@@ -190,7 +281,7 @@ class TestBoxPushPathfinder:
         lvl = Level(level_data="####\n#$@#\n####")
         nav = MouseNavigationSystem()
         nav.set_level(lvl)
-        pf = BoxPushPathfinder(lvl, nav._calculate_path)
+        pf = BoxPushPathfinder(lvl)
         result = pf.find_push_path((1, 1), (2, 1), lvl.player_pos)
         # Box at (1,1), player at (2,1). Push right needs player at (0,1)=wall.
         # So this is likely None.
@@ -198,7 +289,7 @@ class TestBoxPushPathfinder:
     def test_box_already_at_goal(self, push_level):
         nav = MouseNavigationSystem()
         nav.set_level(push_level)
-        pf = BoxPushPathfinder(push_level, nav._calculate_path)
+        pf = BoxPushPathfinder(push_level)
         result = pf.find_push_path((2, 2), (2, 2), push_level.player_pos)
         assert result == []
 
@@ -212,7 +303,7 @@ class TestBoxPushPathfinder:
         lvl = Level(level_data="######\n#    #\n# $@ #\n#    #\n######")
         nav = MouseNavigationSystem()
         nav.set_level(lvl)
-        pf = BoxPushPathfinder(lvl, nav._calculate_path)
+        pf = BoxPushPathfinder(lvl)
         # Box at (2,2), player at (3,2). Push box left to (1,1) = 2 pushes.
         result = pf.find_push_path((2, 2), (1, 1), lvl.player_pos)
         assert result is not None
@@ -228,13 +319,117 @@ class TestBoxPushPathfinder:
         lvl = Level(level_data="#######\n#     #\n# $@  #\n#     #\n#######")
         nav = MouseNavigationSystem()
         nav.set_level(lvl)
-        pf = BoxPushPathfinder(lvl, nav._calculate_path)
+        pf = BoxPushPathfinder(lvl)
         # Box at (2,2), player at (3,2). Push box right to (4,2) = 2 pushes.
         result = pf.find_push_path((2, 2), (4, 2), lvl.player_pos)
         assert result is not None
         assert len(result) == 2
 
 
+class TestPushPlan:
+
+    @staticmethod
+    def brute_force_pushes(level, box, player):
+        """Fewest pushes to each cell by BFS over (box, player cell) states."""
+        others = set(level.boxes) - {box}
+
+        def free(pos):
+            return not level.is_wall(*pos) and pos not in others
+
+        def region(box, player):
+            seen, queue = {player}, deque([player])
+            while queue:
+                x, y = queue.popleft()
+                for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+                    n = (x + dx, y + dy)
+                    if n not in seen and n != box and free(n):
+                        seen.add(n)
+                        queue.append(n)
+            return frozenset(seen)
+
+        start = (box, region(box, player))
+        best = {box: 0}
+        seen, queue = {start}, deque([(start, 0)])
+        while queue:
+            (box, cells), pushes = queue.popleft()
+            for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+                target = (box[0] + dx, box[1] + dy)
+                if (box[0] - dx, box[1] - dy) in cells and free(target):
+                    state = (target, region(target, box))
+                    if state not in seen:
+                        seen.add(state)
+                        best.setdefault(target, pushes + 1)
+                        queue.append((state, pushes + 1))
+        return best
+
+    def assert_matches_brute_force(self, level, box):
+        pf = BoxPushPathfinder(level)
+        pf.plan(box, level.player_pos)
+        expected = self.brute_force_pushes(level, box, level.player_pos)
+        assert pf.destinations == set(expected)
+        for goal, pushes in expected.items():
+            assert len(pf.box_path(goal)) == pushes + 1
+            path = pf.find_push_path(box, goal, level.player_pos)
+            assert len(path) == pushes
+            # The walks and pushes are legal on the level
+            for (dx, dy), walk in path:
+                for step in MouseNavigationSystem()._path_to_movements(walk):
+                    assert level.move(*{'up': (0, -1), 'down': (0, 1),
+                                        'left': (-1, 0), 'right': (1, 0)}[step])
+                assert level.move(dx, dy)
+            assert goal in level.boxes
+            level.undo_to(0)
+
+    def test_matches_brute_force_open_room(self):
+        lvl = Level(level_data="#######\n#  .  #\n# $@$ #\n#  #  #\n#   . #\n#######")
+        self.assert_matches_brute_force(lvl, (2, 2))
+        self.assert_matches_brute_force(lvl, (4, 2))
+
+    def test_matches_brute_force_corridors(self):
+        """Cut cells: pushing into a corridor can separate the player from the box."""
+        lvl = Level(level_data=(
+            "#########\n"
+            "#   #   #\n"
+            "# $   # #\n"
+            "##@## # #\n"
+            "#   #.$ #\n"
+            "# .     #\n"
+            "#########"
+        ))
+        self.assert_matches_brute_force(lvl, (2, 2))
+        self.assert_matches_brute_force(lvl, (6, 4))
+
+    def test_far_drop(self):
+        """Routes longer than the old 50-push limit are found."""
+        width = 70
+        lvl = Level(level_data="#" * width + "\n#@$" + " " * (width - 5) + ".#\n"
+                    + "#" + " " * (width - 2) + "#\n" + "#" * width)
+        pf = BoxPushPathfinder(lvl)
+        path = pf.find_push_path((2, 1), (width - 2, 1), lvl.player_pos)
+        assert path is not None
+        assert len(path) == width - 4
+
+    def test_player_cut_off(self):
+        lvl = Level(level_data="######\n#@# .#\n# $  #\n######")
+        pf = BoxPushPathfinder(lvl)
+        pf.plan((2, 2), lvl.player_pos)
+        assert pf.destinations == {(2, 2), (3, 2), (4, 2)}
+        assert pf.box_path((4, 2)) == [(2, 2), (3, 2), (4, 2)]
+        assert pf.box_path((2, 1)) is None
+
+    def test_preview_reuses_plan(self, nav, push_level):
+        nav.set_level(push_level)
+        nav.player_position = push_level.player_pos
+        nav._handle_left_click((2, 2))
+        nav._update_lift_preview((1, 1))
+        planner = nav._push_planner
+        assert nav.current_path == [(2, 2), (2, 1), (1, 1)] or \
+            nav.current_path == [(2, 2), (1, 2), (1, 1)]
+        nav._update_lift_preview((1, 2))
+        assert nav._push_planner is planner
+        assert nav.lift_push_path is not None
+
+
 # ---------------------------------------------------------------------------
 # Movement Queue
 # ---------------------------------------------------------------------------
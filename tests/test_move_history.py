@@ -0,0 +1,103 @@
+"""Tests for the delta-encoded undo/redo logs of Level."""
+
+import copy
+import pytest
+from src.core.level import Level
+from src.core.move_history import MoveHistory, decode_step, encode_step
+
+
+LEVEL = (
+    "#######\n"
+    "#     #\n"
+    "# @$ .#\n"
+    "#     #\n"
+    "#######"
+)
+
+
+@pytest.fixture
+def level():
+    return Level(level_data=LEVEL)
+
+
+class TestStepEncoding:
+
+    def test_round_trip(self):
+        assert decode_step(encode_step((1, 0))) == ((1, 0), None)
+        assert decode_step(encode_step((0, -1), 0)) == ((0, -1), 0)
+        assert decode_step(encode_step((-1, 0), 41)) == ((-1, 0), 41)
+
+
+class TestMoveHistory:
+
+    def test_one_step_per_move(self, level):
+        for _ in range(3):
+            level.move(0, 1)
+            level.move(0, -1)
+        stats = level.history.get_statistics()
+        assert stats['steps'] == 6
+        assert stats['keyframes'] == 0
+        assert stats['step_bytes'] <= 6 * 4
+
+    def test_entries_are_states_before_each_move(self, level):
+        level.move(1, 0)  # push
+        level.move(0, 1)
+        assert level.history[0] == {'player_pos': (2, 2), 'boxes': [(3, 2)], 'moves': 0, 'pushes': 0}
+        assert level.history[-1] == {'player_pos': (3, 2), 'boxes': [(4, 2)], 'moves': 1, 'pushes': 1}
+        assert level.history == [level.history[0], level.history[1]]
+
+    def test_redo_entries(self, level):
+        level.move(1, 0)
+        level.move(0, 1)
+        level.undo()
+        level.undo()
+        assert level.redo_stack[-1]['player_pos'] == (3, 2)
+        assert level.redo_stack[0]['player_pos'] == (3, 3)
+
+    def test_undo_redo_pull(self, level):
+        level.move(1, 0)
+        level.toggle_reverse_mode()
+        level.move(-1, 0)  # pull the box back
+        assert level.boxes == [(3, 2)]
+        level.undo()
+        assert (level.player_pos, level.boxes, level.pushes) == ((3, 2), [(4, 2)], 1)
+        level.redo()
+        assert (level.player_pos, level.boxes, level.pushes) == ((2, 2), [(3, 2)], 2)
+
+    def test_teleport_is_undoable(self, level):
+        level.move(0, 1)
+        level.player_pos = (5, 1)
+        level.boxes = [(3, 3)]
+        assert len(level.history) == 2  # Both assignments merged into one jump
+        level.undo()
+        assert (level.player_pos, level.boxes, level.moves) == ((2, 3), [(3, 2)], 1)
+        level.redo()
+        assert (level.player_pos, level.boxes) == ((5, 1), [(3, 3)])
+
+    def test_history_copies_are_detached(self, level):
+        level.move(0, 1)
+        log = level.history.copy()
+        assert log.level is None
+        assert copy.deepcopy(level.history).level is None
+        level.move(0, 1)
+        assert len(log) == 1
+
+    def test_assigning_state_list(self, level):
+        level.move(0, 1)
+        level.history = [{'player_pos': (1, 1), 'boxes': [(3, 2)], 'moves': 0, 'pushes': 0}]
+        level.undo()
+        assert level.player_pos == (1, 1)
+        assert level.moves == 0
+
+    def test_deepcopy_keeps_history(self, level):
+        level.move(1, 0)
+        clone = copy.deepcopy(level)
+        assert clone.history.level is clone
+        clone.undo()
+        assert clone.player_pos == (2, 2)
+        assert level.player_pos == (3, 2)
+
+    def test_from_states(self):
+        log = MoveHistory.from_states([{'player_pos': (1, 1), 'boxes': [], 'moves': 0, 'pushes': 0}])
+        assert len(log) == 1
+        assert log.last_is_jump()
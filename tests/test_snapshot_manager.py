@@ -128,3 +128,38 @@ class TestHistoryPreservation:
 
         manager.load_snapshot(level, "s1")
         assert len(level.history) == 1
+
+
+class TestCopyOnWrite:
+
+    def test_snapshot_shares_history(self, manager, level):
+        level.move(1, 0)
+        manager.save_snapshot(level, "s1")
+        assert manager.snapshots["s1"].history._steps is level.history._steps
+
+    def test_undo_after_snapshot_does_not_change_it(self, manager, level):
+        level.move(0, 1)
+        level.move(1, 0)
+        manager.save_snapshot(level, "s1")
+        level.undo()
+        level.move(0, -1)
+        manager.load_snapshot(level, "s1")
+        assert level.player_pos == (2, 2)
+        assert len(level.history) == 2
+        assert level.undo() and level.undo()
+        assert level.player_pos == (1, 1)
+
+    def test_snapshots_of_one_game_share_steps(self, manager, level):
+        level.move(0, 1)
+        manager.save_snapshot(level, "s1")
+        level.move(1, 0)
+        manager.save_snapshot(level, "s2")
+        assert manager.snapshots["s1"].history._steps is manager.snapshots["s2"].history._steps
+        assert len(manager.snapshots["s1"].history) == 1
+        assert len(manager.snapshots["s2"].history) == 2
+
+    def test_start_position(self, manager, level):
+        level.move(1, 0)
+        level.move(0, 1)
+        manager.save_snapshot(level, "s1")
+        assert manager.snapshots["s1"].start_position() == ((1, 1), [(2, 1)])
@@ -0,0 +1,145 @@
+"""Tests for SnapshotStore: LURD encoding, validation and persistence."""
+
+import json
+import os
+import time
+
+import pytest
+from src.core.level import Level
+from src.core.snapshot_manager import SnapshotManager
+from src.core.snapshot_store import SnapshotStore, board_hash
+
+
+LEVEL_DATA = (
+    "######\n"
+    "#@ $.#\n"
+    "#    #\n"
+    "######"
+)
+
+
+@pytest.fixture
+def level():
+    return Level(level_data=LEVEL_DATA)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(directory=str(tmp_path / "snapshots"))
+
+
+def read_entries(store, level):
+    with open(os.path.join(store.directory, board_hash(level) + '.json')) as f:
+        return json.load(f)['snapshots']
+
+
+class TestSnapshotStore:
+
+    def test_saved_as_lurd(self, store, level):
+        manager = SnapshotManager(store=store)
+        level.move(0, 1)
+        level.move(1, 0)
+        level.move(0, -1)
+        level.move(1, 0)
+        manager.save_snapshot(level, "s1")
+        entry = read_entries(store, level)[0]
+        assert entry['lurd'] == 'druR'
+        assert entry['start'] == {'player': [1, 1], 'boxes': [[3, 1]]}
+
+    def test_restored_in_new_session(self, store, level):
+        manager = SnapshotManager(store=store)
+        level.move(1, 0)
+        level.move(1, 0)
+        manager.save_snapshot(level, "s1")
+
+        other_level = Level(level_data=LEVEL_DATA)
+        other = SnapshotManager(store=store)
+        assert other.load_stored(other_level) == 1
+        assert other.load_snapshot(other_level, "s1")
+        assert other_level.player_pos == (3, 1)
+        assert other_level.boxes == [(4, 1)]
+        assert other_level.is_completed()
+        assert (other_level.moves, other_level.pushes) == (2, 1)
+        # Undo history is rebuilt from the LURD string
+        assert other_level.undo() and other_level.undo()
+        assert other_level.player_pos == (1, 1)
+
+    def test_other_board_has_no_snapshots(self, store, level):
+        SnapshotManager(store=store).save_snapshot(level, "s1")
+        other_level = Level(level_data=LEVEL_DATA.replace("#    #", "#   ##"))
+        assert store.load(other_level) == []
+
+    def test_invalid_snapshot_is_skipped(self, store, level):
+        level.move(1, 0)
+        SnapshotManager(store=store).save_snapshot(level, "s1")
+        path = os.path.join(store.directory, board_hash(level) + '.json')
+        with open(path) as f:
+            data = json.load(f)
+        data['snapshots'][0]['lurd'] = 'u'
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        assert store.load(level) == []
+
+    def test_push_case_is_checked(self, store, level):
+        level.move(1, 0)
+        level.move(1, 0)
+        SnapshotManager(store=store).save_snapshot(level, "s1")
+        entries = read_entries(store, level)
+        entries[0]['lurd'] = 'rr'
+        store._write(level, entries)
+        assert store.load(level) == []
+
+    def test_jumps_saved_as_position(self, store, level):
+        level.player_pos = (1, 2)
+        level.move(1, 0)
+        manager = SnapshotManager(store=store)
+        manager.save_snapshot(level, "s1")
+        entry = read_entries(store, level)[0]
+        assert entry['lurd'] is None
+
+        other_level = Level(level_data=LEVEL_DATA)
+        other = SnapshotManager(store=store)
+        other.load_stored(other_level)
+        assert other.load_snapshot(other_level, "s1")
+        assert other_level.player_pos == (2, 2)
+        assert len(other_level.history) == 0
+
+    def test_same_name_replaced_and_delete(self, store, level):
+        manager = SnapshotManager(store=store)
+        manager.save_snapshot(level, "s1")
+        level.move(1, 0)
+        manager.save_snapshot(level, "s1")
+        assert [s.moves for s in store.load(level)] == [1]
+        assert store.delete(level, "s1")
+        assert store.load(level) == []
+
+    def test_deleted_snapshot_stays_deleted_after_reload(self, store, level):
+        manager = SnapshotManager(store=store)
+        manager.save_snapshot(level, "s1")
+        manager.save_snapshot(level, "s2")
+        assert manager.delete_snapshot("s1")
+
+        other = SnapshotManager(store=store)
+        assert other.load_stored(Level(level_data=LEVEL_DATA)) == 1
+        assert list(other.snapshots) == ["s2"]
+
+    def test_oldest_snapshots_pruned(self, tmp_path, level):
+        store = SnapshotStore(directory=str(tmp_path / "snapshots"), max_per_board=3)
+        manager = SnapshotManager(store=store)
+        for _ in range(5):
+            manager.save_snapshot(level)
+        assert [s.name for s in store.load(level)] == [f"Quick Save #{n}" for n in (3, 4, 5)]
+
+    def test_long_game_loads_quickly(self, store):
+        level = Level(level_data="#" * 4 + "\n#@ #\n#$.#\n####")
+        level.move(1, 0)
+        for _ in range(5000):
+            level.move(-1, 0)
+            level.move(1, 0)
+        SnapshotManager(store=store).save_snapshot(level, "long")
+
+        start = time.perf_counter()
+        snapshots = store.load(level)
+        elapsed = time.perf_counter() - start
+        assert len(snapshots[0].history) == 10001
+        assert elapsed < 1.0
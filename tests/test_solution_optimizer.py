@@ -1,8 +1,11 @@
 """Tests for SolutionOptimizer: redundant move removal and path optimization."""
 
+import threading
+
 import pytest
 from src.core.level import Level
-from src.ai.solution_optimizer import SolutionOptimizer
+from src.ai.push_engine import PushEngine
+from src.ai.solution_optimizer import BackgroundOptimizer, SolutionOptimizer
 
 
 @pytest.fixture
@@ -80,3 +83,127 @@ class TestOptimizePlayerPaths:
         moves = ['RIGHT', 'LEFT', 'RIGHT', 'DOWN', 'UP', 'RIGHT']
         optimized = optimizer.optimize(lvl, moves)
         assert len(optimized) <= len(moves)
+
+
+# Open room, box two pushes left of its target
+#  ########
+#  #      #
+#  #      #
+#  # $  . #
+#  #      #
+#  #@     #
+#  ########
+ROOM_LEVEL = "########\n#      #\n#      #\n# $  . #\n#      #\n#@     #\n########"
+
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+
+
+def expand(level, pushes):
+    """Moves of a push sequence given as ((x, y), direction) pairs."""
+    engine = PushEngine(level)
+    return engine.pushes_to_moves([(engine.index(*box), d) for box, d in pushes])
+
+
+def replay(level, moves):
+    direction_map = {'UP': (0, -1), 'DOWN': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+    return all(level.move(*direction_map[move]) for move in moves) and level.is_completed()
+
+
+class TestOptimizePushes:
+
+    def test_removes_push_cycle(self, optimizer):
+        lvl = Level(level_data=ROOM_LEVEL)
+        moves = expand(lvl, [((2, 3), RIGHT), ((3, 3), LEFT), ((2, 3), RIGHT),
+                             ((3, 3), RIGHT), ((4, 3), RIGHT)])
+        optimized, stats = optimizer.optimize_pushes(lvl, moves)
+        assert stats['verified']
+        assert (stats['original_pushes'], stats['optimized_pushes']) == (5, 3)
+        assert stats['moves_saved'] == len(moves) - len(optimized) > 0
+        assert replay(lvl, optimized)
+
+    def test_resolves_detour_window(self, optimizer):
+        lvl = Level(level_data=ROOM_LEVEL)
+        # Up, right, down moves the box one cell right in three pushes
+        moves = expand(lvl, [((2, 3), UP), ((2, 2), RIGHT), ((3, 2), DOWN),
+                             ((3, 3), RIGHT), ((4, 3), RIGHT)])
+        optimized, stats = optimizer.optimize_pushes(lvl, moves)
+        assert stats['optimized_pushes'] == 3
+        assert stats['windows_improved'] >= 1
+        assert stats['complete']
+        assert replay(lvl, optimized)
+
+    def test_optimal_solution_unchanged(self, optimizer):
+        lvl = Level(level_data=ROOM_LEVEL)
+        moves = expand(lvl, [((2, 3), RIGHT), ((3, 3), RIGHT), ((4, 3), RIGHT)])
+        optimized, stats = optimizer.optimize_pushes(lvl, moves)
+        assert optimized == moves
+        assert stats['pushes_saved'] == stats['moves_saved'] == 0
+
+    def test_invalid_solution_returned_as_is(self, optimizer):
+        lvl = Level(level_data=ROOM_LEVEL)
+        moves = ['LEFT', 'UP']
+        optimized, stats = optimizer.optimize_pushes(lvl, moves)
+        assert optimized == moves
+        assert not stats['verified']
+
+    def test_level_not_modified(self, optimizer):
+        lvl = Level(level_data=ROOM_LEVEL)
+        moves = expand(lvl, [((2, 3), UP), ((2, 2), RIGHT), ((3, 2), DOWN),
+                             ((3, 3), RIGHT), ((4, 3), RIGHT)])
+        optimizer.optimize_pushes(lvl, moves)
+        assert lvl.player_pos == (1, 5)
+        assert lvl.boxes == [(2, 3)]
+        assert len(lvl.history) == 0
+
+    def test_zero_budget_keeps_valid_solution(self, optimizer):
+        lvl = Level(level_data=ROOM_LEVEL)
+        moves = expand(lvl, [((2, 3), UP), ((2, 2), RIGHT), ((3, 2), DOWN),
+                             ((3, 3), RIGHT), ((4, 3), RIGHT)])
+        optimized, stats = optimizer.optimize_pushes(lvl, moves, time_budget=0)
+        assert not stats['complete']
+        assert replay(lvl, optimized)
+
+
+class TestBackgroundOptimizer:
+
+    def test_result_delivered(self):
+        lvl = Level(level_data=ROOM_LEVEL)
+        moves = expand(lvl, [((2, 3), UP), ((2, 2), RIGHT), ((3, 2), DOWN),
+                             ((3, 3), RIGHT), ((4, 3), RIGHT)])
+        results = []
+        worker = BackgroundOptimizer()
+        worker.submit(lvl, moves, lambda optimized, stats: results.append((optimized, stats)))
+        # The level can be played while the worker runs
+        lvl.move(1, 0)
+        worker.wait_idle()
+        assert len(results) == 1
+        assert results[0][1]['optimized_pushes'] == 3
+
+    def test_cancel_drops_result(self):
+        started, release = threading.Event(), threading.Event()
+
+        class BlockingOptimizer(SolutionOptimizer):
+            def _optimize_pushes(self, *args):
+                started.set()
+                release.wait(5)
+                return super()._optimize_pushes(*args)
+
+        lvl = Level(level_data=ROOM_LEVEL)
+        results = []
+        worker = BackgroundOptimizer(BlockingOptimizer())
+        worker.submit(lvl, ['RIGHT'], lambda *args: results.append(args))
+        started.wait(5)
+        worker.cancel()
+        release.set()
+        worker.wait_idle()
+        assert results == []
+
+    def test_stop_ends_worker_thread(self):
+        lvl = Level(level_data=ROOM_LEVEL)
+        worker = BackgroundOptimizer()
+        worker.submit(lvl, ['RIGHT'], lambda *args: None)
+        worker.wait_idle()
+        thread = worker._worker._thread
+        worker.stop()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
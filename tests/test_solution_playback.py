@@ -0,0 +1,119 @@
+"""Tests for SolutionPlayback: time-driven ticks, seeking and batched logging."""
+
+import pytest
+from src.core.level import Level
+from src.core.solution_playback import SolutionPlayback
+
+
+LEVEL_DATA = (
+    "#######\n"
+    "#@  $.#\n"
+    "#######"
+)
+
+SOLUTION = ['RIGHT', 'RIGHT', 'RIGHT']  # walk, walk, push
+
+
+@pytest.fixture
+def level():
+    return Level(level_data=LEVEL_DATA)
+
+
+class TestTick:
+
+    def test_first_move_on_first_tick(self, level):
+        playback = SolutionPlayback(level, SOLUTION, move_delay=100)
+        playback.play()
+        assert playback.tick(1000) == 1
+        assert level.player_pos == (2, 1)
+
+    def test_moves_follow_elapsed_time(self, level):
+        playback = SolutionPlayback(level, SOLUTION, move_delay=100)
+        playback.play()
+        playback.tick(1000)
+        assert playback.tick(1050) == 0
+        assert playback.tick(1100) == 1
+        assert playback.index == 2
+
+    def test_several_moves_per_frame(self, level):
+        playback = SolutionPlayback(level, SOLUTION, move_delay=5)
+        playback.play()
+        playback.tick(0)
+        assert playback.tick(16) == 2
+        assert playback.finished
+        assert not playback.playing
+        assert level.is_completed()
+
+    def test_max_moves_per_tick_drops_backlog(self, level):
+        playback = SolutionPlayback(level, SOLUTION, move_delay=10, max_moves_per_tick=1)
+        playback.play()
+        playback.tick(0)
+        assert playback.tick(1000) == 1
+        assert playback.tick(1001) == 0
+
+    def test_paused_does_not_move(self, level):
+        playback = SolutionPlayback(level, SOLUTION, move_delay=100)
+        playback.play()
+        playback.tick(0)
+        playback.pause()
+        assert playback.tick(10000) == 0
+        assert playback.index == 1
+
+    def test_failed_move_stops(self, level):
+        playback = SolutionPlayback(level, ['LEFT', 'RIGHT'], move_delay=0)
+        playback.play()
+        assert playback.tick(0) == 0
+        assert playback.failed_at == 0
+        assert playback.finished
+
+
+class TestSeek:
+
+    def test_seek_forward_and_back(self, level):
+        playback = SolutionPlayback(level, SOLUTION)
+        assert playback.seek(3) == 3
+        assert level.is_completed()
+        assert playback.seek(1) == 1
+        assert level.player_pos == (2, 1)
+        assert level.boxes == [(4, 1)]
+        assert len(level.history) == 1
+
+    def test_seek_is_relative_to_start_position(self, level):
+        level.move(1, 0)
+        playback = SolutionPlayback(level, SOLUTION[1:])
+        playback.seek(2)
+        playback.seek(0)
+        assert level.player_pos == (2, 1)
+        assert len(level.history) == 1
+
+    def test_finish(self, level):
+        playback = SolutionPlayback(level, SOLUTION, move_delay=1000)
+        playback.play()
+        playback.finish()
+        assert playback.finished
+        assert level.is_completed()
+
+
+class TestLogging:
+
+    def test_batched_lines(self):
+        level = Level(level_data="#" * 12 + "\n#@         #\n#$.#########\n" + "#" * 12)
+        lines = []
+        moves = ['RIGHT'] * 9
+        playback = SolutionPlayback(level, moves, logger=lines.append, log_interval=4)
+        playback.seek(9)
+        assert lines == ["Moves 1-9/9 OK"]
+
+        lines.clear()
+        playback.seek(0)
+        for _ in range(9):
+            playback.seek(playback.index + 1)
+        assert lines == ["Moves 1-4/9 OK", "Moves 5-8/9 OK", "Moves 9-9/9 OK"]
+
+    def test_failure_is_logged(self, level):
+        lines = []
+        SolutionPlayback(level, ['RIGHT', 'UP'], logger=lines.append).seek(2)
+        assert lines == ["Moves 1-1/2 OK", "Move 2/2 (UP) FAILED"]
+
+    def test_no_logger(self, level):
+        assert SolutionPlayback(level, SOLUTION).seek(3) == 3
@@ -0,0 +1,84 @@
+"""Tests for the optional per-phase profiling of EnhancedSokolutionSolver."""
+
+import json
+import pstats
+
+from src.core.level import Level
+from src.ai.algorithm_selector import Algorithm
+from src.ai.enhanced_sokolution_solver import EnhancedSokolutionSolver
+from src.ai.solver_profiler import PHASES, SolverProfiler, run_with_cprofile
+
+
+SIMPLE_LEVEL = (
+    "######\n"
+    "#    #\n"
+    "# @$ #\n"
+    "#  . #\n"
+    "######"
+)
+
+
+def _profiled_solve(algorithm=Algorithm.ASTAR):
+    solver = EnhancedSokolutionSolver(Level(level_data=SIMPLE_LEVEL), profile=True)
+    solver.profiler.frontier_sample_every = 1
+    assert solver.solve(algorithm) is not None
+    return solver
+
+
+class TestSolverProfiler:
+
+    def test_disabled_by_default(self):
+        solver = EnhancedSokolutionSolver(Level(level_data=SIMPLE_LEVEL))
+        assert solver.solve(Algorithm.ASTAR) is not None
+        assert solver.profiler is None
+        assert 'profiling' not in solver.get_comprehensive_statistics()
+        assert not hasattr(solver._calculate_heuristic, '__wrapped__')
+
+    def test_phases_are_measured(self):
+        solver = _profiled_solve()
+        profiling = solver.get_comprehensive_statistics()['profiling']
+        for phase in PHASES:
+            assert profiling['phases'][phase]['calls'] > 0
+        assert profiling['phases']['heuristic']['calls'] == solver.heuristic_calls
+        assert profiling['states_per_second'] > 0
+        assert profiling['peak_frontier'] > 0
+
+        histogram = profiling['phases']['successors']['histogram']
+        assert sum(histogram.values()) == profiling['phases']['successors']['calls']
+
+    def test_bfs_queue_counts_as_frontier(self):
+        solver = _profiled_solve(Algorithm.BFS)
+        profiling = solver.get_comprehensive_statistics()['profiling']
+        assert profiling['phases']['heap']['calls'] > 0
+        assert profiling['frontier_samples']
+
+    def test_nested_time_is_not_counted_twice(self):
+        profiler = SolverProfiler()
+        inner = profiler.wrap('deadlock', lambda: sum(range(20000)))
+        outer = profiler.wrap('successors', lambda: inner())
+        outer()
+        profiler.stop()
+
+        measured = profiler.totals_ns['deadlock'] + profiler.totals_ns['successors']
+        assert profiler.totals_ns['deadlock'] > profiler.totals_ns['successors']
+        assert measured <= profiler.elapsed_ns
+
+    def test_speedscope_export(self, tmp_path):
+        solver = _profiled_solve()
+        path = tmp_path / "trace.speedscope.json"
+        solver.export_profile_trace(str(path))
+
+        trace = json.loads(path.read_text())
+        profile = trace['profiles'][0]
+        frames = [frame['name'] for frame in trace['shared']['frames']]
+        assert profile['type'] == 'sampled'
+        assert len(profile['samples']) == len(profile['weights'])
+        assert all(frames[stack[0]] == 'A*' for stack in profile['samples'])
+        assert 'heuristic' in [frames[stack[-1]] for stack in profile['samples']]
+
+    def test_cprofile_export(self, tmp_path):
+        solver = EnhancedSokolutionSolver(Level(level_data=SIMPLE_LEVEL))
+        path = str(tmp_path / "solve.prof")
+        result = run_with_cprofile(solver.solve, path, Algorithm.ASTAR)
+        assert result is not None
+        assert pstats.Stats(path).total_calls > 0
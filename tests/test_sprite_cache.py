@@ -0,0 +1,107 @@
+"""Tests for the shared cache of scaled, display-format sprites."""
+
+import os
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.ui.skins.sprite_cache import SpriteCache
+from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    """Initialize pygame display so sprites can be converted."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def _sprite(size=8, alpha=True):
+    flags = pygame.SRCALPHA if alpha else 0
+    surface = pygame.Surface((size, size), flags)
+    surface.fill((200, 50, 50, 255))
+    return surface
+
+
+class TestSpriteCache:
+
+    def test_scales_once_per_size(self):
+        cache = SpriteCache()
+        sprite = _sprite()
+        first = cache.get(('skin', 8), 'box', sprite, 32)
+        second = cache.get(('skin', 8), 'box', sprite, 32)
+
+        assert first is second
+        assert first.get_size() == (32, 32)
+        assert cache.get_statistics()['hits'] == 1
+        assert cache.get_statistics()['misses'] == 1
+        assert cache.get(('skin', 8), 'box', sprite, 16).get_size() == (16, 16)
+
+    def test_shared_across_sources_with_same_key(self):
+        cache = SpriteCache()
+        first = cache.get(('skin', 8), 'wall', _sprite(), 24)
+        assert cache.get(('skin', 8), 'wall', _sprite(), 24) is first
+
+    def test_keyed_by_surface_without_sprite_key(self):
+        cache = SpriteCache()
+        a, b = _sprite(), _sprite()
+        assert cache.get(('skin', 8), None, a, 24) is not cache.get(('skin', 8), None, b, 24)
+        assert cache.get(('skin', 8), None, a, 24) is cache.get(('skin', 8), None, a, 24)
+
+    def test_converts_to_display_format(self):
+        cache = SpriteCache()
+        scaled = cache.get(('skin', 8), 'floor', _sprite(alpha=False), 8)
+        assert scaled.get_bitsize() == pygame.display.get_surface().get_bitsize()
+        assert cache.get(('skin', 8), 'box', _sprite(), 8).get_flags() & pygame.SRCALPHA
+
+    def test_lru_eviction(self):
+        cache = SpriteCache(max_entries=2)
+        sprite = _sprite()
+        cache.get(('skin', 8), 'a', sprite, 8)
+        cache.get(('skin', 8), 'b', sprite, 8)
+        cache.get(('skin', 8), 'a', sprite, 8)
+        cache.get(('skin', 8), 'c', sprite, 8)
+
+        assert cache.get_statistics()['entries'] == 2
+        misses = cache.misses
+        cache.get(('skin', 8), 'a', sprite, 8)
+        assert cache.misses == misses
+        cache.get(('skin', 8), 'b', sprite, 8)
+        assert cache.misses == misses + 1
+
+    def test_invalidate_by_skin_name(self):
+        cache = SpriteCache()
+        sprite = _sprite()
+        cache.get(('one', 8), 'box', sprite, 8)
+        cache.get(('one', 16, 'background'), 'box', sprite, 8)
+        cache.get(('two', 8), 'box', sprite, 8)
+
+        cache.invalidate('one')
+        assert cache.get_statistics()['entries'] == 1
+        cache.invalidate()
+        assert cache.get_statistics()['entries'] == 0
+
+
+class TestSkinManagerScaling:
+
+    def test_scaled_skin_has_requested_size(self):
+        manager = EnhancedSkinManager()
+        scaled = manager.get_scaled_skin(20)
+        assert set(scaled) == set(manager.get_skin())
+        assert all(sprite.get_size() == (20, 20) for sprite in scaled.values())
+
+    def test_managers_share_scaled_sprites(self):
+        first = EnhancedSkinManager().get_scaled_skin(20)
+        second = EnhancedSkinManager().get_scaled_skin(20)
+        assert all(first[key] is second[key] for key in first)
+
+    def test_player_frames_are_scaled(self):
+        manager = EnhancedSkinManager()
+        sprite = manager.get_player_sprite()
+        scaled = manager.get_scaled_sprite(sprite, 12)
+        assert scaled.get_size() == (12, 12)
+        assert manager.get_scaled_sprite(sprite, 12) is scaled
@@ -0,0 +1,34 @@
+"""Tests for the deferred startup of the enhanced game."""
+
+import os
+import subprocess
+import sys
+
+from src.enhanced_main import DEFERRED_MODULES, StartupProfile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_startup_profile_records_milestones():
+    profile = StartupProfile(start=0.0)
+    profile.mark('imports')
+    profile.mark('first frame')
+
+    assert [name for name, _ in profile.marks] == ['imports', 'first frame']
+    assert 0 < profile.elapsed('imports') <= profile.elapsed('first frame')
+    assert profile.elapsed('missing') is None
+    report = profile.report().splitlines()
+    assert report[0] == "Startup profile:"
+    assert report[2].split()[:2] == ['first', 'frame']
+
+
+def test_menu_imports_do_not_load_deferred_modules():
+    code = ("import sys, src.enhanced_main as main\n"
+            "print([name for name in main.DEFERRED_MODULES if name in sys.modules])\n")
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True,
+                            text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+    assert 'src.gui_main' in DEFERRED_MODULES
@@ -0,0 +1,112 @@
+"""Tests for the streaming telemetry sink and its use by the AI controller."""
+
+import json
+
+from src.core.level import Level
+from src.ai.telemetry_sink import TelemetrySink, level_hash
+from src.ai.unified_ai_controller import UnifiedAIController, SolveRequest
+
+
+SIMPLE_LEVEL = (
+    "######\n"
+    "#    #\n"
+    "# @$ #\n"
+    "#  . #\n"
+    "######"
+)
+
+
+class TestTelemetrySink:
+    def test_ring_buffer_is_bounded(self, tmp_path):
+        sink = TelemetrySink(str(tmp_path / "solves.jsonl"), buffer_size=3)
+        for index in range(10):
+            sink.record({'index': index})
+
+        assert [entry['index'] for entry in sink.recent()] == [7, 8, 9]
+        assert [entry['index'] for entry in sink.recent(2)] == [8, 9]
+        assert sink.total_records == 10
+        assert [entry['index'] for entry in sink.iter_records()] == list(range(10))
+
+    def test_rotation_keeps_a_fixed_number_of_backups(self, tmp_path):
+        path = tmp_path / "solves.jsonl"
+        sink = TelemetrySink(str(path), max_bytes=40, backups=2)
+        for index in range(12):
+            sink.record({'index': index, 'pad': 'x' * 10})
+
+        files = sink.files()
+        assert files == [f"{path}.2", f"{path}.1", str(path)]
+        assert all((tmp_path / name).stat().st_size <= 40 for name in
+                   ("solves.jsonl", "solves.jsonl.1", "solves.jsonl.2"))
+        # The oldest records were dropped with the oldest backup, order is kept
+        indexes = [entry['index'] for entry in sink.iter_records()]
+        assert indexes == list(range(12 - len(indexes), 12))
+
+    def test_export_streams_and_skips_bad_lines(self, tmp_path):
+        path = tmp_path / "solves.jsonl"
+        sink = TelemetrySink(str(path))
+        sink.record({'index': 0})
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"index": 1, "trunc\n')
+        sink.record({'index': 2})
+
+        export_path = tmp_path / "export.json"
+        count = sink.export(str(export_path), header={'name': 'test'}, key='items',
+                            transform=lambda entry: dict(entry, seen=True))
+        assert count == 2
+        with open(export_path, encoding='utf-8') as f:
+            data = json.load(f)
+        assert data == {'name': 'test',
+                        'items': [{'index': 0, 'seen': True}, {'index': 2, 'seen': True}]}
+
+        count = sink.export(str(export_path))
+        with open(export_path, encoding='utf-8') as f:
+            assert json.load(f) == [{'index': 0}, {'index': 2}]
+
+    def test_export_without_records(self, tmp_path):
+        sink = TelemetrySink(str(tmp_path / "solves.jsonl"))
+        export_path = tmp_path / "export.json"
+        assert sink.export(str(export_path), header={}, key='items') == 0
+        with open(export_path, encoding='utf-8') as f:
+            assert json.load(f) == {'items': []}
+
+    def test_memory_only_sink(self, tmp_path):
+        sink = TelemetrySink(None, buffer_size=2)
+        for index in range(3):
+            sink.record({'index': index})
+        assert sink.files() == []
+        assert [entry['index'] for entry in sink.iter_records()] == [1, 2]
+
+    def test_level_hash_depends_on_the_position(self):
+        level = Level(level_data=SIMPLE_LEVEL)
+        other = Level(level_data=SIMPLE_LEVEL)
+        assert level_hash(level) == level_hash(other)
+        other.move(1, 0)
+        assert level_hash(level) != level_hash(other)
+
+
+class TestControllerTelemetry:
+    def test_history_is_bounded_and_export_streams(self, tmp_path):
+        sink = TelemetrySink(str(tmp_path / "solves.jsonl"))
+        controller = UnifiedAIController(sink=sink, history_size=2)
+
+        for _ in range(3):
+            request = SolveRequest(level=Level(level_data=SIMPLE_LEVEL), collect_ml_metrics=False)
+            assert controller.solve_level(request).success
+
+        assert len(controller.solve_history) == 2
+        stats = controller.get_solve_statistics()
+        assert stats['global_statistics']['successful_solves'] == 3
+        assert stats['performance_averages']['avg_moves_count'] > 0
+
+        [entry] = sink.recent(1)
+        assert entry['level_hash'] == level_hash(Level(level_data=SIMPLE_LEVEL))
+        assert entry['success'] and entry['moves_count'] > 0
+        assert entry['max_states'] and entry['time_limit']
+
+        export_path = tmp_path / "history.json"
+        assert controller.export_solve_history(str(export_path)) == 3
+        with open(export_path, encoding='utf-8') as f:
+            data = json.load(f)
+        assert [item['solve_id'] for item in data['solve_history']] == [0, 1, 2]
+        assert data['statistics']['global_statistics']['total_solves'] == 3
+
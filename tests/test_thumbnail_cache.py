@@ -0,0 +1,123 @@
+"""Tests for the cached level thumbnails of the selector and preview."""
+
+import os
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.core.level import Level
+from src.ui.thumbnail_cache import ThumbnailCache
+from src.ui.skins.enhanced_skin_manager import EnhancedSkinManager
+from src.ui.skins.sprite_cache import get_sprite_cache
+
+
+COLLECTION = """Title: Test collection
+
+; Level 1
+#####
+#@$.#
+#####
+Title: First
+
+; Level 2
+######
+#@ $.#
+#    #
+######
+Title: Second
+"""
+
+
+@pytest.fixture(scope="module", autouse=True)
+def init_pygame():
+    """Initialize pygame display for sprite loading."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def collection_file(tmp_path):
+    path = tmp_path / "collection.txt"
+    path.write_text(COLLECTION)
+    return str(path)
+
+
+@pytest.fixture
+def skin_manager():
+    return EnhancedSkinManager()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ThumbnailCache(cache_dir=str(tmp_path / "thumbnails"))
+
+
+class TestThumbnailCache:
+
+    def test_thumbnail_fits_requested_area(self, cache, skin_manager, collection_file):
+        thumbnail = cache.get(skin_manager, collection_file, 1, 120, 100)
+        # 6x4 level: cells are capped at 20 px
+        assert thumbnail.get_size() == (120, 80)
+        small = cache.get(skin_manager, collection_file, 1, 60, 100)
+        assert small.get_size() == (60, 40)
+
+    def test_tiles_come_from_shared_sprite_cache(self, cache, skin_manager, collection_file):
+        # 6x4 level in 60x100: 10 px cells, scaled once for every view
+        cache.get(skin_manager, collection_file, 1, 60, 100)
+        sprite_cache = get_sprite_cache()
+        misses = sprite_cache.misses
+        scaled = skin_manager.get_scaled_skin(10)
+        assert sprite_cache.misses == misses
+        assert all(sprite.get_size() == (10, 10) for sprite in scaled.values())
+
+    def test_rendered_once(self, cache, skin_manager, collection_file):
+        first = cache.get(skin_manager, collection_file, 0, 100, 100)
+        assert cache.get(skin_manager, collection_file, 0, 100, 100) is first
+        stats = cache.get_statistics()
+        assert stats['renders'] == 1
+        assert stats['hits'] == 1
+
+    def test_disk_cache_survives_new_instance(self, tmp_path, skin_manager, collection_file):
+        cache_dir = str(tmp_path / "thumbnails")
+        ThumbnailCache(cache_dir=cache_dir).get(skin_manager, collection_file, 0, 100, 100)
+        assert len(os.listdir(cache_dir)) == 1
+
+        other = ThumbnailCache(cache_dir=cache_dir)
+        thumbnail = other.get(skin_manager, collection_file, 0, 100, 100)
+        assert thumbnail.get_size() == (100, 60)
+        assert other.get_statistics() == {'hits': 0, 'disk_hits': 1, 'renders': 0, 'entries': 1}
+
+    def test_modified_file_is_rendered_again(self, cache, skin_manager, collection_file):
+        cache.get(skin_manager, collection_file, 0, 100, 100)
+        stat = os.stat(collection_file)
+        os.utime(collection_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        cache.get(skin_manager, collection_file, 0, 100, 100)
+        assert cache.get_statistics()['renders'] == 2
+
+    def test_matches_direct_rendering(self, cache, skin_manager, collection_file):
+        thumbnail = cache.get(skin_manager, collection_file, 0, 100, 100)
+        level = cache.load_level(collection_file, 0)
+        expected = ThumbnailCache.render(level, skin_manager, 100, 100)
+        assert pygame.image.tobytes(thumbnail, 'RGBA') == pygame.image.tobytes(
+            expected.convert_alpha(), 'RGBA')
+
+    def test_prefetch_builds_in_background(self, cache, skin_manager, collection_file):
+        cache.prefetch(skin_manager, [(collection_file, 0), (collection_file, 1)], 100, 100)
+        cache.wait_idle()
+        assert cache.get_statistics()['renders'] == 2
+
+        assert cache.get(skin_manager, collection_file, 1, 100, 100, wait=False) is not None
+        assert cache.get_statistics()['renders'] == 2
+
+    def test_missing_file(self, cache, skin_manager, tmp_path):
+        assert cache.get(skin_manager, str(tmp_path / "missing.txt"), 0, 100, 100) is None
+
+    def test_single_level_file(self, cache, skin_manager, tmp_path):
+        path = tmp_path / "single.txt"
+        path.write_text("#####\n#@$.#\n#####\n")
+        assert isinstance(cache.load_level(str(path), -1), Level)
+        assert cache.get(skin_manager, str(path), -1, 50, 50).get_size() == (50, 30)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""Résoudre des collections entières, sans interface, en reprenant là où on s'était arrêté.
+
+    python3 tools/batch_solve.py "Original & Extra/Original.txt"
+    python3 tools/batch_solve.py "Boxxle 1/*.txt" --solveur interne --budget 30
+    python3 tools/batch_solve.py Generated --workers 4 --max-etats 500000
+    python3 tools/batch_solve.py "Original & Extra/Original.txt" --solveur festival --budget 120
+
+Les chemins et motifs sont cherchés tels quels, puis sous src/levels ; un
+dossier désigne tous ses fichiers .txt. Les solutions sont écrites au format
+LURD standard (minuscule = déplacement, majuscule = poussée) dans un fichier
+.sok à côté de chaque collection : ``Original.txt`` -> ``Original.sok``.
+
+Reprise : une solution déjà présente dans le .sok est rejouée sur le niveau,
+par Level.move(), jusqu'à is_completed(). Si elle tient, le niveau est sauté ;
+sinon il est résolu de nouveau. Le .sok est réécrit après chaque niveau
+résolu : un lot interrompu ne perd que les niveaux en cours.
+
+Solveurs :
+
+    auto      Festival si son binaire est présent, le solveur interne sinon
+    festival  Festival seul (voir src/ai/festival_solver.py)
+    interne   EnhancedSokolutionSolver ; algorithme et limites choisis par
+              AlgorithmSelector, ou imposés par --algorithme, --budget et
+              --max-etats
+
+Ce script n'importe jamais pygame : il tourne sur un serveur sans affichage.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+DOSSIER_NIVEAUX = os.path.join(RACINE, "src", "levels")
+SOLVEURS = ("auto", "festival", "interne")
+ALGORITHMES = ("auto", "BFS", "A*", "IDA*", "GREEDY", "BIDIRECTIONAL_GREEDY")
+
+# Sélecteur d'algorithme du processus, créé à la première résolution interne
+_selecteur = None
+
+
+def trouver_collections(motifs: list[str]) -> list[str]:
+    """Les fichiers de collection désignés par des chemins, motifs ou dossiers."""
+    collections: list[str] = []
+    for motif in motifs:
+        trouves: list[str] = []
+        for base in ("", DOSSIER_NIVEAUX):
+            candidat = os.path.join(base, motif) if base else motif
+            if os.path.isdir(candidat):
+                trouves = sorted(glob.glob(os.path.join(glob.escape(candidat), "*.txt")))
+            else:
+                trouves = sorted(c for c in glob.glob(candidat) if os.path.isfile(c))
+            if trouves:
+                break
+        if not trouves:
+            print(f"aucune collection pour « {motif} »")
+        for chemin in trouves:
+            chemin = os.path.abspath(chemin)
+            if chemin not in collections:
+                collections.append(chemin)
+    return collections
+
+
+def chemin_solutions(collection: str) -> str:
+    """Le fichier .sok qui accompagne une collection."""
+    return os.path.splitext(collection)[0] + ".sok"
+
+
+def rejouer_lurd(texte: str, lurd: str) -> bool:
+    """Appliquer une solution LURD à un niveau neuf, jusqu'à sa complétion."""
+    from src.core.level import Level
+    from src.core.move_history import DIRECTIONS, LURD_LETTERS
+
+    essai = Level(level_data=texte)
+    for lettre in lurd:
+        index = LURD_LETTERS.find(lettre.lower())
+        if index < 0 or not essai.move(*DIRECTIONS[index]):
+            return False
+    return essai.is_completed()
+
+
+def coups_en_lurd(texte: str, coups: list[str]) -> str | None:
+    """Rejouer une solution en coups (« UP »…) et la rendre en LURD, ou None si elle ne tient pas."""
+    from src.core.level import Level
+
+    deltas = {"UP": (0, -1), "DOWN": (0, 1), "LEFT": (-1, 0), "RIGHT": (1, 0)}
+    essai = Level(level_data=texte)
+    for coup in coups:
+        if coup not in deltas or not essai.move(*deltas[coup]):
+            return None
+    if not essai.is_completed():
+        return None
+    return essai.history.to_lurd()
+
+
+def lire_solutions(chemin: str) -> dict[int, str]:
+    """Les solutions d'un .sok, par numéro de niveau (à partir de 1)."""
+    solutions: dict[int, str] = {}
+    if not os.path.exists(chemin):
+        return solutions
+    numero = None
+    lurd: list[str] | None = None
+    with open(chemin, encoding="utf-8", errors="replace") as f:
+        for ligne in f:
+            ligne = ligne.strip()
+            if lurd is not None:
+                if ligne and ligne.strip("lrudLRUD") == "":
+                    lurd.append(ligne)
+                    continue
+                if numero is not None and lurd:
+                    solutions[numero] = "".join(lurd)
+                lurd = None
+            if ligne.startswith("Level "):
+                try:
+                    numero = int(ligne.split()[1])
+                except ValueError:
+                    numero = None
+            elif ligne.startswith("Solution"):
+                lurd = []
+    if numero is not None and lurd:
+        solutions[numero] = "".join(lurd)
+    return solutions
+
+
+def ecrire_solutions(chemin: str, titre: str, solutions: dict[int, tuple[str, str]]) -> None:
+    """Réécrire le .sok d'une collection : numéro -> (titre du niveau, LURD)."""
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "w", encoding="utf-8") as f:
+        f.write(f"Title: {titre}\n")
+        f.write("Comment: solutions vérifiées par tools/batch_solve.py\n")
+        for numero in sorted(solutions):
+            titre_niveau, lurd = solutions[numero]
+            f.write(f"\nLevel {numero}\n")
+            if titre_niveau and titre_niveau != str(numero):
+                f.write(f"Title: {titre_niveau}\n")
+            f.write(f"Solution ({len(lurd)}/{sum(c.isupper() for c in lurd)})\n")
+            f.write(f"{lurd}\n")
+    os.replace(temporaire, chemin)
+
+
+def resoudre(tache: tuple) -> dict:
+    """Résoudre un niveau. Tourne dans un processus du pool.
+
+    Args:
+        tache: (collection, numéro, texte du niveau, solveur, algorithme,
+            budget en secondes ou None, max d'états ou None)
+
+    Returns:
+        dict: collection, numero, lurd (vérifié, ou None), duree, etats, erreur
+    """
+    collection, numero, texte, solveur, algorithme, budget, max_etats = tache
+    resultat = {"collection": collection, "numero": numero, "lurd": None,
+                "duree": 0.0, "etats": 0, "erreur": None}
+    depart = time.time()
+    try:
+        if solveur == "festival":
+            coups = _resoudre_festival(texte, budget)
+        else:
+            coups, resultat["etats"] = _resoudre_interne(texte, algorithme, budget, max_etats)
+        if coups:
+            resultat["lurd"] = coups_en_lurd(texte, coups)
+            if resultat["lurd"] is None:
+                resultat["erreur"] = "solution non rejouable"
+    except Exception as e:
+        resultat["erreur"] = str(e) or type(e).__name__
+    resultat["duree"] = time.time() - depart
+    return resultat
+
+
+def _resoudre_festival(texte: str, budget: float | None) -> list[str]:
+    from src.ai.festival_solver import FestivalSolver
+    from src.core.level import Level
+
+    resultat = FestivalSolver(Level(level_data=texte), time_limit=budget or 600.0).solve()
+    return resultat.moves if resultat else []
+
+
+def _resoudre_interne(texte: str, algorithme: str, budget: float | None,
+                      max_etats: int | None) -> tuple[list[str], int]:
+    global _selecteur
+    from src.ai.algorithm_selector import Algorithm, AlgorithmSelector
+    from src.ai.enhanced_sokolution_solver import EnhancedSokolutionSolver, SearchMode
+    from src.core.level import Level
+
+    niveau = Level(level_data=texte)
+    if _selecteur is None:
+        _selecteur = AlgorithmSelector()
+    plan = _selecteur.plan_budget(niveau)
+    choisi = plan.algorithm if algorithme == "auto" else Algorithm(algorithme)
+
+    # Même traduction qu'AutoSolver : le glouton bidirectionnel est un mode
+    solveur = EnhancedSokolutionSolver(niveau, max_etats or plan.max_states, budget or plan.time_limit)
+    if choisi == Algorithm.BIDIRECTIONAL_GREEDY:
+        resultat = solveur.solve(Algorithm.GREEDY, SearchMode.BIDIRECTIONAL)
+    else:
+        resultat = solveur.solve(choisi, SearchMode.FORWARD)
+    return (resultat.moves if resultat else []), solveur.states_explored
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("collections", nargs="+", metavar="COLLECTION",
+                    help="fichier, motif ou dossier, relatif à src/levels ou non")
+    ap.add_argument("--solveur", choices=SOLVEURS, default="auto")
+    ap.add_argument("--algorithme", choices=ALGORITHMES, default="auto",
+                    help="solveur interne : algorithme imposé")
+    ap.add_argument("--budget", type=float, metavar="SECONDES",
+                    help="temps par niveau (défaut : 600 s pour Festival, "
+                         "le plan du sélecteur pour le solveur interne)")
+    ap.add_argument("--max-etats", type=int, metavar="N",
+                    help="solveur interne : états explorés au plus par niveau")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="niveaux résolus en parallèle, un processus chacun")
+    ap.add_argument("--de", type=int, default=1, help="premier niveau de chaque collection")
+    ap.add_argument("--a", type=int, help="dernier niveau de chaque collection")
+    a = ap.parse_args(argv)
+
+    from src.ai.festival_solver import disponible as festival_disponible
+    from src.level_management.level_collection_parser import LevelCollectionParser
+
+    solveur = a.solveur
+    if solveur == "auto":
+        solveur = "festival" if festival_disponible() else "interne"
+    elif solveur == "festival" and not festival_disponible():
+        print("binaire `festival` introuvable — voir src/ai/festival_solver.py")
+        return 2
+
+    collections = trouver_collections(a.collections)
+    if not collections:
+        return 2
+
+    # Solutions connues, vérifiées, et niveaux restant à résoudre
+    titres: dict[str, str] = {}
+    noms: dict[tuple[str, int], str] = {}
+    acquises: dict[str, dict[int, tuple[str, str]]] = {}
+    taches: list[tuple] = []
+    total = deja = 0
+    for chemin in collections:
+        coll = LevelCollectionParser.parse_file(chemin)
+        titres[chemin] = coll.title
+        connues = lire_solutions(chemin_solutions(chemin))
+        acquises[chemin] = {}
+        verifiees = 0
+        fin = coll.get_level_count() if a.a is None else min(a.a, coll.get_level_count())
+        for numero in range(max(1, a.de), fin + 1):
+            titre, niveau = coll.get_level(numero - 1)
+            noms[chemin, numero] = titre
+            texte = niveau.get_state_string(show_fess_coordinates=False)
+            total += 1
+            lurd = connues.get(numero)
+            if lurd and rejouer_lurd(texte, lurd):
+                acquises[chemin][numero] = (titre, lurd)
+                verifiees += 1
+            else:
+                taches.append((chemin, numero, texte, solveur, a.algorithme, a.budget, a.max_etats))
+        # Les solutions déjà là mais hors tranche sont gardées telles quelles
+        for numero, lurd in connues.items():
+            if not a.de <= numero <= fin:
+                titre = (coll.get_level(numero - 1)[0] if numero <= coll.get_level_count()
+                         else str(numero))
+                acquises[chemin][numero] = (titre, lurd)
+        deja += verifiees
+        nom = os.path.relpath(chemin, DOSSIER_NIVEAUX)
+        print(f"{chemin if nom.startswith(os.pardir) else nom} : {coll.title} — "
+              f"{verifiees} solution(s) vérifiée(s) déjà")
+
+    print(f"\n{total} niveaux, {deja} déjà résolus, {len(taches)} à résoudre "
+          f"par {solveur}, {a.workers} worker(s)\n")
+
+    resolus = etats = 0
+    echecs: list[str] = []
+    depart = time.time()
+
+    def consigner(r: dict) -> None:
+        nonlocal resolus, etats
+        etats += r["etats"]
+        nom = f"{os.path.basename(r['collection'])} #{r['numero']}"
+        if r["lurd"]:
+            resolus += 1
+            chemin = r["collection"]
+            acquises[chemin][r["numero"]] = (noms[chemin, r["numero"]], r["lurd"])
+            ecrire_solutions(chemin_solutions(chemin), titres[chemin], acquises[chemin])
+            print(f"  {nom:<32} OK      {r['duree']:7.2f} s  {len(r['lurd']):5} coups")
+        else:
+            raison = r["erreur"] or "non résolu"
+            echecs.append(f"{nom} : {raison}")
+            print(f"  {nom:<32} ÉCHEC   {r['duree']:7.2f} s  {raison}")
+        sys.stdout.flush()
+
+    if a.workers > 1 and len(taches) > 1:
+        with ProcessPoolExecutor(max_workers=a.workers) as pool:
+            for futur in as_completed([pool.submit(resoudre, t) for t in taches]):
+                consigner(futur.result())
+    else:
+        for tache in taches:
+            consigner(resoudre(tache))
+
+    duree = time.time() - depart
+    print(f"\n  solveur             : {solveur}")
+    print(f"  résolus et vérifiés : {resolus}/{len(taches)}  (+{deja} déjà résolus)")
+    print(f"  temps               : {duree:.1f} s")
+    if taches and duree > 0:
+        print(f"  débit               : {len(taches) / duree:.2f} niveaux/s, "
+              f"{resolus / duree * 60:.1f} résolus/min")
+        if etats:
+            print(f"                        {etats / duree:.0f} états/s")
+    if echecs:
+        print("\n  restent :")
+        for e in echecs:
+            print(f"    {e}")
+    return 0 if not echecs else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
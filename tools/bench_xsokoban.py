@@ -4,6 +4,13 @@
     python3 tools/bench_xsokoban.py                 # les 90
     python3 tools/bench_xsokoban.py --a 10          # les 10 premiers
     python3 tools/bench_xsokoban.py --sans-festival # forcer le solveur interne
+    python3 tools/bench_xsokoban.py --sans-festival --telemetrie data/telemetry/solves.jsonl
+                                                    # consigner chaque résolution
+                                                    # pour src/ai/budget_model.py
+    python3 tools/bench_xsokoban.py --sans-festival --profile --profile-dir prof/
+                                                    # temps par phase du solveur
+                                                    # interne, traces speedscope
+                                                    # et pstats par niveau
 
 Ce banc passe par AutoSolver, donc par le chemin que le jeu emprunte
 réellement — pas par un appel direct au solveur. Et il ne fait pas confiance au
@@ -44,6 +51,20 @@ def rejouer(texte: str, coups: list[str]) -> tuple[bool, str]:
     return True, "rejoué jusqu'à la position finale"
 
 
+def afficher_profil(solveur, dossier: str | None, numero: int) -> None:
+    """Temps propre par phase du solveur interne, et export de la trace."""
+    if solveur.solver is None or solveur.solver.profiler is None:
+        print(f"  #{numero:<3} pas de profil (Festival ne passe pas par le solveur interne)")
+        return
+    profil = solveur.solver.get_comprehensive_statistics()["profiling"]
+    phases = "  ".join(f"{nom} {p['share']:5.1%}" for nom, p in profil["phases"].items())
+    print(f"  #{numero:<3} {profil['states_per_second']:9.0f} états/s  "
+          f"frontière max {profil['peak_frontier']:7}  {phases}")
+    if dossier:
+        solveur.solver.export_profile_trace(
+            os.path.join(dossier, f"xsokoban_{numero:02d}.speedscope.json"))
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description=__doc__,
                                  formatter_class=argparse.RawDescriptionHelpFormatter)
@@ -52,6 +73,13 @@ def main() -> int:
     ap.add_argument("--budget", type=float, default=600.0)
     ap.add_argument("--sans-festival", action="store_true",
                     help="masquer le binaire pour mesurer le solveur interne")
+    ap.add_argument("--telemetrie", metavar="CHEMIN",
+                    help="journal JSONL où consigner les résolutions du solveur interne")
+    ap.add_argument("--profile", action="store_true",
+                    help="chronométrer les phases du solveur interne")
+    ap.add_argument("--profile-dir", metavar="DOSSIER",
+                    help="avec --profile : écrire une trace speedscope et un "
+                         "fichier pstats par niveau")
     a = ap.parse_args()
 
     if a.sans_festival:
@@ -63,6 +91,10 @@ def main() -> int:
     from src.core.auto_solver import AutoSolver
     import src.core.auto_solver as autosolver_module
     autosolver_module._FESTIVAL_BUDGET = a.budget
+    telemetrie = None
+    if a.telemetrie:
+        from src.ai.budget_model import SolveTelemetryLog
+        telemetrie = SolveTelemetryLog(a.telemetrie)
 
     coll = LevelCollectionParser.parse_file(COLLECTION)
     total = coll.get_level_count()
@@ -78,11 +110,19 @@ def main() -> int:
         titre, niveau = coll.get_level(i)
         texte = niveau.get_state_string(show_fess_coordinates=False)
 
-        solveur = AutoSolver(niveau)
+        solveur = AutoSolver(niveau, telemetry=telemetrie, profile=a.profile,
+                             optimize=False)
         depart = time.time()
-        ok = solveur.solve_level()
+        if a.profile and a.profile_dir:
+            from src.ai.solver_profiler import run_with_cprofile
+            ok = run_with_cprofile(solveur.solve_level,
+                                   os.path.join(a.profile_dir, f"xsokoban_{i+1:02d}.prof"))
+        else:
+            ok = solveur.solve_level()
         duree = time.time() - depart
         duree_totale += duree
+        if a.profile:
+            afficher_profil(solveur, a.profile_dir, i + 1)
 
         if not ok:
             print(f"  #{i+1:<3} ÉCHEC          {duree:7.2f} s")